@@ -0,0 +1,85 @@
+import argparse
+from datetime import timedelta
+from typing import Optional, Sequence
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run a maintenance command, e.g. `python -m docuisine.cli image-gc --help`.
+
+    Parameters
+    ----------
+    argv : Optional[Sequence[str]], optional
+        The command line arguments, by default `sys.argv[1:]`.
+
+    Returns
+    -------
+    int
+        The exit code.
+    """
+    parser = argparse.ArgumentParser(prog="docuisine", description="Docuisine maintenance tasks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    image_gc = commands.add_parser(
+        "image-gc", help="Report or delete images that no entity references."
+    )
+    image_gc.add_argument(
+        "--grace-hours",
+        type=float,
+        default=24.0,
+        help="Keep unreferenced images younger than this many hours (default: 24).",
+    )
+    image_gc.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Keys checked against the database per query (default: 500).",
+    )
+    image_gc.add_argument(
+        "--delete",
+        action="store_true",
+        help="Delete the orphaned images. Without it, only report them.",
+    )
+    image_gc.set_defaults(handler=run_image_gc)
+
+    index_advisor = commands.add_parser(
+        "index-advisor",
+        help="Explain the queries of the services and report those scanning whole tables.",
+    )
+    index_advisor.add_argument(
+        "--create-missing",
+        action="store_true",
+        help="Create the indexes declared by the models that the database lacks.",
+    )
+    index_advisor.set_defaults(handler=run_index_advisor)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+def run_image_gc(args: argparse.Namespace) -> int:
+    # Imported here so that `--help` works without a configured environment.
+    from docuisine.db.database import SessionLocal
+    from docuisine.db.storage import get_storage
+    from docuisine.services import ImageGCService
+
+    with SessionLocal() as session:
+        report = ImageGCService(db_session=session, storage=get_storage()).collect(
+            grace_period=timedelta(hours=args.grace_hours),
+            dry_run=not args.delete,
+            batch_size=args.batch_size,
+        )
+    print(report.model_dump_json(indent=2))
+    return 0
+
+
+def run_index_advisor(args: argparse.Namespace) -> int:
+    # Imported here so that `--help` works without a configured environment.
+    from docuisine.db.database import SessionLocal
+    from docuisine.services import IndexAdvisorService
+
+    with SessionLocal() as session:
+        report = IndexAdvisorService(db_session=session).advise(create_missing=args.create_missing)
+    print(report.model_dump_json(indent=2))
+    # Fails in CI when a query would scan a whole table in production.
+    return 1 if report.sequential_scans or report.missing_indexes else 0
@@ -0,0 +1,5 @@
+import sys
+
+from docuisine.cli import main
+
+sys.exit(main())
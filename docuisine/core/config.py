@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import Literal, Optional
 
 from dotenv import load_dotenv
@@ -18,6 +19,35 @@ class Environment:
             raise EnvironmentError("DATABASE_URL environment variable is not set.")
         return URL
 
+    @property
+    def DATABASE_ASYNC(self) -> bool:
+        """Opt-in async database engine mode (e.g., asyncpg instead of psycopg2)."""
+        value = os.getenv("DATABASE_ASYNC", "false").strip().lower()
+        if value in ("true", "1", "yes"):
+            return True
+        if value in ("false", "0", "no"):
+            return False
+        raise EnvironmentError("DATABASE_ASYNC environment variable must be 'true' or 'false'.")
+
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """
+        Database URL used by the async engine.
+        Derived from `DATABASE_URL` by swapping in the async driver, unless set explicitly.
+        """
+        URL = os.getenv("ASYNC_DATABASE_URL")
+        if URL is not None:
+            return URL
+
+        scheme, _, rest = self.DATABASE_URL.partition("://")
+        dialect = scheme.split("+")[0]
+        async_drivers = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+        if dialect not in async_drivers:
+            raise EnvironmentError(
+                f"No async driver known for database '{dialect}'. Set ASYNC_DATABASE_URL instead."
+            )
+        return f"{dialect}+{async_drivers[dialect]}://{rest}"
+
     @property
     def DB_USERNAME(self) -> str:
         username = self.DATABASE_URL.split("@")[0].split("//")[1].split(":")[0]
@@ -60,11 +90,57 @@ class Environment:
 
     @property
     def JWT_ACCESS_TOKEN_EXPIRE_MINUTES(self) -> int:
+        expire_minutes = os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "15")
+        return int(expire_minutes)
+
+    @property
+    def JWT_REFRESH_TOKEN_EXPIRE_MINUTES(self) -> int:
         expire_minutes = os.getenv(
-            "JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "525600"
-        )  # Default to 1 year
+            "JWT_REFRESH_TOKEN_EXPIRE_MINUTES", "43200"
+        )  # Default to 30 days
         return int(expire_minutes)
 
+    @property
+    def AUTH_CACHE_SIZE(self) -> int:
+        """Maximum number of access tokens whose identity is cached. 0 disables the cache."""
+        cache_size_str = os.getenv("AUTH_CACHE_SIZE", "1024")
+        try:
+            cache_size = int(cache_size_str)
+            if cache_size < 0:
+                raise ValueError
+            return cache_size
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid AUTH_CACHE_SIZE '{cache_size_str}'. It must be a non-negative integer."
+            )
+
+    @property
+    def AUTH_CACHE_TTL_SECONDS(self) -> int:
+        """Seconds an authenticated identity is served from the cache before re-checking."""
+        ttl_str = os.getenv("AUTH_CACHE_TTL_SECONDS", "60")
+        try:
+            ttl = int(ttl_str)
+            if ttl <= 0:
+                raise ValueError
+            return ttl
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid AUTH_CACHE_TTL_SECONDS '{ttl_str}'. It must be a positive integer."
+            )
+
+    @property
+    def STORAGE_BACKEND(self) -> Literal["s3", "local"]:
+        """Where images are stored: an S3 bucket, or a directory of this machine."""
+        backend = os.getenv("STORAGE_BACKEND", "s3").strip().lower()
+        if backend in ("s3", "local"):
+            return backend  # type: ignore
+        raise EnvironmentError("STORAGE_BACKEND environment variable must be 's3' or 'local'.")
+
+    @property
+    def STORAGE_LOCAL_DIR(self) -> str:
+        """Directory of the images when `STORAGE_BACKEND` is 'local'."""
+        return os.getenv("STORAGE_LOCAL_DIR", os.path.join("data", "images"))
+
     @property
     def S3_ENDPOINT_URL(self) -> str:
         endpoint_url = os.getenv("S3_ENDPOINT_URL")
@@ -98,6 +174,302 @@ class Environment:
             raise EnvironmentError("S3_REGION environment variable is not set.")
         return region
 
+    @property
+    def S3_MAX_POOL_CONNECTIONS(self) -> int:
+        max_connections_str = os.getenv("S3_MAX_POOL_CONNECTIONS", "32")
+        try:
+            max_connections = int(max_connections_str)
+            if max_connections <= 0:
+                raise ValueError
+            return max_connections
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid S3_MAX_POOL_CONNECTIONS '{max_connections_str}'. "
+                "It must be a positive integer."
+            )
+
+    @property
+    def S3_PRESIGNED_URL_EXPIRE_SECONDS(self) -> int:
+        expire_str = os.getenv("S3_PRESIGNED_URL_EXPIRE_SECONDS", "900")
+        try:
+            expire_seconds = int(expire_str)
+            if expire_seconds <= 0:
+                raise ValueError
+            return expire_seconds
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid S3_PRESIGNED_URL_EXPIRE_SECONDS '{expire_str}'. "
+                "It must be a positive integer."
+            )
+
+    @property
+    def IMAGE_INDEX_SIZE(self) -> int:
+        """Number of stored images remembered for deduplication. 0 disables deduplication."""
+        index_size_str = os.getenv("IMAGE_INDEX_SIZE", "10000")
+        try:
+            index_size = int(index_size_str)
+            if index_size < 0:
+                raise ValueError
+            return index_size
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_INDEX_SIZE '{index_size_str}'. It must be a non-negative integer."
+            )
+
+    @property
+    def IMAGE_MAX_UPLOAD_BYTES(self) -> int:
+        """Largest image accepted by the upload routes, after base64 decoding."""
+        max_size_str = os.getenv("IMAGE_MAX_UPLOAD_BYTES", str(20 * 1024 * 1024))
+        try:
+            max_size = int(max_size_str)
+            if max_size <= 0:
+                raise ValueError
+            return max_size
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_MAX_UPLOAD_BYTES '{max_size_str}'. It must be a positive integer."
+            )
+
+    @property
+    def IMAGE_SPOOL_THRESHOLD_BYTES(self) -> int:
+        """Size above which an upload is spooled to a temporary file instead of memory."""
+        threshold_str = os.getenv("IMAGE_SPOOL_THRESHOLD_BYTES", str(1024 * 1024))
+        try:
+            threshold = int(threshold_str)
+            if threshold < 0:
+                raise ValueError
+            return threshold
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_SPOOL_THRESHOLD_BYTES '{threshold_str}'. "
+                "It must be a non-negative integer."
+            )
+
+    @property
+    def IMAGE_BATCH_MAX_FILES(self) -> int:
+        """Most images accepted by one request to the batch upload route."""
+        max_files_str = os.getenv("IMAGE_BATCH_MAX_FILES", "50")
+        try:
+            max_files = int(max_files_str)
+            if max_files <= 0:
+                raise ValueError
+            return max_files
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_BATCH_MAX_FILES '{max_files_str}'. It must be a positive integer."
+            )
+
+    @property
+    def IMAGE_BATCH_CONCURRENCY(self) -> int:
+        """Images of a batch upload processed at the same time."""
+        concurrency_str = os.getenv("IMAGE_BATCH_CONCURRENCY", "4")
+        try:
+            concurrency = int(concurrency_str)
+            if concurrency <= 0:
+                raise ValueError
+            return concurrency
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_BATCH_CONCURRENCY '{concurrency_str}'. "
+                "It must be a positive integer."
+            )
+
+    @property
+    def BULK_MAX_ITEMS(self) -> int:
+        """Most items accepted by one request to a bulk create route."""
+        max_items_str = os.getenv("BULK_MAX_ITEMS", "50000")
+        try:
+            max_items = int(max_items_str)
+            if max_items <= 0:
+                raise ValueError
+            return max_items
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid BULK_MAX_ITEMS '{max_items_str}'. It must be a positive integer."
+            )
+
+    @property
+    def BULK_CHUNK_SIZE(self) -> int:
+        """Items of a bulk create inserted, and committed, together."""
+        chunk_size_str = os.getenv("BULK_CHUNK_SIZE", "1000")
+        try:
+            chunk_size = int(chunk_size_str)
+            if chunk_size <= 0:
+                raise ValueError
+            return chunk_size
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid BULK_CHUNK_SIZE '{chunk_size_str}'. It must be a positive integer."
+            )
+
+    @property
+    def BULK_MAX_BYTES(self) -> int:
+        """Largest body accepted by one request to a bulk create route, in bytes."""
+        max_bytes_str = os.getenv("BULK_MAX_BYTES", str(32 * 1024 * 1024))
+        try:
+            max_bytes = int(max_bytes_str)
+            if max_bytes <= 0:
+                raise ValueError
+            return max_bytes
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid BULK_MAX_BYTES '{max_bytes_str}'. It must be a positive integer."
+            )
+
+    @property
+    def BULK_MAX_LINE_BYTES(self) -> int:
+        """Longest line accepted in an NDJSON body of a bulk create route, in bytes."""
+        max_line_bytes_str = os.getenv("BULK_MAX_LINE_BYTES", str(64 * 1024))
+        try:
+            max_line_bytes = int(max_line_bytes_str)
+            if max_line_bytes <= 0:
+                raise ValueError
+            return max_line_bytes
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid BULK_MAX_LINE_BYTES '{max_line_bytes_str}'. "
+                "It must be a positive integer."
+            )
+
+    @property
+    def IMAGE_CACHE_DIR(self) -> str:
+        """Directory of the disk cache of resized images."""
+        return os.getenv(
+            "IMAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "docuisine-renditions")
+        )
+
+    @property
+    def IMAGE_CACHE_MAX_BYTES(self) -> int:
+        """Size of the disk cache of resized images. 0 disables the cache."""
+        max_bytes_str = os.getenv("IMAGE_CACHE_MAX_BYTES", str(512 * 1024 * 1024))
+        try:
+            max_bytes = int(max_bytes_str)
+            if max_bytes < 0:
+                raise ValueError
+            return max_bytes
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_CACHE_MAX_BYTES '{max_bytes_str}'. "
+                "It must be a non-negative integer."
+            )
+
+    @property
+    def IMAGE_CACHE_CONTROL(self) -> Optional[str]:
+        """`Cache-Control` of stored and served images. Empty omits the header."""
+        cache_control = os.getenv(
+            "IMAGE_CACHE_CONTROL", "public, max-age=31536000, immutable"
+        ).strip()
+        if not cache_control:
+            return None
+        if any(char in cache_control for char in "\r\n"):
+            raise EnvironmentError(
+                "Invalid IMAGE_CACHE_CONTROL. It must be a single-line header value."
+            )
+        return cache_control
+
+    @property
+    def IMAGE_NORMALIZE(self) -> bool:
+        """Opt-in normalization of uploaded originals (EXIF orientation, metadata, size cap)."""
+        value = os.getenv("IMAGE_NORMALIZE", "false").strip().lower()
+        if value in ("true", "1", "yes"):
+            return True
+        if value in ("false", "0", "no"):
+            return False
+        raise EnvironmentError("IMAGE_NORMALIZE environment variable must be 'true' or 'false'.")
+
+    @property
+    def IMAGE_MAX_DIMENSION(self) -> Optional[int]:
+        """Longest side of normalized originals; larger ones are downscaled. 0 disables the cap."""
+        max_dimension_str = os.getenv("IMAGE_MAX_DIMENSION", "0")
+        try:
+            max_dimension = int(max_dimension_str)
+            if max_dimension < 0:
+                raise ValueError
+            return max_dimension or None
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_MAX_DIMENSION '{max_dimension_str}'. "
+                "It must be a non-negative integer."
+            )
+
+    @property
+    def IMAGE_NORMALIZE_QUALITY(self) -> int:
+        quality_str = os.getenv("IMAGE_NORMALIZE_QUALITY", "85")
+        try:
+            quality = int(quality_str)
+            if not 1 <= quality <= 100:
+                raise ValueError
+            return quality
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_NORMALIZE_QUALITY '{quality_str}'. It must be between 1 and 100."
+            )
+
+    @property
+    def IMAGE_VARIANT_WIDTHS(self) -> list[int]:
+        """Widths of the responsive variants of uploaded images. Empty disables variants."""
+        widths_str = os.getenv("IMAGE_VARIANT_WIDTHS", "64,256,1024")
+        try:
+            widths = sorted({int(width) for width in widths_str.split(",") if width.strip()})
+            if any(width <= 0 for width in widths):
+                raise ValueError
+            return widths
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_VARIANT_WIDTHS '{widths_str}'. "
+                "It must be a comma-separated list of positive integers."
+            )
+
+    @property
+    def IMAGE_VARIANT_FORMAT(self) -> Literal["webp", "avif"]:
+        variant_format = os.getenv("IMAGE_VARIANT_FORMAT", "webp").strip().lower()
+        if variant_format in ["webp", "avif"]:
+            return variant_format  # type: ignore
+        raise EnvironmentError(
+            "IMAGE_VARIANT_FORMAT environment variable must be 'webp' or 'avif'."
+        )
+
+    @property
+    def IMAGE_VARIANT_QUALITY(self) -> int:
+        quality_str = os.getenv("IMAGE_VARIANT_QUALITY", "80")
+        try:
+            quality = int(quality_str)
+            if not 1 <= quality <= 100:
+                raise ValueError
+            return quality
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_VARIANT_QUALITY '{quality_str}'. It must be between 1 and 100."
+            )
+
+    @property
+    def IMAGE_WORKERS(self) -> int:
+        """Worker processes for image decoding and encoding. 0 processes images in-line."""
+        workers_str = os.getenv("IMAGE_WORKERS", str(os.cpu_count() or 1))
+        try:
+            workers = int(workers_str)
+            if workers < 0:
+                raise ValueError
+            return workers
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_WORKERS '{workers_str}'. It must be a non-negative integer."
+            )
+
+    @property
+    def IMAGE_QUEUE_SIZE(self) -> int:
+        """Maximum image jobs running or waiting for a worker before uploads are rejected."""
+        queue_size_str = os.getenv("IMAGE_QUEUE_SIZE", str(4 * max(self.IMAGE_WORKERS, 1)))
+        try:
+            queue_size = int(queue_size_str)
+            if queue_size <= 0:
+                raise ValueError
+            return queue_size
+        except ValueError:
+            raise EnvironmentError(
+                f"Invalid IMAGE_QUEUE_SIZE '{queue_size_str}'. It must be a positive integer."
+            )
+
     @property
     def DEPLOYMENT(self) -> Literal["docker", "vercel"]:
         """Deployment environment (e.g., docker or vercel (serverless))."""
@@ -0,0 +1,159 @@
+from http import HTTPStatus
+from typing import Any, Callable, Optional
+
+from loguru import logger
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from docuisine.db.database import Transaction
+from docuisine.db.models import Base
+from docuisine.schemas.common import BulkItem
+
+CONSTRAINT_DETAIL = "Rejected by a database constraint"
+
+
+def bulk_insert(
+    session: Session,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+    chunk_size: int,
+    key: Optional[str] = None,
+    conflict_detail: Optional[Callable[[Any], str]] = None,
+) -> list[BulkItem]:
+    """
+    Insert rows in chunks, each with one multi-row `INSERT` in its own transaction.
+
+    Parameters
+    ----------
+    session : Session
+        The session to insert with. It is committed, and closed, after every chunk.
+    model : type[Base]
+        The model of the rows, with an integer `id` primary key.
+    rows : list[dict[str, Any]]
+        The column values of every row, all with the same columns.
+    chunk_size : int
+        Rows inserted, and committed, together.
+    key : Optional[str]
+        A uniquely constrained column. Rows whose value of it already exists, in the
+        database or earlier in `rows`, are skipped as conflicts. Default is None.
+    conflict_detail : Optional[Callable[[Any], str]]
+        Build the detail of a conflict from the value of `key`. Required with `key`.
+
+    Returns
+    -------
+    list[BulkItem]
+        The outcome of every row, in order: created (201) with its ID,
+        conflict (409), or rejected by another constraint (422).
+
+    Raises
+    ------
+    NotImplementedError
+        If the database is neither PostgreSQL nor SQLite.
+
+    Notes
+    -----
+    - Conflicts are skipped by `ON CONFLICT (key) DO NOTHING`; the rows created are
+      told apart from the skipped ones by what `RETURNING` returns.
+    - A chunk breaking another constraint (e.g. an unknown foreign key) is rolled back
+      and inserted again one row at a time, so that only the offending rows are rejected.
+    - Without `key`, the IDs are matched to the rows by their order. SQLite cannot
+      guarantee the order of a multi-row `RETURNING`, so there each row of a chunk
+      is sent on its own, still in the chunk's transaction.
+    - A failure midway leaves the chunks before it committed.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect not in ("postgresql", "sqlite"):
+        raise NotImplementedError(f"Bulk inserts are not supported on {dialect}.")
+
+    items: list[Optional[BulkItem]] = [None] * len(rows)
+    pending: list[int] = []
+    seen = set()
+    for index, row in enumerate(rows):
+        if key is not None:
+            if row[key] in seen:
+                items[index] = BulkItem(
+                    index=index,
+                    status_code=HTTPStatus.CONFLICT,
+                    detail=conflict_detail(row[key]),  # type: ignore
+                )
+                continue
+            seen.add(row[key])
+        pending.append(index)
+
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start : start + chunk_size]
+        try:
+            with Transaction(session):
+                ids = _insert(session, model, [rows[index] for index in chunk], key, dialect)
+        except IntegrityError:
+            logger.warning(
+                f"Bulk insert chunk rejected table={model.__tablename__} rows={len(chunk)}; "
+                "retrying row by row"
+            )
+            ids = []
+            for index in chunk:
+                try:
+                    with Transaction(session):
+                        ids.extend(_insert(session, model, [rows[index]], key, dialect))
+                except IntegrityError:
+                    ids.append(None)
+                    items[index] = BulkItem(
+                        index=index,
+                        status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                        detail=CONSTRAINT_DETAIL,
+                    )
+
+        for index, row_id in zip(chunk, ids):
+            if items[index] is not None:
+                continue
+            if row_id is None:
+                items[index] = BulkItem(
+                    index=index,
+                    status_code=HTTPStatus.CONFLICT,
+                    detail=conflict_detail(rows[index][key]),  # type: ignore
+                )
+            else:
+                items[index] = BulkItem(index=index, status_code=HTTPStatus.CREATED, id=row_id)
+
+    results: list[BulkItem] = items  # type: ignore
+    created = sum(1 for item in results if item.status_code == HTTPStatus.CREATED)
+    conflicts = sum(1 for item in results if item.status_code == HTTPStatus.CONFLICT)
+    logger.info(
+        f"Bulk inserted table={model.__tablename__} rows={len(rows)} created={created} "
+        f"conflicts={conflicts} rejected={len(rows) - created - conflicts}"
+    )
+    return results
+
+
+def _insert(
+    session: Session,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+    key: Optional[str],
+    dialect: str,
+) -> list[Optional[int]]:
+    """
+    Insert rows with one statement and return their IDs, in order.
+
+    The statement is executed on the connection rather than the session: SQLAlchemy
+    then sends the rows as one multi-row `INSERT` ("insertmanyvalues"), whereas the ORM
+    would split them by the columns left None. The ID of a row skipped as a conflict is None.
+    """
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    statement = insert(model)
+    connection = session.connection()
+    if key is None:
+        result = connection.execute(
+            statement.returning(model.id, sort_by_parameter_order=True),  # type: ignore
+            rows,
+        )
+        return list(result.scalars())
+
+    column = getattr(model, key)
+    statement = statement.on_conflict_do_nothing(index_elements=[column]).returning(
+        model.id,  # type: ignore
+        column,
+    )
+    created = {value: row_id for row_id, value in connection.execute(statement, rows)}
+    return [created.get(row[key]) for row in rows]
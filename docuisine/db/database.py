@@ -1,6 +1,8 @@
-from typing import Self
+from typing import Optional, Self
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from docuisine.core.config import env
@@ -43,6 +45,29 @@ class Transaction:
         return False
 
 
+def is_unique_violation(error: IntegrityError) -> bool:
+    """
+    Check whether an integrity error was raised by a unique constraint.
+
+    Other integrity errors come from foreign keys, `CHECK` and `NOT NULL` constraints.
+
+    Parameters
+    ----------
+    error : IntegrityError
+        The error raised by SQLAlchemy.
+
+    Returns
+    -------
+    bool
+        True for a unique violation on PostgreSQL (SQLSTATE 23505) or SQLite.
+    """
+    orig = error.orig
+    sqlstate = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    if sqlstate is not None:
+        return sqlstate == "23505"
+    return getattr(orig, "sqlite_errorname", None) == "SQLITE_CONSTRAINT_UNIQUE"
+
+
 def IS_PRODUCTION() -> bool:
     """
     Check if the application is running in production mode.
@@ -60,5 +85,40 @@ def IS_PRODUCTION() -> bool:
     return env.MODE == Mode.PRODUCTION
 
 
+def enable_foreign_keys(engine: Engine) -> None:
+    """
+    Make SQLite enforce foreign keys on every connection of `engine`.
+
+    SQLite ignores foreign keys, and so their `ON DELETE` actions, unless enabled
+    per connection. Other databases always enforce them; their engines are left as is.
+
+    Parameters
+    ----------
+    engine : Engine
+        The engine, or the `sync_engine` of an async engine.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_foreign_keys_pragma(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 engine = create_engine(env.DATABASE_URL, echo=not IS_PRODUCTION())
+enable_foreign_keys(engine)
 SessionLocal = sessionmaker(bind=engine)
+
+## Opt-in async engine mode, enabled with DATABASE_ASYNC=true.
+## The sync engine above is still used for schema creation at startup.
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+if env.DATABASE_ASYNC:
+    async_engine = create_async_engine(env.ASYNC_DATABASE_URL, echo=not IS_PRODUCTION())
+    enable_foreign_keys(async_engine.sync_engine)
+    # Objects are read after commit outside of the session's greenlet,
+    # so they must not be expired (which would trigger lazy IO).
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
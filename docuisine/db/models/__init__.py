@@ -1,5 +1,6 @@
 from .base import Base
 from .categories import Category
+from .images import StoredImage
 from .ingredients import Ingredient
 from .recipes import Recipe, RecipeCategory, RecipeIngredient, RecipeStep
 from .stores import Shelf, Store
@@ -16,4 +17,5 @@ __all__ = [
     "Ingredient",
     "Store",
     "Shelf",
+    "StoredImage",
 ]
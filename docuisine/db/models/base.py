@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import TIMESTAMP
+from sqlalchemy import TIMESTAMP, ForeignKey
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -34,8 +34,15 @@ class Entity(Default):
     Attributes:
         preview_img (Optional[str]): URL or path to the preview image.
         img (Optional[str]): URL or path to the main image.
+        placeholder_img (Optional[str]): Tiny inline version of the image, as a data URI.
+        image_key (Optional[str]): Key of the uploaded image in the `images` table,
+            holding its dimensions, size and variants.
         created_at (datetime): Timestamp when the entity was created.
     """
 
     preview_img: Mapped[Optional[str]]
     img: Mapped[Optional[str]]
+    placeholder_img: Mapped[Optional[str]]
+    image_key: Mapped[Optional[str]] = mapped_column(
+        ForeignKey("images.key", ondelete="SET NULL"), index=True, nullable=True
+    )
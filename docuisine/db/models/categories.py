@@ -28,4 +28,6 @@ class Category(Base, Entity):
     name: Mapped[str] = mapped_column(unique=True, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(nullable=True)
 
-    recipes = relationship("Recipe", secondary="recipe_categories", back_populates="categories")
+    recipes = relationship(
+        "Recipe", secondary="recipe_categories", back_populates="categories", passive_deletes=True
+    )
@@ -0,0 +1,46 @@
+from typing import Optional
+
+from sqlalchemy import JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, Default
+
+
+class StoredImage(Base, Default):
+    """
+    Metadata of an uploaded image and the images derived from it.
+    Recorded on upload, so that it can be read without a request to the storage.
+
+    Attributes
+    ----------
+    key : str
+        Object key of the original image, e.g. "<md5>.jpg".
+    sha : str
+        Hex SHA-256 digest of the uploaded bytes, before any normalization.
+    width : int
+        Width of the stored original image in pixels.
+    height : int
+        Height of the stored original image in pixels.
+    bytes : int
+        Size of the stored original image in bytes.
+    format : str
+        Format of the original image, e.g. "jpeg".
+    preview : str
+        Object key of the preview image.
+    placeholder : Optional[str]
+        Tiny inline version of the image, as a data URI.
+    variants : list[dict]
+        Resized variants as `{"key", "width", "format"}`, from narrowest to widest.
+    """
+
+    __tablename__ = "images"
+
+    key: Mapped[str] = mapped_column(primary_key=True)
+    sha: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    width: Mapped[int] = mapped_column(nullable=False)
+    height: Mapped[int] = mapped_column(nullable=False)
+    bytes: Mapped[int] = mapped_column(nullable=False)
+    format: Mapped[str] = mapped_column(nullable=False)
+    preview: Mapped[str] = mapped_column(nullable=False)
+    placeholder: Mapped[Optional[str]] = mapped_column(nullable=True)
+    variants: Mapped[list[dict]] = mapped_column(JSON, default=list, nullable=False)
@@ -37,10 +37,15 @@ class Ingredient(Base, Entity):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(unique=True, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(nullable=True)
-    recipe_id: Mapped[Optional[int]] = mapped_column(ForeignKey("recipes.id"), nullable=True)
+    recipe_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("recipes.id", ondelete="SET NULL"), index=True, nullable=True
+    )
 
     recipe: Mapped[Optional[List["Recipe"]]] = relationship(back_populates="product")
-    recipes: Mapped[List["RecipeIngredient"]] = relationship(back_populates="ingredients")
+    # Removed from recipes and stores by the database when the ingredient is deleted.
+    recipes: Mapped[List["RecipeIngredient"]] = relationship(
+        back_populates="ingredients", passive_deletes=True
+    )
     stores: Mapped[List["Store"]] = relationship(
-        "Store", secondary="shelves", back_populates="ingredients"
+        "Store", secondary="shelves", back_populates="ingredients", passive_deletes=True
     )
@@ -47,19 +47,29 @@ class Recipe(Base, Entity):
     __tablename__ = "recipes"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    name: Mapped[str] = mapped_column(nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    name: Mapped[str] = mapped_column(index=True, nullable=False)
     cook_time_sec: Mapped[int] = mapped_column(nullable=True)
     prep_time_sec: Mapped[int] = mapped_column(nullable=True)
     non_blocking_time_sec: Mapped[int] = mapped_column(nullable=True)
     servings: Mapped[int] = mapped_column(nullable=True)
     description: Mapped[str] = mapped_column(nullable=True)
 
-    product: Mapped[Optional["Ingredient"]] = relationship(back_populates="recipe")
+    # The rows referencing a recipe are deleted (or unlinked) by the database's
+    # ON DELETE actions, so the ORM does not load them to delete a recipe.
+    product: Mapped[Optional["Ingredient"]] = relationship(
+        back_populates="recipe", passive_deletes=True
+    )
     creator = relationship("User", back_populates="recipes")
-    steps: Mapped[List["RecipeStep"]] = relationship()
-    ingredients: Mapped[List["RecipeIngredient"]] = relationship(back_populates="recipes")
-    categories = relationship("Category", secondary="recipe_categories", back_populates="recipes")
+    # Serialized with every recipe (`RecipeOut`), so they are loaded together with it,
+    # lazy loading them after the session's work is done is not possible in async mode.
+    steps: Mapped[List["RecipeStep"]] = relationship(lazy="selectin", passive_deletes=True)
+    ingredients: Mapped[List["RecipeIngredient"]] = relationship(
+        back_populates="recipes", lazy="selectin", passive_deletes=True
+    )
+    categories = relationship(
+        "Category", secondary="recipe_categories", back_populates="recipes", passive_deletes=True
+    )
 
     __table_args__ = (
         CheckConstraint("cook_time_sec >= 0", name="cook_time_non_negative"),
@@ -87,7 +97,9 @@ class RecipeStep(Base, Default):
 
     __tablename__ = "recipe_steps"
 
-    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.id"), primary_key=True)
+    recipe_id: Mapped[int] = mapped_column(
+        ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True
+    )
     step_number: Mapped[int] = mapped_column(primary_key=True)
     description: Mapped[str] = mapped_column(nullable=False)
 
@@ -114,8 +126,13 @@ class RecipeIngredient(Base, Default):
 
     __tablename__ = "recipe_ingredients"
 
-    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.id"), primary_key=True)
-    ingredient_id: Mapped[int] = mapped_column(ForeignKey("ingredients.id"), primary_key=True)
+    recipe_id: Mapped[int] = mapped_column(
+        ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True
+    )
+    # The primary key only serves lookups by recipe; this one serves lookups by ingredient.
+    ingredient_id: Mapped[int] = mapped_column(
+        ForeignKey("ingredients.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
     unit: Mapped[str] = mapped_column(nullable=False)
     quantity: Mapped[float] = mapped_column(nullable=False)
     notes: Mapped[Optional[str]] = mapped_column(nullable=True)
@@ -136,5 +153,9 @@ class RecipeCategory(Base, Entity):
     """
 
     __tablename__ = "recipe_categories"
-    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.id"), primary_key=True)
-    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), primary_key=True)
+    recipe_id: Mapped[int] = mapped_column(
+        ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True
+    )
+    category_id: Mapped[int] = mapped_column(
+        ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
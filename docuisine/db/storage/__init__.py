@@ -0,0 +1,57 @@
+from functools import cache
+
+import boto3
+from botocore.config import Config
+
+from docuisine.core.config import env
+from docuisine.schemas.image import S3Config
+
+from .base import ObjectReader, ObjectStorage
+from .local import LocalStorage
+from .s3 import S3Storage
+
+__all__ = [
+    "ObjectReader",
+    "ObjectStorage",
+    "LocalStorage",
+    "S3Storage",
+    "get_storage",
+]
+
+
+@cache
+def get_storage() -> ObjectStorage:
+    """
+    Return the storage backend selected by `STORAGE_BACKEND`, created on first use.
+
+    Returns
+    -------
+    ObjectStorage
+        The storage shared by the whole process.
+
+    Notes
+    -----
+    - The S3 environment variables are only read, and the S3 client only created,
+      when the S3 backend is selected.
+    """
+    if env.STORAGE_BACKEND == "local":
+        return LocalStorage(env.STORAGE_LOCAL_DIR)
+
+    s3_config = S3Config(
+        endpoint_url=env.S3_ENDPOINT_URL,
+        access_key=env.S3_ACCESS_KEY,
+        secret_key=env.S3_SECRET_KEY,
+        bucket_name=env.S3_BUCKET_NAME,
+        region=env.S3_REGION,
+        max_pool_connections=env.S3_MAX_POOL_CONNECTIONS,
+    )
+    s3 = boto3.client(
+        "s3",
+        endpoint_url=s3_config.endpoint_url,
+        aws_access_key_id=s3_config.access_key,
+        aws_secret_access_key=s3_config.secret_key,
+        region_name=s3_config.region,
+        # Connections are reused across requests and concurrent uploads share the pool.
+        config=Config(max_pool_connections=s3_config.max_pool_connections, tcp_keepalive=True),
+    )
+    return S3Storage(s3, bucket_name=s3_config.bucket_name)
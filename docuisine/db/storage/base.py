@@ -0,0 +1,204 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from docuisine.schemas.image import ObjectInfo
+from docuisine.utils.errors import UnsupportedStorageOperationError
+
+
+class ObjectReader(ABC):
+    """An object being downloaded from storage, read whole or in chunks.
+
+    Usage
+    -----
+    ```
+    with storage.get(key) as reader:
+        for chunk in reader.iter_chunks(64 * 1024):
+            ...
+    ```
+    """
+
+    size: int
+    # The object as a local file, when the backend stores it on this machine;
+    # lets servers send it with `sendfile` instead of copying it through Python.
+    path: Optional[Path] = None
+
+    @abstractmethod
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        """Yield the object in chunks of up to `chunk_size` bytes."""
+
+    @abstractmethod
+    def read(self) -> bytes:
+        """Read the whole object."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the connection or file handle."""
+
+    def __enter__(self) -> "ObjectReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ObjectStorage(ABC):
+    """Flat key-value store of immutable objects, e.g. an S3 bucket or a local directory.
+
+    Keys are `/`-separated paths such as "<hash>.jpeg" or "uploads/<uuid>".
+    """
+
+    # Name of the backend, used in logs and error messages.
+    backend: str
+
+    @abstractmethod
+    def prepare(self) -> None:
+        """Create the bucket or directory holding the objects, if it does not exist."""
+
+    @abstractmethod
+    def head(self, key: str) -> Optional[ObjectInfo]:
+        """
+        Return the properties of an object.
+
+        Parameters
+        ----------
+        key : str
+            The object key.
+
+        Returns
+        -------
+        Optional[ObjectInfo]
+            The size, modification time and metadata of the object,
+            or None if it does not exist.
+        """
+
+    @abstractmethod
+    def get(self, key: str) -> ObjectReader:
+        """
+        Start reading an object.
+
+        Parameters
+        ----------
+        key : str
+            The object key.
+
+        Returns
+        -------
+        ObjectReader
+            The object, to be closed by the caller.
+
+        Raises
+        ------
+        ObjectNotFoundError
+            If the object does not exist.
+        """
+
+    @abstractmethod
+    def put(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str,
+        cache_control: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> None:
+        """
+        Store an object, replacing any object with the same key.
+
+        Parameters
+        ----------
+        key : str
+            The object key.
+        data : bytes
+            The object data.
+        content_type : str
+            The media type of the object, e.g. "image/png".
+        cache_control : Optional[str], optional
+            The `Cache-Control` served with the object, by default None.
+        metadata : Optional[dict[str, str]], optional
+            ASCII user metadata stored with the object, by default None.
+        """
+
+    @abstractmethod
+    def copy(
+        self, source_key: str, key: str, content_type: str, cache_control: Optional[str] = None
+    ) -> None:
+        """
+        Copy an object within the storage, without its user metadata.
+
+        Parameters
+        ----------
+        source_key : str
+            The key of the object to copy.
+        key : str
+            The key of the copy.
+        content_type : str
+            The media type of the copy.
+        cache_control : Optional[str], optional
+            The `Cache-Control` served with the copy, by default None.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Delete an object. A missing object is ignored.
+
+        Parameters
+        ----------
+        key : str
+            The object key.
+        """
+
+    @abstractmethod
+    def delete_many(self, keys: Iterable[str]) -> list[str]:
+        """
+        Delete objects in one request where the backend allows it. Missing objects are ignored.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            The keys of the objects, up to 1000.
+
+        Returns
+        -------
+        list[str]
+            The keys that could not be deleted.
+        """
+
+    @abstractmethod
+    def iter_objects(self) -> Iterator[ObjectInfo]:
+        """
+        Stream every object, without its metadata.
+
+        Returns
+        -------
+        Iterator[ObjectInfo]
+            The objects. Keys sharing a prefix are listed next to each other.
+        """
+
+    def presign_put(self, key: str, content_type: str, size: int, expires_in: int) -> str:
+        """
+        Create a URL to store an object with a PUT request, without credentials.
+
+        Parameters
+        ----------
+        key : str
+            The object key.
+        content_type : str
+            The `Content-Type` the request must send.
+        size : int
+            The `Content-Length` the request must send.
+        expires_in : int
+            Seconds until the URL expires.
+
+        Returns
+        -------
+        str
+            The presigned URL.
+
+        Raises
+        ------
+        UnsupportedStorageOperationError
+            If the backend cannot be written to directly by clients.
+        """
+        raise UnsupportedStorageOperationError(operation="presigned uploads", backend=self.backend)
@@ -0,0 +1,223 @@
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+import tempfile
+from typing import BinaryIO, Iterable, Iterator, Optional, Union
+
+from loguru import logger
+
+from docuisine.schemas.image import ObjectInfo
+from docuisine.utils.errors import ObjectNotFoundError
+
+from .base import ObjectReader, ObjectStorage
+
+TEMP_PREFIX = ".tmp-"
+# User metadata is kept next to its object, e.g. "<key>.meta.json".
+METADATA_SUFFIX = ".meta.json"
+# Keys are relative paths of plain segments; nothing can escape the root directory.
+SAFE_KEY = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9._-]*(/[A-Za-z0-9_-][A-Za-z0-9._-]*)*")
+
+
+class FileObjectReader(ObjectReader):
+    """Object read from a local file."""
+
+    def __init__(self, path: Path, file: BinaryIO):
+        self.path = path
+        self.file = file
+        self.size = os.fstat(file.fileno()).st_size
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        while chunk := self.file.read(chunk_size):
+            yield chunk
+
+    def read(self) -> bytes:
+        return self.file.read()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class LocalStorage(ObjectStorage):
+    """Objects stored as files in a local directory, for single-node deployments.
+
+    Each object is written atomically: to a temporary file in its final directory,
+    then renamed over the target, so readers never see a partial object.
+    Files are sharded by the first characters of their name, e.g.
+    `<root>/ab/cd/abcd1234.jpeg`, to keep directories small.
+
+    Usage
+    -----
+    ```
+    storage = LocalStorage("/var/lib/docuisine/images")
+    storage.put("abcd1234.jpeg", data, content_type="image/jpeg")
+    ```
+    """
+
+    backend = "local"
+
+    def __init__(self, root: Union[str, Path], shard_depth: int = 2):
+        """
+        Initialize the storage. Nothing is written until `prepare` or `put` is called.
+
+        Parameters
+        ----------
+        root : Union[str, Path]
+            The directory holding the objects.
+        shard_depth : int, optional
+            Levels of two-character directories above each file, by default 2.
+        """
+        self.root = Path(root)
+        self.shard_depth = shard_depth
+
+    def prepare(self) -> None:
+        """Create the root directory, if it does not exist."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Storing images in directory '{self.root}'")
+
+    def head(self, key: str) -> Optional[ObjectInfo]:
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return ObjectInfo(
+            key=key,
+            size=stat.st_size,
+            last_modified=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+            metadata=self._read_metadata(path),
+        )
+
+    def get(self, key: str) -> ObjectReader:
+        path = self._path(key)
+        try:
+            return FileObjectReader(path, path.open("rb"))
+        except FileNotFoundError:
+            raise ObjectNotFoundError(key=key)
+
+    def put(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str,
+        cache_control: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> None:
+        # The content type follows from the extension of the key, and the
+        # `Cache-Control` is set by the route serving the file.
+        path = self._path(key)
+        if metadata:
+            self._write_atomically(self._metadata_path(path), json.dumps(metadata).encode())
+        else:
+            self._metadata_path(path).unlink(missing_ok=True)
+        self._write_atomically(path, data)
+
+    def copy(
+        self, source_key: str, key: str, content_type: str, cache_control: Optional[str] = None
+    ) -> None:
+        source, path = self._path(source_key), self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=TEMP_PREFIX)
+        os.close(fd)
+        try:
+            shutil.copyfile(source, temp_path)
+            os.replace(temp_path, path)
+        except FileNotFoundError:
+            Path(temp_path).unlink(missing_ok=True)
+            raise ObjectNotFoundError(key=source_key)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        self._metadata_path(path).unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        path.unlink(missing_ok=True)
+        self._metadata_path(path).unlink(missing_ok=True)
+
+    def delete_many(self, keys: Iterable[str]) -> list[str]:
+        failed = []
+        for key in keys:
+            try:
+                self.delete(key)
+            except OSError as e:
+                logger.warning(f"Failed to delete key={key} error={e}")
+                failed.append(key)
+        return failed
+
+    def iter_objects(self) -> Iterator[ObjectInfo]:
+        # Directories and files are walked in name order, so the objects of one
+        # shard, and the keys sharing a prefix within it, are listed together.
+        for directory, directories, files in os.walk(self.root):
+            directories.sort()
+            for name in sorted(files):
+                if name.startswith(TEMP_PREFIX) or name.endswith(METADATA_SUFFIX):
+                    continue
+                path = Path(directory) / name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                yield ObjectInfo(
+                    key=self._key(path),
+                    size=stat.st_size,
+                    last_modified=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+                )
+
+    def _path(self, key: str) -> Path:
+        """
+        Return the file of an object.
+
+        Parameters
+        ----------
+        key : str
+            The object key, e.g. "abcd1234.jpeg" or "uploads/abcd1234".
+
+        Returns
+        -------
+        Path
+            The sharded path, e.g. "<root>/ab/cd/abcd1234.jpeg"
+            or "<root>/uploads/ab/cd/abcd1234".
+
+        Raises
+        ------
+        ObjectNotFoundError
+            If the key is not a safe relative path.
+        """
+        if not SAFE_KEY.fullmatch(key) or key.endswith(METADATA_SUFFIX):
+            raise ObjectNotFoundError(key=key)
+        prefix, _, name = key.rpartition("/")
+        padded = name.ljust(2 * self.shard_depth, "_")
+        shards = [padded[2 * level : 2 * level + 2] for level in range(self.shard_depth)]
+        return self.root.joinpath(prefix, *shards, name)
+
+    def _key(self, path: Path) -> str:
+        """Return the key of an object from its file, reversing `_path`."""
+        parts = path.relative_to(self.root).parts
+        prefix = parts[: len(parts) - 1 - self.shard_depth]
+        return "/".join((*prefix, parts[-1]))
+
+    @staticmethod
+    def _metadata_path(path: Path) -> Path:
+        return path.with_name(path.name + METADATA_SUFFIX)
+
+    def _read_metadata(self, path: Path) -> dict[str, str]:
+        try:
+            return json.loads(self._metadata_path(path).read_bytes())
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def _write_atomically(path: Path, data: bytes) -> None:
+        """Write a file through a temporary file renamed over it."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
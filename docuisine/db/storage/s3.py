@@ -0,0 +1,183 @@
+from io import BytesIO
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+from boto3.s3.transfer import TransferConfig
+from botocore import client
+from botocore.exceptions import ClientError
+from loguru import logger
+
+from docuisine.schemas.image import ObjectInfo
+from docuisine.utils.errors import ObjectNotFoundError
+
+from .base import ObjectReader, ObjectStorage
+
+# Images are small enough for a single PUT (up to 5 GiB), which keeps the ETag of
+# every object the MD5 of its content: for originals stored as uploaded, the hash in their key.
+SINGLE_PART_UPLOAD = TransferConfig(multipart_threshold=5 * 1024**3)
+
+
+class S3ObjectReader(ObjectReader):
+    """Body of an S3 GET response."""
+
+    def __init__(self, response: dict):
+        self.body = response["Body"]
+        self.size = response["ContentLength"]
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        return self.body.iter_chunks(chunk_size)
+
+    def read(self) -> bytes:
+        return self.body.read()
+
+    def close(self) -> None:
+        self.body.close()
+
+
+class S3Storage(ObjectStorage):
+    """Objects stored in an S3 bucket, e.g. on AWS or MinIO."""
+
+    backend = "s3"
+
+    def __init__(self, s3: client.BaseClient, bucket_name: str):
+        """
+        Initialize the storage with an S3 client.
+
+        Parameters
+        ----------
+        s3 : client.BaseClient
+            The S3 client, shared by every request.
+        bucket_name : str
+            The bucket holding the objects.
+        """
+        self.s3 = s3
+        self.bucket_name = bucket_name
+
+    def prepare(self) -> None:
+        """Create the bucket with a public-read policy, if it does not exist."""
+        try:
+            logger.info(f"Checking if S3 bucket '{self.bucket_name}' exists...")
+            self.s3.head_bucket(Bucket=self.bucket_name)
+            logger.info(f"S3 bucket '{self.bucket_name}' already exists.")
+        except ClientError:
+            logger.warning(f"S3 bucket '{self.bucket_name}' does not exist. Creating bucket...")
+            self.s3.create_bucket(Bucket=self.bucket_name)
+            self.s3.put_bucket_policy(Bucket=self.bucket_name, Policy=json.dumps(self._policy()))
+
+    def head(self, key: str) -> Optional[ObjectInfo]:
+        try:
+            response = self.s3.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if self._is_missing_object(e):
+                return None
+            raise
+        return ObjectInfo(
+            key=key,
+            size=response.get("ContentLength", 0),
+            last_modified=response.get("LastModified"),
+            metadata=response.get("Metadata", {}),
+        )
+
+    def get(self, key: str) -> ObjectReader:
+        try:
+            return S3ObjectReader(self.s3.get_object(Bucket=self.bucket_name, Key=key))
+        except ClientError as e:
+            if self._is_missing_object(e):
+                raise ObjectNotFoundError(key=key)
+            raise
+
+    def put(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str,
+        cache_control: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> None:
+        self.s3.upload_fileobj(
+            Bucket=self.bucket_name,
+            Key=key,
+            Fileobj=BytesIO(data),
+            ExtraArgs=self._build_object_args(content_type, cache_control, metadata),
+            Config=SINGLE_PART_UPLOAD,
+        )
+
+    def copy(
+        self, source_key: str, key: str, content_type: str, cache_control: Optional[str] = None
+    ) -> None:
+        self.s3.copy_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            CopySource={"Bucket": self.bucket_name, "Key": source_key},
+            MetadataDirective="REPLACE",
+            **self._build_object_args(content_type, cache_control),
+        )
+
+    def delete(self, key: str) -> None:
+        self.s3.delete_object(Bucket=self.bucket_name, Key=key)
+
+    def delete_many(self, keys: Iterable[str]) -> list[str]:
+        response = self.s3.delete_objects(
+            Bucket=self.bucket_name,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+        failed = []
+        for error in response.get("Errors", []):
+            logger.warning(f"Failed to delete key={error.get('Key')} code={error.get('Code')}")
+            failed.append(error.get("Key"))
+        return failed
+
+    def iter_objects(self) -> Iterator[ObjectInfo]:
+        # S3 lists keys in lexicographic order.
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name):
+            for obj in page.get("Contents", []):
+                yield ObjectInfo(
+                    key=obj["Key"], size=obj["Size"], last_modified=obj["LastModified"]
+                )
+
+    def presign_put(self, key: str, content_type: str, size: int, expires_in: int) -> str:
+        return self.s3.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": self.bucket_name,
+                "Key": key,
+                "ContentType": content_type,
+                "ContentLength": size,
+            },
+            ExpiresIn=expires_in,
+            HttpMethod="PUT",
+        )
+
+    @staticmethod
+    def _build_object_args(
+        content_type: str,
+        cache_control: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> dict[str, Any]:
+        """Build the headers stored with an object, served as is by the bucket or a CDN."""
+        args: dict[str, Any] = {"ContentType": content_type}
+        if cache_control is not None:
+            args["CacheControl"] = cache_control
+        if metadata:
+            args["Metadata"] = metadata
+        return args
+
+    @staticmethod
+    def _is_missing_object(error: ClientError) -> bool:
+        """Whether an S3 error means that the requested object does not exist."""
+        return error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    def _policy(self) -> dict:
+        """Bucket policy allowing public read access to objects."""
+        return {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Principal": "*",
+                    "Action": ["s3:GetObject"],
+                    "Resource": [f"arn:aws:s3:::{self.bucket_name}/*"],
+                }
+            ],
+        }
@@ -1,6 +1,14 @@
 from .auth import AuthenticatedUser, AuthForm, AuthToken
-from .db import DB_Session
+from .bulk import Bulk_Limits
+from .db import Async_DB_Session, Blocking_DB_Session, DB_Session
+from .pagination import Page_Params
 from .services import (
+    Async_Category_Service,
+    Async_Image_Service,
+    Async_Ingredient_Service,
+    Async_Recipe_Service,
+    Async_Store_Service,
+    Async_User_Service,
     Category_Service,
     Image_Service,
     Ingredient_Service,
@@ -8,16 +16,29 @@ from .services import (
     Store_Service,
     User_Service,
 )
+from .uploads import Upload_Limits, UploadRoute
 
 __all__ = [
     "AuthenticatedUser",
     "AuthForm",
     "AuthToken",
+    "Async_DB_Session",
     "DB_Session",
+    "Blocking_DB_Session",
+    "Page_Params",
+    "Upload_Limits",
+    "UploadRoute",
+    "Bulk_Limits",
     "User_Service",
     "Category_Service",
     "Image_Service",
     "Ingredient_Service",
     "Store_Service",
     "Recipe_Service",
+    "Async_User_Service",
+    "Async_Category_Service",
+    "Async_Ingredient_Service",
+    "Async_Store_Service",
+    "Async_Recipe_Service",
+    "Async_Image_Service",
 ]
@@ -4,10 +4,10 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from loguru import logger
 
-from docuisine.db.models import User
+from docuisine.schemas.auth import UserIdentity
 from docuisine.utils import errors
 
-from .services import User_Service
+from .services import Async_User_Service
 
 OAuth2_Scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
@@ -16,9 +16,9 @@ AuthToken = Annotated[str, Depends(OAuth2_Scheme)]
 AuthForm = Annotated[OAuth2PasswordRequestForm, Depends()]
 
 
-async def get_client_user(token: AuthToken, user_service: User_Service):
+async def get_client_user(token: AuthToken, user_service: Async_User_Service) -> UserIdentity:
     try:
-        user = user_service.authorize_user(token=token)
+        user = await user_service.authorize_identity(token=token)
     except errors.InvalidCredentialsError as e:
         logger.warning("Unauthorized request due to invalid credentials")
         raise HTTPException(
@@ -29,4 +29,4 @@ async def get_client_user(token: AuthToken, user_service: User_Service):
     return user
 
 
-AuthenticatedUser = Annotated[User, Depends(get_client_user)]
+AuthenticatedUser = Annotated[UserIdentity, Depends(get_client_user)]
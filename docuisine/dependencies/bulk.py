@@ -0,0 +1,18 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from docuisine.core.config import env
+from docuisine.schemas.common import BulkLimits
+
+
+def get_bulk_limits() -> BulkLimits:
+    return BulkLimits(
+        max_items=env.BULK_MAX_ITEMS,
+        chunk_size=env.BULK_CHUNK_SIZE,
+        max_bytes=env.BULK_MAX_BYTES,
+        max_line_bytes=env.BULK_MAX_LINE_BYTES,
+    )
+
+
+Bulk_Limits = Annotated[BulkLimits, Depends(get_bulk_limits)]
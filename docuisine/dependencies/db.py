@@ -1,13 +1,37 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from docuisine.db.database import SessionLocal
+from docuisine.db.database import AsyncSessionLocal, SessionLocal
 
 
-def get_db_session():
-    db = SessionLocal()
+async def get_async_db_session():
+    """
+    Yield an `AsyncSession` when the async engine mode is enabled, otherwise `None`.
+    """
+    if AsyncSessionLocal is None:
+        yield None
+        return
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+Async_DB_Session = Annotated[Optional[AsyncSession], Depends(get_async_db_session)]
+
+
+def get_db_session(async_db_session: Async_DB_Session):
+    # In async engine mode the services share the async session's underlying `Session`,
+    # their calls are then awaited through `AsyncSession.run_sync`.
+    if async_db_session is not None:
+        yield async_db_session.sync_session
+        return
+
+    # Otherwise they run in the threadpool, and the routes serialize what they return
+    # on the event loop: objects are not expired on commit, which would reload them there.
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
@@ -15,3 +39,16 @@ def get_db_session():
 
 
 DB_Session = Annotated[Session, Depends(get_db_session)]
+
+
+def get_blocking_db_session():
+    # Services that block on storage or CPU-bound work always run in the threadpool,
+    # so they need a `Session` on the sync engine, even in async engine mode.
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+Blocking_DB_Session = Annotated[Session, Depends(get_blocking_db_session)]
@@ -0,0 +1,27 @@
+from typing import Annotated, Optional
+
+from fastapi import Depends, HTTPException, Query, status
+
+from docuisine.schemas.common import Pagination
+from docuisine.utils import errors
+from docuisine.utils.pagination import decode_cursor
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def get_pagination(
+    limit: Annotated[
+        int, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of items to return")
+    ] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[
+        Optional[str], Query(description="The `next_cursor` of the previous page")
+    ] = None,
+) -> Pagination:
+    try:
+        return Pagination(limit=limit, after_id=decode_cursor(cursor))
+    except errors.InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+Page_Params = Annotated[Pagination, Depends(get_pagination)]
@@ -1,14 +1,66 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
+from cachetools import TTLCache
 from fastapi import Depends
 
 from docuisine import services
 from docuisine.core.config import env
 from docuisine.schemas.auth import JWTConfig
 from docuisine.schemas.enums import JWTAlgorithm
-
-from .db import DB_Session
-from .storage import S3_Client
+from docuisine.schemas.image import ImageNormalizationConfig, ImageSet, ImageVariantConfig
+from docuisine.services.user import IdentityCache, create_identity_cache
+from docuisine.utils.dedup import ContentIndex
+from docuisine.utils.disk_cache import DiskCache
+from docuisine.utils.workers import ProcessPool
+
+from .db import Async_DB_Session, Blocking_DB_Session, DB_Session
+from .storage import Object_Storage
+
+# Shared by every request of this process so that role changes, password changes
+# and deletions invalidate the identities cached by earlier requests.
+identity_cache: Optional[IdentityCache] = (
+    create_identity_cache(maxsize=env.AUTH_CACHE_SIZE, ttl=env.AUTH_CACHE_TTL_SECONDS)
+    if env.AUTH_CACHE_SIZE > 0
+    else None
+)
+# Token versions bumped by this process; kept as long as the access tokens they revoke.
+token_versions: TTLCache[int, int] = TTLCache(
+    maxsize=10_000, ttl=env.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+# Worker processes for image decoding and encoding, started on the first upload.
+image_pool: Optional[ProcessPool] = (
+    ProcessPool(max_workers=env.IMAGE_WORKERS, max_pending=env.IMAGE_QUEUE_SIZE)
+    if env.IMAGE_WORKERS > 0
+    else None
+)
+# Images known to be in the bucket. Entries are re-checked with a HEAD request daily.
+image_index: Optional[ContentIndex[ImageSet]] = (
+    ContentIndex(maxsize=env.IMAGE_INDEX_SIZE, ttl=24 * 60 * 60)
+    if env.IMAGE_INDEX_SIZE > 0
+    else None
+)
+# Resized images served by `GET /image/{key}`.
+rendition_cache: Optional[DiskCache] = (
+    DiskCache(env.IMAGE_CACHE_DIR, max_bytes=env.IMAGE_CACHE_MAX_BYTES)
+    if env.IMAGE_CACHE_MAX_BYTES > 0
+    else None
+)
+image_variants: Optional[ImageVariantConfig] = (
+    ImageVariantConfig(
+        widths=env.IMAGE_VARIANT_WIDTHS,
+        format=env.IMAGE_VARIANT_FORMAT,
+        quality=env.IMAGE_VARIANT_QUALITY,
+    )
+    if env.IMAGE_VARIANT_WIDTHS
+    else None
+)
+image_normalization: Optional[ImageNormalizationConfig] = (
+    ImageNormalizationConfig(
+        max_dimension=env.IMAGE_MAX_DIMENSION, quality=env.IMAGE_NORMALIZE_QUALITY
+    )
+    if env.IMAGE_NORMALIZE
+    else None
+)
 
 
 def get_user_service(
@@ -20,7 +72,10 @@ def get_user_service(
             secret_key=env.JWT_SECRET_KEY,
             algorithm=JWTAlgorithm(value=env.JWT_ALGORITHM),
             access_token_expire_minutes=env.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
+            refresh_token_expire_minutes=env.JWT_REFRESH_TOKEN_EXPIRE_MINUTES,
         ),
+        identity_cache=identity_cache,
+        token_versions=token_versions,
     )
 
 
@@ -49,9 +104,21 @@ def get_recipe_service(
 
 
 def get_image_service(
-    s3_client: S3_Client,
+    storage: Object_Storage,
+    db_session: Blocking_DB_Session,
 ) -> services.ImageService:
-    return services.ImageService(s3=s3_client)
+    return services.ImageService(
+        storage=storage,
+        pool=image_pool,
+        index=image_index,
+        variants=image_variants,
+        normalization=image_normalization,
+        presigned_url_ttl=env.S3_PRESIGNED_URL_EXPIRE_SECONDS,
+        cache=rendition_cache,
+        db_session=db_session,
+        batch_concurrency=env.IMAGE_BATCH_CONCURRENCY,
+        cache_control=env.IMAGE_CACHE_CONTROL,
+    )
 
 
 User_Service = Annotated[services.UserService, Depends(get_user_service)]
@@ -60,3 +127,59 @@ Ingredient_Service = Annotated[services.IngredientService, Depends(get_ingredien
 Store_Service = Annotated[services.StoreService, Depends(get_store_service)]
 Recipe_Service = Annotated[services.RecipeService, Depends(get_recipe_service)]
 Image_Service = Annotated[services.ImageService, Depends(get_image_service)]
+
+
+def get_async_user_service(
+    user_service: User_Service, async_db_session: Async_DB_Session
+) -> services.AsyncService[services.UserService]:
+    return services.AsyncService(user_service, async_session=async_db_session)
+
+
+def get_async_category_service(
+    category_service: Category_Service, async_db_session: Async_DB_Session
+) -> services.AsyncService[services.CategoryService]:
+    return services.AsyncService(category_service, async_session=async_db_session)
+
+
+def get_async_ingredient_service(
+    ingredient_service: Ingredient_Service, async_db_session: Async_DB_Session
+) -> services.AsyncService[services.IngredientService]:
+    return services.AsyncService(ingredient_service, async_session=async_db_session)
+
+
+def get_async_store_service(
+    store_service: Store_Service, async_db_session: Async_DB_Session
+) -> services.AsyncService[services.StoreService]:
+    return services.AsyncService(store_service, async_session=async_db_session)
+
+
+def get_async_recipe_service(
+    recipe_service: Recipe_Service, async_db_session: Async_DB_Session
+) -> services.AsyncService[services.RecipeService]:
+    return services.AsyncService(recipe_service, async_session=async_db_session)
+
+
+def get_async_image_service(
+    image_service: Image_Service,
+) -> services.AsyncService[services.ImageService]:
+    return services.AsyncService(image_service)
+
+
+Async_User_Service = Annotated[
+    services.AsyncService[services.UserService], Depends(get_async_user_service)
+]
+Async_Category_Service = Annotated[
+    services.AsyncService[services.CategoryService], Depends(get_async_category_service)
+]
+Async_Ingredient_Service = Annotated[
+    services.AsyncService[services.IngredientService], Depends(get_async_ingredient_service)
+]
+Async_Store_Service = Annotated[
+    services.AsyncService[services.StoreService], Depends(get_async_store_service)
+]
+Async_Recipe_Service = Annotated[
+    services.AsyncService[services.RecipeService], Depends(get_async_recipe_service)
+]
+Async_Image_Service = Annotated[
+    services.AsyncService[services.ImageService], Depends(get_async_image_service)
+]
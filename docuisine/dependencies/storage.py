@@ -1,13 +1,12 @@
 from typing import Annotated
 
-from botocore import client
 from fastapi import Depends
 
-from docuisine.db.storage import s3_storage
+from docuisine.db.storage import ObjectStorage, get_storage
 
 
-def get_s3_client() -> client.BaseClient:
-    return s3_storage
+def get_object_storage() -> ObjectStorage:
+    return get_storage()
 
 
-S3_Client = Annotated[client.BaseClient, Depends(get_s3_client)]
+Object_Storage = Annotated[ObjectStorage, Depends(get_object_storage)]
@@ -0,0 +1,77 @@
+from typing import Annotated, Any, Callable, Coroutine, get_args, get_origin
+
+from fastapi import Depends, HTTPException, Request, Response, UploadFile, status
+from fastapi.routing import APIRoute
+
+from docuisine.core.config import env
+from docuisine.schemas.image import UploadLimits
+from docuisine.utils.errors import UploadTooLargeError
+
+# Allowance for the boundaries, part headers and form fields around the files of a multipart body.
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def get_upload_limits() -> UploadLimits:
+    return UploadLimits(
+        max_size=env.IMAGE_MAX_UPLOAD_BYTES,
+        spool_threshold=env.IMAGE_SPOOL_THRESHOLD_BYTES,
+        max_files=env.IMAGE_BATCH_MAX_FILES,
+    )
+
+
+Upload_Limits = Annotated[UploadLimits, Depends(get_upload_limits)]
+
+
+class UploadRoute(APIRoute):
+    """Route rejecting a multipart body larger than its files may be, before it is parsed.
+
+    FastAPI parses a form, spooling every file in it, before it solves the dependencies
+    of the route, so `Upload_Limits` is only checked once the whole body has been read.
+    This route checks the `Content-Length` of the request first: the body may hold
+    `max_size` bytes for each file the route accepts (`max_files` for a list of files),
+    plus `MULTIPART_OVERHEAD`. Bodies of unknown length are still checked file by file
+    by `docuisine.utils.ingest.ingest_upload`.
+
+    Usage
+    -----
+    ```
+    router = APIRouter(prefix="/image", route_class=UploadRoute)
+    ```
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        files = [
+            get_origin(field.field_info.annotation) is list
+            for field in self.dependant.body_params
+            if _is_upload(field.field_info.annotation)
+        ]
+        if not files:
+            return handler
+
+        async def upload_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length", "")
+            if content_length.isdigit():
+                limits = request.app.dependency_overrides.get(
+                    get_upload_limits, get_upload_limits
+                )()
+                max_body = (
+                    sum(limits.max_files if many else 1 for many in files) * limits.max_size
+                    + MULTIPART_OVERHEAD
+                )
+                if int(content_length) > max_body:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                        detail=UploadTooLargeError(max_size=limits.max_size).message,
+                    )
+            return await handler(request)
+
+        return upload_handler
+
+
+def _is_upload(annotation: Any) -> bool:
+    """Whether a parameter annotation is an uploaded file, a list of them, or optionally one."""
+    return any(
+        isinstance(arg, type) and issubclass(arg, UploadFile)
+        for arg in (annotation, *get_args(annotation))
+    )
@@ -1,8 +1,6 @@
 from contextlib import asynccontextmanager
-import json
 import time
 
-from botocore.exceptions import ClientError
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
@@ -10,24 +8,12 @@ from starlette.responses import Response
 
 from docuisine import routes
 from docuisine.core.config import env
-from docuisine.db.database import engine
+from docuisine.db.database import async_engine, engine
 from docuisine.db.models.base import Base
-from docuisine.db.storage import s3_config, s3_storage
+from docuisine.db.storage import get_storage
+from docuisine.dependencies.services import image_pool
 from docuisine.utils.logs import setup_logging
 
-## Define S3 bucket policy to allow public read access to objects
-policy = {
-    "Version": "2012-10-17",
-    "Statement": [
-        {
-            "Effect": "Allow",
-            "Principal": "*",
-            "Action": ["s3:GetObject"],
-            "Resource": [f"arn:aws:s3:::{s3_config.bucket_name}/*"],
-        }
-    ],
-}
-
 
 @asynccontextmanager
 async def on_startup(app: FastAPI):
@@ -39,23 +25,14 @@ async def on_startup(app: FastAPI):
     This startup event runs when the application starts
     It does three things:
     1. Creates all database tables based on the defined models
-    2. Ensures the S3 bucket for image storage exists with the correct policy
+    2. Ensures the image storage exists (S3 bucket with a public-read policy, or directory)
     3. Sets up logging configuration
     """
     try:
         setup_logging()
         logger.info("Starting Docuisine application...")
         Base.metadata.create_all(bind=engine)
-        try:
-            logger.info(f"Checking if S3 bucket '{s3_config.bucket_name}' exists...")
-            s3_storage.head_bucket(Bucket=s3_config.bucket_name)
-            logger.info(f"S3 bucket '{s3_config.bucket_name}' already exists.")
-        except ClientError:
-            logger.warning(
-                f"S3 bucket '{s3_config.bucket_name}' does not exist. Creating bucket..."
-            )
-            s3_storage.create_bucket(Bucket=s3_config.bucket_name)
-            s3_storage.put_bucket_policy(Bucket=s3_config.bucket_name, Policy=json.dumps(policy))
+        get_storage().prepare()
         yield
     finally:
         # Dispose of the database engine when the application shuts down
@@ -66,7 +43,11 @@ async def on_startup(app: FastAPI):
                 f" Provided DATABASE_URL: {env.DATABASE_URL}"
             )
         else:
-            await engine.dispose()
+            engine.dispose()
+            if async_engine is not None:
+                await async_engine.dispose()
+        if image_pool is not None:
+            image_pool.shutdown()
 
 
 app = FastAPI(lifespan=on_startup)
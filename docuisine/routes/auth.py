@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException, status
 
 from docuisine.db.models import User
 from docuisine.dependencies import AuthForm
-from docuisine.dependencies.services import User_Service
+from docuisine.dependencies.services import Async_User_Service
 from docuisine.schemas import auth as auth_schemas
 from docuisine.schemas.common import Detail
 from docuisine.schemas.enums import TokenType
@@ -15,21 +15,21 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
     "/token",
     response_model=auth_schemas.Token,
     summary="User Login",
-    description="Authenticate user and return an access token.",
+    description="Authenticate user and return an access token and a refresh token.",
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_401_UNAUTHORIZED: {"model": Detail},
         status.HTTP_404_NOT_FOUND: {"model": Detail},
     },
 )
-async def login(form_data: AuthForm, user_service: User_Service) -> auth_schemas.Token:
+async def login(form_data: AuthForm, user_service: Async_User_Service) -> auth_schemas.Token:
     """
-    Authenticate user and return an access token.
+    Authenticate user and return a short-lived access token and a refresh token.
 
     Access Level: Public
     """
     try:
-        user = user_service.authenticate_user(
+        user = await user_service.authenticate_user(
             username=form_data.username, password=form_data.password
         )
     except errors.UserNotFoundError as e:
@@ -46,10 +46,44 @@ async def login(form_data: AuthForm, user_service: User_Service) -> auth_schemas
         )
 
     if isinstance(user, User):
-        access_token = user_service.create_access_token(user)
-        return auth_schemas.Token(access_token=access_token, token_type=TokenType.BEARER)
+        access_token = await user_service.create_access_token(user)
+        refresh_token = await user_service.create_refresh_token(user)
+        return auth_schemas.Token(
+            access_token=access_token, refresh_token=refresh_token, token_type=TokenType.BEARER
+        )
 
     raise HTTPException(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         detail="An unexpected error occurred during authentication.",
     )
+
+
+@router.post(
+    "/refresh",
+    response_model=auth_schemas.Token,
+    summary="Refresh Tokens",
+    description="Exchange a refresh token for a new access token and refresh token.",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_401_UNAUTHORIZED: {"model": Detail}},
+)
+async def refresh(
+    request: auth_schemas.RefreshRequest, user_service: Async_User_Service
+) -> auth_schemas.Token:
+    """
+    Exchange a refresh token for a new access token and refresh token.
+
+    Access Level: Public
+    """
+    try:
+        access_token, refresh_token = await user_service.refresh_tokens(
+            refresh_token=request.refresh_token
+        )
+    except errors.InvalidCredentialsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return auth_schemas.Token(
+        access_token=access_token, refresh_token=refresh_token, token_type=TokenType.BEARER
+    )
@@ -1,27 +1,51 @@
 from typing import Optional
 
-from fastapi import APIRouter, Form, HTTPException, status
+from fastapi import APIRouter, Form, HTTPException, Request, status
 
 from docuisine.db.models import Category
-from docuisine.dependencies import AuthenticatedUser, Category_Service, Image_Service
+from docuisine.dependencies import (
+    Async_Category_Service,
+    Async_Image_Service,
+    AuthenticatedUser,
+    Bulk_Limits,
+    Page_Params,
+    Upload_Limits,
+    UploadRoute,
+)
 from docuisine.schemas import category as category_schemas
 from docuisine.schemas.annotations import CategoryName, ImageUpload
-from docuisine.schemas.common import Detail
+from docuisine.schemas.common import BulkResult, Detail, Page
 from docuisine.utils import errors
+from docuisine.utils.bulk import bulk_request_body, ingest_items
+from docuisine.utils.ingest import ingest_upload
+from docuisine.utils.pagination import paginate
 from docuisine.utils.validation import validate_role
 
-router = APIRouter(prefix="/categories", tags=["Categories"])
+router = APIRouter(prefix="/categories", tags=["Categories"], route_class=UploadRoute)
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[category_schemas.CategoryOut])
-async def get_categories(category_service: Category_Service) -> list[category_schemas.CategoryOut]:
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[category_schemas.CategoryOut],
+    responses={status.HTTP_400_BAD_REQUEST: {"model": Detail}},
+)
+async def get_categories(
+    category_service: Async_Category_Service, pagination: Page_Params
+) -> Page[category_schemas.CategoryOut]:
     """
-    Get all categories.
+    Get all categories, one page at a time.
 
     Access Level: Public
     """
-    categories: list[Category] = category_service.get_all_categories()
-    return [category_schemas.CategoryOut.model_validate(category) for category in categories]
+    categories: list[Category] = await category_service.get_all_categories(
+        limit=pagination.limit + 1, after_id=pagination.after_id
+    )
+    categories, next_cursor = paginate(categories, pagination.limit)
+    return Page(
+        items=[category_schemas.CategoryOut.model_validate(category) for category in categories],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
@@ -31,7 +55,7 @@ async def get_categories(category_service: Category_Service) -> list[category_sc
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
 async def get_cuisine_by_name(
-    name: str, category_service: Category_Service
+    name: str, category_service: Async_Category_Service
 ) -> category_schemas.CategoryOut:
     """
     Get a cuisine by name.
@@ -39,7 +63,7 @@ async def get_cuisine_by_name(
     Access Level: Public
     """
     try:
-        category: Category = category_service.get_category(name=name)
+        category: Category = await category_service.get_category(name=name)
         return category_schemas.CategoryOut.model_validate(category)
     except errors.CategoryNotFoundError as e:
         raise HTTPException(
@@ -52,12 +76,18 @@ async def get_cuisine_by_name(
     "/",
     status_code=status.HTTP_201_CREATED,
     response_model=category_schemas.CategoryOut,
-    responses={status.HTTP_409_CONFLICT: {"model": Detail}},
+    responses={
+        status.HTTP_409_CONFLICT: {"model": Detail},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": Detail},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": Detail},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Detail},
+    },
 )
 async def create_category(
-    category_service: Category_Service,
+    category_service: Async_Category_Service,
     authenticated_user: AuthenticatedUser,
-    image_service: Image_Service,
+    image_service: Async_Image_Service,
+    upload_limits: Upload_Limits,
     name: CategoryName,
     image: Optional[ImageUpload] = None,
     description: Optional[str] = Form(
@@ -73,14 +103,30 @@ async def create_category(
     """
     validate_role(authenticated_user.role, "a")
     if image is not None:
-        image_set = image_service.upload_image(await image.read())
+        try:
+            with await ingest_upload(image, upload_limits) as upload:
+                image_set = await image_service.upload_spooled_image(upload)
+        except errors.UploadTooLargeError as e:
+            raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=e.message)
+        except errors.UnsupportedImageFormatError as e:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message
+            )
+        except errors.InvalidImageError as e:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message
+            )
+        except errors.WorkerPoolBusyError as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message)
 
     try:
-        new_category: Category = category_service.create_category(
+        new_category: Category = await category_service.create_category(
             name=name,
             description=description,
             img=image_set.original if image is not None else None,
             preview_img=image_set.preview if image is not None else None,
+            placeholder_img=image_set.placeholder if image is not None else None,
+            image_key=image_set.original if image is not None else None,
         )
         return category_schemas.CategoryOut.model_validate(new_category)
     except errors.CategoryExistsError as e:
@@ -90,6 +136,56 @@ async def create_category(
         )
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": Detail},
+        status.HTTP_403_FORBIDDEN: {"model": Detail},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": Detail},
+    },
+    openapi_extra=bulk_request_body(category_schemas.CategoryCreate),
+)
+async def create_categories(
+    request: Request,
+    category_service: Async_Category_Service,
+    authenticated_user: AuthenticatedUser,
+    bulk_limits: Bulk_Limits,
+) -> BulkResult:
+    """
+    Create many categories in one request.
+
+    Send a JSON array of categories, or one category per line as NDJSON
+    (`Content-Type: application/x-ndjson`). Each category gets its own status
+    in the response: an existing name (409) does not fail the others.
+
+    Access Level: Admin
+    """
+    validate_role(authenticated_user.role, "a")
+    try:
+        categories = await ingest_items(
+            request.stream(),
+            content_type=request.headers.get("content-type", ""),
+            schema=category_schemas.CategoryCreate,
+            limits=bulk_limits,
+        )
+    except errors.TooManyItemsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+    except (errors.BulkRequestTooLargeError, errors.BulkLineTooLongError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=e.message,
+        )
+    items = await category_service.create_categories(
+        [category.model_dump() for category in categories], chunk_size=bulk_limits.chunk_size
+    )
+    return BulkResult(items=items)
+
+
 @router.put(
     "/",
     status_code=status.HTTP_200_OK,
@@ -98,11 +194,12 @@ async def create_category(
         status.HTTP_403_FORBIDDEN: {"model": Detail},
         status.HTTP_404_NOT_FOUND: {"model": Detail},
         status.HTTP_409_CONFLICT: {"model": Detail},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": Detail},
     },
 )
 async def update_category(
     category: category_schemas.CategoryUpdate,
-    category_service: Category_Service,
+    category_service: Async_Category_Service,
     authenticated_user: AuthenticatedUser,
 ) -> category_schemas.CategoryOut:
     """
@@ -112,7 +209,7 @@ async def update_category(
     """
     validate_role(authenticated_user.role, "a")
     try:
-        updated_category: Category = category_service.update_category(
+        updated_category: Category = await category_service.update_category(
             category_id=category.id, name=category.name, description=category.description
         )
         return category_schemas.CategoryOut.model_validate(updated_category)
@@ -126,6 +223,11 @@ async def update_category(
             status_code=status.HTTP_409_CONFLICT,
             detail=e.message,
         )
+    except errors.ConstraintViolationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=e.message,
+        )
 
 
 @router.delete(
@@ -135,7 +237,9 @@ async def update_category(
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
 async def delete_category(
-    category_id: int, category_service: Category_Service, authenticated_user: AuthenticatedUser
+    category_id: int,
+    category_service: Async_Category_Service,
+    authenticated_user: AuthenticatedUser,
 ) -> Detail:
     """
     Delete a category by ID.
@@ -144,7 +248,7 @@ async def delete_category(
     """
     validate_role(authenticated_user.role, "a")
     try:
-        category_service.delete_category(category_id=category_id)
+        await category_service.delete_category(category_id=category_id)
         return Detail(detail=f"Category with ID {category_id} has been deleted.")
     except errors.CategoryNotFoundError as e:
         raise HTTPException(
@@ -1,23 +1,78 @@
-from fastapi import APIRouter, HTTPException, status
+from contextlib import ExitStack
+from typing import Annotated, Optional
 
-from docuisine.dependencies import AuthenticatedUser, Image_Service
+from fastapi import (
+    APIRouter,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import FileResponse, StreamingResponse
+
+from docuisine.dependencies import (
+    Async_Image_Service,
+    AuthenticatedUser,
+    Upload_Limits,
+    UploadRoute,
+)
 from docuisine.schemas import image as image_schemas
 from docuisine.schemas.annotations import ImageUpload
 from docuisine.schemas.common import Detail
-from docuisine.utils.errors import DecodingError
+from docuisine.utils.errors import (
+    DecodingError,
+    ImageNotFoundError,
+    InvalidImageError,
+    UnsupportedImageFormatError,
+    UnsupportedStorageOperationError,
+    UploadNotFoundError,
+    UploadTooLargeError,
+    WorkerPoolBusyError,
+)
+from docuisine.utils.ingest import ingest_base64, ingest_upload
 from docuisine.utils.validation import validate_role
 
-router = APIRouter(prefix="/image", tags=["Image"])
+router = APIRouter(prefix="/image", tags=["Image"], route_class=UploadRoute)
+
+
+@router.get(
+    "/stats",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_403_FORBIDDEN: {"model": Detail}},
+    response_model=image_schemas.DedupStats,
+)
+async def get_dedup_stats(
+    authenticated_user: AuthenticatedUser, image_service: Async_Image_Service
+) -> image_schemas.DedupStats:
+    """
+    Get how many uploads were skipped because the image was already stored.
+
+    Access Level: Admin
+    """
+    validate_role(authenticated_user.role, "a")
+    return await image_service.get_dedup_stats()
 
 
 @router.post(
     "/",
     status_code=status.HTTP_200_OK,
-    responses={status.HTTP_403_FORBIDDEN: {"model": Detail}},
+    responses={
+        status.HTTP_403_FORBIDDEN: {"model": Detail},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": Detail},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": Detail},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Detail},
+    },
     response_model=image_schemas.ImageSet,
 )
 async def upload_image(
-    authenticated_user: AuthenticatedUser, image_service: Image_Service, image: ImageUpload
+    authenticated_user: AuthenticatedUser,
+    image_service: Async_Image_Service,
+    upload_limits: Upload_Limits,
+    image: ImageUpload,
 ) -> image_schemas.ImageSet:
     """
     Upload images.
@@ -25,7 +80,17 @@ async def upload_image(
     Access Level: Admin
     """
     validate_role(authenticated_user.role, "a")
-    return image_service.upload_image(await image.read())
+    try:
+        with await ingest_upload(image, upload_limits) as upload:
+            return await image_service.upload_spooled_image(upload)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=e.message)
+    except UnsupportedImageFormatError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+    except InvalidImageError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+    except WorkerPoolBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message)
 
 
 @router.post(
@@ -34,22 +99,238 @@ async def upload_image(
     responses={
         status.HTTP_400_BAD_REQUEST: {"model": Detail},
         status.HTTP_403_FORBIDDEN: {"model": Detail},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": Detail},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": Detail},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Detail},
     },
     response_model=image_schemas.ImageSet,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"text/plain": {"schema": {"type": "string", "format": "base64"}}},
+        }
+    },
 )
 async def upload_image_base64(
-    authenticated_user: AuthenticatedUser, image_service: Image_Service, image: str
+    request: Request,
+    authenticated_user: AuthenticatedUser,
+    image_service: Async_Image_Service,
+    upload_limits: Upload_Limits,
 ) -> image_schemas.ImageSet:
     """
-    Upload images.
+    Upload images encoded in base64, sent as the request body.
 
     Access Level: Admin
     """
 
     try:
         validate_role(authenticated_user.role, "a")
-        return image_service.upload_image_base64(image)
+        with await ingest_base64(request.stream(), upload_limits) as upload:
+            return await image_service.upload_spooled_image(upload)
     except DecodingError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Error in decoding the image"
         )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=e.message)
+    except UnsupportedImageFormatError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+    except InvalidImageError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+    except WorkerPoolBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message)
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": Detail},
+        status.HTTP_403_FORBIDDEN: {"model": Detail},
+    },
+    response_model=image_schemas.ImageBatch,
+)
+async def upload_image_batch(
+    authenticated_user: AuthenticatedUser,
+    image_service: Async_Image_Service,
+    upload_limits: Upload_Limits,
+    images: Annotated[list[UploadFile], File()],
+) -> image_schemas.ImageBatch:
+    """
+    Upload several images in one request.
+
+    Each image gets its own status in the response: a rejected image
+    (too large, unsupported or busy server) does not fail the others.
+
+    Access Level: Admin
+    """
+    validate_role(authenticated_user.role, "a")
+    if len(images) > upload_limits.max_files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch holds at most {upload_limits.max_files} images",
+        )
+
+    items: list[Optional[image_schemas.ImageBatchItem]] = [None] * len(images)
+    with ExitStack() as uploads:
+        accepted = {}
+        for position, image in enumerate(images):
+            try:
+                accepted[position] = uploads.enter_context(
+                    await ingest_upload(image, upload_limits)
+                )
+            except UploadTooLargeError as e:
+                items[position] = image_schemas.ImageBatchItem(
+                    status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=e.message
+                )
+        results = await image_service.upload_spooled_images(list(accepted.values()))
+    for position, result in zip(accepted, results):
+        items[position] = result
+
+    return image_schemas.ImageBatch(
+        items=[
+            item.model_copy(update={"filename": image.filename})  # type: ignore
+            for item, image in zip(items, images)
+        ]
+    )
+
+
+@router.post(
+    "/uploads",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_403_FORBIDDEN: {"model": Detail},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": Detail},
+        status.HTTP_501_NOT_IMPLEMENTED: {"model": Detail},
+    },
+    response_model=image_schemas.PresignedUpload,
+)
+async def create_presigned_upload(
+    upload_request: image_schemas.PresignedUploadRequest,
+    authenticated_user: AuthenticatedUser,
+    image_service: Async_Image_Service,
+    upload_limits: Upload_Limits,
+) -> image_schemas.PresignedUpload:
+    """
+    Get a URL to upload an image directly to storage.
+
+    Send the image with a PUT request to the returned URL and headers,
+    then call `POST /image/uploads/complete` with the returned key.
+    Only available when images are stored in S3.
+
+    Access Level: Admin
+    """
+    validate_role(authenticated_user.role, "a")
+    try:
+        return await image_service.create_presigned_upload(
+            content_type=upload_request.content_type,
+            size=upload_request.size,
+            limits=upload_limits,
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=e.message)
+    except UnsupportedStorageOperationError as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=e.message)
+
+
+@router.post(
+    "/uploads/complete",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_403_FORBIDDEN: {"model": Detail},
+        status.HTTP_404_NOT_FOUND: {"model": Detail},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": Detail},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": Detail},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Detail},
+    },
+    response_model=image_schemas.ImageSet,
+)
+async def complete_presigned_upload(
+    completion: image_schemas.PresignedUploadCompletion,
+    authenticated_user: AuthenticatedUser,
+    image_service: Async_Image_Service,
+    upload_limits: Upload_Limits,
+) -> image_schemas.ImageSet:
+    """
+    Process an image uploaded to a presigned URL.
+
+    Access Level: Admin
+    """
+    validate_role(authenticated_user.role, "a")
+    try:
+        return await image_service.complete_presigned_upload(
+            key=completion.key, limits=upload_limits
+        )
+    except UploadNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=e.message)
+    except UnsupportedImageFormatError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+    except InvalidImageError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+    except WorkerPoolBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message)
+
+
+@router.get(
+    "/{key}/metadata",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
+    response_model=image_schemas.ImageMetadata,
+)
+async def get_image_metadata(
+    key: str, image_service: Async_Image_Service
+) -> image_schemas.ImageMetadata:
+    """
+    Get the dimensions, size and variants of an uploaded image, e.g. to lay it out
+    before it loads.
+
+    Access Level: Public
+    """
+    try:
+        return await image_service.get_image_metadata(key)
+    except ImageNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+
+
+@router.get(
+    "/{key}",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={
+        status.HTTP_200_OK: {"content": {"image/*": {}}},
+        status.HTTP_304_NOT_MODIFIED: {"description": "The cached image is still valid"},
+        status.HTTP_404_NOT_FOUND: {"model": Detail},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Detail},
+    },
+)
+async def get_image(
+    key: str,
+    options: Annotated[image_schemas.RenditionOptions, Query()],
+    image_service: Async_Image_Service,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
+    """
+    Get an image, or a rendition of it resized to `width` and re-encoded to `format`.
+
+    Access Level: Public
+    """
+    try:
+        image = await image_service.get_image(key, options, if_none_match)
+    except ImageNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+    except WorkerPoolBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message)
+
+    headers = {"ETag": image.etag}
+    if image.cache_control is not None:
+        headers["Cache-Control"] = image.cache_control
+    if image.not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if image.path is not None:
+        return FileResponse(image.path, media_type=image.content_type, headers=headers)
+    if image.stream is not None:
+        headers["Content-Length"] = str(image.content_length)
+        return StreamingResponse(image.stream, media_type=image.content_type, headers=headers)
+    return Response(content=image.content, media_type=image.content_type, headers=headers)
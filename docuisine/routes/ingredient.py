@@ -1,30 +1,47 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 
 from docuisine.db.models import Ingredient
-from docuisine.dependencies import AuthenticatedUser, Ingredient_Service
+from docuisine.dependencies import (
+    Async_Ingredient_Service,
+    AuthenticatedUser,
+    Bulk_Limits,
+    Page_Params,
+)
 from docuisine.schemas import ingredient as ingredient_schemas
-from docuisine.schemas.common import Detail
+from docuisine.schemas.common import BulkResult, Detail, Page
 from docuisine.utils import errors
+from docuisine.utils.bulk import bulk_request_body, ingest_items
+from docuisine.utils.pagination import paginate
 from docuisine.utils.validation import validate_role
 
 router = APIRouter(prefix="/ingredients", tags=["Ingredients"])
 
 
 @router.get(
-    "/", status_code=status.HTTP_200_OK, response_model=list[ingredient_schemas.IngredientOut]
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[ingredient_schemas.IngredientOut],
+    responses={status.HTTP_400_BAD_REQUEST: {"model": Detail}},
 )
 async def get_ingredients(
-    ingredient_service: Ingredient_Service,
-) -> list[ingredient_schemas.IngredientOut]:
+    ingredient_service: Async_Ingredient_Service, pagination: Page_Params
+) -> Page[ingredient_schemas.IngredientOut]:
     """
-    Get all ingredients.
+    Get all ingredients, one page at a time.
 
     Access Level: Public
     """
-    ingredients: list[Ingredient] = ingredient_service.get_all_ingredients()
-    return [
-        ingredient_schemas.IngredientOut.model_validate(ingredient) for ingredient in ingredients
-    ]
+    ingredients: list[Ingredient] = await ingredient_service.get_all_ingredients(
+        limit=pagination.limit + 1, after_id=pagination.after_id
+    )
+    ingredients, next_cursor = paginate(ingredients, pagination.limit)
+    return Page(
+        items=[
+            ingredient_schemas.IngredientOut.model_validate(ingredient)
+            for ingredient in ingredients
+        ],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
@@ -34,7 +51,7 @@ async def get_ingredients(
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
 async def get_ingredient(
-    ingredient_id: int, ingredient_service: Ingredient_Service
+    ingredient_id: int, ingredient_service: Async_Ingredient_Service
 ) -> ingredient_schemas.IngredientOut:
     """
     Get an ingredient by ID.
@@ -42,7 +59,9 @@ async def get_ingredient(
     Access Level: Public
     """
     try:
-        ingredient: Ingredient = ingredient_service.get_ingredient(ingredient_id=ingredient_id)
+        ingredient: Ingredient = await ingredient_service.get_ingredient(
+            ingredient_id=ingredient_id
+        )
         return ingredient_schemas.IngredientOut.model_validate(ingredient)
     except errors.IngredientNotFoundError as e:
         raise HTTPException(
@@ -59,7 +78,7 @@ async def get_ingredient(
 )
 async def create_ingredient(
     ingredient: ingredient_schemas.IngredientCreate,
-    ingredient_service: Ingredient_Service,
+    ingredient_service: Async_Ingredient_Service,
     authenticated_user: AuthenticatedUser,
 ) -> ingredient_schemas.IngredientOut:
     """
@@ -69,7 +88,7 @@ async def create_ingredient(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        new_ingredient: Ingredient = ingredient_service.create_ingredient(
+        new_ingredient: Ingredient = await ingredient_service.create_ingredient(
             name=ingredient.name,
             description=ingredient.description,
             recipe_id=ingredient.recipe_id,
@@ -82,6 +101,57 @@ async def create_ingredient(
         )
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": Detail},
+        status.HTTP_403_FORBIDDEN: {"model": Detail},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": Detail},
+    },
+    openapi_extra=bulk_request_body(ingredient_schemas.IngredientCreate),
+)
+async def create_ingredients(
+    request: Request,
+    ingredient_service: Async_Ingredient_Service,
+    authenticated_user: AuthenticatedUser,
+    bulk_limits: Bulk_Limits,
+) -> BulkResult:
+    """
+    Create many ingredients in one request.
+
+    Send a JSON array of ingredients, or one ingredient per line as NDJSON
+    (`Content-Type: application/x-ndjson`). Each ingredient gets its own status
+    in the response: an existing name (409) or an unknown `recipe_id` (422)
+    does not fail the others.
+
+    Access Level: Admin, User
+    """
+    validate_role(authenticated_user.role, "au")
+    try:
+        ingredients = await ingest_items(
+            request.stream(),
+            content_type=request.headers.get("content-type", ""),
+            schema=ingredient_schemas.IngredientCreate,
+            limits=bulk_limits,
+        )
+    except errors.TooManyItemsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+    except (errors.BulkRequestTooLargeError, errors.BulkLineTooLongError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=e.message,
+        )
+    items = await ingredient_service.create_ingredients(
+        [ingredient.model_dump() for ingredient in ingredients], chunk_size=bulk_limits.chunk_size
+    )
+    return BulkResult(items=items)
+
+
 @router.put(
     "/{ingredient_id}",
     status_code=status.HTTP_200_OK,
@@ -89,12 +159,13 @@ async def create_ingredient(
     responses={
         status.HTTP_404_NOT_FOUND: {"model": Detail},
         status.HTTP_409_CONFLICT: {"model": Detail},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": Detail},
     },
 )
 async def update_ingredient(
     ingredient_id: int,
     ingredient: ingredient_schemas.IngredientUpdate,
-    ingredient_service: Ingredient_Service,
+    ingredient_service: Async_Ingredient_Service,
     authenticated_user: AuthenticatedUser,
 ) -> ingredient_schemas.IngredientOut:
     """
@@ -104,7 +175,7 @@ async def update_ingredient(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        updated_ingredient: Ingredient = ingredient_service.update_ingredient(
+        updated_ingredient: Ingredient = await ingredient_service.update_ingredient(
             ingredient_id=ingredient_id,
             name=ingredient.name,
             description=ingredient.description,
@@ -121,6 +192,11 @@ async def update_ingredient(
             status_code=status.HTTP_409_CONFLICT,
             detail=e.message,
         )
+    except errors.ConstraintViolationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=e.message,
+        )
 
 
 @router.delete(
@@ -131,7 +207,7 @@ async def update_ingredient(
 )
 async def delete_ingredient(
     ingredient_id: int,
-    ingredient_service: Ingredient_Service,
+    ingredient_service: Async_Ingredient_Service,
     authenticated_user: AuthenticatedUser,
 ) -> Detail:
     """
@@ -141,7 +217,7 @@ async def delete_ingredient(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        ingredient_service.delete_ingredient(ingredient_id=ingredient_id)
+        await ingredient_service.delete_ingredient(ingredient_id=ingredient_id)
         return Detail(detail=f"Ingredient with ID {ingredient_id} has been deleted.")
     except errors.IngredientNotFoundError as e:
         raise HTTPException(
@@ -1,42 +1,63 @@
 from fastapi import APIRouter, HTTPException, status
 
 from docuisine.db.models import Recipe
-from docuisine.dependencies import AuthenticatedUser, Recipe_Service
+from docuisine.dependencies import Async_Recipe_Service, AuthenticatedUser, Page_Params
 from docuisine.schemas import recipe as recipe_schemas
-from docuisine.schemas.common import Detail
+from docuisine.schemas.common import Detail, Page
 from docuisine.schemas.enums import Role
 from docuisine.utils import errors
+from docuisine.utils.pagination import paginate
 from docuisine.utils.validation import validate_role
 
 router = APIRouter(prefix="/recipes", tags=["Recipes"])
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[recipe_schemas.RecipeOut])
-async def get_recipes(recipe_service: Recipe_Service) -> list[recipe_schemas.RecipeOut]:
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[recipe_schemas.RecipeOut],
+    responses={status.HTTP_400_BAD_REQUEST: {"model": Detail}},
+)
+async def get_recipes(
+    recipe_service: Async_Recipe_Service, pagination: Page_Params
+) -> Page[recipe_schemas.RecipeOut]:
     """
-    Get all recipes.
+    Get all recipes, one page at a time.
 
     Access Level: Public
     """
-    recipes: list[Recipe] = recipe_service.get_all_recipes()
-    return [recipe_schemas.RecipeOut.model_validate(recipe) for recipe in recipes]
+    recipes: list[Recipe] = await recipe_service.get_all_recipes(
+        limit=pagination.limit + 1, after_id=pagination.after_id
+    )
+    recipes, next_cursor = paginate(recipes, pagination.limit)
+    return Page(
+        items=[recipe_schemas.RecipeOut.model_validate(recipe) for recipe in recipes],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
     "/user/{user_id}",
     status_code=status.HTTP_200_OK,
-    response_model=list[recipe_schemas.RecipeOut],
+    response_model=Page[recipe_schemas.RecipeOut],
+    responses={status.HTTP_400_BAD_REQUEST: {"model": Detail}},
 )
 async def get_recipes_by_user(
-    user_id: int, recipe_service: Recipe_Service
-) -> list[recipe_schemas.RecipeOut]:
+    user_id: int, recipe_service: Async_Recipe_Service, pagination: Page_Params
+) -> Page[recipe_schemas.RecipeOut]:
     """
-    Get all recipes created by a specific user.
+    Get all recipes created by a specific user, one page at a time.
 
     Access Level: Public
     """
-    recipes: list[Recipe] = recipe_service.get_recipes_by_user(user_id=user_id)
-    return [recipe_schemas.RecipeOut.model_validate(recipe) for recipe in recipes]
+    recipes: list[Recipe] = await recipe_service.get_recipes_by_user(
+        user_id=user_id, limit=pagination.limit + 1, after_id=pagination.after_id
+    )
+    recipes, next_cursor = paginate(recipes, pagination.limit)
+    return Page(
+        items=[recipe_schemas.RecipeOut.model_validate(recipe) for recipe in recipes],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
@@ -45,14 +66,16 @@ async def get_recipes_by_user(
     response_model=recipe_schemas.RecipeOut,
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
-async def get_recipe(recipe_id: int, recipe_service: Recipe_Service) -> recipe_schemas.RecipeOut:
+async def get_recipe(
+    recipe_id: int, recipe_service: Async_Recipe_Service
+) -> recipe_schemas.RecipeOut:
     """
     Get a recipe by ID.
 
     Access Level: Public
     """
     try:
-        recipe: Recipe = recipe_service.get_recipe(recipe_id=recipe_id)
+        recipe: Recipe = await recipe_service.get_recipe(recipe_id=recipe_id)
         return recipe_schemas.RecipeOut.model_validate(recipe)
     except errors.RecipeNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
@@ -66,7 +89,7 @@ async def get_recipe(recipe_id: int, recipe_service: Recipe_Service) -> recipe_s
 )
 async def create_recipe(
     recipe: recipe_schemas.RecipeCreate,
-    recipe_service: Recipe_Service,
+    recipe_service: Async_Recipe_Service,
     authenticated_user: AuthenticatedUser,
 ) -> recipe_schemas.RecipeOut:
     """
@@ -76,7 +99,7 @@ async def create_recipe(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        new_recipe: Recipe = recipe_service.create_recipe(
+        new_recipe: Recipe = await recipe_service.create_recipe(
             user_id=authenticated_user.id,
             name=recipe.name,
             ingredients=recipe.ingredients,
@@ -99,12 +122,13 @@ async def create_recipe(
     responses={
         status.HTTP_404_NOT_FOUND: {"model": Detail},
         status.HTTP_409_CONFLICT: {"model": Detail},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": Detail},
     },
 )
 async def update_recipe(
     recipe_id: int,
     recipe: recipe_schemas.RecipeUpdate,
-    recipe_service: Recipe_Service,
+    recipe_service: Async_Recipe_Service,
     authenticated_user: AuthenticatedUser,
 ) -> recipe_schemas.RecipeOut:
     """
@@ -113,11 +137,12 @@ async def update_recipe(
     Access Level: Admin, User
     """
     validate_role(authenticated_user.role, "au")
-    if authenticated_user.role == Role.USER:
-        if recipe_id not in {r.id for r in authenticated_user.recipes}:
-            raise errors.ForbiddenAccessError
+    if authenticated_user.role == Role.USER and not await recipe_service.is_recipe_owner(
+        recipe_id=recipe_id, user_id=authenticated_user.id
+    ):
+        raise errors.ForbiddenAccessError
     try:
-        updated: Recipe = recipe_service.update_recipe(
+        updated: Recipe = await recipe_service.update_recipe(
             recipe_id=recipe_id,
             name=recipe.name,
             cook_time_sec=recipe.cook_time_sec,
@@ -131,6 +156,8 @@ async def update_recipe(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except errors.RecipeExistsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except errors.ConstraintViolationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=e.message)
 
 
 @router.delete(
@@ -140,7 +167,7 @@ async def update_recipe(
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
 async def delete_recipe(
-    recipe_id: int, recipe_service: Recipe_Service, authenticated_user: AuthenticatedUser
+    recipe_id: int, recipe_service: Async_Recipe_Service, authenticated_user: AuthenticatedUser
 ) -> Detail:
     """
     Delete a recipe by ID.
@@ -148,11 +175,12 @@ async def delete_recipe(
     Access Level: Admin, User
     """
     validate_role(authenticated_user.role, "au")
-    if authenticated_user.role == Role.USER:
-        if recipe_id not in {r.id for r in authenticated_user.recipes}:
-            raise errors.ForbiddenAccessError
+    if authenticated_user.role == Role.USER and not await recipe_service.is_recipe_owner(
+        recipe_id=recipe_id, user_id=authenticated_user.id
+    ):
+        raise errors.ForbiddenAccessError
     try:
-        recipe_service.delete_recipe(recipe_id=recipe_id)
+        await recipe_service.delete_recipe(recipe_id=recipe_id)
         return Detail(detail=f"Recipe with ID {recipe_id} has been deleted.")
     except errors.RecipeNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
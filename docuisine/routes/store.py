@@ -1,24 +1,44 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 
 from docuisine.db.models import Store
-from docuisine.dependencies import AuthenticatedUser, Store_Service
+from docuisine.dependencies import (
+    Async_Store_Service,
+    AuthenticatedUser,
+    Bulk_Limits,
+    Page_Params,
+)
 from docuisine.schemas import store as store_schemas
-from docuisine.schemas.common import Detail
+from docuisine.schemas.common import BulkResult, Detail, Page
 from docuisine.utils import errors
+from docuisine.utils.bulk import bulk_request_body, ingest_items
+from docuisine.utils.pagination import paginate
 from docuisine.utils.validation import validate_role
 
 router = APIRouter(prefix="/stores", tags=["Stores"])
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[store_schemas.StoreOut])
-async def get_stores(store_service: Store_Service) -> list[store_schemas.StoreOut]:
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[store_schemas.StoreOut],
+    responses={status.HTTP_400_BAD_REQUEST: {"model": Detail}},
+)
+async def get_stores(
+    store_service: Async_Store_Service, pagination: Page_Params
+) -> Page[store_schemas.StoreOut]:
     """
-    Get all stores.
+    Get all stores, one page at a time.
 
     Access Level: Public
     """
-    stores: list[Store] = store_service.get_all_stores()
-    return [store_schemas.StoreOut.model_validate(store) for store in stores]
+    stores: list[Store] = await store_service.get_all_stores(
+        limit=pagination.limit + 1, after_id=pagination.after_id
+    )
+    stores, next_cursor = paginate(stores, pagination.limit)
+    return Page(
+        items=[store_schemas.StoreOut.model_validate(store) for store in stores],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
@@ -27,14 +47,14 @@ async def get_stores(store_service: Store_Service) -> list[store_schemas.StoreOu
     response_model=store_schemas.StoreOut,
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
-async def get_store(store_id: int, store_service: Store_Service) -> store_schemas.StoreOut:
+async def get_store(store_id: int, store_service: Async_Store_Service) -> store_schemas.StoreOut:
     """
     Get a store by ID.
 
     Access Level: Public
     """
     try:
-        store: Store = store_service.get_store(store_id=store_id)
+        store: Store = await store_service.get_store(store_id=store_id)
         return store_schemas.StoreOut.model_validate(store)
     except errors.StoreNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
@@ -48,7 +68,7 @@ async def get_store(store_id: int, store_service: Store_Service) -> store_schema
 )
 async def create_store(
     store: store_schemas.StoreCreate,
-    store_service: Store_Service,
+    store_service: Async_Store_Service,
     authenticated_user: AuthenticatedUser,
 ) -> store_schemas.StoreOut:
     """
@@ -58,7 +78,7 @@ async def create_store(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        new_store: Store = store_service.create_store(
+        new_store: Store = await store_service.create_store(
             name=store.name,
             address=store.address,
             longitude=store.longitude,
@@ -72,6 +92,56 @@ async def create_store(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=BulkResult,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": Detail},
+        status.HTTP_403_FORBIDDEN: {"model": Detail},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": Detail},
+    },
+    openapi_extra=bulk_request_body(store_schemas.StoreCreate),
+)
+async def create_stores(
+    request: Request,
+    store_service: Async_Store_Service,
+    authenticated_user: AuthenticatedUser,
+    bulk_limits: Bulk_Limits,
+) -> BulkResult:
+    """
+    Create many stores in one request.
+
+    Send a JSON array of stores, or one store per line as NDJSON
+    (`Content-Type: application/x-ndjson`). Each store gets its own status
+    in the response: out of range coordinates (422) do not fail the others.
+
+    Access Level: Admin, User
+    """
+    validate_role(authenticated_user.role, "au")
+    try:
+        stores = await ingest_items(
+            request.stream(),
+            content_type=request.headers.get("content-type", ""),
+            schema=store_schemas.StoreCreate,
+            limits=bulk_limits,
+        )
+    except errors.TooManyItemsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+    except (errors.BulkRequestTooLargeError, errors.BulkLineTooLongError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=e.message,
+        )
+    items = await store_service.create_stores(
+        [store.model_dump() for store in stores], chunk_size=bulk_limits.chunk_size
+    )
+    return BulkResult(items=items)
+
+
 @router.put(
     "/{store_id}",
     status_code=status.HTTP_200_OK,
@@ -79,12 +149,13 @@ async def create_store(
     responses={
         status.HTTP_404_NOT_FOUND: {"model": Detail},
         status.HTTP_409_CONFLICT: {"model": Detail},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": Detail},
     },
 )
 async def update_store(
     store_id: int,
     store: store_schemas.StoreUpdate,
-    store_service: Store_Service,
+    store_service: Async_Store_Service,
     authenticated_user: AuthenticatedUser,
 ) -> store_schemas.StoreOut:
     """
@@ -94,7 +165,7 @@ async def update_store(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        updated: Store = store_service.update_store(
+        updated: Store = await store_service.update_store(
             store_id=store_id,
             name=store.name,
             address=store.address,
@@ -109,6 +180,8 @@ async def update_store(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
     except errors.StoreExistsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+    except errors.ConstraintViolationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=e.message)
 
 
 @router.delete(
@@ -118,7 +191,7 @@ async def update_store(
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
 async def delete_store(
-    store_id: int, store_service: Store_Service, authenticated_user: AuthenticatedUser
+    store_id: int, store_service: Async_Store_Service, authenticated_user: AuthenticatedUser
 ) -> Detail:
     """
     Delete a store by ID.
@@ -127,7 +200,7 @@ async def delete_store(
     """
     validate_role(authenticated_user.role, "au")
     try:
-        store_service.delete_store(store_id=store_id)
+        await store_service.delete_store(store_id=store_id)
         return Detail(detail=f"Store with ID {store_id} has been deleted.")
     except errors.StoreNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
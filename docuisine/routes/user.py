@@ -3,26 +3,48 @@ from typing import Annotated
 from fastapi import APIRouter, Form, HTTPException, status
 
 from docuisine.db.models import User
-from docuisine.dependencies import AuthenticatedUser, Image_Service, User_Service
+from docuisine.dependencies import (
+    Async_Image_Service,
+    Async_User_Service,
+    AuthenticatedUser,
+    Page_Params,
+    Upload_Limits,
+    UploadRoute,
+)
 from docuisine.schemas import user as user_schemas
 from docuisine.schemas.annotations import ImageUpload
-from docuisine.schemas.common import Detail
+from docuisine.schemas.common import Detail, Page
 from docuisine.schemas.enums import Role
 from docuisine.utils import errors
+from docuisine.utils.ingest import ingest_upload
+from docuisine.utils.pagination import paginate
 from docuisine.utils.validation import validate_role
 
-router = APIRouter(prefix="/users", tags=["Users"])
+router = APIRouter(prefix="/users", tags=["Users"], route_class=UploadRoute)
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_model=list[user_schemas.UserOut])
-async def get_users(user_service: User_Service) -> list[user_schemas.UserOut]:
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=Page[user_schemas.UserOut],
+    responses={status.HTTP_400_BAD_REQUEST: {"model": Detail}},
+)
+async def get_users(
+    user_service: Async_User_Service, pagination: Page_Params
+) -> Page[user_schemas.UserOut]:
     """
-    Get all users.
+    Get all users, one page at a time.
 
     Access Level: Public
     """
-    users: list[User] = user_service.get_all_users()
-    return [user_schemas.UserOut.model_validate(user) for user in users]
+    users: list[User] = await user_service.get_all_users(
+        limit=pagination.limit + 1, after_id=pagination.after_id
+    )
+    users, next_cursor = paginate(users, pagination.limit)
+    return Page(
+        items=[user_schemas.UserOut.model_validate(user) for user in users],
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
@@ -31,14 +53,14 @@ async def get_users(user_service: User_Service) -> list[user_schemas.UserOut]:
     response_model=user_schemas.UserOut,
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
-async def get_user(username: str, user_service: User_Service) -> user_schemas.UserOut:
+async def get_user(username: str, user_service: Async_User_Service) -> user_schemas.UserOut:
     """
     Get a user by username.
 
     Access Level: Public
     """
     try:
-        user: User = user_service.get_user(username=username)
+        user: User = await user_service.get_user(username=username)
         return user_schemas.UserOut.model_validate(user)
     except errors.UserNotFoundError as e:
         raise HTTPException(
@@ -54,7 +76,7 @@ async def get_user(username: str, user_service: User_Service) -> user_schemas.Us
     responses={status.HTTP_409_CONFLICT: {"model": Detail}},
 )
 async def create_user(
-    user: user_schemas.UserCreate, user_service: User_Service
+    user: user_schemas.UserCreate, user_service: Async_User_Service
 ) -> user_schemas.UserOut:
     """
     Create a new user.
@@ -62,7 +84,7 @@ async def create_user(
     Access Level: Public
     """
     try:
-        new_user: User = user_service.create_user(user.username, user.password, user.email)
+        new_user: User = await user_service.create_user(user.username, user.password, user.email)
         return user_schemas.UserOut.model_validate(new_user)
     except errors.UserExistsError as e:
         raise HTTPException(
@@ -78,7 +100,7 @@ async def create_user(
     responses={status.HTTP_404_NOT_FOUND: {"model": Detail}},
 )
 async def delete_user(
-    user_id: int, user_service: User_Service, authenticated_user: AuthenticatedUser
+    user_id: int, user_service: Async_User_Service, authenticated_user: AuthenticatedUser
 ) -> Detail:
     """
     Delete a user by ID.
@@ -89,7 +111,7 @@ async def delete_user(
     if (authenticated_user.id != user_id) and (authenticated_user.role != Role.ADMIN):
         raise errors.ForbiddenAccessError
     try:
-        user_service.delete_user(user_id=user_id)
+        await user_service.delete_user(user_id=user_id)
         return Detail(detail=f"User with ID {user_id} has been deleted.")
     except errors.UserNotFoundError as e:
         raise HTTPException(
@@ -110,7 +132,7 @@ async def delete_user(
 )
 async def update_user_email(
     user: user_schemas.UserUpdateEmail,
-    user_service: User_Service,
+    user_service: Async_User_Service,
     authenticated_user: AuthenticatedUser,
 ) -> user_schemas.UserOut:
     """
@@ -122,7 +144,9 @@ async def update_user_email(
     if authenticated_user.id != user.id:
         raise errors.ForbiddenAccessError
     try:
-        updated_user: User = user_service.update_user_email(user_id=user.id, new_email=user.email)
+        updated_user: User = await user_service.update_user_email(
+            user_id=user.id, new_email=user.email
+        )
         return user_schemas.UserOut.model_validate(updated_user)
     except errors.UserNotFoundError as e:
         raise HTTPException(
@@ -146,7 +170,7 @@ async def update_user_email(
 )
 async def update_user_password(
     user: user_schemas.UserUpdatePassword,
-    user_service: User_Service,
+    user_service: Async_User_Service,
     authenticated_user: AuthenticatedUser,
 ) -> user_schemas.UserOut:
     """
@@ -158,7 +182,7 @@ async def update_user_password(
     if authenticated_user.id != user.id:
         raise errors.ForbiddenAccessError
     try:
-        updated_user: User = user_service.update_user_password(
+        updated_user: User = await user_service.update_user_password(
             user_id=user.id, old_password=user.old_password, new_password=user.new_password
         )
         return user_schemas.UserOut.model_validate(updated_user)
@@ -178,13 +202,20 @@ async def update_user_password(
     "/img",
     status_code=status.HTTP_200_OK,
     response_model=user_schemas.UserOut,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"model": Detail},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": Detail},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"model": Detail},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": Detail},
+    },
 )
 async def update_user_img(
     user_id: Annotated[int, Form()],
-    user_service: User_Service,
+    user_service: Async_User_Service,
     authenticated_user: AuthenticatedUser,
     fileb: ImageUpload,
-    image_service: Image_Service,
+    image_service: Async_Image_Service,
+    upload_limits: Upload_Limits,
 ) -> user_schemas.UserOut:
     """
     Update the current user's profile.
@@ -196,10 +227,15 @@ async def update_user_img(
         raise errors.ForbiddenAccessError
 
     try:
-        image_set = image_service.upload_image(await fileb.read())
-
-        updated_user = user_service.update_user_img(
-            user_id=user_id, img=image_set.original, preview_img=image_set.preview
+        with await ingest_upload(fileb, upload_limits) as upload:
+            image_set = await image_service.upload_spooled_image(upload)
+
+        updated_user = await user_service.update_user_img(
+            user_id=user_id,
+            img=image_set.original,
+            preview_img=image_set.preview,
+            placeholder_img=image_set.placeholder,
+            image_key=image_set.original,
         )
         return updated_user
 
@@ -208,6 +244,14 @@ async def update_user_img(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.message,
         )
+    except errors.UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=e.message)
+    except errors.UnsupportedImageFormatError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+    except errors.InvalidImageError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+    except errors.WorkerPoolBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=e.message)
 
 
 @router.put(
@@ -216,7 +260,7 @@ async def update_user_img(
 )
 async def toggle_user_role(
     user_id: int,
-    user_service: User_Service,
+    user_service: Async_User_Service,
     authenticated_user: AuthenticatedUser,
 ) -> user_schemas.UserOut:
     """
@@ -227,7 +271,7 @@ async def toggle_user_role(
     validate_role(authenticated_user.role, "a")
 
     try:
-        updated_user = user_service.toggle_user_role(user_id=user_id)
+        updated_user = await user_service.toggle_user_role(user_id=user_id)
     except errors.UserNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,6 +1,7 @@
 from . import (
     annotations,
     common,
+    database,
     enums,
     health,
     image,
@@ -15,6 +16,7 @@ from .health import HealthCheck
 __all__ = [
     "annotations",
     "common",
+    "database",
     "enums",
     "health",
     "image",
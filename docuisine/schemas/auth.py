@@ -1,8 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from .enums import JWTAlgorithm, TokenType
+from .enums import JWTAlgorithm, Role, TokenType
 
 
 class Token(BaseModel):
@@ -11,9 +11,39 @@ class Token(BaseModel):
     """
 
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: TokenType
 
 
+class RefreshRequest(BaseModel):
+    """
+    Schema for exchanging a refresh token for a new pair of tokens.
+    """
+
+    refresh_token: str
+
+
+class UserIdentity(BaseModel):
+    """
+    Identity of the user behind an access token.
+
+    Attributes
+    ----------
+    id : int
+        The user's unique identifier.
+    username : str
+        The user's username.
+    role : Role
+        The user's role at the time the token was authorized.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+    username: str
+    role: Role
+
+
 class JWTConfig(BaseModel):
     """
     Configuration settings for JWT authentication.
@@ -25,9 +55,12 @@ class JWTConfig(BaseModel):
     algorithm : str
         The algorithm used for signing the JWT tokens.
     access_token_expire_minutes : Optional[int]
-        The expiration time for access tokens in minutes. Defaults to 525600 (1 year).
+        The expiration time for access tokens in minutes. Defaults to 15.
+    refresh_token_expire_minutes : Optional[int]
+        The expiration time for refresh tokens in minutes. Defaults to 43200 (30 days).
     """
 
     secret_key: str
     algorithm: JWTAlgorithm = Field(default=JWTAlgorithm.HS256)
-    access_token_expire_minutes: Optional[int] = Field(default=60 * 24 * 365, ge=1)
+    access_token_expire_minutes: Optional[int] = Field(default=15, ge=1)
+    refresh_token_expire_minutes: Optional[int] = Field(default=60 * 24 * 30, ge=1)
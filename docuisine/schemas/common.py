@@ -1,7 +1,9 @@
 from datetime import datetime
-from typing import Optional
+from typing import Generic, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+T = TypeVar("T")
 
 
 class Detail(BaseModel):
@@ -40,6 +42,8 @@ class Entity(BaseModel):
         URL or path to the main image.
     preview_img : Optional[str]
         URL or path to the preview image.
+    placeholder_img : Optional[str]
+        Tiny inline version of the image, as a data URI, shown while the image loads.
     """
 
     img: Optional[str] = Field(
@@ -48,3 +52,97 @@ class Entity(BaseModel):
     preview_img: Optional[str] = Field(
         None, description="URL or path to the preview image", examples=["preview_image.jpg"]
     )
+    placeholder_img: Optional[str] = Field(
+        None,
+        description="Tiny inline version of the image, as a data URI",
+        examples=[
+            "data:image/webp;base64,UklGRiQAAABXRUJQVlA4IBgAAAAwAQCdASoBAAEAAQAcJaQAA3AA/v3AgAA="
+        ],
+    )
+
+
+class Pagination(BaseModel):
+    """
+    Keyset pagination parameters of a list request.
+
+    Attributes
+    ----------
+    limit : int
+        Maximum number of items to return.
+    after_id : Optional[int]
+        Only items with an ID greater than this are returned. `None` for the first page.
+    """
+
+    limit: int
+    after_id: Optional[int] = None
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    Schema for a page of items in list responses.
+
+    Attributes
+    ----------
+    items : list[T]
+        The items in this page, ordered by ID.
+    next_cursor : Optional[str]
+        Opaque cursor to request the next page with. `None` on the last page.
+    """
+
+    items: list[T]
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page", examples=["MTA"]
+    )
+
+
+class BulkLimits(BaseModel):
+    """
+    Limits of the bulk create routes.
+
+    Attributes
+    ----------
+    max_items : int
+        Most items accepted by one request.
+    chunk_size : int
+        Items inserted, and committed, together.
+    max_bytes : int
+        Largest body accepted by one request, in bytes.
+    max_line_bytes : int
+        Longest line accepted in an NDJSON body, in bytes.
+    """
+
+    max_items: int
+    chunk_size: int
+    max_bytes: int = Field(default=32 * 1024 * 1024, ge=1)
+    max_line_bytes: int = Field(default=64 * 1024, ge=1)
+
+
+class BulkItem(BaseModel):
+    """
+    Outcome of one item of a bulk create.
+    """
+
+    index: int = Field(..., description="Position of the item in the request", examples=[0])
+    status_code: int = Field(..., description="HTTP status of this item alone", examples=[201])
+    id: Optional[int] = Field(None, description="ID of the created row", examples=[1])
+    detail: Optional[str] = Field(None, description="Why the item was not created")
+
+
+class BulkResult(BaseModel):
+    """
+    Outcome of a bulk create, one item per element of the request in order.
+    """
+
+    items: list[BulkItem]
+
+    @computed_field
+    @property
+    def created(self) -> int:
+        """Number of rows created."""
+        return sum(1 for item in self.items if item.status_code == 201)
+
+    @computed_field
+    @property
+    def conflicts(self) -> int:
+        """Number of items that already existed."""
+        return sum(1 for item in self.items if item.status_code == 409)
@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+
+
+class QueryPlan(BaseModel):
+    """
+    Plan the database chose for one query issued by the services.
+    """
+
+    name: str = Field(..., description="Where the query comes from", examples=["Recipe.product"])
+    sql: str = Field(..., description="The statement explained, with sample values")
+    plan: list[str] = Field(..., description="The plan, one line per step")
+    sequential_scans: list[str] = Field(
+        ..., description="Tables read in full", examples=[["ingredients"]]
+    )
+
+
+class IndexReport(BaseModel):
+    """
+    Outcome of checking the indexes of the database against the queries of the services.
+    """
+
+    dialect: str = Field(..., description="The database dialect", examples=["postgresql"])
+    queries: list[QueryPlan] = Field(..., description="The plan of every query shape")
+    missing_indexes: list[str] = Field(
+        ..., description="Indexes declared by the models but absent from the database"
+    )
+    created_indexes: list[str] = Field(..., description="Missing indexes created")
+
+    @property
+    def sequential_scans(self) -> int:
+        """Number of queries reading a table in full."""
+        return sum(1 for query in self.queries if query.sequential_scans)
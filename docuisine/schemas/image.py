@@ -1,4 +1,8 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class S3Config(BaseModel):
@@ -17,6 +21,8 @@ class S3Config(BaseModel):
         The name of the S3 bucket to use. Default is "docuisine-images".
     region : str
         The region where the S3 bucket is located. Default is "apac" (Asia Pacific).
+    max_pool_connections : int
+        The maximum number of connections kept open to the S3 service. Default is 32.
     """
 
     endpoint_url: str
@@ -24,12 +30,257 @@ class S3Config(BaseModel):
     secret_key: str
     bucket_name: str = "docuisine-images"
     region: str = "apac"
+    max_pool_connections: int = Field(default=32, ge=1)
+
+
+class ObjectInfo(BaseModel):
+    """
+    Properties of an object in storage.
+
+    Attributes
+    ----------
+    key : str
+        The object key.
+    size : int
+        The size of the object in bytes.
+    last_modified : Optional[datetime]
+        When the object was last written, timezone-aware.
+    metadata : dict[str, str]
+        The user metadata stored with the object.
+    """
+
+    key: str
+    size: int
+    last_modified: Optional[datetime] = None
+    metadata: dict[str, str] = Field(default_factory=dict)
+
+
+class UploadLimits(BaseModel):
+    """
+    Limits applied while an upload is read from the request.
+
+    Attributes
+    ----------
+    max_size : int
+        The largest accepted image in bytes, after base64 decoding.
+    spool_threshold : int
+        The size in bytes above which the upload is buffered in a temporary file.
+    max_files : int
+        The most images accepted in one batch upload.
+    """
+
+    max_size: int = Field(default=20 * 1024 * 1024, ge=1)
+    spool_threshold: int = Field(default=1024 * 1024, ge=0)
+    max_files: int = Field(default=50, ge=1)
+
+
+class ImageVariantConfig(BaseModel):
+    """
+    Configuration of the responsive variants generated for every uploaded image.
+
+    Attributes
+    ----------
+    widths : list[int]
+        The maximum widths of the variants in pixels. Default is [64, 256, 1024].
+        Images are never upscaled, so a variant may be narrower than its width.
+    format : Literal["webp", "avif"]
+        The format the variants are encoded in. Default is "webp".
+    quality : int
+        The encoder quality, from 1 to 100. Default is 80.
+    """
+
+    widths: list[int] = Field(default=[64, 256, 1024], min_length=1)
+    format: Literal["webp", "avif"] = "webp"
+    quality: int = Field(default=80, ge=1, le=100)
+
+
+class ImageNormalizationConfig(BaseModel):
+    """
+    Configuration of the normalization applied to uploaded originals before they are stored.
+
+    Attributes
+    ----------
+    max_dimension : Optional[int]
+        The longest side of stored originals in pixels. Larger images are downscaled
+        and re-encoded. Default is None (no cap).
+    quality : int
+        The encoder quality of re-encoded originals, from 1 to 100. Default is 85.
+    """
+
+    max_dimension: Optional[int] = Field(default=None, gt=0)
+    quality: int = Field(default=85, ge=1, le=100)
+
+
+class ImageVariant(BaseModel):
+    """
+    Represents a resized copy of an image in a web-optimized format.
+    """
+
+    key: str = Field(..., description="Variant image", examples=["123940712123_w256.webp"])
+    width: int = Field(..., description="Maximum width in pixels", examples=[256])
+    format: str = Field(..., description="Image format", examples=["webp"])
 
 
 class ImageSet(BaseModel):
     """
-    Represents a set of images including the original and its preview.
+    Represents a set of images including the original, its preview and its variants.
     """
 
     original: str = Field(..., description="Original image", examples=["123940712123.jpg"])
     preview: str = Field(..., description="Preview image", examples=["1412312341234.jpg"])
+    variants: list[ImageVariant] = Field(
+        default_factory=list, description="Resized variants, from narrowest to widest"
+    )
+    placeholder: Optional[str] = Field(
+        None, description="Tiny inline version of the image, as a data URI"
+    )
+
+
+class ImageBatchItem(BaseModel):
+    """
+    Outcome of one image of a batch upload.
+    """
+
+    filename: Optional[str] = Field(None, description="Name of the uploaded file")
+    status_code: int = Field(..., description="HTTP status of this image alone", examples=[200])
+    detail: Optional[str] = Field(None, description="Why the image was rejected")
+    image: Optional[ImageSet] = Field(None, description="The stored images, if accepted")
+
+
+class ImageBatch(BaseModel):
+    """
+    Outcome of a batch upload, one item per file in upload order.
+    """
+
+    items: list[ImageBatchItem]
+
+
+class DedupStats(BaseModel):
+    """
+    Counters of image uploads skipped because the image was already stored.
+    """
+
+    local_hits: int = Field(..., description="Duplicates found in the local index")
+    remote_hits: int = Field(..., description="Duplicates found in the bucket")
+    misses: int = Field(..., description="Images that were uploaded")
+
+
+class PresignedUploadRequest(BaseModel):
+    """
+    Request for a URL to upload an image directly to the bucket.
+    """
+
+    content_type: Literal["image/jpeg", "image/png", "image/webp", "image/avif"] = Field(
+        ..., description="Content type of the image", examples=["image/jpeg"]
+    )
+    size: int = Field(..., gt=0, description="Size of the image in bytes", examples=[482133])
+
+
+class PresignedUpload(BaseModel):
+    """
+    A presigned URL to upload an image directly to the bucket.
+    """
+
+    key: str = Field(..., description="Key to pass to the completion endpoint")
+    url: str = Field(..., description="URL to send the image to")
+    method: Literal["PUT"] = Field(default="PUT", description="HTTP method to use")
+    headers: dict[str, str] = Field(..., description="Headers the request must include")
+    expires_in: int = Field(..., description="Seconds until the URL expires", examples=[900])
+
+
+class PresignedUploadCompletion(BaseModel):
+    """
+    Notification that an image was uploaded to a presigned URL.
+    """
+
+    key: str = Field(..., description="Key of the presigned upload")
+
+
+class RenditionOptions(BaseModel):
+    """
+    Query parameters selecting a rendition of a stored image.
+
+    Without `width` and `format`, the stored image is served as is.
+    """
+
+    width: Optional[int] = Field(
+        None, ge=1, le=4096, description="Maximum width in pixels; never upscaled", examples=[640]
+    )
+    format: Optional[Literal["jpeg", "png", "webp", "avif"]] = Field(
+        None, description="Format to re-encode to, by default the stored format"
+    )
+    quality: int = Field(80, ge=1, le=100, description="Encoder quality of the rendition")
+
+
+class ServedImage(BaseModel):
+    """
+    An image ready to be sent to a client, either whole or as a stream of chunks.
+
+    Attributes
+    ----------
+    etag : str
+        The strong entity tag of the image, including quotes.
+    content_type : str
+        The media type of the image.
+    cache_control : Optional[str]
+        The `Cache-Control` header of the response, if any.
+    not_modified : bool
+        Whether the client already has this image (`If-None-Match` matched).
+        When set, none of `content`, `stream` and `path` is given.
+    content : Optional[bytes]
+        The image data, for generated renditions.
+    stream : Optional[Iterator[bytes]]
+        The image data in chunks, for stored images.
+    path : Optional[Path]
+        The image as a local file, for stored images on the local filesystem.
+    content_length : Optional[int]
+        The size of the image in bytes.
+    """
+
+    etag: str
+    content_type: str
+    cache_control: Optional[str] = None
+    not_modified: bool = False
+    content: Optional[bytes] = None
+    stream: Optional[Iterator[bytes]] = None
+    path: Optional[Path] = None
+    content_length: Optional[int] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class ImageGCReport(BaseModel):
+    """
+    Outcome of a garbage collection of unreferenced images.
+    """
+
+    dry_run: bool = Field(..., description="Whether orphans were only reported")
+    scanned_objects: int = Field(..., description="Objects listed in the bucket")
+    scanned_bytes: int = Field(..., description="Total size of the listed objects")
+    referenced_objects: int = Field(..., description="Objects kept because an entity uses them")
+    recent_objects: int = Field(..., description="Unreferenced objects kept as too recent")
+    orphaned_objects: int = Field(..., description="Unreferenced objects past the grace period")
+    reclaimable_bytes: int = Field(..., description="Total size of the orphaned objects")
+    deleted_objects: int = Field(..., description="Orphaned objects deleted")
+
+
+class ImageMetadata(BaseModel):
+    """
+    Dimensions, size and renditions of an uploaded image, as recorded on upload.
+    """
+
+    key: str = Field(..., description="Original image", examples=["123940712123.jpg"])
+    sha: str = Field(..., description="Hex SHA-256 digest of the original image")
+    width: int = Field(..., description="Width of the original image in pixels", examples=[1920])
+    height: int = Field(..., description="Height of the original image in pixels", examples=[1080])
+    bytes: int = Field(..., description="Size of the original image in bytes", examples=[482133])
+    format: str = Field(..., description="Format of the original image", examples=["jpeg"])
+    preview: str = Field(..., description="Preview image", examples=["123940712123_preview.jpg"])
+    placeholder: Optional[str] = Field(
+        None, description="Tiny inline version of the image, as a data URI"
+    )
+    variants: list[ImageVariant] = Field(
+        default_factory=list, description="Resized variants, from narrowest to widest"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
@@ -3,6 +3,7 @@ from typing import Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 from .base import Default
+from .common import Entity
 
 
 class RecipeIngredient(BaseModel):
@@ -64,7 +65,7 @@ class RecipeUpdate(BaseModel):
     description: Optional[str] = Field(None, description="Recipe description")
 
 
-class RecipeOut(Default):
+class RecipeOut(Entity, Default):
     id: int = Field(..., description="Recipe's unique identifier", examples=[1])
     user_id: int = Field(..., description="ID of the user who created the recipe", examples=[1])
     name: str = Field(..., description="Recipe name", examples=["Chocolate Cake"])
@@ -1,14 +1,20 @@
+from .asynchronous import AsyncService
 from .category import CategoryService
 from .health import HealthService
 from .image import ImageService
+from .image_gc import ImageGCService
+from .index_advisor import IndexAdvisorService
 from .ingredient import IngredientService
 from .recipe import RecipeService
 from .store import StoreService
 from .user import UserService
 
 __all__ = [
+    "AsyncService",
     "UserService",
     "ImageService",
+    "ImageGCService",
+    "IndexAdvisorService",
     "CategoryService",
     "IngredientService",
     "StoreService",
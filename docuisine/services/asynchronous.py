@@ -0,0 +1,71 @@
+from functools import wraps
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+
+class AsyncService(Generic[S]):
+    """Awaitable variant of a synchronous service `docuisine.services`
+
+    Every method of the wrapped service becomes a coroutine that runs off the event loop,
+    either through `AsyncSession.run_sync` (async engine mode) or in the threadpool.
+    Business logic stays in the synchronous service.
+
+    Usage
+    -----
+    ```
+    category_service = AsyncService(CategoryService(session))
+    categories = await category_service.get_all_categories()
+    ```
+    """
+
+    def __init__(self, service: S, async_session: Optional[AsyncSession] = None):
+        """
+        Initialize the AsyncService with a synchronous service.
+
+        Parameters
+        ----------
+        service : S
+            The synchronous service to wrap (e.g., `CategoryService`).
+        async_session : Optional[AsyncSession], optional
+            The async session whose `sync_session` the service was built with.
+            When given, calls run on the async engine, otherwise in the threadpool.
+            By default None.
+        """
+        self.service = service
+        self.async_session = async_session
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.service, name)
+        if not callable(attribute):
+            return attribute
+
+        @wraps(attribute)
+        async def method(*args, **kwargs):
+            return await self.run(attribute, *args, **kwargs)
+
+        return method
+
+    async def run(self, function: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking callable without blocking the event loop.
+
+        Parameters
+        ----------
+        function : Callable[..., T]
+            The callable to run, usually a bound method of the wrapped service.
+        *args, **kwargs
+            Arguments passed through to `function`.
+
+        Returns
+        -------
+        T
+            The return value of `function`.
+        """
+        if self.async_session is not None:
+            return await self.async_session.run_sync(lambda _: function(*args, **kwargs))
+        return await run_in_threadpool(function, *args, **kwargs)
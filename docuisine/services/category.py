@@ -1,11 +1,16 @@
-from typing import Optional
+from typing import Any, Optional
 
 from loguru import logger
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from docuisine.db.bulk import bulk_insert
+from docuisine.db.database import is_unique_violation
 from docuisine.db.models import Category
+from docuisine.schemas.common import BulkItem
 from docuisine.utils.errors.category import CategoryExistsError, CategoryNotFoundError
+from docuisine.utils.errors.database import ConstraintViolationError
 
 
 class CategoryService:
@@ -18,6 +23,8 @@ class CategoryService:
         description: Optional[str] = None,
         img: Optional[str] = None,
         preview_img: Optional[str] = None,
+        placeholder_img: Optional[str] = None,
+        image_key: Optional[str] = None,
     ) -> Category:
         """
         Create a new category in the database.
@@ -32,6 +39,10 @@ class CategoryService:
             The image URL for the category. Default is None.
         preview_img : Optional[str]
             The preview image URL for the category. Default is None.
+        placeholder_img : Optional[str]
+            The inline placeholder of the image, as a data URI. Default is None.
+        image_key : Optional[str]
+            The key of the uploaded image in the `images` table. Default is None.
 
         Returns
         -------
@@ -48,7 +59,12 @@ class CategoryService:
         - This method commits the transaction immediately.
         """
         new_category = Category(
-            name=name, description=description, img=img, preview_img=preview_img
+            name=name,
+            description=description,
+            img=img,
+            preview_img=preview_img,
+            placeholder_img=placeholder_img,
+            image_key=image_key,
         )
         try:
             self.db_session.add(new_category)
@@ -60,6 +76,38 @@ class CategoryService:
             raise CategoryExistsError(name)
         return new_category
 
+    def create_categories(
+        self, categories: list[dict[str, Any]], chunk_size: int
+    ) -> list[BulkItem]:
+        """
+        Create many categories, skipping those whose name already exists.
+
+        Parameters
+        ----------
+        categories : list[dict[str, Any]]
+            The `name`, `description` and image URLs of every category.
+        chunk_size : int
+            Categories inserted, and committed, together.
+
+        Returns
+        -------
+        list[BulkItem]
+            The outcome of every category, in order: created (201) with its ID,
+            or existing name (409).
+
+        Notes
+        -----
+        - Each chunk is committed on its own, see `docuisine.db.bulk.bulk_insert`.
+        """
+        return bulk_insert(
+            self.db_session,
+            Category,
+            categories,
+            chunk_size,
+            key="name",
+            conflict_detail=lambda name: CategoryExistsError(name).message,
+        )
+
     def get_category(
         self, category_id: Optional[int] = None, name: Optional[str] = None
     ) -> Category:
@@ -106,16 +154,31 @@ class CategoryService:
 
         return result
 
-    def get_all_categories(self) -> list[Category]:
+    def get_all_categories(
+        self, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> list[Category]:
         """
         Retrieve all categories from the database.
 
+        Parameters
+        ----------
+        limit : Optional[int]
+            Maximum number of categories to return. Default is None (no limit).
+        after_id : Optional[int]
+            Only return categories with an ID greater than this (keyset pagination).
+            Default is None (from the start).
+
         Returns
         -------
         list[Category]
-            A list of all `Category` instances in the database.
+            The `Category` instances ordered by ID.
         """
-        return self.db_session.query(Category).all()
+        query = self.db_session.query(Category).order_by(Category.id)
+        if after_id is not None:
+            query = query.filter(Category.id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
     def update_category(
         self,
@@ -146,31 +209,41 @@ class CategoryService:
             If no category is found with the given ID.
         CategoryExistsError
             If updating the name would conflict with an existing category.
+        ConstraintViolationError
+            If the new values break another constraint.
 
         Notes
         -----
         - This method commits the transaction immediately.
+        - The category is updated and returned by a single `UPDATE ... RETURNING`
+          statement; the returned instance is detached from the session.
         - At least one of `name` or `description` should be provided.
         """
-        category = self._get_category_by_id(category_id)
-        if category is None:
-            logger.warning(f"Update category failed; category_id={category_id} not found")
-            raise CategoryNotFoundError(category_id=category_id)
-
-        if name is not None:
-            category.name = name
-        if description is not None:
-            category.description = description
-
+        values = {"name": name, "description": description}
+        statement = (
+            update(Category)
+            .where(Category.id == category_id)
+            .values({key: value for key, value in values.items() if value is not None})
+            .returning(Category)
+        )
         try:
+            category = self.db_session.scalars(statement).one_or_none()
+            if category is None:
+                logger.warning(f"Update category failed; category_id={category_id} not found")
+                raise CategoryNotFoundError(category_id=category_id)
+            # Detached before the commit, which would otherwise expire the returned row.
+            self.db_session.expunge(category)
             self.db_session.commit()
             logger.info(f"Updated category category_id={category_id}")
-        except IntegrityError:
+        except IntegrityError as e:
             self.db_session.rollback()
+            if name is not None and is_unique_violation(e):
+                logger.warning(f"Update category failed due to duplicate name={name}")
+                raise CategoryExistsError(name)
             logger.warning(
-                f"Update category failed due to duplicate name={name if name is not None else category.name}"
+                f"Update category failed; category_id={category_id} rejected by a constraint"
             )
-            raise CategoryExistsError(name if name is not None else category.name)
+            raise ConstraintViolationError
 
         return category
 
@@ -191,12 +264,15 @@ class CategoryService:
         Notes
         -----
         - This method commits the transaction immediately.
+        - The category's links to recipes are deleted with it by the database
+          (`ON DELETE CASCADE`).
         """
-        category = self._get_category_by_id(category_id)
-        if category is None:
+        deleted = self.db_session.execute(
+            delete(Category).where(Category.id == category_id).returning(Category.id)
+        ).scalar_one_or_none()
+        if deleted is None:
             logger.warning(f"Delete category failed; category_id={category_id} not found")
             raise CategoryNotFoundError(category_id=category_id)
-        self.db_session.delete(category)
         self.db_session.commit()
         logger.info(f"Deleted category category_id={category_id}")
 
@@ -1,81 +1,479 @@
 import base64
 import binascii
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from functools import cached_property
-from hashlib import md5
+from http import HTTPStatus
 from io import BytesIO
+import re
+import threading
+from typing import Iterator, Optional
+from uuid import uuid4
 
-from botocore import client
 from loguru import logger
-from PIL import Image, ImageFile
+from PIL import ExifTags, Image, ImageFile, ImageOps
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
+from docuisine.db.models import StoredImage
+from docuisine.db.storage import ObjectReader, ObjectStorage
 from docuisine.schemas.enums import ImageFormat
-from docuisine.schemas.image import ImageSet
-from docuisine.utils.errors import DecodingError, UnsupportedImageFormatError
+from docuisine.schemas.image import (
+    DedupStats,
+    ImageBatchItem,
+    ImageMetadata,
+    ImageNormalizationConfig,
+    ImageSet,
+    ImageVariant,
+    ImageVariantConfig,
+    ObjectInfo,
+    PresignedUpload,
+    RenditionOptions,
+    ServedImage,
+    UploadLimits,
+)
+from docuisine.utils.dedup import ContentIndex
+from docuisine.utils.disk_cache import DiskCache
+from docuisine.utils.errors import (
+    DecodingError,
+    ImageNotFoundError,
+    InvalidImageError,
+    ObjectNotFoundError,
+    UnsupportedImageFormatError,
+    UploadNotFoundError,
+    UploadTooLargeError,
+    WorkerPoolBusyError,
+)
+from docuisine.utils.ingest import CHUNK_SIZE, SpooledUpload
+from docuisine.utils.timing import StageTimer
+from docuisine.utils.workers import ProcessPool
+
+## Open regardless of truncated images
+ImageFile.LOAD_TRUNCATED_IMAGES = True  # type: ignore
+
+# Leading bytes identifying each format, as ((offset, signature), ...) and format.
+# Every signature of an entry must match, e.g. WebP is a RIFF container of type WEBP.
+MAGIC_BYTES: tuple[tuple[tuple[tuple[int, bytes], ...], str], ...] = (
+    (((0, b"\xff\xd8\xff"),), "jpeg"),
+    (((0, b"\x89PNG\r\n\x1a\n"),), "png"),
+    (((0, b"GIF87a"),), "gif"),
+    (((0, b"GIF89a"),), "gif"),
+    (((0, b"RIFF"), (8, b"WEBP")), "webp"),
+    (((4, b"ftypavif"),), "avif"),
+    (((4, b"ftypavis"),), "avif"),
+)
+
+PREVIEW_SIZE: tuple[int, int] = (256, 256)
+# Metadata removed from originals by normalization, as JPEG markers and PNG chunks.
+# JFIF (APP0), ICC profiles (APP2, iCCP) and Adobe color transforms (APP14) are kept.
+JPEG_METADATA_MARKERS = frozenset({0xE1, *range(0xE3, 0xEE), 0xEF, 0xFE})
+PNG_METADATA_CHUNKS = frozenset({b"eXIf", b"tEXt", b"zTXt", b"iTXt", b"tIME"})
+# Inline placeholders stay well under the 2 KB limit of S3 user metadata.
+PLACEHOLDER_SIZE: tuple[int, int] = (32, 32)
+PLACEHOLDER_QUALITY = 40
+
+# Presigned uploads land under this prefix until they are completed.
+STAGING_PREFIX = "uploads/"
+STAGED_KEY = re.compile(rf"{STAGING_PREFIX}[0-9a-f]{{32}}")
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Keys built by `_build_image_name` and `_build_variant_name`; only these are served.
+HASHED_IMAGE_NAME = re.compile(r"[0-9a-f]{32}(_[a-z0-9]+)?\.[a-z]+")
 
 
 class ImageService:
     def __init__(
         self,
-        s3: client.BaseClient,
+        storage: ObjectStorage,
+        pool: Optional[ProcessPool] = None,
+        index: Optional[ContentIndex[ImageSet]] = None,
+        variants: Optional[ImageVariantConfig] = None,
+        normalization: Optional[ImageNormalizationConfig] = None,
+        presigned_url_ttl: int = 900,
+        cache: Optional[DiskCache] = None,
+        db_session: Optional[Session] = None,
+        batch_concurrency: int = 4,
+        cache_control: Optional[str] = IMMUTABLE,
     ):
         """
-        Initialize the ImageService with S3 client.
+        Initialize the ImageService with object storage.
 
         Parameters
         ----------
-        s3 : client.BaseClient
-            The S3 client for interacting with the S3 storage.
+        storage : ObjectStorage
+            The storage holding the images, e.g. an S3 bucket or a local directory.
+        pool : Optional[ProcessPool], optional
+            Process pool running the CPU-bound image work,
+            by default None (run in the calling thread).
+        index : Optional[ContentIndex[ImageSet]], optional
+            Index of images already in storage. When given, images that are
+            already stored are not processed or uploaded again. By default None.
+        variants : Optional[ImageVariantConfig], optional
+            Responsive variants generated alongside the preview,
+            by default None (no variants).
+        normalization : Optional[ImageNormalizationConfig], optional
+            Normalization of originals before they are stored: EXIF orientation applied,
+            metadata stripped and, above `max_dimension`, downscaled.
+            By default None (originals are stored as uploaded).
+        presigned_url_ttl : int, optional
+            Seconds a presigned upload URL stays valid, by default 900.
+        cache : Optional[DiskCache], optional
+            Disk cache of the renditions served by `get_image`,
+            by default None (renditions are generated on every request).
+        db_session : Optional[Session], optional
+            Session recording the metadata of uploaded images in the `images` table,
+            which is also used to detect duplicates. By default None (not recorded).
+        batch_concurrency : int, optional
+            Images of a batch processed at the same time by `upload_spooled_images`,
+            by default 4.
+        cache_control : Optional[str], optional
+            `Cache-Control` stored with every object and sent with served images.
+            Objects are named after their content and never change, so by default
+            they are cached for a year without revalidation. None omits the header.
         """
-        self.s3 = s3
+        self.storage = storage
+        self.pool = pool
+        self.index = index
+        self.variants = variants
+        self.normalization = normalization
+        self.presigned_url_ttl = presigned_url_ttl
+        self.cache = cache
+        self.db_session = db_session
+        self.batch_concurrency = batch_concurrency
+        self.cache_control = cache_control
+        # Batch uploads store images from several threads; a session is not thread-safe.
+        self._db_lock = threading.Lock()
 
     def upload_image(self, image: bytes) -> ImageSet:
         """
-        Upload an image to the S3 bucket.
+        Upload an image to storage.
 
         Parameters
         ----------
-        image_bytes : bytes
+        image : bytes
             The image data in bytes.
 
         Returns
         -------
         ImageSet
-            The set of uploaded images including original and preview.
+            The set of uploaded images including original, preview and variants.
+
+        Notes
+        -----
+        - See `upload_spooled_image`, which the upload routes use to avoid
+          holding the request body in memory.
+        """
+        with SpooledUpload.from_bytes(image) as upload:
+            return self.upload_spooled_image(upload)
+
+    def upload_spooled_image(self, upload: SpooledUpload) -> ImageSet:
+        """
+        Upload an image that was streamed from the request to storage.
+
+        Parameters
+        ----------
+        upload : SpooledUpload
+            The image, as read by `docuisine.utils.ingest`.
+
+        Returns
+        -------
+        ImageSet
+            The set of uploaded images including original, preview and variants.
+
+        Raises
+        ------
+        UnsupportedImageFormatError
+            If the image format is not supported.
+        InvalidImageError
+            If the image has a supported signature but cannot be decoded.
+        WorkerPoolBusyError
+            If the image processing pool has no room for another job.
+
+        Notes
+        -----
+        - The format is sniffed from the leading bytes and the object key from the
+          hash computed while the upload was read, so duplicates are detected
+          before the image is loaded into memory.
+        - The image is decoded only once, at reduced resolution where the codec
+          supports it.
+        - The duration of each stage is logged with the upload.
+        - The original is uploaded while the preview and variants are generated,
+          and all uploads run concurrently, so the upload costs about one round-trip.
+        - Objects are named after the hash of the original, so an image that is
+          already stored is returned as is when an index or a database session
+          is configured.
+        - The dimensions, size, format and renditions of the image are recorded
+          in the `images` table when a database session is configured.
         """
-        buffer = BytesIO(image)
-        buffer.seek(0)
+        return self._store_image(upload)
 
-        format = self._determine_format(buffer)
-        self._validate_format(format)
-        original_image_name = self._build_image_name(image, format)
+    def upload_spooled_images(self, uploads: list[SpooledUpload]) -> list[ImageBatchItem]:
+        """
+        Upload a batch of images, `batch_concurrency` at a time.
 
-        preview_image = self._generate_image_preview(image)
-        preview_buffer = BytesIO(preview_image)
-        preview_buffer.seek(0)
+        Parameters
+        ----------
+        uploads : list[SpooledUpload]
+            The images, as read by `docuisine.utils.ingest`.
 
-        preview_image_name = self._build_image_name(preview_image, format)
+        Returns
+        -------
+        list[ImageBatchItem]
+            One item per upload, in the same order, holding either the stored
+            images or the status and reason of the rejection:
+            415 for unsupported formats, 422 for undecodable images and 503
+            when the image processing pool is busy.
+
+        Notes
+        -----
+        - Identical images within the batch are processed once and share their result.
+        - A rejected image does not affect the rest of the batch.
+        """
+        first_by_hash: dict[str, int] = {}
+        for position, upload in enumerate(uploads):
+            first_by_hash.setdefault(upload.md5, position)
+        unique = list(first_by_hash.values())
 
-        self.s3.upload_fileobj(
-            Bucket=self.s3.bucket_name,
-            Key=original_image_name,
-            Fileobj=buffer,
-            ExtraArgs={"ContentType": f"image/{format}"},
+        timer = StageTimer()
+        with timer.stage("batch"):
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.batch_concurrency, len(unique))),
+                thread_name_prefix="image-batch",
+            ) as executor:
+                results = dict(
+                    zip(unique, executor.map(self._store_batch_item, (uploads[i] for i in unique)))
+                )
+        items = [results[first_by_hash[upload.md5]] for upload in uploads]
+        rejected = sum(item.image is None for item in results.values())
+        logger.info(
+            f"Uploaded image batch files={len(uploads)} unique={len(unique)} "
+            f"rejected={rejected} timings={timer}"
         )
+        return items
+
+    def _store_batch_item(self, upload: SpooledUpload) -> ImageBatchItem:
+        """Store one image of a batch, turning the expected rejections into an item."""
+        try:
+            return ImageBatchItem(status_code=HTTPStatus.OK, image=self._store_image(upload))
+        except UnsupportedImageFormatError as e:
+            return ImageBatchItem(status_code=HTTPStatus.UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+        except InvalidImageError as e:
+            return ImageBatchItem(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail=e.message)
+        except WorkerPoolBusyError as e:
+            return ImageBatchItem(status_code=HTTPStatus.SERVICE_UNAVAILABLE, detail=e.message)
+
+    def create_presigned_upload(
+        self, content_type: str, size: int, limits: UploadLimits
+    ) -> PresignedUpload:
+        """
+        Create a URL to upload an image directly to storage.
 
-        self.s3.upload_fileobj(
-            Bucket=self.s3.bucket_name,
-            Key=preview_image_name,
-            Fileobj=preview_buffer,
-            ExtraArgs={"ContentType": f"image/{format}"},
+        Parameters
+        ----------
+        content_type : str
+            The content type of the image, e.g. "image/jpeg".
+        size : int
+            The exact size of the image in bytes.
+        limits : UploadLimits
+            The upload limits; only the maximum size applies.
+
+        Returns
+        -------
+        PresignedUpload
+            The URL and headers of the PUT request, and the key to complete it with.
+
+        Raises
+        ------
+        UploadTooLargeError
+            If `size` exceeds the maximum upload size.
+        UnsupportedStorageOperationError
+            If the storage backend does not support presigned uploads.
+
+        Notes
+        -----
+        - The content type and length are part of the signature,
+          so the storage rejects uploads that do not match them.
+        - The image is only processed once `complete_presigned_upload` is called.
+        """
+        if size > limits.max_size:
+            raise UploadTooLargeError(max_size=limits.max_size)
+        key = f"{STAGING_PREFIX}{uuid4().hex}"
+        url = self.storage.presign_put(key, content_type, size, self.presigned_url_ttl)
+        logger.info(f"Created presigned upload key={key} size={size}")
+        return PresignedUpload(
+            key=key,
+            url=url,
+            headers={"Content-Type": content_type, "Content-Length": str(size)},
+            expires_in=self.presigned_url_ttl,
         )
+
+    def complete_presigned_upload(self, key: str, limits: UploadLimits) -> ImageSet:
+        """
+        Process an image uploaded with `create_presigned_upload`.
+
+        Parameters
+        ----------
+        key : str
+            The key of the presigned upload.
+        limits : UploadLimits
+            The limits applied while the image is read back from storage.
+
+        Returns
+        -------
+        ImageSet
+            The set of stored images including original, preview and variants.
+
+        Raises
+        ------
+        UploadNotFoundError
+            If `key` is not a presigned upload or nothing was uploaded to it.
+        UploadTooLargeError
+            If the uploaded image exceeds the maximum upload size.
+        UnsupportedImageFormatError
+            If the image format is not supported.
+        InvalidImageError
+            If the image has a supported signature but cannot be decoded.
+        WorkerPoolBusyError
+            If the image processing pool has no room for another job.
+
+        Notes
+        -----
+        - The original is copied to its final key inside the storage rather than
+          uploaded again; only the preview and variants leave this server.
+        - The staged object is deleted once processed or rejected, but kept when
+          the pool is busy so that completion can be retried. The copy of an image
+          that cannot be decoded is deleted too.
+        """
+        if not STAGED_KEY.fullmatch(key):
+            raise UploadNotFoundError(key=key)
+        try:
+            reader = self.storage.get(key)
+        except ObjectNotFoundError:
+            raise UploadNotFoundError(key=key)
+
+        try:
+            if reader.size > limits.max_size:
+                raise UploadTooLargeError(max_size=limits.max_size)
+            with SpooledUpload(limits) as upload:
+                for chunk in reader.iter_chunks(CHUNK_SIZE):
+                    upload.write(chunk)
+                image_set = self._store_image(upload, staged_key=key)
+        except (UploadTooLargeError, UnsupportedImageFormatError, InvalidImageError):
+            self._delete_object(key)
+            raise
+        finally:
+            reader.close()
+        self._delete_object(key)
+        return image_set
+
+    def _store_image(self, upload: SpooledUpload, staged_key: Optional[str] = None) -> ImageSet:
+        """
+        Store an image with its preview and variants, unless it is already stored.
+
+        Parameters
+        ----------
+        upload : SpooledUpload
+            The image.
+        staged_key : Optional[str], optional
+            The key the image is already stored under in storage. When given,
+            the original is copied from there instead of uploaded. By default None.
+
+        Returns
+        -------
+        ImageSet
+            The set of stored images including original, preview and variants.
+
+        Notes
+        -----
+        - Keys are built from the hash of the uploaded bytes, before normalization,
+          so that duplicates are found without decoding them. Normalization is
+          deterministic, so a key still always names the same content.
+        - The original is stored while the renditions are generated. If the image
+          cannot be decoded, the stored original is deleted before the error is raised.
+        """
+        timer = StageTimer()
+        with timer.stage("sniff"):
+            format = self._determine_format(upload.head)
+            self._validate_format(format)
+            planned_image_set = self._plan_image_set(self._build_image_name(upload.md5, format))
+
+        with timer.stage("dedup"):
+            existing_image_set = self._find_existing_image(planned_image_set)
+        if existing_image_set is not None:
+            logger.info(f"Skipped upload of existing image original={existing_image_set.original}")
+            with timer.stage("record"):
+                self._record_image(existing_image_set, upload, format)
+            return existing_image_set
+
+        with timer.stage("read"):
+            image = upload.read()
+        bytes_saved = 0
+        if self.normalization is not None:
+            with timer.stage("normalize"):
+                normalized = self._normalize(image, format)
+            bytes_saved = len(image) - len(normalized)
+            if normalized != image:
+                image, staged_key = normalized, None
+
+        with ThreadPoolExecutor(
+            max_workers=2 + len(planned_image_set.variants), thread_name_prefix="object-upload"
+        ) as uploads:
+            if staged_key is None:
+                original_upload = uploads.submit(
+                    self._upload_object, planned_image_set.original, image, format
+                )
+            else:
+                original_upload = uploads.submit(
+                    self._copy_object, staged_key, planned_image_set.original, format
+                )
+            pending_uploads = [original_upload]
+            with timer.stage("resize"):
+                try:
+                    preview_image, variant_images, placeholder = self._generate_renditions(
+                        image, format
+                    )
+                except InvalidImageError:
+                    # Keys name the content, so no complete image set can ever exist under
+                    # this one: the original stored alongside the decode is deleted.
+                    wait([original_upload])
+                    self._delete_object(planned_image_set.original)
+                    raise
+            pending_uploads.append(
+                uploads.submit(
+                    self._upload_object,
+                    planned_image_set.preview,
+                    preview_image,
+                    format,
+                    {"placeholder": placeholder},
+                )
+            )
+            for variant in planned_image_set.variants:
+                pending_uploads.append(
+                    uploads.submit(
+                        self._upload_object,
+                        variant.key,
+                        variant_images[variant.width],
+                        variant.format,
+                    )
+                )
+
+            with timer.stage("upload"):
+                for pending_upload in pending_uploads:
+                    pending_upload.result()
         logger.info(
-            f"Uploaded image set original={original_image_name} preview={preview_image_name}"
+            f"Uploaded image set original={planned_image_set.original} "
+            f"preview={planned_image_set.preview} variants={len(planned_image_set.variants)} "
+            f"bytes_saved={bytes_saved} timings={timer}"
         )
-        return ImageSet(original=original_image_name, preview=preview_image_name)
+        image_set = planned_image_set.model_copy(update={"placeholder": placeholder})
+        self._record_image(image_set, upload, format, original=image)
+        if self.index is not None:
+            self.index.add(image_set.original, image_set)
+        return image_set
 
     def upload_image_base64(self, image: str) -> ImageSet:
         """
-        Upload a base64-encoded image to the S3 bucket.
+        Upload a base64-encoded image to storage.
 
         Parameters
         ----------
@@ -93,14 +491,448 @@ class ImageService:
         except (binascii.Error, ValueError):
             raise DecodingError
 
+    def get_dedup_stats(self) -> DedupStats:
+        """
+        Return how often uploads were skipped because the image was already stored.
+
+        Returns
+        -------
+        DedupStats
+            The hit and miss counters of the image index, all zero without an index.
+        """
+        if self.index is None:
+            return DedupStats(local_hits=0, remote_hits=0, misses=0)
+        return DedupStats(
+            local_hits=self.index.local_hits,
+            remote_hits=self.index.remote_hits,
+            misses=self.index.misses,
+        )
+
+    def get_image_metadata(self, key: str) -> ImageMetadata:
+        """
+        Get the dimensions, size and renditions of an uploaded image.
+
+        Parameters
+        ----------
+        key : str
+            The key of the original image, e.g. an `ImageSet.original`.
+
+        Returns
+        -------
+        ImageMetadata
+            The metadata recorded when the image was uploaded.
+
+        Raises
+        ------
+        ImageNotFoundError
+            If no metadata is recorded for `key`.
+
+        Notes
+        -----
+        - Answered from the `images` table; the storage is never queried.
+        """
+        record = self.db_session.get(StoredImage, key) if self.db_session is not None else None
+        if record is None:
+            raise ImageNotFoundError(key=key)
+        return ImageMetadata.model_validate(record)
+
+    def get_image(
+        self, key: str, options: RenditionOptions, if_none_match: Optional[str] = None
+    ) -> ServedImage:
+        """
+        Get a stored image, or a resized and re-encoded rendition of it.
+
+        Parameters
+        ----------
+        key : str
+            The key of the stored image, e.g. an `ImageSet.original`.
+        options : RenditionOptions
+            The width, format and quality of the rendition. Without width and
+            format, the stored image is streamed as is.
+        if_none_match : Optional[str], optional
+            The `If-None-Match` header of the request, by default None.
+
+        Returns
+        -------
+        ServedImage
+            The image, or a not-modified marker if `if_none_match` matches its ETag.
+
+        Raises
+        ------
+        ImageNotFoundError
+            If `key` is not an uploaded image or is not in storage.
+        WorkerPoolBusyError
+            If a rendition must be generated and the pool has no room for it.
+
+        Notes
+        -----
+        - Keys are content hashes, so the ETag is derived from the key and the
+          options, and revalidation never reaches the storage.
+        - Stored images on the local filesystem are returned as a `path`, so that
+          the server can send the file with `sendfile` instead of reading it.
+        - Renditions are served from the disk cache when one is configured.
+        - Images and renditions never change for a given key and options,
+          so they are served with the same `Cache-Control` as stored objects.
+        """
+        if not HASHED_IMAGE_NAME.fullmatch(key):
+            raise ImageNotFoundError(key=key)
+        stored_format = key.rsplit(".", 1)[1]
+        format = options.format or stored_format
+        etag = self._build_etag(key, options)
+        if if_none_match is not None and (
+            if_none_match.strip() == "*"
+            or etag in (tag.strip() for tag in if_none_match.split(","))
+        ):
+            return ServedImage(
+                etag=etag,
+                content_type=f"image/{format}",
+                cache_control=self.cache_control,
+                not_modified=True,
+            )
+
+        if options.width is None and options.format is None:
+            reader = self._get_object(key)
+            if reader.path is not None:
+                reader.close()
+                return ServedImage(
+                    etag=etag,
+                    content_type=f"image/{stored_format}",
+                    cache_control=self.cache_control,
+                    path=reader.path,
+                    content_length=reader.size,
+                )
+            return ServedImage(
+                etag=etag,
+                content_type=f"image/{stored_format}",
+                cache_control=self.cache_control,
+                stream=self._stream_body(reader),
+                content_length=reader.size,
+            )
+
+        cache_key = etag.strip('"')
+        content = self.cache.get(cache_key) if self.cache is not None else None
+        if content is None:
+            timer = StageTimer()
+            with timer.stage("download"):
+                with self._get_object(key) as reader:
+                    image = reader.read()
+            with timer.stage("render"):
+                content = self._render(image, options.width, format, options.quality)
+            if self.cache is not None:
+                self.cache.set(cache_key, content)
+            logger.info(f"Rendered image key={key} rendition={cache_key} timings={timer}")
+        return ServedImage(
+            etag=etag,
+            content_type=f"image/{format}",
+            cache_control=self.cache_control,
+            content=content,
+            content_length=len(content),
+        )
+
+    def _plan_image_set(self, original_name: str) -> ImageSet:
+        """
+        Build the object keys of every image derived from an original.
+
+        Parameters
+        ----------
+        original_name : str
+            The object key of the original image, as built by `_build_image_name`.
+
+        Returns
+        -------
+        ImageSet
+            The original, its preview and one variant per configured width.
+        """
+        variants = []
+        if self.variants is not None:
+            variants = [
+                ImageVariant(
+                    key=self._build_variant_name(original_name, f"w{width}", self.variants.format),
+                    width=width,
+                    format=self.variants.format,
+                )
+                for width in sorted(set(self.variants.widths))
+            ]
+        return ImageSet(
+            original=original_name,
+            preview=self._build_variant_name(original_name, "preview"),
+            variants=variants,
+        )
+
+    def _find_existing_image(self, planned_image_set: ImageSet) -> Optional[ImageSet]:
+        """
+        Look up an image in the index, then in the `images` table, then in storage.
+
+        Parameters
+        ----------
+        planned_image_set : ImageSet
+            The object keys the image would be stored under.
+
+        Returns
+        -------
+        Optional[ImageSet]
+            The stored image set, or None if the image must be uploaded.
+            Always None when neither an index nor a database session is configured.
+
+        Notes
+        -----
+        - The storage is only queried when an index is configured and the image
+          is not recorded, e.g. for images uploaded before the table existed.
+        - With a database session, an image found in the index is only trusted
+          if it is still recorded: `ImageGCService` deletes the record of an image
+          before its objects, from another process, so the index cannot be told.
+        """
+        if self.index is not None:
+            image_set = self.index.peek(planned_image_set.original)
+            if image_set is not None and image_set.variants == planned_image_set.variants:
+                if self._is_recorded(image_set.original):
+                    self.index.record_local_hit()
+                    return image_set
+                self.index.discard(image_set.original)
+
+        if self.db_session is not None:
+            with self._db_lock:
+                record = self.db_session.get(StoredImage, planned_image_set.original)
+                image_set = (
+                    ImageSet(
+                        original=record.key,
+                        preview=record.preview,
+                        variants=record.variants,
+                        placeholder=record.placeholder,
+                    )
+                    if record is not None
+                    else None
+                )
+            if image_set is not None and image_set.variants == planned_image_set.variants:
+                if self.index is not None:
+                    self.index.record_remote_hit()
+                    self.index.add(image_set.original, image_set)
+                return image_set
+
+        if self.index is None:
+            return None
+        keys = [
+            planned_image_set.original,
+            planned_image_set.preview,
+            *(variant.key for variant in planned_image_set.variants),
+        ]
+        with ThreadPoolExecutor(max_workers=len(keys), thread_name_prefix="object-head") as heads:
+            stored = list(heads.map(self._head_object, keys))
+        if any(info is None for info in stored):
+            self.index.record_miss()
+            return None
+
+        self.index.record_remote_hit()
+        # The placeholder is kept in the metadata of the preview.
+        preview_metadata = stored[1].metadata  # type: ignore
+        image_set = planned_image_set.model_copy(
+            update={"placeholder": preview_metadata.get("placeholder")}
+        )
+        self.index.add(image_set.original, image_set)
+        return image_set
+
+    def _is_recorded(self, key: str) -> bool:
+        """
+        Check that an image still has its `images` record, or that none are kept.
+
+        The record is read from the database rather than the session's identity map,
+        which may hold it from before it was deleted.
+        """
+        if self.db_session is None:
+            return True
+        with self._db_lock:
+            return self.db_session.get(StoredImage, key, populate_existing=True) is not None
+
+    def _record_image(
+        self,
+        image_set: ImageSet,
+        upload: SpooledUpload,
+        format: str,
+        original: Optional[bytes] = None,
+    ) -> None:
+        """
+        Record the metadata of a stored image in the `images` table, if not already recorded.
+
+        Parameters
+        ----------
+        image_set : ImageSet
+            The stored images.
+        upload : SpooledUpload
+            The uploaded image.
+        format : str
+            The format of the original image.
+        original : Optional[bytes], optional
+            The stored original, when it was normalized, by default None (the upload).
+
+        Notes
+        -----
+        - Only the image header is parsed to read the dimensions.
+        - A record with the same variants is kept as is: it describes the stored
+          original, which may differ from the upload once normalized.
+        - A concurrent upload of the same image may record it first,
+          in which case its record is kept.
+        """
+        if self.db_session is None:
+            return
+        variants = [variant.model_dump() for variant in image_set.variants]
+        with self._db_lock:
+            existing = self.db_session.get(StoredImage, image_set.original)
+            if existing is not None and existing.variants == variants:
+                return
+        if original is None:
+            upload.file.seek(0)
+            with Image.open(upload.file) as img:
+                width, height = img.size
+            size = upload.size
+        else:
+            with Image.open(BytesIO(original)) as img:
+                width, height = img.size
+            size = len(original)
+        record = StoredImage(
+            key=image_set.original,
+            sha=upload.sha256,
+            width=width,
+            height=height,
+            bytes=size,
+            format=format,
+            preview=image_set.preview,
+            placeholder=image_set.placeholder,
+            variants=variants,
+        )
+        with self._db_lock:
+            try:
+                self.db_session.merge(record)
+                self.db_session.commit()
+            except IntegrityError:
+                self.db_session.rollback()
+                logger.info(
+                    f"Image already recorded by a concurrent upload key={image_set.original}"
+                )
+
+    def _head_object(self, key: str) -> Optional[ObjectInfo]:
+        """
+        Fetch the properties of an object in storage, e.g. with an S3 HEAD request.
+
+        Parameters
+        ----------
+        key : str
+            The object key.
+
+        Returns
+        -------
+        Optional[ObjectInfo]
+            The size and metadata of the object, or None if it does not exist.
+        """
+        return self.storage.head(key)
+
+    def _get_object(self, key: str) -> ObjectReader:
+        """
+        Start reading an object from storage.
+
+        Parameters
+        ----------
+        key : str
+            The object key.
+
+        Returns
+        -------
+        ObjectReader
+            The object, to be closed by the caller.
+
+        Raises
+        ------
+        ImageNotFoundError
+            If the object does not exist.
+        """
+        try:
+            return self.storage.get(key)
+        except ObjectNotFoundError:
+            raise ImageNotFoundError(key=key)
+
+    @staticmethod
+    def _stream_body(reader: ObjectReader) -> Iterator[bytes]:
+        """Yield an object in chunks, closing it once consumed or abandoned."""
+        try:
+            yield from reader.iter_chunks(CHUNK_SIZE)
+        finally:
+            reader.close()
+
     @staticmethod
-    def _build_image_name(image_bytes: bytes, format: str) -> str:
+    def _build_etag(key: str, options: RenditionOptions) -> str:
+        """
+        Build the strong ETag of an image or rendition from its key and options.
+
+        Parameters
+        ----------
+        key : str
+            The key of the stored image.
+        options : RenditionOptions
+            The rendition options.
+
+        Returns
+        -------
+        str
+            The quoted ETag, e.g. `"<hash>"` or `"<hash>_w640_q80.webp"`.
+        """
+        stem, stored_format = key.rsplit(".", 1)
+        if options.width is None and options.format is None:
+            return f'"{stem}"'
+        width = f"_w{options.width}" if options.width is not None else ""
+        return f'"{stem}{width}_q{options.quality}.{options.format or stored_format}"'
+
+    def _upload_object(
+        self, key: str, data: bytes, format: str, metadata: Optional[dict[str, str]] = None
+    ) -> None:
+        """
+        Store bytes under the given key, with the configured `Cache-Control`.
+
+        Parameters
+        ----------
+        key : str
+            The object key.
+        data : bytes
+            The object data.
+        format : str
+            The image format, used for the content type.
+        metadata : Optional[dict[str, str]], optional
+            ASCII user metadata stored with the object, by default None.
+        """
+        self.storage.put(key, data, f"image/{format}", self.cache_control, metadata)
+
+    def _copy_object(self, source_key: str, key: str, format: str) -> None:
+        """
+        Copy an object within storage.
+
+        Parameters
+        ----------
+        source_key : str
+            The key of the object to copy.
+        key : str
+            The key of the copy.
+        format : str
+            The image format, used for the content type.
+        """
+        self.storage.copy(source_key, key, f"image/{format}", self.cache_control)
+
+    def _delete_object(self, key: str) -> None:
+        """
+        Delete an object from storage.
+
+        Parameters
+        ----------
+        key : str
+            The object key.
+        """
+        self.storage.delete(key)
+
+    @staticmethod
+    def _build_image_name(image_hash: str, format: str) -> str:
         """
         Build a unique image name based on the MD5 hash of the image bytes.
         Parameters
         ----------
-        image_bytes : bytes
-            The image data in bytes.
+        image_hash : str
+            The hex MD5 digest of the image bytes.
         format : str
             The image format.
 
@@ -109,31 +941,58 @@ class ImageService:
         str
             The generated image name.
         """
-        image_hash = md5(image_bytes).hexdigest()
         return f"{image_hash}.{format}"
 
     @staticmethod
-    def _determine_format(image: BytesIO) -> str:
+    def _build_variant_name(image_name: str, variant: str, format: Optional[str] = None) -> str:
         """
-        Determine the format of the given image bytes.
+        Build the name of an image derived from another image, e.g. its preview.
 
+        Parameters
+        ----------
+        image_name : str
+            The name of the source image, as built by `_build_image_name`.
+        variant : str
+            The name of the variant, e.g. "preview" or "w256".
+        format : Optional[str], optional
+            The format of the variant, by default the format of the source image.
+
+        Returns
+        -------
+        str
+            The generated image name, e.g. "<hash>_preview.png" or "<hash>_w256.webp".
+        """
+        stem, image_format = image_name.rsplit(".", 1)
+        return f"{stem}_{variant}.{format or image_format}"
+
+    @staticmethod
+    def _determine_format(image: bytes) -> str:
+        """
+        Determine the format of the given image bytes from their magic bytes.
 
         Parameters
         ----------
-        image : BytesIO
-            The image data in bytes.
+        image : bytes
+            The leading bytes of the image.
 
         Returns
         -------
         str
-            The format of the image.
+            The format of the image, e.g. "jpeg" or "png".
+
+        Raises
+        ------
+        UnsupportedImageFormatError
+            If the bytes do not start with a known image signature.
         """
-        ## Open regardless of truncated images
-        ImageFile.LOAD_TRUNCATED_IMAGES = True  # type: ignore
-        image.seek(0)
-        with Image.open(image) as img:
-            image.seek(0)
-            return img.format.lower()
+        for signatures, format in MAGIC_BYTES:
+            if all(
+                image[offset : offset + len(signature)] == signature
+                for offset, signature in signatures
+            ):
+                return format
+        logger.warning("Unrecognized image signature received")
+        raise UnsupportedImageFormatError(format="unknown")
 
     def _validate_format(self, format: str) -> None:
         """
@@ -160,28 +1019,315 @@ class ImageService:
         """
         return {fmt.value.lower() for fmt in ImageFormat}
 
-    def _generate_image_preview(self, image: bytes, size: tuple[int, int] = (256, 256)) -> bytes:
+    def _generate_renditions(
+        self, image: bytes, format: str
+    ) -> tuple[bytes, dict[int, bytes], str]:
         """
-        Generate a preview of the image with the specified size.
+        Generate the preview, the configured variants and the placeholder of the image,
+        in the process pool when one is configured.
 
         Parameters
         ----------
-        image_name : str
-            The name of the image in the S3 bucket.
-        size : tuple[int, int]
-            The desired size (width, height) of the preview. Default is (256, 256).
+        image : bytes
+            The image data in bytes.
+        format : str
+            The format of the image, as returned by `_determine_format`.
 
         Returns
         -------
-        bytes
-            The preview image data in bytes.
+        tuple[bytes, dict[int, bytes], str]
+            The preview in the same format as the image, the variants by width,
+            and the placeholder as a data URI.
+        """
+        widths: tuple[int, ...] = ()
+        variant_format, quality = "webp", 80
+        if self.variants is not None:
+            widths = tuple(sorted(set(self.variants.widths)))
+            variant_format, quality = self.variants.format, self.variants.quality
+        args = (image, format, PREVIEW_SIZE, widths, variant_format, quality)
+        with _decoding():
+            if self.pool is None:
+                return generate_image_renditions(*args)
+            return self.pool.run(generate_image_renditions, *args)
+
+    def _normalize(self, image: bytes, format: str) -> bytes:
+        """
+        Normalize an original, in the process pool when one is configured.
+
+        See `normalize_image` for the parameters.
+        """
+        assert self.normalization is not None
+        args = (image, format, self.normalization.max_dimension, self.normalization.quality)
+        with _decoding():
+            if self.pool is None:
+                return normalize_image(*args)
+            return self.pool.run(normalize_image, *args)
+
+    def _render(self, image: bytes, width: Optional[int], format: str, quality: int) -> bytes:
+        """
+        Resize and re-encode an image, in the process pool when one is configured.
+
+        See `render_image` for the parameters.
         """
-        buffer = BytesIO(image)
-        buffer.seek(0)
+        if self.pool is None:
+            return render_image(image, width, format, quality)
+        return self.pool.run(render_image, image, width, format, quality)
+
+
+@contextmanager
+def _decoding() -> Iterator[None]:
+    """
+    Turn the errors of decoding a corrupt image into `InvalidImageError`.
+
+    Pillow reports a body that does not match its signature as an `OSError`
+    (e.g. "Truncated File Read"), a `SyntaxError` (e.g. "broken PNG file"),
+    or a `DecompressionBombError` for absurd dimensions.
+    """
+    try:
+        yield
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        raise InvalidImageError from e
+
+
+def normalize_image(
+    image: bytes, format: str, max_dimension: Optional[int], quality: int
+) -> bytes:
+    """
+    Apply the EXIF orientation of an image, strip its metadata and cap its size.
+
+    Defined at module level so that it can run in a worker process.
+
+    Parameters
+    ----------
+    image : bytes
+        The image data in bytes.
+    format : str
+        The format of the image, as returned by `ImageService._determine_format`.
+    max_dimension : Optional[int]
+        The longest side of the result in pixels; None keeps the image size.
+    quality : int
+        The encoder quality used when the image is re-encoded, from 1 to 100.
+
+    Returns
+    -------
+    bytes
+        The normalized image, in the same format.
+
+    Notes
+    -----
+    - Images that are upright and within `max_dimension` are not re-encoded:
+      their JPEG metadata segments or PNG text chunks are removed losslessly.
+    - Rotated or oversized images are decoded, transposed, downscaled and
+      re-encoded without EXIF. Their ICC profile is kept so colors do not shift.
+    - Animated images are returned unchanged.
+    """
+    with Image.open(BytesIO(image)) as img:
+        if getattr(img, "n_frames", 1) > 1:
+            return image
+        orientation = img.getexif().get(ExifTags.Base.Orientation, 1)
+        oversized = max_dimension is not None and max(img.size) > max_dimension
+        if orientation == 1 and not oversized:
+            return strip_metadata(image, format)
+
+        if max_dimension is not None:
+            img.draft(img.mode, (max_dimension, max_dimension))
+        img.load()
+        normalized = ImageOps.exif_transpose(img)
+        if max_dimension is not None:
+            normalized.thumbnail(
+                (max_dimension, max_dimension), Image.Resampling.LANCZOS, reducing_gap=2.0
+            )
+        if format == "jpeg" and normalized.mode not in ("RGB", "L", "CMYK"):
+            normalized = normalized.convert("RGB")
+        save_args: dict = {"quality": quality}
+        if img.info.get("icc_profile"):
+            save_args["icc_profile"] = img.info["icc_profile"]
+        buffer = BytesIO()
+        normalized.save(buffer, format=format.upper(), **save_args)
+        return buffer.getvalue()
+
+
+def strip_metadata(image: bytes, format: str) -> bytes:
+    """
+    Remove EXIF, XMP, text and comment metadata from a JPEG or PNG without re-encoding it.
+
+    Parameters
+    ----------
+    image : bytes
+        The image data in bytes.
+    format : str
+        The format of the image. Other formats than "jpeg" and "png" are returned unchanged.
+
+    Returns
+    -------
+    bytes
+        The image without metadata, or `image` if its structure is not understood.
+    """
+    if format == "jpeg":
+        return _strip_jpeg_metadata(image)
+    if format == "png":
+        return _strip_png_metadata(image)
+    return image
+
+
+def _strip_jpeg_metadata(image: bytes) -> bytes:
+    """Drop the metadata segments before the first scan of a JPEG."""
+    kept = [image[:2]]
+    position = 2
+    while True:
+        if position + 4 > len(image) or image[position] != 0xFF:
+            return image
+        marker = image[position + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker.
+            position += 1
+            continue
+        if marker == 0xDA:
+            # Start of scan: the compressed data follows, with no metadata after it.
+            kept.append(image[position:])
+            return b"".join(kept)
+        end = position + 2 + int.from_bytes(image[position + 2 : position + 4], "big")
+        if marker not in JPEG_METADATA_MARKERS:
+            kept.append(image[position:end])
+        position = end
+
+
+def _strip_png_metadata(image: bytes) -> bytes:
+    """Drop the EXIF, text and timestamp chunks of a PNG."""
+    kept = [image[:8]]
+    position = 8
+    while position + 12 <= len(image):
+        length = int.from_bytes(image[position : position + 4], "big")
+        chunk_type = image[position + 4 : position + 8]
+        end = position + 12 + length
+        if chunk_type not in PNG_METADATA_CHUNKS:
+            kept.append(image[position:end])
+        position = end
+        if chunk_type == b"IEND":
+            return b"".join(kept)
+    return image
+
+
+def render_image(image: bytes, width: Optional[int], format: str, quality: int) -> bytes:
+    """
+    Resize and re-encode an image.
+
+    Defined at module level so that it can run in a worker process.
+
+    Parameters
+    ----------
+    image : bytes
+        The image data in bytes.
+    width : Optional[int]
+        The maximum width of the rendition; None keeps the image size.
+        Images are never upscaled.
+    format : str
+        The format of the rendition, e.g. "webp".
+    quality : int
+        The encoder quality, from 1 to 100. Ignored by lossless formats.
+
+    Returns
+    -------
+    bytes
+        The rendition data in bytes.
+    """
+    with Image.open(BytesIO(image)) as img:
+        if width is not None:
+            img.draft(img.mode, (width, width))
+        img.load()
+        ImageOps.exif_transpose(img, in_place=True)
+        rendition: Image.Image = img
+        if width is not None and img.width > width:
+            height = max(1, round(img.height * width / img.width))
+            rendition = img.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        if format in ("webp", "avif"):
+            rendition = _to_web_mode(rendition)
+        elif format == "jpeg" and rendition.mode not in ("RGB", "L", "CMYK"):
+            rendition = rendition.convert("RGB")
+        buffer = BytesIO()
+        rendition.save(buffer, format=format.upper(), quality=quality)
+        return buffer.getvalue()
+
+
+def generate_image_renditions(
+    image: bytes,
+    format: str,
+    preview_size: tuple[int, int],
+    widths: tuple[int, ...],
+    variant_format: str,
+    quality: int,
+) -> tuple[bytes, dict[int, bytes], str]:
+    """
+    Generate the preview, the resized variants and the placeholder of an image
+    from a single decode.
+
+    Defined at module level so that it can run in a worker process.
+
+    Parameters
+    ----------
+    image : bytes
+        The image data in bytes.
+    format : str
+        The format of the image, as returned by `ImageService._determine_format`.
+    preview_size : tuple[int, int]
+        The bounding box (width, height) of the preview.
+    widths : tuple[int, ...]
+        The maximum widths of the variants.
+    variant_format : str
+        The format of the variants, e.g. "webp" or "avif".
+    quality : int
+        The encoder quality of the variants, from 1 to 100.
+
+    Returns
+    -------
+    tuple[bytes, dict[int, bytes], str]
+        The preview in the same format as the image, the variants by width,
+        and the placeholder as a WebP data URI.
+
+    Notes
+    -----
+    - JPEG images are decoded directly at the smallest scale (1/2, 1/4 or 1/8)
+      that still covers the largest rendition, instead of at full resolution.
+    - The EXIF orientation is applied, so that renditions of phone photos are upright.
+    - Variants are resized from the next larger variant rather than from the
+      original, and are never wider than the image itself.
+    - The placeholder is a heavily compressed thumbnail of the preview,
+      small enough to be inlined in list responses.
+    """
+    largest = max(preview_size[0], preview_size[1], *widths)
+    with Image.open(BytesIO(image)) as img:
+        img.draft(img.mode, (largest, largest))
+        img.load()
+        ImageOps.exif_transpose(img, in_place=True)
+
+        preview = img.copy()
+        preview.thumbnail(preview_size, reducing_gap=2.0)
+        preview_buffer = BytesIO()
+        preview.save(preview_buffer, format=format.upper())
+
+        variants: dict[int, bytes] = {}
+        source = _to_web_mode(img) if widths else img
+        for width in sorted(widths, reverse=True):
+            if source.width > width:
+                height = max(1, round(source.height * width / source.width))
+                source = source.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+            variant_buffer = BytesIO()
+            source.save(variant_buffer, format=variant_format.upper(), quality=quality)
+            variants[width] = variant_buffer.getvalue()
+
+        placeholder = _to_web_mode(preview)
+        placeholder.thumbnail(PLACEHOLDER_SIZE)
+        placeholder_buffer = BytesIO()
+        placeholder.save(placeholder_buffer, format="WEBP", quality=PLACEHOLDER_QUALITY)
+        placeholder_uri = "data:image/webp;base64," + base64.b64encode(
+            placeholder_buffer.getvalue()
+        ).decode("ascii")
+        return preview_buffer.getvalue(), variants, placeholder_uri
+
 
-        with Image.open(buffer) as img:
-            img.thumbnail(size)
-            preview_buffer = BytesIO()
-            img.save(preview_buffer, format=img.format)
-            preview_buffer.seek(0)
-            return preview_buffer.read()
+def _to_web_mode(img: Image.Image) -> Image.Image:
+    """Convert an image to RGB, or RGBA if it has transparency, for WebP and AVIF encoding."""
+    if img.mode in ("RGB", "RGBA"):
+        return img
+    has_alpha = img.mode in ("LA", "PA") or "transparency" in img.info
+    return img.convert("RGBA" if has_alpha else "RGB")
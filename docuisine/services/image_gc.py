@@ -0,0 +1,181 @@
+from datetime import datetime, timedelta, timezone
+import re
+from typing import Iterable, Iterator
+
+from loguru import logger
+from sqlalchemy import delete, select, union
+from sqlalchemy.orm import Session
+
+from docuisine.db.models import Base, StoredImage
+from docuisine.db.models.base import Entity
+from docuisine.db.storage import ObjectStorage
+from docuisine.schemas.image import ImageGCReport, ObjectInfo
+
+# Every object derived from an upload starts with the hash of the original.
+HASH_PREFIX = re.compile(r"[0-9a-f]{32}(?=[._])")
+# Maximum number of keys in one delete request (the S3 DeleteObjects limit).
+DELETE_BATCH_SIZE = 1000
+
+
+class ImageGCService:
+    def __init__(self, db_session: Session, storage: ObjectStorage):
+        """
+        Initialize the ImageGCService with a database session and object storage.
+
+        Parameters
+        ----------
+        db_session : Session
+            The session used to look up which images entities reference.
+        storage : ObjectStorage
+            The storage holding the images.
+        """
+        self.db_session = db_session
+        self.storage = storage
+
+    def collect(
+        self,
+        grace_period: timedelta = timedelta(days=1),
+        dry_run: bool = True,
+        batch_size: int = 500,
+    ) -> ImageGCReport:
+        """
+        Delete the objects in storage that no entity references (mark and sweep).
+
+        Parameters
+        ----------
+        grace_period : timedelta, optional
+            Unreferenced objects younger than this are kept, so that images
+            uploaded just before their entity is saved survive. By default 1 day.
+        dry_run : bool, optional
+            Only report the orphaned objects, by default True.
+        batch_size : int, optional
+            Number of listed keys checked against the database per query, by default 500.
+
+        Returns
+        -------
+        ImageGCReport
+            The counts of scanned, referenced, recent, orphaned and deleted objects.
+
+        Notes
+        -----
+        - The listing is streamed and checked in batches, and orphans are only kept
+          until they are deleted (never in a dry run), so memory does not grow with
+          the size of the storage.
+        - An original, its preview and its variants share the hash prefix of their
+          keys and are kept or deleted together: a family is referenced if any
+          `img` or `preview_img` column of any entity table names one of its keys.
+        - Abandoned presigned uploads are unreferenced and collected the same way.
+        - The `images` records of deleted originals are removed first, so that
+          uploads never find a record whose objects are gone. Servers confirm the
+          images of their dedup index against these records before returning them.
+        """
+        cutoff = datetime.now(timezone.utc) - grace_period
+        report = ImageGCReport(
+            dry_run=dry_run,
+            scanned_objects=0,
+            scanned_bytes=0,
+            referenced_objects=0,
+            recent_objects=0,
+            orphaned_objects=0,
+            reclaimable_bytes=0,
+            deleted_objects=0,
+        )
+        orphans: list[str] = []
+        for batch in self._batch_families(self.storage.iter_objects(), batch_size):
+            referenced = {self._family(key) for key in self._find_referenced(o.key for o in batch)}
+            for obj in batch:
+                report.scanned_objects += 1
+                report.scanned_bytes += obj.size
+                if self._family(obj.key) in referenced:
+                    report.referenced_objects += 1
+                elif obj.last_modified is not None and obj.last_modified > cutoff:
+                    report.recent_objects += 1
+                else:
+                    report.orphaned_objects += 1
+                    report.reclaimable_bytes += obj.size
+                    if not dry_run:
+                        orphans.append(obj.key)
+
+            while len(orphans) >= DELETE_BATCH_SIZE:
+                report.deleted_objects += self._delete_images(orphans[:DELETE_BATCH_SIZE])
+                orphans = orphans[DELETE_BATCH_SIZE:]
+        if orphans:
+            report.deleted_objects += self._delete_images(orphans)
+
+        logger.info(
+            f"Collected unreferenced images dry_run={dry_run} "
+            f"scanned={report.scanned_objects} orphaned={report.orphaned_objects} "
+            f"reclaimable_bytes={report.reclaimable_bytes} deleted={report.deleted_objects}"
+        )
+        return report
+
+    def _batch_families(
+        self, objects: Iterable[ObjectInfo], batch_size: int
+    ) -> Iterator[list[ObjectInfo]]:
+        """
+        Group listed objects into batches of about `batch_size`.
+
+        Listings keep keys sharing a prefix together, so the objects of a family
+        are adjacent; a batch is only cut between two families.
+        """
+        batch: list[ObjectInfo] = []
+        for obj in objects:
+            if len(batch) >= batch_size and self._family(obj.key) != self._family(batch[-1].key):
+                yield batch
+                batch = []
+            batch.append(obj)
+        if batch:
+            yield batch
+
+    def _find_referenced(self, keys: Iterable[str]) -> set[str]:
+        """
+        Return which of `keys` an entity references, in a single query.
+
+        Parameters
+        ----------
+        keys : Iterable[str]
+            Object keys.
+
+        Returns
+        -------
+        set[str]
+            The keys found in an `img` or `preview_img` column.
+        """
+        keys = list(keys)
+        selects = [
+            select(column.label("key")).where(column.in_(keys))
+            for model in self._entity_models()
+            for column in (model.img, model.preview_img)
+        ]
+        return set(self.db_session.execute(union(*selects)).scalars().all())
+
+    def _delete_images(self, keys: list[str]) -> int:
+        """
+        Delete the `images` records, then the objects, of up to `DELETE_BATCH_SIZE` keys.
+
+        Returns
+        -------
+        int
+            The number of objects deleted.
+        """
+        self.db_session.execute(delete(StoredImage).where(StoredImage.key.in_(keys)))
+        self.db_session.commit()
+        return len(keys) - len(self.storage.delete_many(keys))
+
+    @staticmethod
+    def _entity_models() -> list[type]:
+        """Return every mapped model with image columns."""
+        return sorted(
+            (
+                mapper.class_
+                for mapper in Base.registry.mappers
+                if issubclass(mapper.class_, Entity)
+            ),
+            key=lambda model: model.__tablename__,
+        )
+
+    @staticmethod
+    def _family(key: str) -> str:
+        """Return the hash shared by an upload and its derived images, or the key itself."""
+        match = HASH_PREFIX.match(key)
+        return match.group(0) if match else key
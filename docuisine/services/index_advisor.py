@@ -0,0 +1,263 @@
+import json
+
+from loguru import logger
+from sqlalchemy import Index, Select, inspect, select
+from sqlalchemy.orm import Session
+
+from docuisine.db.models import (
+    Base,
+    Category,
+    Ingredient,
+    Recipe,
+    RecipeCategory,
+    RecipeIngredient,
+    RecipeStep,
+    Shelf,
+    Store,
+    User,
+)
+from docuisine.schemas.database import IndexReport, QueryPlan
+
+# Values bound in the explained queries. Plans depend on the shape of a query,
+# and only marginally on the values compared in it.
+SAMPLE_ID = 1
+SAMPLE_NAME = "sample"
+PAGE_SIZE = 20
+
+
+class IndexAdvisorService:
+    def __init__(self, db_session: Session):
+        """
+        Initialize the IndexAdvisorService with a database session.
+
+        Parameters
+        ----------
+        db_session : Session
+            The session on the database to check, ideally populated like production.
+        """
+        self.db_session = db_session
+
+    def advise(self, create_missing: bool = False) -> IndexReport:
+        """
+        Explain the queries of the services and report those reading a table in full.
+
+        Parameters
+        ----------
+        create_missing : bool, optional
+            Create the indexes declared by the models that the database lacks,
+            before explaining the queries. By default False.
+
+        Returns
+        -------
+        IndexReport
+            The plan of every query shape, and the missing and created indexes.
+
+        Raises
+        ------
+        NotImplementedError
+            If the database is neither PostgreSQL nor SQLite.
+
+        Notes
+        -----
+        - `create_all` does not add indexes to existing tables, so databases created
+          before an index was declared lack it until `create_missing` is used.
+        - On PostgreSQL, sequential scans are disabled while explaining, so that a
+          sequential scan is only chosen when no index can serve the query, however
+          small the table. Full scans of an index, without a condition, are reported
+          as well: the planner prefers them to a disabled sequential scan.
+        - On SQLite, every `SCAN` (a full pass over a table or one of its indexes)
+          is reported, as opposed to a `SEARCH`.
+        """
+        dialect = self.db_session.get_bind().dialect.name
+        if dialect not in ("postgresql", "sqlite"):
+            raise NotImplementedError(f"Explaining queries is not supported on {dialect}.")
+
+        missing = self._find_missing_indexes()
+        created: list[str] = []
+        if create_missing:
+            for index in missing:
+                index.create(bind=self.db_session.connection())
+                logger.info(f"Created index {index.name} on {index.table.name}")  # type: ignore
+                created.append(index.name)  # type: ignore
+            self.db_session.commit()
+            missing = []
+
+        try:
+            if dialect == "postgresql":
+                # Only lasts until the transaction is rolled back below.
+                self.db_session.connection().exec_driver_sql("SET LOCAL enable_seqscan = off")
+            queries = [
+                self._explain(name, statement, dialect) for name, statement in self._query_shapes()
+            ]
+        finally:
+            self.db_session.rollback()
+
+        report = IndexReport(
+            dialect=dialect,
+            queries=queries,
+            missing_indexes=[index.name for index in missing],  # type: ignore
+            created_indexes=created,
+        )
+        logger.info(
+            f"Explained queries dialect={dialect} queries={len(queries)} "
+            f"sequential_scans={report.sequential_scans} "
+            f"missing_indexes={len(report.missing_indexes)} created={len(created)}"
+        )
+        return report
+
+    def _find_missing_indexes(self) -> list[Index]:
+        """
+        Return the indexes declared by the models that the database lacks.
+
+        Tables that do not exist yet are skipped: `create_all` creates them
+        together with their indexes.
+        """
+        inspector = inspect(self.db_session.connection())
+        tables = set(inspector.get_table_names())
+        missing = []
+        for table in Base.metadata.sorted_tables:
+            if table.name not in tables:
+                continue
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            missing.extend(
+                index
+                for index in sorted(table.indexes, key=lambda index: index.name)  # type: ignore
+                if index.name not in existing
+            )
+        return missing
+
+    def _explain(self, name: str, statement: Select, dialect: str) -> QueryPlan:
+        """
+        Explain a query and find the tables it reads in full, directly or through an index.
+
+        Parameters
+        ----------
+        name : str
+            Where the query comes from.
+        statement : Select
+            The query, with sample values.
+        dialect : str
+            The database dialect, "postgresql" or "sqlite".
+
+        Returns
+        -------
+        QueryPlan
+            The plan of the query.
+        """
+        connection = self.db_session.connection()
+        sql = str(
+            statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+        )
+        plan: list[str] = []
+        sequential_scans: list[str] = []
+        if dialect == "postgresql":
+            result = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar_one()
+            if isinstance(result, str):
+                result = json.loads(result)
+            self._walk_postgresql_plan(result[0]["Plan"], 0, plan, sequential_scans)
+        else:
+            for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"):
+                detail: str = row[-1]
+                plan.append(detail)
+                # `SCAN CONSTANT ROW` is the single row of a SELECT without a table, e.g. EXISTS.
+                if detail.startswith("SCAN ") and detail != "SCAN CONSTANT ROW":
+                    sequential_scans.append(detail.split()[1])
+        return QueryPlan(name=name, sql=sql, plan=plan, sequential_scans=sequential_scans)
+
+    def _walk_postgresql_plan(
+        self, node: dict, depth: int, plan: list[str], sequential_scans: list[str]
+    ) -> None:
+        """Flatten a PostgreSQL JSON plan into lines, collecting its full scans."""
+        node_type = node["Node Type"]
+        line = node_type
+        if "Relation Name" in node:
+            line += f" on {node['Relation Name']}"
+        if "Index Name" in node:
+            line += f" using {node['Index Name']}"
+        if "Index Cond" in node:
+            line += f" ({node['Index Cond']})"
+        plan.append("  " * depth + line)
+        if node_type == "Seq Scan" or (
+            node_type in ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+            and "Index Cond" not in node
+        ):
+            sequential_scans.append(node.get("Relation Name", node.get("Index Name")))
+        for child in node.get("Plans", []):
+            self._walk_postgresql_plan(child, depth + 1, plan, sequential_scans)
+
+    @staticmethod
+    def _query_shapes() -> list[tuple[str, Select]]:
+        """
+        Return the queries the services and relationship loads issue, with sample values.
+
+        Keep in sync with the lookups of the services: a query missing here
+        is not checked. `test_query_shapes_cover_service_filters` fails when a
+        service filters on a column that none of these queries compares.
+        """
+        return [
+            (
+                "RecipeService.get_all_recipes",
+                select(Recipe).where(Recipe.id > SAMPLE_ID).order_by(Recipe.id).limit(PAGE_SIZE),
+            ),
+            (
+                "RecipeService.get_recipes_by_user",
+                select(Recipe)
+                .where(Recipe.user_id == SAMPLE_ID)
+                .order_by(Recipe.id)
+                .limit(PAGE_SIZE),
+            ),
+            (
+                "RecipeService.is_recipe_owner",
+                select(
+                    select(Recipe)
+                    .where(Recipe.id == SAMPLE_ID, Recipe.user_id == SAMPLE_ID)
+                    .exists()
+                ),
+            ),
+            (
+                "RecipeService.get_recipe(name=...)",
+                select(Recipe).where(Recipe.name == SAMPLE_NAME).limit(1),
+            ),
+            (
+                "StoreService.get_store(name=...)",
+                select(Store).where(Store.name == SAMPLE_NAME).limit(1),
+            ),
+            (
+                "IngredientService.get_ingredient(name=...)",
+                select(Ingredient).where(Ingredient.name == SAMPLE_NAME).limit(1),
+            ),
+            (
+                "CategoryService.get_category(name=...)",
+                select(Category).where(Category.name == SAMPLE_NAME).limit(1),
+            ),
+            (
+                "UserService.get_user(username=...)",
+                select(User).where(User.username == SAMPLE_NAME).limit(1),
+            ),
+            (
+                "Recipe.steps",
+                select(RecipeStep).where(RecipeStep.recipe_id.in_([SAMPLE_ID])),
+            ),
+            (
+                "Recipe.ingredients",
+                select(RecipeIngredient).where(RecipeIngredient.recipe_id.in_([SAMPLE_ID])),
+            ),
+            ("Recipe.product", select(Ingredient).where(Ingredient.recipe_id == SAMPLE_ID)),
+            (
+                "Ingredient.recipes",
+                select(RecipeIngredient).where(RecipeIngredient.ingredient_id == SAMPLE_ID),
+            ),
+            (
+                "Ingredient.stores",
+                select(Store)
+                .join(Shelf, Shelf.store_id == Store.id)
+                .where(Shelf.ingredient_id == SAMPLE_ID),
+            ),
+            (
+                "Category.recipes",
+                select(Recipe)
+                .join(RecipeCategory, RecipeCategory.recipe_id == Recipe.id)
+                .where(RecipeCategory.category_id == SAMPLE_ID),
+            ),
+            ("User.recipes", select(Recipe).where(Recipe.user_id == SAMPLE_ID)),
+        ]
@@ -1,10 +1,15 @@
-from typing import Optional
+from typing import Any, Optional
 
 from loguru import logger
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from docuisine.db.bulk import bulk_insert
+from docuisine.db.database import is_unique_violation
 from docuisine.db.models import Ingredient
+from docuisine.schemas.common import BulkItem
+from docuisine.utils.errors.database import ConstraintViolationError
 from docuisine.utils.errors.ingredient import IngredientExistsError, IngredientNotFoundError
 
 
@@ -51,6 +56,38 @@ class IngredientService:
             raise IngredientExistsError(name)
         return new_ingredient
 
+    def create_ingredients(
+        self, ingredients: list[dict[str, Any]], chunk_size: int
+    ) -> list[BulkItem]:
+        """
+        Create many ingredients, skipping those whose name already exists.
+
+        Parameters
+        ----------
+        ingredients : list[dict[str, Any]]
+            The `name`, `description` and `recipe_id` of every ingredient.
+        chunk_size : int
+            Ingredients inserted, and committed, together.
+
+        Returns
+        -------
+        list[BulkItem]
+            The outcome of every ingredient, in order: created (201) with its ID,
+            existing name (409), or unknown `recipe_id` (422).
+
+        Notes
+        -----
+        - Each chunk is committed on its own, see `docuisine.db.bulk.bulk_insert`.
+        """
+        return bulk_insert(
+            self.db_session,
+            Ingredient,
+            ingredients,
+            chunk_size,
+            key="name",
+            conflict_detail=lambda name: IngredientExistsError(name).message,
+        )
+
     def get_ingredient(
         self, ingredient_id: Optional[int] = None, name: Optional[str] = None
     ) -> Ingredient:
@@ -97,16 +134,31 @@ class IngredientService:
 
         return result
 
-    def get_all_ingredients(self) -> list[Ingredient]:
+    def get_all_ingredients(
+        self, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> list[Ingredient]:
         """
         Return all ingredients.
 
+        Parameters
+        ----------
+        limit : Optional[int]
+            Maximum number of ingredients to return. Default is None (no limit).
+        after_id : Optional[int]
+            Only return ingredients with an ID greater than this (keyset pagination).
+            Default is None (from the start).
+
         Returns
         -------
         list[Ingredient]
-            A list of all `Ingredient` instances in the database.
+            The `Ingredient` instances ordered by ID.
         """
-        return self.db_session.query(Ingredient).all()
+        query = self.db_session.query(Ingredient).order_by(Ingredient.id)
+        if after_id is not None:
+            query = query.filter(Ingredient.id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
     def update_ingredient(
         self,
@@ -140,29 +192,35 @@ class IngredientService:
             If no ingredient is found with the given ID.
         IngredientExistsError
             If an ingredient with the new name already exists.
+        ConstraintViolationError
+            If the new values break another constraint, e.g. an unknown `recipe_id`.
         """
-        ingredient = self._get_ingredient_by_id(ingredient_id)
-        if ingredient is None:
-            logger.warning(f"Update ingredient failed; ingredient_id={ingredient_id} not found")
-            raise IngredientNotFoundError(ingredient_id=ingredient_id)
-
-        if name is not None:
-            ingredient.name = name
-        if description is not None:
-            ingredient.description = description
-        if recipe_id is not None:
-            ingredient.recipe_id = recipe_id
-
+        values = {"name": name, "description": description, "recipe_id": recipe_id}
+        statement = (
+            update(Ingredient)
+            .where(Ingredient.id == ingredient_id)
+            .values({key: value for key, value in values.items() if value is not None})
+            .returning(Ingredient)
+        )
         try:
+            ingredient = self.db_session.scalars(statement).one_or_none()
+            if ingredient is None:
+                logger.warning(
+                    f"Update ingredient failed; ingredient_id={ingredient_id} not found"
+                )
+                raise IngredientNotFoundError(ingredient_id=ingredient_id)
+            self.db_session.expunge(ingredient)
             self.db_session.commit()
             logger.info(f"Updated ingredient ingredient_id={ingredient_id}")
-        except IntegrityError:
+        except IntegrityError as e:
             self.db_session.rollback()
-            # Use provided name, otherwise current name
+            if name is not None and is_unique_violation(e):
+                logger.warning(f"Update ingredient failed due to duplicate name={name}")
+                raise IngredientExistsError(name)
             logger.warning(
-                f"Update ingredient failed due to duplicate name={name if name is not None else ingredient.name}"
+                f"Update ingredient failed; ingredient_id={ingredient_id} rejected by a constraint"
             )
-            raise IngredientExistsError(name if name is not None else ingredient.name)
+            raise ConstraintViolationError
 
         return ingredient
 
@@ -174,12 +232,18 @@ class IngredientService:
         ------
         IngredientNotFoundError
             If no ingredient is found with the given ID.
+
+        Notes
+        -----
+        - The ingredient is removed from the recipes using it and the stores stocking it,
+          by the database (`ON DELETE CASCADE`).
         """
-        ingredient = self._get_ingredient_by_id(ingredient_id)
-        if ingredient is None:
+        deleted = self.db_session.execute(
+            delete(Ingredient).where(Ingredient.id == ingredient_id).returning(Ingredient.id)
+        ).scalar_one_or_none()
+        if deleted is None:
             logger.warning(f"Delete ingredient failed; ingredient_id={ingredient_id} not found")
             raise IngredientNotFoundError(ingredient_id=ingredient_id)
-        self.db_session.delete(ingredient)
         self.db_session.commit()
         logger.info(f"Deleted ingredient ingredient_id={ingredient_id}")
 
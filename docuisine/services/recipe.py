@@ -1,15 +1,24 @@
 from typing import List, Optional
 
 from loguru import logger
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session, selectinload
 
+from docuisine.db.database import is_unique_violation
 from docuisine.db.models import Recipe, RecipeIngredient, RecipeStep
 from docuisine.schemas import recipe as recipe_schemas
+from docuisine.utils.errors.database import ConstraintViolationError
 from docuisine.utils.errors.recipe import RecipeExistsError, RecipeNotFoundError
 
 
 class RecipeService:
+    # Loader strategy for the children serialized with every `RecipeOut`.
+    # Each relationship is batched into one `SELECT ... WHERE recipe_id IN (...)`,
+    # so reading N recipes costs a constant 3 queries instead of 2N + 1. Joining both
+    # sibling collections instead would return ingredients x steps rows per recipe.
+    LOADER_OPTIONS = (selectinload(Recipe.ingredients), selectinload(Recipe.steps))
+
     def __init__(self, db_session: Session):
         self.db_session: Session = db_session
 
@@ -137,11 +146,31 @@ class RecipeService:
 
         return result
 
-    def get_all_recipes(self) -> list[Recipe]:
-        """Retrieve all recipes from the database."""
-        return self.db_session.query(Recipe).all()
+    def get_all_recipes(
+        self, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> list[Recipe]:
+        """
+        Retrieve all recipes from the database.
+
+        Parameters
+        ----------
+        limit : Optional[int]
+            Maximum number of recipes to return. Default is None (no limit).
+        after_id : Optional[int]
+            Only return recipes with an ID greater than this (keyset pagination).
+            Default is None (from the start).
 
-    def get_recipes_by_user(self, user_id: int) -> list[Recipe]:
+        Returns
+        -------
+        list[Recipe]
+            The `Recipe` instances ordered by ID.
+        """
+        query = self.db_session.query(Recipe).options(*self.LOADER_OPTIONS)
+        return self._paginate(query, limit=limit, after_id=after_id)
+
+    def get_recipes_by_user(
+        self, user_id: int, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> list[Recipe]:
         """
         Retrieve all recipes created by a specific user.
 
@@ -149,13 +178,45 @@ class RecipeService:
         ----------
         user_id : int
             The ID of the user.
+        limit : Optional[int]
+            Maximum number of recipes to return. Default is None (no limit).
+        after_id : Optional[int]
+            Only return recipes with an ID greater than this (keyset pagination).
+            Default is None (from the start).
 
         Returns
         -------
         list[Recipe]
-            A list of `Recipe` instances created by the user.
+            The `Recipe` instances created by the user, ordered by ID.
+        """
+        query = (
+            self.db_session.query(Recipe).options(*self.LOADER_OPTIONS).filter_by(user_id=user_id)
+        )
+        return self._paginate(query, limit=limit, after_id=after_id)
+
+    def is_recipe_owner(self, recipe_id: int, user_id: int) -> bool:
+        """
+        Check whether a recipe was created by a specific user.
+
+        Parameters
+        ----------
+        recipe_id : int
+            The unique ID of the recipe.
+        user_id : int
+            The ID of the user.
+
+        Returns
+        -------
+        bool
+            True if the recipe exists and belongs to the user, otherwise False.
+
+        Notes
+        -----
+        - A single `EXISTS` query on the recipe's primary key, whatever the number
+          of recipes the user has.
         """
-        return self.db_session.query(Recipe).filter_by(user_id=user_id).all()
+        query = self.db_session.query(Recipe).filter_by(id=recipe_id, user_id=user_id)
+        return bool(self.db_session.query(query.exists()).scalar())
 
     def update_recipe(
         self,
@@ -198,34 +259,41 @@ class RecipeService:
             If no recipe exists with `recipe_id`.
         RecipeExistsError
             If updating the name conflicts with an existing recipe.
+        ConstraintViolationError
+            If the new values break another constraint, e.g. a negative time.
         """
-        recipe = self._get_recipe_by_id(recipe_id)
-        if recipe is None:
-            logger.warning(f"Update recipe failed; recipe_id={recipe_id} not found")
-            raise RecipeNotFoundError(recipe_id=recipe_id)
-
-        if name is not None:
-            recipe.name = name
-        if cook_time_sec is not None:
-            recipe.cook_time_sec = cook_time_sec
-        if prep_time_sec is not None:
-            recipe.prep_time_sec = prep_time_sec
-        if non_blocking_time_sec is not None:
-            recipe.non_blocking_time_sec = non_blocking_time_sec
-        if servings is not None:
-            recipe.servings = servings
-        if description is not None:
-            recipe.description = description
-
+        values = {
+            "name": name,
+            "cook_time_sec": cook_time_sec,
+            "prep_time_sec": prep_time_sec,
+            "non_blocking_time_sec": non_blocking_time_sec,
+            "servings": servings,
+            "description": description,
+        }
+        statement = (
+            update(Recipe)
+            .where(Recipe.id == recipe_id)
+            .values({key: value for key, value in values.items() if value is not None})
+            .returning(Recipe)
+        )
         try:
+            recipe = self.db_session.scalars(statement).one_or_none()
+            if recipe is None:
+                logger.warning(f"Update recipe failed; recipe_id={recipe_id} not found")
+                raise RecipeNotFoundError(recipe_id=recipe_id)
+            # The steps and ingredients are loaded with the returned row (`lazy="selectin"`),
+            # they are detached with it so that the commit does not expire them.
+            for instance in (recipe, *recipe.steps, *recipe.ingredients):
+                self.db_session.expunge(instance)
             self.db_session.commit()
             logger.info(f"Updated recipe recipe_id={recipe_id}")
-        except IntegrityError:
+        except IntegrityError as e:
             self.db_session.rollback()
-            logger.warning(
-                f"Update recipe failed due to duplicate name={name if name is not None else recipe.name}"
-            )
-            raise RecipeExistsError(name if name is not None else recipe.name)
+            if name is not None and is_unique_violation(e):
+                logger.warning(f"Update recipe failed due to duplicate name={name}")
+                raise RecipeExistsError(name)
+            logger.warning(f"Update recipe failed; recipe_id={recipe_id} rejected by a constraint")
+            raise ConstraintViolationError
 
         return recipe
 
@@ -242,15 +310,40 @@ class RecipeService:
         ------
         RecipeNotFoundError
             If no recipe is found with the given ID.
+
+        Notes
+        -----
+        - The recipe's steps, ingredient lines and category links are deleted with it,
+          and the ingredient it produces, if any, is kept without a recipe. Both are
+          done by the database (`ON DELETE`), in the same statement.
         """
-        recipe = self._get_recipe_by_id(recipe_id)
-        if recipe is None:
+        deleted = self.db_session.execute(
+            delete(Recipe).where(Recipe.id == recipe_id).returning(Recipe.id)
+        ).scalar_one_or_none()
+        if deleted is None:
             logger.warning(f"Delete recipe failed; recipe_id={recipe_id} not found")
             raise RecipeNotFoundError(recipe_id=recipe_id)
-        self.db_session.delete(recipe)
         self.db_session.commit()
         logger.info(f"Deleted recipe recipe_id={recipe_id}")
 
+    @staticmethod
+    def _paginate(
+        query: Query[Recipe], limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> list[Recipe]:
+        """
+        Apply keyset pagination on the recipe ID to a recipe query.
+
+        Notes
+        -----
+        No business logic should be placed here.
+        """
+        query = query.order_by(Recipe.id)
+        if after_id is not None:
+            query = query.filter(Recipe.id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
     def _get_recipe_by_id(self, recipe_id: int) -> Optional[Recipe]:
         """
         Retrieve a recipe from the database by its unique ID.
@@ -269,7 +362,12 @@ class RecipeService:
         -----
         No business logic should be placed here.
         """
-        return self.db_session.query(Recipe).filter_by(id=recipe_id).first()
+        return (
+            self.db_session.query(Recipe)
+            .options(*self.LOADER_OPTIONS)
+            .filter_by(id=recipe_id)
+            .first()
+        )
 
     def _get_recipe_by_name(self, name: str) -> Optional[Recipe]:
         """
@@ -1,10 +1,15 @@
-from typing import Optional
+from typing import Any, Optional
 
 from loguru import logger
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from docuisine.db.bulk import bulk_insert
+from docuisine.db.database import is_unique_violation
 from docuisine.db.models import Store
+from docuisine.schemas.common import BulkItem
+from docuisine.utils.errors.database import ConstraintViolationError
 from docuisine.utils.errors.store import StoreExistsError, StoreNotFoundError
 
 
@@ -71,6 +76,30 @@ class StoreService:
             raise StoreExistsError(name)
         return new_store
 
+    def create_stores(self, stores: list[dict[str, Any]], chunk_size: int) -> list[BulkItem]:
+        """
+        Create many stores.
+
+        Parameters
+        ----------
+        stores : list[dict[str, Any]]
+            The fields of `create_store` of every store.
+        chunk_size : int
+            Stores inserted, and committed, together.
+
+        Returns
+        -------
+        list[BulkItem]
+            The outcome of every store, in order: created (201) with its ID,
+            or out of range coordinates (422).
+
+        Notes
+        -----
+        - Store names are not unique, so no store conflicts with another.
+        - Each chunk is committed on its own, see `docuisine.db.bulk.bulk_insert`.
+        """
+        return bulk_insert(self.db_session, Store, stores, chunk_size)
+
     def get_store(self, store_id: Optional[int] = None, name: Optional[str] = None) -> Store:
         """
         Retrieve a store by ID or name.
@@ -115,16 +144,31 @@ class StoreService:
 
         return result
 
-    def get_all_stores(self) -> list[Store]:
+    def get_all_stores(
+        self, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> list[Store]:
         """
         Retrieve all stores from the database.
 
+        Parameters
+        ----------
+        limit : Optional[int]
+            Maximum number of stores to return. Default is None (no limit).
+        after_id : Optional[int]
+            Only return stores with an ID greater than this (keyset pagination).
+            Default is None (from the start).
+
         Returns
         -------
         list[Store]
-            A list of all `Store` instances.
+            The `Store` instances ordered by ID.
         """
-        return self.db_session.query(Store).all()
+        query = self.db_session.query(Store).order_by(Store.id)
+        if after_id is not None:
+            query = query.filter(Store.id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
     def update_store(
         self,
@@ -170,36 +214,39 @@ class StoreService:
             If no store exists with `store_id`.
         StoreExistsError
             If updating the name conflicts with an existing store.
+        ConstraintViolationError
+            If the new values break another constraint, e.g. out of range coordinates.
         """
-        store = self._get_store_by_id(store_id)
-        if store is None:
-            logger.warning(f"Update store failed; store_id={store_id} not found")
-            raise StoreNotFoundError(store_id=store_id)
-
-        if name is not None:
-            store.name = name
-        if address is not None:
-            store.address = address
-        if longitude is not None:
-            store.longitude = longitude
-        if latitude is not None:
-            store.latitude = latitude
-        if phone is not None:
-            store.phone = phone
-        if website is not None:
-            store.website = website
-        if description is not None:
-            store.description = description
-
+        values = {
+            "name": name,
+            "address": address,
+            "longitude": longitude,
+            "latitude": latitude,
+            "phone": phone,
+            "website": website,
+            "description": description,
+        }
+        statement = (
+            update(Store)
+            .where(Store.id == store_id)
+            .values({key: value for key, value in values.items() if value is not None})
+            .returning(Store)
+        )
         try:
+            store = self.db_session.scalars(statement).one_or_none()
+            if store is None:
+                logger.warning(f"Update store failed; store_id={store_id} not found")
+                raise StoreNotFoundError(store_id=store_id)
+            self.db_session.expunge(store)
             self.db_session.commit()
             logger.info(f"Updated store store_id={store_id}")
-        except IntegrityError:
+        except IntegrityError as e:
             self.db_session.rollback()
-            logger.warning(
-                f"Update store failed due to duplicate name={name if name is not None else store.name}"
-            )
-            raise StoreExistsError(name if name is not None else store.name)
+            if name is not None and is_unique_violation(e):
+                logger.warning(f"Update store failed due to duplicate name={name}")
+                raise StoreExistsError(name)
+            logger.warning(f"Update store failed; store_id={store_id} rejected by a constraint")
+            raise ConstraintViolationError
 
         return store
 
@@ -216,12 +263,17 @@ class StoreService:
         ------
         StoreNotFoundError
             If no store is found with the given ID.
+
+        Notes
+        -----
+        - The store's shelves are deleted with it by the database (`ON DELETE CASCADE`).
         """
-        store = self._get_store_by_id(store_id)
-        if store is None:
+        deleted = self.db_session.execute(
+            delete(Store).where(Store.id == store_id).returning(Store.id)
+        ).scalar_one_or_none()
+        if deleted is None:
             logger.warning(f"Delete store failed; store_id={store_id} not found")
             raise StoreNotFoundError(store_id=store_id)
-        self.db_session.delete(store)
         self.db_session.commit()
         logger.info(f"Deleted store store_id={store_id}")
 
@@ -1,24 +1,59 @@
 import datetime
+import math
+import threading
+import time
 from typing import Optional, Union
 
+from cachetools import TLRUCache, TTLCache
 import jwt
 from loguru import logger
+from sqlalchemy import case, delete, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from docuisine.db.models import User
-from docuisine.schemas.auth import JWTConfig
-from docuisine.schemas.enums import Role
+from docuisine.schemas.auth import JWTConfig, UserIdentity
+from docuisine.schemas.enums import Role, TokenType
 from docuisine.schemas.user import UserOut
 from docuisine.utils import errors
 from docuisine.utils.hashing import hash_in_sha256
 
+# Identity of an access token, with the time (`time.time()`) the token expires at.
+IdentityCache = TLRUCache[str, tuple[UserIdentity, float]]
+# The caches are shared by the services of every request, and are not thread-safe.
+_cache_lock = threading.Lock()
+
+
+def create_identity_cache(maxsize: int, ttl: float) -> IdentityCache:
+    """
+    Create a cache of identities, kept until their token expires or for `ttl` seconds.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of identities kept, least recently used first out. Must be positive.
+    ttl : float
+        Seconds an identity is served before its token is checked again.
+
+    Returns
+    -------
+    IdentityCache
+        The empty cache.
+    """
+    return TLRUCache(
+        maxsize=maxsize,
+        ttu=lambda token, entry, now: min(entry[1], now + ttl),
+        timer=time.time,
+    )
+
 
 class UserService:
     def __init__(
         self,
         db_session: Session,
         jwt_config: Optional[JWTConfig] = None,
+        identity_cache: Optional[IdentityCache] = None,
+        token_versions: Optional[TTLCache[int, int]] = None,
     ):
         """
         Initialize the UserService with a database session and optional JWT configuration.
@@ -29,9 +64,17 @@ class UserService:
             The SQLAlchemy database session for database operations.
         jwt_config : Optional[JWTConfig], optional
             The JWT configuration for token generation and validation, by default None.
+        identity_cache : Optional[IdentityCache], optional
+            Cache of access token to user identity used by `authorize_identity`,
+            by default None (every token is resolved against the database).
+        token_versions : Optional[TTLCache[int, int]], optional
+            Record of user ID to the token version set by this process, used to detect
+            revoked access tokens without a database lookup, by default None.
         """
         self.db_session: Session = db_session
         self.jwt_config = jwt_config
+        self.identity_cache = identity_cache
+        self.token_versions = token_versions
 
     def create_user(
         self, username: str, password: str, email: Optional[str] = None, role: Role = Role.USER
@@ -123,16 +166,31 @@ class UserService:
 
         return result
 
-    def get_all_users(self) -> list[User]:
+    def get_all_users(
+        self, limit: Optional[int] = None, after_id: Optional[int] = None
+    ) -> list[User]:
         """
         Retrieve all users from the database.
 
+        Parameters
+        ----------
+        limit : Optional[int]
+            Maximum number of users to return. Default is None (no limit).
+        after_id : Optional[int]
+            Only return users with an ID greater than this (keyset pagination).
+            Default is None (from the start).
+
         Returns
         -------
         list[User]
-            A list of all `User` instances in the database.
+            The `User` instances ordered by ID.
         """
-        return self.db_session.query(User).all()
+        query = self.db_session.query(User).order_by(User.id)
+        if after_id is not None:
+            query = query.filter(User.id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
     def delete_user(self, user_id: int) -> None:
         """
@@ -152,12 +210,14 @@ class UserService:
         -----
         - This method commits the transaction immediately.
         """
-        user = self._get_user_by_id(user_id)
-        if user is None:
+        token_version = self.db_session.execute(
+            delete(User).where(User.id == user_id).returning(User.token_version)
+        ).scalar_one_or_none()
+        if token_version is None:
             logger.warning(f"Delete user failed; user_id={user_id} not found")
             raise errors.UserNotFoundError(user_id=user_id)
-        self.db_session.delete(user)
         self.db_session.commit()
+        self._invalidate_identity(user_id, token_version=token_version + 1)
         logger.info(f"Deleted user user_id={user_id}")
 
     def _get_user_by_id(self, user_id: int) -> Optional[User]:
@@ -228,12 +288,13 @@ class UserService:
         -----
         - This method commits the transaction immediately.
         """
-        user = self._get_user_by_id(user_id)
-        if user is None:
-            logger.warning(f"Update email failed; user_id={user_id} not found")
-            raise errors.UserNotFoundError(user_id=user_id)
-        user.email = new_email
+        statement = update(User).where(User.id == user_id).values(email=new_email).returning(User)
         try:
+            user = self.db_session.scalars(statement).one_or_none()
+            if user is None:
+                logger.warning(f"Update email failed; user_id={user_id} not found")
+                raise errors.UserNotFoundError(user_id=user_id)
+            self.db_session.expunge(user)
             self.db_session.commit()
             logger.info(f"Updated email for user_id={user_id}")
         except IntegrityError:
@@ -266,7 +327,9 @@ class UserService:
         Notes
         -----
         - The new password is encrypted using SHA-256 before storage.
+        - The stored password is read first to check `old_password`.
         - This method commits the transaction immediately.
+        - Tokens issued before the change are revoked.
         """
         user = self._get_user_by_id(user_id)
         if user is None:
@@ -276,8 +339,15 @@ class UserService:
             logger.warning(f"Update password failed due to invalid old password user_id={user_id}")
             raise errors.InvalidPasswordError("Old password does not match.")
         encrypted_password = hash_in_sha256(new_password)
-        user.password = encrypted_password
+        user = self.db_session.scalars(
+            update(User)
+            .where(User.id == user_id)
+            .values(password=encrypted_password, token_version=User.token_version + 1)
+            .returning(User)
+        ).one()
+        self.db_session.expunge(user)
         self.db_session.commit()
+        self._invalidate_identity(user_id, token_version=user.token_version)
         logger.info(f"Updated password for user_id={user_id}")
         return user
 
@@ -345,7 +415,7 @@ class UserService:
 
     def create_access_token(self, user: User) -> str:
         """
-        Create a JWT access token for the given user.
+        Create a short-lived JWT access token for the given user.
 
         Parameters
         ----------
@@ -361,20 +431,84 @@ class UserService:
         ------
         ValueError
             If the JWT configuration is not set for the UserService.
-        """
 
+        Notes
+        -----
+        - The token carries the user's id, role and token version so that it can be
+          authorized without a database lookup (see `authorize_identity`).
+        """
         if self.jwt_config is None:
             raise ValueError("JWT configuration is not set for UserService.")
-        data = {"sub": user.username}
-        if self.jwt_config.access_token_expire_minutes:
-            expires_delta = datetime.timedelta(minutes=self.jwt_config.access_token_expire_minutes)
-            data.update({"exp": datetime.datetime.now(datetime.timezone.utc) + expires_delta})
-        token = jwt.encode(
-            data, self.jwt_config.secret_key, algorithm=self.jwt_config.algorithm.value
+        token = self._encode_token(
+            user, TokenType.BEARER, self.jwt_config.access_token_expire_minutes
         )
         logger.info(f"Created access token for username={user.username}")
         return token
 
+    def create_refresh_token(self, user: User) -> str:
+        """
+        Create a long-lived JWT refresh token for the given user.
+
+        Parameters
+        ----------
+        user : User
+            The user for whom the refresh token is to be created.
+
+        Returns
+        -------
+        str
+            The generated JWT refresh token as a string.
+
+        Raises
+        ------
+        ValueError
+            If the JWT configuration is not set for the UserService.
+        """
+        if self.jwt_config is None:
+            raise ValueError("JWT configuration is not set for UserService.")
+        token = self._encode_token(
+            user, TokenType.REFRESH, self.jwt_config.refresh_token_expire_minutes
+        )
+        logger.info(f"Created refresh token for username={user.username}")
+        return token
+
+    def refresh_tokens(self, refresh_token: str) -> tuple[str, str]:
+        """
+        Exchange a refresh token for a new access token and refresh token.
+
+        Parameters
+        ----------
+        refresh_token : str
+            A refresh token created by `create_refresh_token`.
+
+        Returns
+        -------
+        tuple[str, str]
+            The new access token and the new refresh token.
+
+        Raises
+        ------
+        ValueError
+            If the JWT configuration is not set for the UserService.
+        InvalidCredentialsError
+            If the token is invalid, is not a refresh token, its user no longer exists,
+            or it was issued before the user's token version changed.
+
+        Notes
+        -----
+        - The token version is always checked against the database here, which keeps
+          the lifetime of stateless access tokens bounded by the access token expiry.
+        """
+        payload = self._decode_token(refresh_token)
+        if payload.get("type") != TokenType.REFRESH.value:
+            logger.warning("Token refresh failed; not a refresh token")
+            raise errors.InvalidCredentialsError
+        user = self._get_user_by_id(payload.get("uid"))  # type: ignore[arg-type]
+        if user is None or user.token_version != payload.get("ver"):
+            logger.warning(f"Token refresh failed for user_id={payload.get('uid')}")
+            raise errors.InvalidCredentialsError
+        return self.create_access_token(user), self.create_refresh_token(user)
+
     def authorize_user(self, token: str) -> User:
         """
         Authorize a user based on the provided JWT token.
@@ -397,23 +531,255 @@ class UserService:
             If the token is invalid.
         """
 
+        user, _ = self._authorize_token(token)
+        logger.info(f"Authorized user username={user.username}")
+        return user
+
+    def authorize_identity(self, token: str) -> UserIdentity:
+        """
+        Resolve the identity of the user behind a JWT access token.
+
+        Parameters
+        ----------
+        token : str
+            The JWT access token to decode and verify.
+
+        Returns
+        -------
+        UserIdentity
+            The id, username and role of the authorized user.
+
+        Raises
+        ------
+        ValueError
+            If the JWT configuration is not set for the UserService.
+        InvalidCredentialsError
+            If the token is invalid, is a refresh token, or has been revoked.
+
+        Notes
+        -----
+        - A cached identity is served without decoding the token or querying the database.
+        - Entries never outlive the token's `exp` claim and are dropped by `delete_user`,
+          `toggle_user_role` and `update_user_password`.
+        - Access tokens are authorized from their claims alone. The database is only
+          consulted when this process knows of a newer token version for the user,
+          or for tokens issued without claims.
+        """
+        if self.identity_cache is not None:
+            with _cache_lock:
+                entry = self.identity_cache.get(token)
+            if entry is not None:
+                return entry[0]
+
+        payload = self._decode_token(token)
+        if "type" not in payload:
+            user = self._get_user_from_payload(payload)
+            identity = UserIdentity.model_validate(user)
+        elif payload["type"] == TokenType.BEARER.value:
+            identity = self._get_identity_from_claims(payload)
+        else:
+            logger.warning("Token authorization failed; not an access token")
+            raise errors.InvalidCredentialsError
+
+        if self.identity_cache is not None:
+            with _cache_lock:
+                self.identity_cache[token] = (identity, payload.get("exp", math.inf))
+        logger.info(f"Authorized user username={identity.username}")
+        return identity
+
+    def _encode_token(
+        self, user: User, token_type: TokenType, expire_minutes: Optional[int]
+    ) -> str:
+        """
+        Sign a JWT token carrying the claims of the given user.
+
+        Parameters
+        ----------
+        user : User
+            The user the token is issued to.
+        token_type : TokenType
+            `TokenType.BEARER` for access tokens or `TokenType.REFRESH` for refresh tokens.
+        expire_minutes : Optional[int]
+            Minutes until the token expires, or None for a token that never expires.
+
+        Returns
+        -------
+        str
+            The encoded JWT token.
+        """
+        assert self.jwt_config is not None
+        data: dict = {
+            "sub": user.username,
+            "uid": user.id,
+            "ver": user.token_version or 0,
+            "type": token_type.value,
+        }
+        if token_type == TokenType.BEARER:
+            data["role"] = user.role
+        if expire_minutes:
+            expires_delta = datetime.timedelta(minutes=expire_minutes)
+            data.update({"exp": datetime.datetime.now(datetime.timezone.utc) + expires_delta})
+        return jwt.encode(
+            data, self.jwt_config.secret_key, algorithm=self.jwt_config.algorithm.value
+        )
+
+    def _decode_token(self, token: str) -> dict:
+        """
+        Decode and verify a JWT token.
+
+        Parameters
+        ----------
+        token : str
+            The JWT token to decode and verify.
+
+        Returns
+        -------
+        dict
+            The decoded payload.
+
+        Raises
+        ------
+        ValueError
+            If the JWT configuration is not set for the UserService.
+        InvalidCredentialsError
+            If the token's signature or expiry is invalid.
+        """
         if self.jwt_config is None:
             raise ValueError("JWT configuration is not set for UserService.")
         try:
-            payload = jwt.decode(
+            return jwt.decode(
                 token, self.jwt_config.secret_key, algorithms=[self.jwt_config.algorithm.value]
             )
-            username: str = payload.get("sub")
-            if username is None:
-                raise errors.InvalidCredentialsError
-            user = self.get_user(username=username)
-        except (jwt.InvalidTokenError, errors.UserNotFoundError) as e:
+        except jwt.InvalidTokenError as e:
             logger.warning("Token authorization failed")
             raise errors.InvalidCredentialsError from e
-        logger.info(f"Authorized user username={user.username}")
-        return user
 
-    def update_user_img(self, user_id: int, img: str, preview_img: str) -> UserOut:
+    def _authorize_token(self, token: str) -> tuple[User, dict]:
+        """
+        Decode a JWT token and load the user it was issued to.
+
+        Parameters
+        ----------
+        token : str
+            The JWT token to decode and verify.
+
+        Returns
+        -------
+        tuple[User, dict]
+            The user named by the token's `sub` claim and the decoded payload.
+
+        Raises
+        ------
+        ValueError
+            If the JWT configuration is not set for the UserService.
+        InvalidCredentialsError
+            If the token is invalid or its user no longer exists.
+        """
+        payload = self._decode_token(token)
+        return self._get_user_from_payload(payload), payload
+
+    def _get_user_from_payload(self, payload: dict) -> User:
+        """
+        Load the user named by the `sub` claim of a decoded token.
+
+        Parameters
+        ----------
+        payload : dict
+            The decoded token payload.
+
+        Returns
+        -------
+        User
+            The `User` instance the token was issued to.
+
+        Raises
+        ------
+        InvalidCredentialsError
+            If the claim is missing or the user no longer exists.
+        """
+        username: Optional[str] = payload.get("sub")
+        if username is None:
+            logger.warning("Token authorization failed; missing subject")
+            raise errors.InvalidCredentialsError
+        try:
+            return self.get_user(username=username)
+        except errors.UserNotFoundError as e:
+            logger.warning("Token authorization failed")
+            raise errors.InvalidCredentialsError from e
+
+    def _get_identity_from_claims(self, payload: dict) -> UserIdentity:
+        """
+        Build the user identity from the claims of a decoded access token.
+
+        Parameters
+        ----------
+        payload : dict
+            The decoded access token payload.
+
+        Returns
+        -------
+        UserIdentity
+            The identity carried by the token.
+
+        Raises
+        ------
+        InvalidCredentialsError
+            If the claims are malformed or the token version has been revoked.
+        """
+        try:
+            identity = UserIdentity(
+                id=payload["uid"], username=payload["sub"], role=payload["role"]
+            )
+            version = int(payload["ver"])
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Token authorization failed; malformed claims")
+            raise errors.InvalidCredentialsError from e
+
+        if self.token_versions is not None:
+            with _cache_lock:
+                known_version = self.token_versions.get(identity.id)
+            if known_version is not None and version < known_version:
+                user = self._get_user_by_id(identity.id)
+                if user is None or user.token_version != version:
+                    logger.warning(f"Token authorization failed; revoked user_id={identity.id}")
+                    raise errors.InvalidCredentialsError
+        return identity
+
+    def _invalidate_identity(self, user_id: int, token_version: int) -> None:
+        """
+        Revoke the tokens of a user issued before `token_version`.
+
+        Cached identities are dropped and the new version is recorded so that
+        older access tokens are checked against the database.
+
+        Parameters
+        ----------
+        user_id : int
+            The unique ID of the user whose tokens are revoked.
+        token_version : int
+            The user's new token version.
+        """
+        removed = 0
+        with _cache_lock:
+            if self.token_versions is not None:
+                self.token_versions[user_id] = token_version
+            if self.identity_cache is not None:
+                for token in list(self.identity_cache.keys()):
+                    entry = self.identity_cache.get(token)
+                    if entry is not None and entry[0].id == user_id:
+                        del self.identity_cache[token]
+                        removed += 1
+        if removed:
+            logger.info(f"Invalidated {removed} cached identities for user_id={user_id}")
+
+    def update_user_img(
+        self,
+        user_id: int,
+        img: str,
+        preview_img: str,
+        placeholder_img: Optional[str] = None,
+        image_key: Optional[str] = None,
+    ) -> UserOut:
         """
         Update the profile image and preview image of an existing user.
 
@@ -425,6 +791,10 @@ class UserService:
             The new profile image URL to set for the user.
         preview_img : str
             The new preview image URL to set for the user.
+        placeholder_img : Optional[str]
+            The inline placeholder of the new image, as a data URI. Default is None.
+        image_key : Optional[str]
+            The key of the uploaded image in the `images` table. Default is None.
 
         Returns
         -------
@@ -440,12 +810,21 @@ class UserService:
         -----
         - This method commits the transaction immediately.
         """
-        user = self._get_user_by_id(user_id)
+        user = self.db_session.scalars(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                img=img,
+                preview_img=preview_img,
+                placeholder_img=placeholder_img,
+                image_key=image_key,
+            )
+            .returning(User)
+        ).one_or_none()
         if user is None:
             logger.warning(f"Update user image failed; user_id={user_id} not found")
             raise errors.UserNotFoundError(user_id=user_id)
-        user.img = img
-        user.preview_img = preview_img
+        self.db_session.expunge(user)
         self.db_session.commit()
         logger.info(f"Updated profile image for user_id={user_id}")
         user_out = UserOut.model_validate(user)
@@ -473,18 +852,26 @@ class UserService:
         Notes
         -----
         - This method commits the transaction immediately.
+        - The role is switched in the database, by a single `UPDATE ... RETURNING`.
+        - Tokens issued before the change are revoked, so they carry the new role.
         """
-        user = self._get_user_by_id(user_id)
+        user = self.db_session.scalars(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                role=case(
+                    (User.role == Role.ADMIN.value, Role.USER.value), else_=Role.ADMIN.value
+                ),
+                token_version=User.token_version + 1,
+            )
+            .returning(User)
+        ).one_or_none()
         if user is None:
             logger.warning(f"Toggle role failed; user_id={user_id} not found")
             raise errors.UserNotFoundError(user_id=user_id)
-
-        if user.role == Role.ADMIN.value:
-            user.role = Role.USER.value
-        else:
-            user.role = Role.ADMIN.value
-
+        self.db_session.expunge(user)
         self.db_session.commit()
+        self._invalidate_identity(user_id, token_version=user.token_version)
         logger.info(f"Toggled role for user_id={user_id} new_role={user.role}")
         user_out = UserOut.model_validate(user)
         return user_out
@@ -0,0 +1,143 @@
+from typing import Any, AsyncIterable, TypeVar
+
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from docuisine.schemas.common import BulkLimits
+from docuisine.utils.errors import (
+    BulkLineTooLongError,
+    BulkRequestTooLargeError,
+    TooManyItemsError,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Content type of a body of one JSON document per line.
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_JSON_ARRAY = TypeAdapter(list[Any])
+
+
+async def ingest_items(
+    chunks: AsyncIterable[bytes], content_type: str, schema: type[M], limits: BulkLimits
+) -> list[M]:
+    """
+    Validate the items of a bulk request, sent as a JSON array or as NDJSON.
+
+    Parameters
+    ----------
+    chunks : AsyncIterable[bytes]
+        The body, e.g. `Request.stream()`.
+    content_type : str
+        The content type of the body. NDJSON (`application/x-ndjson`) is read
+        one line at a time, anything else is read whole as a JSON array.
+    schema : type[M]
+        The schema of one item.
+    limits : BulkLimits
+        The most items, bytes and bytes per NDJSON line accepted.
+
+    Returns
+    -------
+    list[M]
+        The items, in order.
+
+    Raises
+    ------
+    BulkRequestTooLargeError
+        If the body exceeds `limits.max_bytes`, as soon as the chunk past the limit is read.
+    BulkLineTooLongError
+        If a line of an NDJSON body exceeds `limits.max_line_bytes`.
+    TooManyItemsError
+        If the body holds more than `limits.max_items` items, before any item is validated.
+        NDJSON bodies are rejected as soon as the item past the limit is read.
+    RequestValidationError
+        If an item is invalid, with the position of every invalid item in the error locations.
+    """
+    if content_type.split(";")[0].strip().lower() != NDJSON_MEDIA_TYPE:
+        body = await _read(chunks, limits.max_bytes)
+        try:
+            documents = _JSON_ARRAY.validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(_located(e, ("body",)))
+        if len(documents) > limits.max_items:
+            raise TooManyItemsError(max_items=limits.max_items)
+        try:
+            return TypeAdapter(list[schema]).validate_python(documents)
+        except ValidationError as e:
+            raise RequestValidationError(_located(e, ("body",)))
+
+    items: list[M] = []
+    errors: list[dict] = []
+    index = 0
+    async for line in _lines(chunks, limits):
+        if not line.strip():
+            continue
+        if index == limits.max_items:
+            raise TooManyItemsError(max_items=limits.max_items)
+        try:
+            items.append(schema.model_validate_json(line))
+        except ValidationError as e:
+            errors.extend(_located(e, ("body", index)))
+        index += 1
+    if errors:
+        raise RequestValidationError(errors)
+    return items
+
+
+def bulk_request_body(schema: type[BaseModel]) -> dict:
+    """
+    Describe the body read by `ingest_items` in OpenAPI, for `openapi_extra`.
+
+    Parameters
+    ----------
+    schema : type[BaseModel]
+        The schema of one item.
+
+    Returns
+    -------
+    dict
+        The OpenAPI request body: a JSON array of items, or one item per line as NDJSON.
+    """
+    item = schema.model_json_schema()
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": item}},
+                NDJSON_MEDIA_TYPE: {"schema": item},
+            },
+        }
+    }
+
+
+async def _read(chunks: AsyncIterable[bytes], max_bytes: int) -> bytes:
+    """Read a whole body, stopping at the first chunk past `max_bytes`."""
+    body = bytearray()
+    async for chunk in chunks:
+        body += chunk
+        if len(body) > max_bytes:
+            raise BulkRequestTooLargeError(max_bytes=max_bytes)
+    return bytes(body)
+
+
+async def _lines(chunks: AsyncIterable[bytes], limits: BulkLimits) -> AsyncIterable[bytes]:
+    """Split chunks of bytes into lines, without their line breaks, within the size limits."""
+    pending = b""
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if size > limits.max_bytes:
+            raise BulkRequestTooLargeError(max_bytes=limits.max_bytes)
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in (*lines, pending):
+            if len(line) > limits.max_line_bytes:
+                raise BulkLineTooLongError(max_line_bytes=limits.max_line_bytes)
+        for line in lines:
+            yield line
+    yield pending
+
+
+def _located(error: ValidationError, prefix: tuple) -> list[dict]:
+    """Return the details of a validation error, located in the request like FastAPI's."""
+    return [
+        {**detail, "loc": (*prefix, *detail["loc"])} for detail in error.errors(include_url=False)
+    ]
@@ -0,0 +1,121 @@
+import threading
+from typing import Generic, Optional, TypeVar
+
+from cachetools import TTLCache
+
+V = TypeVar("V")
+
+
+class ContentIndex(Generic[V]):
+    """Local index of content-addressed objects known to be in storage.
+
+    Counts how duplicates were detected: from this index (`local_hits`),
+    from storage itself (`remote_hits`), or not at all (`misses`).
+
+    Usage
+    -----
+    ```
+    index = ContentIndex[ImageSet](maxsize=10_000, ttl=86_400)
+    if (image_set := index.get(key)) is None:
+        ...  # check storage, then upload
+        index.add(key, image_set)
+    ```
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize an empty index.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of keys remembered, least recently used first out. Must be positive.
+        ttl : float
+            Seconds a key is trusted before storage is checked again.
+        """
+        self._entries: TTLCache[str, V] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.remote_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[V]:
+        """
+        Return the value indexed under `key`, counting a local hit if found.
+
+        Parameters
+        ----------
+        key : str
+            The content-addressed key.
+
+        Returns
+        -------
+        Optional[V]
+            The indexed value, if any.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self.local_hits += 1
+        return value
+
+    def peek(self, key: str) -> Optional[V]:
+        """
+        Return the value indexed under `key` without counting a hit.
+
+        Used when the value must be confirmed before it is trusted; count the
+        hit with `record_local_hit` once it is.
+
+        Parameters
+        ----------
+        key : str
+            The content-addressed key.
+
+        Returns
+        -------
+        Optional[V]
+            The indexed value, if any.
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def add(self, key: str, value: V) -> None:
+        """
+        Remember that `key` is stored.
+
+        Parameters
+        ----------
+        key : str
+            The content-addressed key.
+        value : V
+            The value to return for later lookups of `key`.
+        """
+        with self._lock:
+            self._entries[key] = value
+
+    def discard(self, key: str) -> None:
+        """
+        Forget `key`, e.g. after the object was deleted from storage.
+
+        Parameters
+        ----------
+        key : str
+            The content-addressed key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def record_local_hit(self) -> None:
+        """Count a duplicate found in the index, after `peek`."""
+        with self._lock:
+            self.local_hits += 1
+
+    def record_remote_hit(self) -> None:
+        """Count a duplicate found in storage but not in the index."""
+        with self._lock:
+            self.remote_hits += 1
+
+    def record_miss(self) -> None:
+        """Count a key that was not stored yet."""
+        with self._lock:
+            self.misses += 1
@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from hashlib import sha256
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Optional, Union
+
+from loguru import logger
+
+TEMP_PREFIX = ".tmp-"
+
+
+class DiskCache:
+    """Least-recently-used cache of byte strings stored as files, bounded in total bytes.
+
+    Each entry is one file named after the hash of its key, written atomically,
+    so concurrent readers never see a partial file. Entries found in the directory
+    at start-up are kept, oldest first in line for eviction. The size bound is
+    enforced per process; files evicted by another process are treated as misses.
+
+    Usage
+    -----
+    ```
+    cache = DiskCache("/var/cache/docuisine", max_bytes=512 * 1024 * 1024)
+    if (data := cache.get(key)) is None:
+        data = render()
+        cache.set(key, data)
+    ```
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int):
+        """
+        Initialize the cache, indexing the files already in `directory`.
+
+        Parameters
+        ----------
+        directory : Union[str, Path]
+            The directory holding the cache files. Created on the first write.
+        max_bytes : int
+            Maximum total size of the cached files; least recently used go first.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached files in bytes."""
+        return self._size
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the bytes cached under `key` and mark them as recently used.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        Optional[bytes]
+            The cached bytes, or None on a miss.
+        """
+        name = self._name(key)
+        with self._lock:
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+        try:
+            return (self.directory / name).read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self._forget(name)
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        """
+        Cache `data` under `key`, evicting least recently used entries as needed.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        data : bytes
+            The bytes to cache. Larger than `max_bytes` is not cached.
+        """
+        if len(data) > self.max_bytes:
+            return
+        name = self._name(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, self.directory / name)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._forget(name)
+            self._entries[name] = len(data)
+            self._size += len(data)
+            evicted = self._evict()
+        if evicted:
+            logger.debug(f"Evicted {evicted} entries from disk cache size={self._size}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _forget(self, name: str) -> None:
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._size -= size
+
+    def _evict(self) -> int:
+        evicted = 0
+        while self._size > self.max_bytes:
+            oldest, size = self._entries.popitem(last=False)
+            self._size -= size
+            (self.directory / oldest).unlink(missing_ok=True)
+            evicted += 1
+        return evicted
+
+    def _load(self) -> None:
+        if not self.directory.is_dir():
+            return
+        files = []
+        for path in self.directory.iterdir():
+            # Files being written by another process are not entries yet.
+            if path.is_file() and not path.name.startswith(TEMP_PREFIX):
+                stat = path.stat()
+                files.append((stat.st_mtime, path.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._size += size
+        self._evict()
+        logger.info(f"Loaded disk cache entries={len(self._entries)} size={self._size}")
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return sha256(key.encode()).hexdigest()
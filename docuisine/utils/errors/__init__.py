@@ -4,12 +4,24 @@ from .auth import (
     InvalidPasswordError,
     UnauthorizedError,
 )
+from .bulk import BulkLineTooLongError, BulkRequestTooLargeError, TooManyItemsError
 from .category import CategoryExistsError, CategoryNotFoundError
-from .image import DecodingError, UnsupportedImageFormatError
+from .database import ConstraintViolationError
+from .image import (
+    DecodingError,
+    ImageNotFoundError,
+    InvalidImageError,
+    UnsupportedImageFormatError,
+    UploadNotFoundError,
+    UploadTooLargeError,
+)
 from .ingredient import IngredientExistsError, IngredientNotFoundError
+from .pagination import InvalidCursorError
 from .recipe import RecipeExistsError, RecipeNotFoundError
+from .storage import ObjectNotFoundError, UnsupportedStorageOperationError
 from .store import StoreExistsError, StoreNotFoundError
 from .user import DuplicateEmailError, UserExistsError, UserNotFoundError
+from .workers import WorkerPoolBusyError
 
 __all__ = [
     "ForbiddenAccessError",
@@ -21,8 +33,13 @@ __all__ = [
     "UserNotFoundError",
     "CategoryExistsError",
     "CategoryNotFoundError",
+    "ConstraintViolationError",
     "UnsupportedImageFormatError",
+    "InvalidImageError",
     "DecodingError",
+    "UploadTooLargeError",
+    "UploadNotFoundError",
+    "ImageNotFoundError",
     "IngredientExistsError",
     "IngredientNotFoundError",
     "StoreExistsError",
@@ -30,4 +47,11 @@ __all__ = [
     "RecipeExistsError",
     "RecipeNotFoundError",
     "InvalidPasswordError",
+    "InvalidCursorError",
+    "TooManyItemsError",
+    "BulkRequestTooLargeError",
+    "BulkLineTooLongError",
+    "WorkerPoolBusyError",
+    "ObjectNotFoundError",
+    "UnsupportedStorageOperationError",
 ]
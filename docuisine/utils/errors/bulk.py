@@ -0,0 +1,25 @@
+class TooManyItemsError(Exception):
+    """Exception raised when a bulk request holds more items than allowed."""
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self.message = f"A bulk request holds at most {max_items} items"
+        super().__init__(self.message)
+
+
+class BulkRequestTooLargeError(Exception):
+    """Exception raised when the body of a bulk request exceeds the maximum size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.message = f"A bulk request holds at most {max_bytes} bytes"
+        super().__init__(self.message)
+
+
+class BulkLineTooLongError(Exception):
+    """Exception raised when a line of an NDJSON bulk request exceeds the maximum length."""
+
+    def __init__(self, max_line_bytes: int):
+        self.max_line_bytes = max_line_bytes
+        self.message = f"A line of a bulk request holds at most {max_line_bytes} bytes"
+        super().__init__(self.message)
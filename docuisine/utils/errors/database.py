@@ -0,0 +1,6 @@
+class ConstraintViolationError(Exception):
+    """Exception raised when a write breaks a database constraint other than uniqueness."""
+
+    def __init__(self, message: str = "Rejected by a database constraint"):
+        self.message = message
+        super().__init__(self.message)
@@ -7,9 +7,44 @@ class UnsupportedImageFormatError(Exception):
         super().__init__(self.message)
 
 
+class InvalidImageError(Exception):
+    """Exception raised when an image of a supported format cannot be decoded."""
+
+    def __init__(self, message: str = "Image could not be decoded"):
+        self.message = message
+        super().__init__(self.message)
+
+
 class DecodingError(Exception):
     """Exception raised for errors in decoding base64 images."""
 
     def __init__(self, message: str = "Failed to decode base64 image"):
         self.message = message
         super().__init__(self.message)
+
+
+class UploadTooLargeError(Exception):
+    """Exception raised when an upload exceeds the maximum upload size."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.message = f"Image exceeds the maximum upload size of {max_size} bytes"
+        super().__init__(self.message)
+
+
+class UploadNotFoundError(Exception):
+    """Exception raised when a presigned upload does not exist or was not sent."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.message = f"Upload '{key}' not found"
+        super().__init__(self.message)
+
+
+class ImageNotFoundError(Exception):
+    """Exception raised when an image does not exist in storage."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.message = f"Image '{key}' not found"
+        super().__init__(self.message)
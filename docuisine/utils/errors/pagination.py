@@ -0,0 +1,7 @@
+class InvalidCursorError(Exception):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        self.message = f"Invalid pagination cursor: '{self.cursor}'"
+        super().__init__(self.message)
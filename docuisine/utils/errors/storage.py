@@ -0,0 +1,17 @@
+class ObjectNotFoundError(Exception):
+    """Exception raised when an object does not exist in storage."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.message = f"Object '{key}' not found"
+        super().__init__(self.message)
+
+
+class UnsupportedStorageOperationError(Exception):
+    """Exception raised when the configured storage backend cannot perform an operation."""
+
+    def __init__(self, operation: str, backend: str):
+        self.operation = operation
+        self.backend = backend
+        self.message = f"The {backend} storage backend does not support {operation}"
+        super().__init__(self.message)
@@ -0,0 +1,6 @@
+class WorkerPoolBusyError(Exception):
+    """Exception raised when a worker pool has no room for another job."""
+
+    def __init__(self, message: str = "Too many images are being processed. Try again later."):
+        self.message = message
+        super().__init__(self.message)
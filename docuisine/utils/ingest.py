@@ -0,0 +1,302 @@
+import base64
+import binascii
+from hashlib import md5, sha256
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterable, BinaryIO, Optional
+
+from fastapi import UploadFile
+
+from docuisine.schemas.image import UploadLimits
+from docuisine.utils.errors import DecodingError, UploadTooLargeError
+
+# Size of the chunks read from an upload.
+CHUNK_SIZE = 64 * 1024
+# Leading bytes kept in memory to sniff the format of an upload.
+HEAD_SIZE = 32
+_WHITESPACE = b" \t\r\n"
+
+
+class SpooledUpload:
+    """Upload body kept in memory up to a threshold and in a temporary file beyond it.
+
+    The size limit is enforced and the MD5 and SHA-256 hashes computed as chunks are written,
+    so an upload is never read twice and never held in memory past the threshold. A file
+    that already holds the upload can be wrapped instead, its chunks passed to `update`.
+
+    Usage
+    -----
+    ```
+    with SpooledUpload(UploadLimits(max_size=20_000_000)) as upload:
+        upload.write(chunk)
+        ...
+        image_bytes = upload.read()
+    ```
+    """
+
+    def __init__(self, limits: UploadLimits, file: Optional[BinaryIO] = None):
+        """
+        Initialize an empty upload.
+
+        Parameters
+        ----------
+        limits : UploadLimits
+            The maximum size of the upload and the size at which it is moved to disk.
+        file : Optional[BinaryIO]
+            A file already holding the upload, to be accounted for with `update` instead
+            of copied with `write`. Default is None, for a new spooled file.
+        """
+        self.limits = limits
+        self.file = (
+            file if file is not None else SpooledTemporaryFile(max_size=limits.spool_threshold)
+        )
+        self.size = 0
+        self.head = b""
+        self._hash = md5()
+        self._sha256 = sha256()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SpooledUpload":
+        """
+        Wrap bytes that are already in memory.
+
+        Parameters
+        ----------
+        data : bytes
+            The upload data.
+
+        Returns
+        -------
+        SpooledUpload
+            An upload holding `data`, never spooled to disk.
+        """
+        upload = cls(UploadLimits(max_size=max(len(data), 1), spool_threshold=len(data) + 1))
+        upload.write(data)
+        return upload
+
+    @property
+    def md5(self) -> str:
+        """The hex MD5 digest of the bytes written so far."""
+        return self._hash.hexdigest()
+
+    @property
+    def sha256(self) -> str:
+        """The hex SHA-256 digest of the bytes written so far."""
+        return self._sha256.hexdigest()
+
+    def write(self, chunk: bytes) -> None:
+        """
+        Append a chunk to the upload.
+
+        Parameters
+        ----------
+        chunk : bytes
+            The next bytes of the upload.
+
+        Raises
+        ------
+        UploadTooLargeError
+            If the upload would exceed its maximum size.
+        """
+        self.update(chunk)
+        self.file.write(chunk)
+
+    def update(self, chunk: bytes) -> None:
+        """
+        Account for the next chunk of an upload already held in `file`, without writing it.
+
+        Parameters
+        ----------
+        chunk : bytes
+            The next bytes of the upload.
+
+        Raises
+        ------
+        UploadTooLargeError
+            If the upload would exceed its maximum size.
+        """
+        if self.size + len(chunk) > self.limits.max_size:
+            raise UploadTooLargeError(max_size=self.limits.max_size)
+        if len(self.head) < HEAD_SIZE:
+            self.head += chunk[: HEAD_SIZE - len(self.head)]
+        self._hash.update(chunk)
+        self._sha256.update(chunk)
+        self.size += len(chunk)
+
+    def read(self) -> bytes:
+        """
+        Read the whole upload.
+
+        Returns
+        -------
+        bytes
+            The upload data.
+        """
+        self.file.seek(0)
+        return self.file.read()
+
+    def close(self) -> None:
+        """Release the memory or temporary file holding the upload."""
+        self.file.close()
+
+    def __enter__(self) -> "SpooledUpload":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class Base64StreamDecoder:
+    """Decode base64 text that arrives in arbitrary chunks.
+
+    Whitespace is ignored, and input is decoded in multiples of four characters
+    so that only up to three characters are carried over between chunks.
+
+    Usage
+    -----
+    ```
+    decoder = Base64StreamDecoder()
+    for chunk in chunks:
+        upload.write(decoder.decode(chunk))
+    upload.write(decoder.finish())
+    ```
+    """
+
+    def __init__(self):
+        self._pending = b""
+        self._padded = False
+
+    def decode(self, chunk: bytes) -> bytes:
+        """
+        Decode as much of the input as possible.
+
+        Parameters
+        ----------
+        chunk : bytes
+            The next base64 characters.
+
+        Returns
+        -------
+        bytes
+            The decoded bytes, possibly empty.
+
+        Raises
+        ------
+        DecodingError
+            If the input is not valid base64.
+        """
+        data = self._pending + chunk.translate(None, _WHITESPACE)
+        if not data:
+            return b""
+        if self._padded:
+            raise DecodingError
+        complete = len(data) - len(data) % 4
+        self._pending = data[complete:]
+        decoded = self._decode(data[:complete])
+        self._padded = data[:complete].endswith(b"=")
+        return decoded
+
+    def finish(self) -> bytes:
+        """
+        Check that the input ended on a complete base64 group.
+
+        Returns
+        -------
+        bytes
+            Always empty; returned for symmetry with `decode`.
+
+        Raises
+        ------
+        DecodingError
+            If characters are left over.
+        """
+        if self._pending:
+            raise DecodingError
+        return b""
+
+    @staticmethod
+    def _decode(data: bytes) -> bytes:
+        try:
+            return base64.b64decode(data, validate=True)
+        except (binascii.Error, ValueError):
+            raise DecodingError
+
+
+async def ingest_upload(
+    upload: UploadFile, limits: UploadLimits, chunk_size: int = CHUNK_SIZE
+) -> SpooledUpload:
+    """
+    Hash a multipart upload in chunks, keeping it in the file it was received in.
+
+    Parameters
+    ----------
+    upload : UploadFile
+        The uploaded file.
+    limits : UploadLimits
+        The maximum size of the upload.
+    chunk_size : int, optional
+        The number of bytes read at a time, by default 64 KiB.
+
+    Returns
+    -------
+    SpooledUpload
+        The upload, reading the file of `upload`, to be closed by the caller.
+
+    Raises
+    ------
+    UploadTooLargeError
+        If the upload exceeds `limits.max_size`. Uploads of known size
+        are rejected without being read.
+
+    Notes
+    -----
+    - Starlette has already spooled the whole body when a route runs; bodies declared
+      larger than a route accepts are rejected before that by `UploadRoute`.
+    - The upload is not copied, so `limits.spool_threshold` does not apply: Starlette
+      moves files to disk past its own threshold of 1 MiB.
+    """
+    if upload.size is not None and upload.size > limits.max_size:
+        raise UploadTooLargeError(max_size=limits.max_size)
+    spooled = SpooledUpload(limits, file=upload.file)
+    try:
+        await upload.seek(0)
+        while chunk := await upload.read(chunk_size):
+            spooled.update(chunk)
+    except BaseException:
+        spooled.close()
+        raise
+    return spooled
+
+
+async def ingest_base64(chunks: AsyncIterable[bytes], limits: UploadLimits) -> SpooledUpload:
+    """
+    Decode a base64-encoded upload as it is received.
+
+    Parameters
+    ----------
+    chunks : AsyncIterable[bytes]
+        The base64 text, e.g. `Request.stream()`.
+    limits : UploadLimits
+        The maximum decoded size of the upload and the size at which it is moved to disk.
+
+    Returns
+    -------
+    SpooledUpload
+        The decoded upload, to be closed by the caller.
+
+    Raises
+    ------
+    DecodingError
+        If the body is not valid base64.
+    UploadTooLargeError
+        If the decoded upload exceeds `limits.max_size`.
+    """
+    spooled = SpooledUpload(limits)
+    decoder = Base64StreamDecoder()
+    try:
+        async for chunk in chunks:
+            spooled.write(decoder.decode(chunk))
+        spooled.write(decoder.finish())
+    except BaseException:
+        spooled.close()
+        raise
+    return spooled
@@ -0,0 +1,81 @@
+import base64
+import binascii
+from typing import Optional, Sequence, TypeVar
+
+from docuisine.utils.errors import InvalidCursorError
+
+T = TypeVar("T")
+
+# IDs are 32-bit integer columns; a larger cursor would fail in the database.
+MAX_ID = 2**31 - 1
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode the ID of the last item of a page into an opaque cursor.
+
+    Parameters
+    ----------
+    last_id : int
+        The ID of the last item of the page.
+
+    Returns
+    -------
+    str
+        The URL-safe cursor string.
+    """
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decode a cursor produced by `encode_cursor` back into an item ID.
+
+    Parameters
+    ----------
+    cursor : Optional[str]
+        The cursor string, or `None` for the first page.
+
+    Returns
+    -------
+    Optional[int]
+        The ID to continue after, or `None` if no cursor was given.
+
+    Raises
+    ------
+    InvalidCursorError
+        If the cursor is not a valid encoded ID, or the ID is out of the range of IDs.
+    """
+    if cursor is None:
+        return None
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        last_id = int(base64.urlsafe_b64decode(cursor + padding).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError(cursor)
+    if not 0 < last_id <= MAX_ID:
+        raise InvalidCursorError(cursor)
+    return last_id
+
+
+def paginate(rows: Sequence[T], limit: int) -> tuple[list[T], Optional[str]]:
+    """
+    Split rows fetched with `limit + 1` into a page and the cursor of the next page.
+
+    Parameters
+    ----------
+    rows : Sequence[T]
+        Rows ordered by ID, fetched with a limit of `limit + 1`.
+        Each row must have an `id` attribute.
+    limit : int
+        The page size requested by the client.
+
+    Returns
+    -------
+    tuple[list[T], Optional[str]]
+        The items of the page and the next cursor, `None` if this is the last page.
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    return items, encode_cursor(items[-1].id)  # type: ignore[attr-defined]
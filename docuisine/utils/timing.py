@@ -0,0 +1,40 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
+
+
+class StageTimer:
+    """Collect the wall-clock duration of the named stages of a pipeline.
+
+    Usage
+    -----
+    ```
+    timer = StageTimer()
+    with timer.stage("decode"):
+        ...
+    logger.info(f"Processed image timings={timer}")  # timings=decode=12.3ms
+    ```
+    """
+
+    def __init__(self):
+        self.durations_ms: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block and record it under `name`.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage. Repeated stages accumulate.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (perf_counter() - start) * 1000
+            self.durations_ms[name] = self.durations_ms.get(name, 0.0) + elapsed_ms
+
+    def __str__(self) -> str:
+        return ",".join(f"{name}={ms:.1f}ms" for name, ms in self.durations_ms.items())
@@ -0,0 +1,155 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
+from typing import Callable, Optional, TypeVar
+
+from loguru import logger
+
+from docuisine.utils.errors import WorkerPoolBusyError
+
+T = TypeVar("T")
+
+
+class ProcessPool:
+    """Process pool for CPU-bound work with a bounded number of pending jobs.
+
+    Jobs beyond `max_pending` are rejected with `WorkerPoolBusyError` instead of
+    queueing without limit, so a burst of work cannot grow memory or latency unbounded.
+    Worker processes are started on first use, and started again after a worker dies
+    (e.g. killed for running out of memory), which fails the jobs it held.
+
+    Usage
+    -----
+    ```
+    pool = ProcessPool(max_workers=4, max_pending=16)
+    result = pool.run(generate_image_renditions, image, "jpeg", ...)
+    ```
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        """
+        Initialize the pool without starting any worker process.
+
+        Parameters
+        ----------
+        max_workers : int
+            Number of worker processes.
+        max_pending : int
+            Maximum number of jobs running or waiting for a worker.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._broken: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def run(self, function: Callable[..., T], *args) -> T:
+        """
+        Run `function(*args)` in a worker process and wait for its result.
+
+        Parameters
+        ----------
+        function : Callable[..., T]
+            A module-level (picklable) function.
+        *args
+            Picklable arguments passed to `function`.
+
+        Returns
+        -------
+        T
+            The return value of `function`.
+
+        Raises
+        ------
+        WorkerPoolBusyError
+            If `max_pending` jobs are already running or waiting, or if a worker
+            process died while running the job.
+        """
+        try:
+            return self.submit(function, *args).result()
+        except BrokenProcessPool:
+            raise WorkerPoolBusyError
+
+    def submit(self, function: Callable[..., T], *args) -> "Future[T]":
+        """
+        Schedule `function(*args)` in a worker process.
+
+        Parameters
+        ----------
+        function : Callable[..., T]
+            A module-level (picklable) function.
+        *args
+            Picklable arguments passed to `function`.
+
+        Returns
+        -------
+        Future[T]
+            The future of the job. It raises `BrokenProcessPool` if a worker
+            process dies before the job is done.
+
+        Raises
+        ------
+        WorkerPoolBusyError
+            If `max_pending` jobs are already running or waiting, or if the
+            pool broke before the job could be scheduled.
+        """
+        if not self._slots.acquire(blocking=False):
+            logger.warning(f"Worker pool is full; rejecting job max_pending={self.max_pending}")
+            raise WorkerPoolBusyError
+        executor = self._get_executor()
+        try:
+            future = executor.submit(function, *args)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._discard(executor)
+            raise WorkerPoolBusyError
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda done: self._on_done(executor, done))
+        return future
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, waiting for running jobs to finish."""
+        with self._lock:
+            executors = [e for e in (self._executor, self._broken) if e is not None]
+            self._executor = self._broken = None
+        for executor in executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _on_done(self, executor: ProcessPoolExecutor, future: Future) -> None:
+        self._slots.release()
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._discard(executor)
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Mark a broken executor to be replaced, so that the next job starts a new one.
+
+        A broken executor has already failed its jobs and stopped its workers. It
+        is kept referenced until the next job shuts it down: this may run in its
+        management thread, which deadlocks if the executor is collected from there.
+        """
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._broken = executor
+        logger.warning(f"Worker pool broke; restarting it max_workers={self.max_workers}")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            broken, self._broken = self._broken, None
+            if self._executor is None:
+                # Spawned workers do not inherit the server's threads and open sockets.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.info(f"Started worker pool max_workers={self.max_workers}")
+            executor = self._executor
+        if broken is not None:
+            broken.shutdown(wait=True)
+        return executor
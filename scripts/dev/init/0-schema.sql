@@ -3,9 +3,23 @@ CREATE TABLE default_table (
     updated_at TIMESTAMP DEFAULT NOW()
 );
 
+CREATE TABLE images (
+    key TEXT PRIMARY KEY,
+    sha VARCHAR(64) UNIQUE NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    preview TEXT NOT NULL,
+    placeholder TEXT,
+    variants JSON NOT NULL DEFAULT '[]'
+) INHERITS (default_table);
+
 CREATE TABLE entity (
     preview_img TEXT,
-    img TEXT
+    img TEXT,
+    placeholder_img TEXT,
+    image_key TEXT
 ) INHERITS (default_table);
 
 CREATE TABLE users (
@@ -13,7 +27,8 @@ CREATE TABLE users (
     username TEXT UNIQUE NOT NULL,
     email TEXT UNIQUE,
     password TEXT NOT NULL,
-    role TEXT NOT NULL
+    role TEXT NOT NULL,
+    token_version INTEGER NOT NULL DEFAULT 0
 ) INHERITS (entity);
 
 
@@ -88,6 +103,28 @@ CREATE TABLE shelf (
 ) INHERITS (default_table);
 
 
+-- Foreign keys and indexes are not inherited, so each entity table declares its own.
+ALTER TABLE users ADD FOREIGN KEY (image_key) REFERENCES images(key) ON DELETE SET NULL;
+ALTER TABLE recipes ADD FOREIGN KEY (image_key) REFERENCES images(key) ON DELETE SET NULL;
+ALTER TABLE ingredients ADD FOREIGN KEY (image_key) REFERENCES images(key) ON DELETE SET NULL;
+ALTER TABLE categories ADD FOREIGN KEY (image_key) REFERENCES images(key) ON DELETE SET NULL;
+ALTER TABLE stores ADD FOREIGN KEY (image_key) REFERENCES images(key) ON DELETE SET NULL;
+CREATE INDEX ix_users_image_key ON users (image_key);
+CREATE INDEX ix_recipes_image_key ON recipes (image_key);
+CREATE INDEX ix_ingredients_image_key ON ingredients (image_key);
+CREATE INDEX ix_categories_image_key ON categories (image_key);
+CREATE INDEX ix_stores_image_key ON stores (image_key);
+
+-- Lookups by name and foreign key; composite primary keys only serve their first column.
+CREATE INDEX ix_recipes_user_id ON recipes (user_id);
+CREATE INDEX ix_recipes_name ON recipes (name);
+CREATE INDEX ix_stores_name ON stores (name);
+CREATE INDEX ix_ingredients_recipe_id ON ingredients (recipe_id);
+CREATE INDEX ix_recipe_ingredients_ingredient_id ON recipe_ingredients (ingredient_id);
+CREATE INDEX ix_recipe_categories_category_id ON recipe_categories (category_id);
+CREATE INDEX ix_shelf_ingredient_id ON shelf (ingredient_id);
+
+
 CREATE OR REPLACE FUNCTION set_updated_at()
 RETURNS TRIGGER AS $$
 BEGIN
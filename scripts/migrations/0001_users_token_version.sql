@@ -0,0 +1,2 @@
+-- Version of a user's tokens, bumped to revoke the tokens issued before.
+ALTER TABLE users ADD COLUMN IF NOT EXISTS token_version INTEGER NOT NULL DEFAULT 0;
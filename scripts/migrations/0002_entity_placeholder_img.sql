@@ -0,0 +1,11 @@
+-- Tiny inline version of an entity's image, as a data URI.
+-- Databases built from 0-schema.sql get the column from `entity`; those built by
+-- create_all have no `entity` table and get it on each table.
+ALTER TABLE IF EXISTS entity ADD COLUMN IF NOT EXISTS placeholder_img TEXT;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS placeholder_img TEXT;
+ALTER TABLE recipes ADD COLUMN IF NOT EXISTS placeholder_img TEXT;
+ALTER TABLE ingredients ADD COLUMN IF NOT EXISTS placeholder_img TEXT;
+ALTER TABLE categories ADD COLUMN IF NOT EXISTS placeholder_img TEXT;
+ALTER TABLE stores ADD COLUMN IF NOT EXISTS placeholder_img TEXT;
+ALTER TABLE recipe_categories ADD COLUMN IF NOT EXISTS placeholder_img TEXT;
+ALTER TABLE IF EXISTS shelves ADD COLUMN IF NOT EXISTS placeholder_img TEXT;
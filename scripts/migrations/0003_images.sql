@@ -0,0 +1,38 @@
+-- Metadata of uploaded images, and the image each entity shows.
+CREATE TABLE IF NOT EXISTS images (
+    key TEXT PRIMARY KEY,
+    sha VARCHAR(64) UNIQUE NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    preview TEXT NOT NULL,
+    placeholder TEXT,
+    variants JSON NOT NULL DEFAULT '[]',
+    created_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- Foreign keys are not inherited, so the column is added to each entity table with its
+-- own, before it is added to `entity` (only present in databases built from 0-schema.sql).
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY[
+        'users', 'recipes', 'ingredients', 'categories', 'stores', 'recipe_categories', 'shelves'
+    ] LOOP
+        IF to_regclass(t) IS NOT NULL THEN
+            EXECUTE format(
+                'ALTER TABLE %I ADD COLUMN IF NOT EXISTS image_key TEXT '
+                'REFERENCES images(key) ON DELETE SET NULL',
+                t
+            );
+            EXECUTE format(
+                'CREATE INDEX IF NOT EXISTS %I ON %I (image_key)', 'ix_' || t || '_image_key', t
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+ALTER TABLE IF EXISTS entity ADD COLUMN IF NOT EXISTS image_key TEXT;
@@ -0,0 +1,25 @@
+-- Secondary indexes for lookups by name and by foreign key. Composite primary keys
+-- only serve lookups by their first column. `shelf` is the name of `shelves` in
+-- databases built from 0-schema.sql.
+DO $$
+DECLARE
+    i TEXT[];
+BEGIN
+    FOREACH i SLICE 1 IN ARRAY ARRAY[
+        ['recipes', 'user_id'],
+        ['recipes', 'name'],
+        ['stores', 'name'],
+        ['ingredients', 'recipe_id'],
+        ['recipe_ingredients', 'ingredient_id'],
+        ['recipe_categories', 'category_id'],
+        ['shelves', 'ingredient_id'],
+        ['shelf', 'ingredient_id']
+    ] LOOP
+        IF to_regclass(i[1]) IS NOT NULL THEN
+            EXECUTE format(
+                'CREATE INDEX IF NOT EXISTS %I ON %I (%I)',
+                'ix_' || i[1] || '_' || i[2], i[1], i[2]
+            );
+        END IF;
+    END LOOP;
+END $$;
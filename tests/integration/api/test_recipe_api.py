@@ -0,0 +1,90 @@
+import pytest
+
+from docuisine.db.models import Ingredient, Recipe, RecipeIngredient, RecipeStep, User
+
+
+def seed_recipes(db_session, recipe_ids: range) -> None:
+    """Insert recipes with two steps and one ingredient each."""
+    if db_session.get(User, 1) is None:
+        db_session.add(User(id=1, username="chef", password="hashed", role="user"))
+        db_session.add(Ingredient(id=1, name="Flour"))
+    for recipe_id in recipe_ids:
+        db_session.add(
+            Recipe(
+                id=recipe_id,
+                user_id=1,
+                name=f"Recipe {recipe_id}",
+                steps=[
+                    RecipeStep(step_number=1, description="Mix"),
+                    RecipeStep(step_number=2, description="Bake"),
+                ],
+                ingredients=[RecipeIngredient(ingredient_id=1, unit="g", quantity=100)],
+            )
+        )
+    db_session.commit()
+
+
+def count_selects(client, url: str, executed_statements: list[str]) -> int:
+    """Return the number of SELECT statements issued while serving `url`."""
+    executed_statements.clear()
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    return len([s for s in executed_statements if s.lstrip().upper().startswith("SELECT")])
+
+
+@pytest.mark.parametrize("url", ["/recipes/", "/recipes/user/1"])
+def test_list_recipes_query_count_is_constant(
+    client, setup_and_teardown, db_session, executed_statements, url
+):
+    seed_recipes(db_session, range(1, 3))
+    few = count_selects(client, url, executed_statements)
+
+    seed_recipes(db_session, range(3, 21))
+    many = count_selects(client, url, executed_statements)
+
+    assert few == many == 3
+
+
+def test_list_recipes_serializes_children(client, setup_and_teardown, db_session):
+    seed_recipes(db_session, range(1, 4))
+
+    response = client.get("/recipes/")
+
+    assert response.status_code == 200, response.text
+    data = response.json()["items"]
+    assert len(data) == 3
+    assert all(len(recipe["steps"]) == 2 for recipe in data)
+    assert all(len(recipe["ingredients"]) == 1 for recipe in data)
+
+
+@pytest.mark.parametrize("url", ["/recipes/", "/recipes/user/1"])
+def test_list_recipes_pages_through_all_recipes(client, setup_and_teardown, db_session, url):
+    seed_recipes(db_session, range(1, 6))
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        response = client.get(url, params=params)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen.extend(recipe["id"] for recipe in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [1, 2, 3, 4, 5]
+
+
+def test_list_recipes_invalid_cursor(client, setup_and_teardown):
+    response = client.get("/recipes/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert "Invalid pagination cursor" in response.json()["detail"]
+
+
+def test_get_recipe_batches_children(client, setup_and_teardown, db_session, executed_statements):
+    seed_recipes(db_session, range(1, 2))
+
+    # The recipe, then its ingredients and its steps, each in one query.
+    assert count_selects(client, "/recipes/1", executed_statements) == 3
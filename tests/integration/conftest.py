@@ -1,10 +1,12 @@
 from fastapi.testclient import TestClient
 import pytest
-from sqlalchemy import StaticPool, create_engine
+from sqlalchemy import StaticPool, create_engine, event
 from sqlalchemy.orm import sessionmaker
 
+from docuisine.db.database import enable_foreign_keys
 from docuisine.db.models.base import Base
-from docuisine.dependencies.db import get_db_session
+from docuisine.dependencies.db import get_blocking_db_session, get_db_session
+from docuisine.dependencies.services import identity_cache
 from docuisine.main import app
 
 DATABASE_URL = "sqlite:///:memory:"
@@ -12,6 +14,7 @@ DATABASE_URL = "sqlite:///:memory:"
 engine = create_engine(
     DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
 )
+enable_foreign_keys(engine)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -24,6 +27,7 @@ def get_test_db():
 
 
 app.dependency_overrides[get_db_session] = get_test_db
+app.dependency_overrides[get_blocking_db_session] = get_test_db
 
 
 @pytest.fixture()
@@ -34,8 +38,33 @@ def setup_and_teardown():
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
+    if identity_cache is not None:
+        identity_cache.clear()
 
 
 @pytest.fixture(scope="module")
 def client():
     return TestClient(app)
+
+
+@pytest.fixture()
+def db_session():
+    """Provide a session on the test database, e.g. for seeding rows directly."""
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture()
+def executed_statements():
+    """Record every SQL statement executed against the test database."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
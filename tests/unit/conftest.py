@@ -3,8 +3,12 @@ from unittest.mock import MagicMock
 
 from fastapi.testclient import TestClient
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
-from docuisine.db.models import User
+from docuisine.db.database import enable_foreign_keys
+from docuisine.db.models import Base, User
 from docuisine.dependencies.auth import get_client_user
 from docuisine.main import app
 from docuisine.schemas.enums import Role
@@ -18,7 +22,11 @@ def db_session():
     """
     session = MagicMock()
     session.query.return_value = session
+    session.options.return_value = session
     session.filter_by.return_value = session
+    session.filter.return_value = session
+    session.order_by.return_value = session
+    session.limit.return_value = session
     session.delete.return_value = session
     session.commit.return_value = session
     session.add.return_value = session
@@ -26,6 +34,32 @@ def db_session():
     return session
 
 
+@pytest.fixture
+def sqlite_session():
+    """
+    Provide a session on an empty in-memory SQLite database with every declared table.
+    Used in unit tests for services whose statements a mock session cannot answer,
+    such as `UPDATE ... RETURNING`.
+    """
+    engine = create_engine("sqlite://")
+    enable_foreign_keys(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def unique_violation():
+    """
+    Provide the integrity error PostgreSQL raises for a duplicate value (SQLSTATE 23505).
+    Used as the side effect of a mock session's commit.
+    """
+    orig = Exception("duplicate key value violates unique constraint")
+    orig.pgcode = "23505"  # type: ignore
+    return IntegrityError(statement=None, params=None, orig=orig)
+
+
 @pytest.fixture
 def regular_user():
     """
@@ -2,7 +2,11 @@ from fastapi import status
 
 from docuisine.schemas.enums import Role
 
-POST_RESPONSE_1 = {"token_type": "bearer", "access_token": "testaccesstoken"}
+POST_RESPONSE_1 = {
+    "token_type": "bearer",
+    "access_token": "testaccesstoken",
+    "refresh_token": "testrefreshtoken",
+}
 
 POST_PARAMETERS = [
     # scenario, role, expected_status, expected_response
@@ -20,3 +24,21 @@ POST_PARAMETERS = [
         {"detail": "User with username 'nonexistentuser' not found."},
     ),
 ]
+
+REFRESH_PARAMETERS = [
+    # scenario, expected_status, expected_response
+    (
+        "success_refresh",
+        status.HTTP_200_OK,
+        {
+            "token_type": "bearer",
+            "access_token": "newaccesstoken",
+            "refresh_token": "newrefreshtoken",
+        },
+    ),
+    (
+        "invalid_refresh",
+        status.HTTP_401_UNAUTHORIZED,
+        {"detail": "Could not validate credentials."},
+    ),
+]
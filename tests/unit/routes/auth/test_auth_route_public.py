@@ -37,6 +37,7 @@ class TestPOST:
                     role="user",
                 )
                 mock_user_service.create_access_token.return_value = "testaccesstoken"
+                mock_user_service.create_refresh_token.return_value = "testrefreshtoken"
             case "invalid_credentials":
                 mock_user_service.authenticate_user.side_effect = errors.InvalidPasswordError
             case "user_not_found":
@@ -56,3 +57,30 @@ class TestPOST:
         )
         assert response.status_code == expected_status, response.text
         assert response.json() == expected_response
+
+
+@pytest.mark.parametrize("scenario, expected_status, expected_response", p.REFRESH_PARAMETERS)
+def test_refresh_token(
+    scenario: str,
+    expected_status: int,
+    expected_response: dict,
+    create_client: Callable[[Role], TestClient],
+):
+    ## Setup
+    mock_user_service = MagicMock()
+    match scenario:
+        case "success_refresh":
+            mock_user_service.refresh_tokens.return_value = ("newaccesstoken", "newrefreshtoken")
+        case "invalid_refresh":
+            mock_user_service.refresh_tokens.side_effect = errors.InvalidCredentialsError
+
+    client = create_client(Role.PUBLIC)
+    client.app.dependency_overrides[services.get_user_service] = (  # type: ignore
+        lambda: mock_user_service
+    )
+
+    ## Test
+    response = client.post("/auth/refresh", json={"refresh_token": "testrefreshtoken"})
+    assert response.status_code == expected_status, response.text
+    assert response.json() == expected_response
+    mock_user_service.refresh_tokens.assert_called_once_with(refresh_token="testrefreshtoken")
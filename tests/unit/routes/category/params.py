@@ -14,6 +14,7 @@ GET_ALL_CATEGORIES_RESPONSE = [
         "description": "Sweet treats",
         "img": None,
         "preview_img": None,
+        "placeholder_img": None,
     },
     {
         "id": 2,
@@ -21,6 +22,7 @@ GET_ALL_CATEGORIES_RESPONSE = [
         "description": "Meat-free dishes",
         "img": None,
         "preview_img": None,
+        "placeholder_img": None,
     },
     {
         "id": 3,
@@ -28,6 +30,7 @@ GET_ALL_CATEGORIES_RESPONSE = [
         "description": None,
         "img": None,
         "preview_img": None,
+        "placeholder_img": None,
     },
 ]
 
@@ -37,16 +40,19 @@ GET_BY_NAME_RESPONSE = {
     "description": "Sweet treats",
     "img": None,
     "preview_img": None,
+    "placeholder_img": None,
 }
 
 GET_NOT_FOUND_RESPONSE = {"detail": "Category with ID 999 not found."}
 
 
+GET_ALL_CATEGORIES_PAGE_RESPONSE = {"items": GET_ALL_CATEGORIES_RESPONSE, "next_cursor": None}
+
 GET_PARAMETERS = [
     # scenario, role, expected_status, expected_response
-    ("get_all", Role.PUBLIC, status.HTTP_200_OK, GET_ALL_CATEGORIES_RESPONSE),
-    ("get_all", Role.USER, status.HTTP_200_OK, GET_ALL_CATEGORIES_RESPONSE),
-    ("get_all", Role.ADMIN, status.HTTP_200_OK, GET_ALL_CATEGORIES_RESPONSE),
+    ("get_all", Role.PUBLIC, status.HTTP_200_OK, GET_ALL_CATEGORIES_PAGE_RESPONSE),
+    ("get_all", Role.USER, status.HTTP_200_OK, GET_ALL_CATEGORIES_PAGE_RESPONSE),
+    ("get_all", Role.ADMIN, status.HTTP_200_OK, GET_ALL_CATEGORIES_PAGE_RESPONSE),
     ("get_by_name", Role.PUBLIC, status.HTTP_200_OK, GET_BY_NAME_RESPONSE),
     ("get_by_name", Role.USER, status.HTTP_200_OK, GET_BY_NAME_RESPONSE),
     ("get_by_name", Role.ADMIN, status.HTTP_200_OK, GET_BY_NAME_RESPONSE),
@@ -64,6 +70,7 @@ POST_RESPONSE_1 = {
     "id": 4,
     "img": None,
     "preview_img": None,
+    "placeholder_img": None,
 }
 POST_RESPONSE_2 = {
     "name": "Appetizer",
@@ -71,6 +78,7 @@ POST_RESPONSE_2 = {
     "id": 4,
     "img": None,
     "preview_img": None,
+    "placeholder_img": None,
 }
 POST_RESPONSE_3 = {"detail": "Category with name 'Dessert' already exists."}
 POST_RESPONSE_IMAGE_UPLOAD = {
@@ -79,6 +87,7 @@ POST_RESPONSE_IMAGE_UPLOAD = {
     "id": 4,
     "img": "appetizer_full.jpg",
     "preview_img": "appetizer_preview.jpg",
+    "placeholder_img": None,
 }
 
 POST_PARAMETERS = [
@@ -121,6 +130,7 @@ PUT_PARAMETERS = [
             "description": "Updated description",
             "img": "test",
             "preview_img": "test",
+            "placeholder_img": None,
         },
     ),
     (
@@ -133,6 +143,7 @@ PUT_PARAMETERS = [
             "description": "Original description",
             "img": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
     ),
     (
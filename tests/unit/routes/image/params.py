@@ -0,0 +1,34 @@
+from fastapi import status
+
+from docuisine.schemas.enums import Role
+
+FORBIDDEN_ACCESS_RESPONSE = {"detail": "You do not have permission to perform this action."}
+UNAUTHORIZED_ACCESS_RESPONSE = {"detail": "Not authenticated"}
+
+
+# ---------------- POST PARAMETERS ----------------
+UNSUPPORTED_IMAGE_RESPONSE = {"detail": "Unsupported image format: unknown"}
+INVALID_IMAGE_RESPONSE = {"detail": "Image could not be decoded"}
+TOO_LARGE_RESPONSE = {"detail": "Image exceeds the maximum upload size of 1024 bytes"}
+
+POST_PARAMETERS = [
+    # scenario, role, expected_status, expected_response
+    ("unauthorized", Role.PUBLIC, status.HTTP_401_UNAUTHORIZED, UNAUTHORIZED_ACCESS_RESPONSE),
+    ("unauthorized", Role.USER, status.HTTP_403_FORBIDDEN, FORBIDDEN_ACCESS_RESPONSE),
+    (
+        "non_image",
+        Role.ADMIN,
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        UNSUPPORTED_IMAGE_RESPONSE,
+    ),
+    (
+        "non_image_base64",
+        Role.ADMIN,
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        UNSUPPORTED_IMAGE_RESPONSE,
+    ),
+    ("corrupt_jpeg", Role.ADMIN, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, INVALID_IMAGE_RESPONSE),
+    ("corrupt_png", Role.ADMIN, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, INVALID_IMAGE_RESPONSE),
+    ("too_large", Role.ADMIN, status.HTTP_413_CONTENT_TOO_LARGE, TOO_LARGE_RESPONSE),
+    ("too_large_declared", Role.ADMIN, status.HTTP_413_CONTENT_TOO_LARGE, TOO_LARGE_RESPONSE),
+]
@@ -0,0 +1,82 @@
+import base64
+from typing import Callable
+from unittest.mock import MagicMock
+
+from fastapi import Request
+from fastapi.testclient import TestClient
+import pytest
+
+from docuisine.db.storage import S3Storage
+from docuisine.dependencies.services import get_image_service
+from docuisine.dependencies.uploads import get_upload_limits
+from docuisine.schemas.image import UploadLimits
+from docuisine.schemas.enums import Role
+from docuisine.services import ImageService
+
+from . import params as p
+
+NON_IMAGE = b"this is plain text, not an image"
+# Valid signatures followed by bodies that cannot be decoded.
+CORRUPT_IMAGES = {
+    "corrupt_jpeg": b"\xff\xd8\xff\xe0" + b"garbage" * 10,
+    "corrupt_png": b"\x89PNG\r\n\x1a\n" + b"garbage" * 10,
+}
+
+
+@pytest.mark.parametrize(
+    "scenario, client_name, expected_status, expected_response", p.POST_PARAMETERS
+)
+class TestPOST:
+    def test_upload_image(
+        self,
+        scenario: str,
+        client_name: Role,
+        expected_status: int,
+        expected_response: dict,
+        create_client: Callable[[Role], TestClient],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that uploads that are not images, or too large, are rejected."""
+
+        ## Setup
+        mock_s3 = MagicMock()
+        image_service = ImageService(storage=S3Storage(mock_s3, bucket_name="docuisine-images"))
+
+        client = create_client(client_name)
+        client.app.dependency_overrides[get_image_service] = lambda: image_service  # type: ignore
+        client.app.dependency_overrides[get_upload_limits] = lambda: UploadLimits(max_size=1024)  # type: ignore
+
+        ## Test
+        match scenario:
+            case "unauthorized" | "non_image":
+                response = client.post(
+                    "/image/", files={"image": ("notes.jpg", NON_IMAGE, "image/jpeg")}
+                )
+            case "non_image_base64":
+                response = client.post(
+                    "/image/base64",
+                    content=base64.b64encode(NON_IMAGE),
+                    headers={"Content-Type": "text/plain"},
+                )
+            case "corrupt_jpeg" | "corrupt_png":
+                response = client.post(
+                    "/image/", files={"image": ("photo", CORRUPT_IMAGES[scenario], "image/*")}
+                )
+            case "too_large":
+                response = client.post(
+                    "/image/", files={"image": ("photo.jpg", b"\xff" * 2048, "image/jpeg")}
+                )
+            case "too_large_declared":
+                # The declared length is over the limit, so the form is never parsed.
+                monkeypatch.setattr(Request, "form", MagicMock(side_effect=AssertionError))
+                response = client.post(
+                    "/image/", files={"image": ("photo.jpg", b"\xff" * 128 * 1024, "image/jpeg")}
+                )
+        assert response.status_code == expected_status, response.text
+        assert response.json() == expected_response
+        if scenario in CORRUPT_IMAGES:
+            # The original is stored while the image is decoded, then deleted.
+            mock_s3.delete_object.assert_called_once()
+        else:
+            mock_s3.put_object.assert_not_called()
+            mock_s3.upload_fileobj.assert_not_called()
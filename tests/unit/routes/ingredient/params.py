@@ -15,12 +15,14 @@ GET_INGREDIENT_BY_ID_RESPONSE = {
 }
 GET_INGREDIENT_NOT_FOUND_RESPONSE = {"detail": "Ingredient with ID 999 not found."}
 
+GET_INGREDIENTS_PAGE_RESPONSE = {"items": GET_INGREDIENTS_RESPONSE, "next_cursor": None}
+
 # Parametrization for GET tests
 GET_PARAMETERS = [
     # scenario, client_name, expected_status, expected_response
-    ("get_all", "public", status.HTTP_200_OK, GET_INGREDIENTS_RESPONSE),
-    ("get_all", "user", status.HTTP_200_OK, GET_INGREDIENTS_RESPONSE),
-    ("get_all", "admin", status.HTTP_200_OK, GET_INGREDIENTS_RESPONSE),
+    ("get_all", "public", status.HTTP_200_OK, GET_INGREDIENTS_PAGE_RESPONSE),
+    ("get_all", "user", status.HTTP_200_OK, GET_INGREDIENTS_PAGE_RESPONSE),
+    ("get_all", "admin", status.HTTP_200_OK, GET_INGREDIENTS_PAGE_RESPONSE),
     ("get_by_id", "public", status.HTTP_200_OK, GET_INGREDIENT_BY_ID_RESPONSE),
     ("get_by_id", "user", status.HTTP_200_OK, GET_INGREDIENT_BY_ID_RESPONSE),
     ("get_by_id", "admin", status.HTTP_200_OK, GET_INGREDIENT_BY_ID_RESPONSE),
@@ -90,6 +92,13 @@ PUT_PARAMETERS = [
         status.HTTP_409_CONFLICT,
         {"detail": "Ingredient with name 'Existing' already exists."},
     ),
+    (
+        "unknown_recipe",
+        "admin",
+        {"recipe_id": 999},
+        status.HTTP_422_UNPROCESSABLE_CONTENT,
+        {"detail": "Rejected by a database constraint"},
+    ),
 ]
 
 # Define DELETE test scenarios
@@ -110,3 +119,33 @@ DELETE_PARAMETERS = [
         {"detail": "Ingredient with ID 999 not found."},
     ),
 ]
+
+# Define bulk POST test scenarios
+BULK_POST_RESPONSE = {
+    "items": [
+        {"index": 0, "status_code": 201, "id": 1, "detail": None},
+        {"index": 1, "status_code": 409, "id": None, "detail": POST_RESPONSE_4["detail"]},
+    ],
+    "created": 1,
+    "conflicts": 1,
+}
+
+BULK_POST_PARAMETERS = [
+    # scenario, client_name, expected_status, expected_response
+    ("json", "user", status.HTTP_200_OK, BULK_POST_RESPONSE),
+    ("json", "admin", status.HTTP_200_OK, BULK_POST_RESPONSE),
+    ("ndjson", "admin", status.HTTP_200_OK, BULK_POST_RESPONSE),
+    (
+        "too_many",
+        "admin",
+        status.HTTP_400_BAD_REQUEST,
+        {"detail": "A bulk request holds at most 2 items"},
+    ),
+    (
+        "too_large",
+        "admin",
+        status.HTTP_413_CONTENT_TOO_LARGE,
+        {"detail": "A bulk request holds at most 1024 bytes"},
+    ),
+    ("json", "public", status.HTTP_401_UNAUTHORIZED, {"detail": "Not authenticated"}),
+]
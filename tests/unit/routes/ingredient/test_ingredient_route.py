@@ -1,3 +1,4 @@
+import json
 from typing import Callable
 from unittest.mock import MagicMock
 
@@ -6,8 +7,10 @@ from fastapi.testclient import TestClient
 import pytest
 
 from docuisine.db.models import Ingredient
+from docuisine.dependencies.bulk import get_bulk_limits
 from docuisine.dependencies.services import get_ingredient_service
 from docuisine.schemas import Role
+from docuisine.schemas.common import BulkLimits
 from docuisine.utils import errors
 
 from . import params as p
@@ -92,6 +95,56 @@ class TestPOST:
         assert data == post_response
 
 
+@pytest.mark.parametrize(
+    "scenario, client_name, expected_status, expected_response", p.BULK_POST_PARAMETERS
+)
+class TestBulkPOST:
+    def test_create_ingredients(
+        self,
+        scenario: str,
+        client_name: Role,
+        expected_status: int,
+        expected_response: dict,
+        create_client: Callable[[Role], TestClient],
+    ):
+        """Test creating ingredients in bulk, from a JSON array or NDJSON."""
+        mock = MagicMock()
+        mock.create_ingredients.return_value = p.BULK_POST_RESPONSE["items"]
+
+        client = create_client(client_name)
+        client.app.dependency_overrides[get_ingredient_service] = lambda: mock  # type: ignore
+        client.app.dependency_overrides[get_bulk_limits] = lambda: BulkLimits(  # type: ignore
+            max_items=2, chunk_size=1, max_bytes=1024
+        )
+
+        ingredients = [{"name": "Eggs"}, {"name": "Eggs", "description": "Large eggs"}]
+        match scenario:
+            case "json":
+                response = client.post("/ingredients/bulk", json=ingredients)
+            case "ndjson":
+                response = client.post(
+                    "/ingredients/bulk",
+                    content="\n".join(json.dumps(ingredient) for ingredient in ingredients),
+                    headers={"Content-Type": "application/x-ndjson"},
+                )
+            case "too_many":
+                response = client.post("/ingredients/bulk", json=ingredients * 2)
+            case "too_large":
+                response = client.post(
+                    "/ingredients/bulk", json=[{"name": "Eggs", "description": "x" * 2048}]
+                )
+        assert response.status_code == expected_status, response.text
+        assert response.json() == expected_response
+        if expected_status == status.HTTP_200_OK:
+            mock.create_ingredients.assert_called_once_with(
+                [
+                    {"name": "Eggs", "description": None, "recipe_id": None},
+                    {"name": "Eggs", "description": "Large eggs", "recipe_id": None},
+                ],
+                chunk_size=1,
+            )
+
+
 @pytest.mark.parametrize(
     "scenario, client_name, input_data, expected_status, expected_response", p.PUT_PARAMETERS
 )
@@ -117,6 +170,8 @@ class TestPUT:
                 )
             elif scenario == "conflict":
                 mock.update_ingredient.side_effect = errors.IngredientExistsError(name="Existing")
+            elif scenario == "unknown_recipe":
+                mock.update_ingredient.side_effect = errors.ConstraintViolationError()
             return mock
 
         client = create_client(client_name)
@@ -18,6 +18,9 @@ GET_ALL_RECIPES_RESPONSE = [
         "steps": [],
         "created_at": "2024-01-01T12:00:00Z",
         "updated_at": "2024-01-01T12:00:00Z",
+        "img": None,
+        "preview_img": None,
+        "placeholder_img": None,
     },
     {
         "id": 2,
@@ -32,7 +35,9 @@ GET_ALL_RECIPES_RESPONSE = [
         "steps": [],
         "created_at": "2024-01-01T12:00:00Z",
         "updated_at": "2024-01-01T12:00:00Z",
-
+        "img": None,
+        "preview_img": None,
+        "placeholder_img": None,
     },
     {
         "id": 3,
@@ -47,7 +52,9 @@ GET_ALL_RECIPES_RESPONSE = [
         "steps": [],
         "created_at": "2024-01-01T12:00:00Z",
         "updated_at": "2024-01-01T12:00:00Z",
-
+        "img": None,
+        "preview_img": None,
+        "placeholder_img": None,
     },
 ]
 
@@ -64,16 +71,21 @@ GET_RECIPE_BY_ID_RESPONSE = {
     "steps": [],
     "created_at": "2024-01-01T12:00:00Z",
     "updated_at": "2024-01-01T12:00:00Z",
+    "img": None,
+    "preview_img": None,
+    "placeholder_img": None,
 }
 
 GET_RECIPE_NOT_FOUND_RESPONSE = {"detail": "Recipe with ID 999 not found."}
 
+GET_ALL_RECIPES_PAGE_RESPONSE = {"items": GET_ALL_RECIPES_RESPONSE, "next_cursor": None}
+
 # Parametrization for GET tests
 # scenario, client_name, expected_status, expected_response
 GET_PARAMETERS = [
-    ("get_all", "public", status.HTTP_200_OK, GET_ALL_RECIPES_RESPONSE),
-    ("get_all", "user", status.HTTP_200_OK, GET_ALL_RECIPES_RESPONSE),
-    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_RECIPES_RESPONSE),
+    ("get_all", "public", status.HTTP_200_OK, GET_ALL_RECIPES_PAGE_RESPONSE),
+    ("get_all", "user", status.HTTP_200_OK, GET_ALL_RECIPES_PAGE_RESPONSE),
+    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_RECIPES_PAGE_RESPONSE),
     ("get_by_id", "public", status.HTTP_200_OK, GET_RECIPE_BY_ID_RESPONSE),
     ("get_by_id", "user", status.HTTP_200_OK, GET_RECIPE_BY_ID_RESPONSE),
     ("get_by_id", "admin", status.HTTP_200_OK, GET_RECIPE_BY_ID_RESPONSE),
@@ -97,6 +109,9 @@ POST_RESPONSE_1 = {
     "steps": [],
     "created_at": "2024-01-01T12:00:00Z",
     "updated_at": "2024-01-01T12:00:00Z",
+    "img": None,
+    "preview_img": None,
+    "placeholder_img": None,
 }
 
 POST_RESPONSE_2 = {
@@ -112,6 +127,9 @@ POST_RESPONSE_2 = {
     "steps": [],
     "created_at": "2024-01-01T12:00:00Z",
     "updated_at": "2024-01-01T12:00:00Z",
+    "img": None,
+    "preview_img": None,
+    "placeholder_img": None,
 }
 POST_RESPONSE_CONFLICT = {"detail": "Recipe with name 'Existing Recipe' already exists."}
 
@@ -140,6 +158,9 @@ PUT_RESPONSE_FULL = {
     "steps": [],
     "created_at": "2024-01-01T12:00:00Z",
     "updated_at": "2024-01-01T12:00:00Z",
+    "img": None,
+    "preview_img": None,
+    "placeholder_img": None,
 }
 PUT_RESPONSE_PARTIAL = {
     "id": 1,
@@ -154,9 +175,13 @@ PUT_RESPONSE_PARTIAL = {
     "steps": [],
     "created_at": "2024-01-01T12:00:00Z",
     "updated_at": "2024-01-01T12:00:00Z",
+    "img": None,
+    "preview_img": None,
+    "placeholder_img": None,
 }
 PUT_RESPONSE_NOT_FOUND = {"detail": "Recipe with ID 999 not found."}
 PUT_RESPONSE_CONFLICT = {"detail": "Recipe with name 'Existing Recipe' already exists."}
+FORBIDDEN_ACCESS_RESPONSE = {"detail": "You do not have permission to perform this action."}
 
 # Parametrization for PUT tests
 # scenario, client_name, input_data, expected_status, expected_response
@@ -195,6 +220,20 @@ PUT_PARAMETERS = [
         status.HTTP_409_CONFLICT,
         PUT_RESPONSE_CONFLICT,
     ),
+    (
+        "update_partial",
+        "user",
+        {"servings": 10},
+        status.HTTP_200_OK,
+        PUT_RESPONSE_PARTIAL,
+    ),
+    (
+        "not_owner",
+        "user",
+        {"servings": 10},
+        status.HTTP_403_FORBIDDEN,
+        FORBIDDEN_ACCESS_RESPONSE,
+    ),
 ]
 
 # ========== DELETE Responses ==========
@@ -207,4 +246,6 @@ DELETE_RESPONSE_NOT_FOUND = {"detail": "Recipe with ID 999 not found."}
 DELETE_PARAMETERS = [
     ("delete_success", "admin", 1, status.HTTP_200_OK, DELETE_RESPONSE_SUCCESS),
     ("delete_not_found", "admin", 999, status.HTTP_404_NOT_FOUND, DELETE_RESPONSE_NOT_FOUND),
+    ("delete_success", "user", 1, status.HTTP_200_OK, DELETE_RESPONSE_SUCCESS),
+    ("not_owner", "user", 1, status.HTTP_403_FORBIDDEN, FORBIDDEN_ACCESS_RESPONSE),
 ]
@@ -114,6 +114,7 @@ class TestPUT:
 
         def mock_recipe_service():
             mock = MagicMock()
+            mock.is_recipe_owner.return_value = scenario != "not_owner"
             if scenario in ["update_full", "update_partial"]:
                 mock.update_recipe.return_value = Recipe(**expected_response)
             elif scenario == "not_found":
@@ -148,6 +149,7 @@ class TestDELETE:
 
         def mock_recipe_service():
             mock = MagicMock()
+            mock.is_recipe_owner.return_value = scenario != "not_owner"
             if scenario == "delete_success":
                 mock.delete_recipe.return_value = None
             elif scenario == "delete_not_found":
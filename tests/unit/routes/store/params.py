@@ -50,12 +50,14 @@ GET_STORE_BY_ID_RESPONSE = {
 
 GET_STORE_NOT_FOUND_RESPONSE = {"detail": "Store with ID 999 not found."}
 
+GET_ALL_STORES_PAGE_RESPONSE = {"items": GET_ALL_STORES_RESPONSE, "next_cursor": None}
+
 # Parametrization for GET tests
 # scenario, client_name, expected_status, expected_response
 GET_PARAMETERS = [
-    ("get_all", "public", status.HTTP_200_OK, GET_ALL_STORES_RESPONSE),
-    ("get_all", "user", status.HTTP_200_OK, GET_ALL_STORES_RESPONSE),
-    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_STORES_RESPONSE),
+    ("get_all", "public", status.HTTP_200_OK, GET_ALL_STORES_PAGE_RESPONSE),
+    ("get_all", "user", status.HTTP_200_OK, GET_ALL_STORES_PAGE_RESPONSE),
+    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_STORES_PAGE_RESPONSE),
     ("get_by_id", "public", status.HTTP_200_OK, GET_STORE_BY_ID_RESPONSE),
     ("get_by_id", "user", status.HTTP_200_OK, GET_STORE_BY_ID_RESPONSE),
     ("get_by_id", "admin", status.HTTP_200_OK, GET_STORE_BY_ID_RESPONSE),
@@ -17,6 +17,7 @@ GET_ALL_USERS_RESPONSE = [
         "role": "user",
         "updated_at": None,
         "preview_img": None,
+        "placeholder_img": None,
     },
     {
         "id": 2,
@@ -27,6 +28,7 @@ GET_ALL_USERS_RESPONSE = [
         "role": "user",
         "updated_at": None,
         "preview_img": None,
+        "placeholder_img": None,
     },
 ]
 
@@ -39,16 +41,19 @@ GET_A_USER_RESPONSE = {
     "img": None,
     "updated_at": None,
     "preview_img": None,
+    "placeholder_img": None,
 }
 
 GET_USER_NOT_FOUND_RESPONSE = {"detail": "User with ID 999 not found."}
 
+GET_ALL_USERS_PAGE_RESPONSE = {"items": GET_ALL_USERS_RESPONSE, "next_cursor": None}
+
 # Parametrization for GET tests
 # scenario, client_name, expected_status, expected_response
 GET_PARAMETERS = [
-    ("get_all", "public", status.HTTP_200_OK, GET_ALL_USERS_RESPONSE),
-    ("get_all", "user", status.HTTP_200_OK, GET_ALL_USERS_RESPONSE),
-    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_USERS_RESPONSE),
+    ("get_all", "public", status.HTTP_200_OK, GET_ALL_USERS_PAGE_RESPONSE),
+    ("get_all", "user", status.HTTP_200_OK, GET_ALL_USERS_PAGE_RESPONSE),
+    ("get_all", "admin", status.HTTP_200_OK, GET_ALL_USERS_PAGE_RESPONSE),
     ("get_not_found", "public", status.HTTP_404_NOT_FOUND, GET_USER_NOT_FOUND_RESPONSE),
     ("get_not_found", "user", status.HTTP_404_NOT_FOUND, GET_USER_NOT_FOUND_RESPONSE),
     ("get_not_found", "admin", status.HTTP_404_NOT_FOUND, GET_USER_NOT_FOUND_RESPONSE),
@@ -65,6 +70,7 @@ POST_RESPONSE_1 = {
     "email": None,
     "role": "user",
     "preview_img": None,
+    "placeholder_img": None,
     "created_at": None,
     "img": None,
     "updated_at": None,
@@ -75,6 +81,7 @@ POST_RESPONSE_2 = {
     "email": "newuser@example.com",
     "role": "user",
     "preview_img": None,
+    "placeholder_img": None,
     "created_at": None,
     "img": None,
     "updated_at": None,
@@ -100,6 +107,7 @@ PUT_RESPONSE_PASSWORD_SUCCESS = {
     "img": None,
     "updated_at": None,
     "preview_img": None,
+    "placeholder_img": None,
 }
 PUT_RESPONSE_PASSWORD_NOT_FOUND = {"detail": "User with ID 1 not found."}
 PUT_RESPONSE_EMAIL_SUCCESS = {
@@ -111,6 +119,7 @@ PUT_RESPONSE_EMAIL_SUCCESS = {
     "img": None,
     "updated_at": None,
     "preview_img": None,
+    "placeholder_img": None,
 }
 PUT_RESPONSE_EMAIL_NOT_FOUND = {"detail": "User with ID 1 not found."}
 PUT_RESPONSE_EMAIL_CONFLICT = {
@@ -131,6 +140,7 @@ PUT_PARAMETERS = [
             "img": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
         status.HTTP_200_OK,
         PUT_RESPONSE_PASSWORD_SUCCESS,
@@ -152,6 +162,7 @@ PUT_PARAMETERS = [
             "created_at": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
         status.HTTP_200_OK,
         PUT_RESPONSE_EMAIL_SUCCESS,
@@ -167,6 +178,7 @@ PUT_PARAMETERS = [
             "img": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
         status.HTTP_404_NOT_FOUND,
         PUT_RESPONSE_EMAIL_NOT_FOUND,
@@ -182,6 +194,7 @@ PUT_PARAMETERS = [
             "img": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
         status.HTTP_409_CONFLICT,
         PUT_RESPONSE_EMAIL_CONFLICT,
@@ -198,6 +211,7 @@ PUT_PARAMETERS = [
             "img": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
         status.HTTP_200_OK,
         {
@@ -209,6 +223,7 @@ PUT_PARAMETERS = [
             "img": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
     ),
     (
@@ -223,6 +238,7 @@ PUT_PARAMETERS = [
             "img": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
         status.HTTP_200_OK,
         {
@@ -234,6 +250,7 @@ PUT_PARAMETERS = [
             "img": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
     ),
     (
@@ -248,6 +265,7 @@ PUT_PARAMETERS = [
             "img": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
         status.HTTP_403_FORBIDDEN,
         FORBIDDEN_ACCESS_RESPONSE,
@@ -264,6 +282,7 @@ PUT_PARAMETERS = [
             "img": None,
             "updated_at": None,
             "preview_img": None,
+            "placeholder_img": None,
         },
         status.HTTP_401_UNAUTHORIZED,
         UNAUTHORIZED_ACCESS_RESPONSE,
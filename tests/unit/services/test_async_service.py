@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from docuisine.db.models import Category
+from docuisine.schemas.auth import JWTConfig
+from docuisine.services import AsyncService, CategoryService, UserService
+from docuisine.utils.errors import CategoryNotFoundError
+
+
+def test_async_service_runs_method_in_threadpool(db_session: MagicMock):
+    """Test that wrapped service methods are awaitable without an async session."""
+    service = CategoryService(db_session)
+    categories = [Category(id=1, name="Dessert"), Category(id=2, name="Korean")]
+    db_session.query.return_value.all.return_value = categories
+
+    async_service = AsyncService(service)
+    result = asyncio.run(async_service.get_all_categories())
+
+    assert result == categories
+    db_session.query.assert_called_once_with(Category)
+
+
+def test_async_service_runs_method_through_async_session(db_session: MagicMock):
+    """Test that wrapped service methods run through `AsyncSession.run_sync` when given."""
+    service = CategoryService(db_session)
+    example = Category(id=1, name="Dessert")
+    db_session.first.return_value = example
+
+    async_session = MagicMock()
+    async_session.run_sync = AsyncMock(side_effect=lambda function: function(db_session))
+
+    async_service = AsyncService(service, async_session=async_session)
+    result = asyncio.run(async_service.get_category(category_id=1))
+
+    assert result == example
+    async_session.run_sync.assert_awaited_once()
+
+
+def test_async_service_propagates_exceptions(db_session: MagicMock, monkeypatch):
+    """Test that exceptions raised by the wrapped service reach the awaiting caller."""
+    service = CategoryService(db_session)
+    monkeypatch.setattr(service, "_get_category_by_id", lambda category_id: None)
+
+    async_service = AsyncService(service)
+
+    with pytest.raises(CategoryNotFoundError) as exc_info:
+        asyncio.run(async_service.get_category(category_id=999))
+
+    assert "999" in str(exc_info.value)
+
+
+def test_async_service_exposes_attributes(db_session: MagicMock):
+    """Test that non-callable attributes of the wrapped service are returned as is."""
+    jwt_config = JWTConfig(secret_key="secret")
+    service = UserService(db_session, jwt_config=jwt_config)
+
+    async_service = AsyncService(service)
+
+    assert async_service.jwt_config is jwt_config
@@ -1,9 +1,11 @@
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
-from docuisine.db.models import Category
+from docuisine.db.models import Category, Recipe, RecipeCategory, User
 from docuisine.services import CategoryService
 from docuisine.utils.errors import CategoryExistsError, CategoryNotFoundError
 
@@ -41,6 +43,23 @@ def test_create_category_duplicate_name_raises_error(db_session: MagicMock):
     assert "Dessert" in str(exc_info.value)
 
 
+def test_create_categories(sqlite_session: Session):
+    """Test that existing and repeated names are reported as conflicts."""
+    sqlite_session.add(Category(id=1, name="Dessert"))
+    sqlite_session.commit()
+    rows = [
+        {"name": name, "description": None}
+        for name in ("Vegetarian", "Dessert", "Vegetarian", "Vegan")
+    ]
+
+    items = CategoryService(sqlite_session).create_categories(rows, chunk_size=1)
+
+    assert [item.status_code for item in items] == [201, 409, 409, 201]
+    assert items[1].detail == CategoryExistsError("Dessert").message
+    names = set(sqlite_session.scalars(select(Category.name)))
+    assert names == {"Dessert", "Vegetarian", "Vegan"}
+
+
 def test_get_category_by_id(db_session: MagicMock, monkeypatch):
     """Test retrieving a category by ID."""
     service = CategoryService(db_session)
@@ -129,67 +148,67 @@ def test_get_all_categories(db_session: MagicMock):
     assert category_names == {"Mexican", "Japanese", "Indian"}
 
 
-def test_update_category_name(db_session: MagicMock, monkeypatch):
-    """Test updating a category's name."""
+def test_get_all_categories_paginated(db_session: MagicMock):
+    """Test retrieving a page of categories after a given ID."""
     service = CategoryService(db_session)
+    cat3 = Category(id=3, name="Indian")
+    db_session.all.return_value = [cat3]
+
+    page = service.get_all_categories(limit=1, after_id=2)
+
+    assert page == [cat3]
+    db_session.limit.assert_called_once_with(1)
+    db_session.filter.assert_called_once()
+
+
+def test_update_category_name(sqlite_session: Session):
+    """Test updating a category's name."""
+    service = CategoryService(sqlite_session)
     category: Category = Category(id=1, name="Deserts", description="Sweet dishes")
-    monkeypatch.setattr(
-        service,
-        "_get_category_by_id",
-        lambda x: category,
-    )
+    sqlite_session.add(category)
+    sqlite_session.commit()
 
     updated_category: Category = service.update_category(category.id, name="Desserts")
 
-    db_session.commit.assert_called_once()
     assert updated_category.id == category.id
     assert updated_category.name == "Desserts"
-    assert updated_category.description == category.description
+    assert updated_category.description == "Sweet dishes"
 
 
-def test_update_category_description(db_session: MagicMock, monkeypatch):
+def test_update_category_description(sqlite_session: Session):
     """Test updating a category's description."""
-    service = CategoryService(db_session)
+    service = CategoryService(sqlite_session)
     category: Category = Category(id=1, name="Vegan", description="No animal products")
-    monkeypatch.setattr(
-        service,
-        "_get_category_by_id",
-        lambda x: category,
-    )
+    sqlite_session.add(category)
+    sqlite_session.commit()
 
     updated_category: Category = service.update_category(
         category.id, description="Plant-based dishes"
     )
 
-    db_session.commit.assert_called_once()
     assert updated_category.id == category.id
     assert updated_category.name == "Vegan"
     assert updated_category.description == "Plant-based dishes"
 
 
-def test_update_category_both_fields(db_session: MagicMock, monkeypatch):
+def test_update_category_both_fields(sqlite_session: Session):
     """Test updating both name and description of a category."""
-    service = CategoryService(db_session)
+    service = CategoryService(sqlite_session)
     example_category: Category = Category(id=1, name="QuickMeals", description="Fast recipes")
-    monkeypatch.setattr(
-        service,
-        "_get_category_by_id",
-        lambda x: example_category,
-    )
+    sqlite_session.add(example_category)
+    sqlite_session.commit()
 
     updated_category = service.update_category(
         example_category.id, name="Quick & Easy", description="Fast and simple meals"
     )
-    db_session.commit.assert_called_once()
     assert updated_category.id == example_category.id
     assert updated_category.name == "Quick & Easy"
     assert updated_category.description == "Fast and simple meals"
 
 
-def test_update_category_not_found_raises_error(db_session: MagicMock, monkeypatch):
+def test_update_category_not_found_raises_error(sqlite_session: Session):
     """Test that updating a non-existent category raises CategoryNotFoundError."""
-    service = CategoryService(db_session)
-    monkeypatch.setattr(service, "_get_category_by_id", lambda x: None)
+    service = CategoryService(sqlite_session)
 
     with pytest.raises(CategoryNotFoundError) as exc_info:
         service.update_category(999, name="NewName")
@@ -197,39 +216,61 @@ def test_update_category_not_found_raises_error(db_session: MagicMock, monkeypat
     assert "999" in str(exc_info.value)
 
 
-def test_update_category_duplicate_name_raises_error(db_session: MagicMock):
+def test_update_category_duplicate_name_raises_error(
+    db_session: MagicMock, unique_violation: IntegrityError
+):
     """Test that updating to a duplicate name raises CategoryExistsError."""
     service = CategoryService(db_session)
 
-    db_session.commit.side_effect = IntegrityError(
-        statement=None,
-        params=None,
-        orig=Exception(),
-    )
+    db_session.commit.side_effect = unique_violation
     with pytest.raises(CategoryExistsError) as exc_info:
         service.update_category(1, name="Breakfast")
 
     assert "Breakfast" in str(exc_info.value)
 
 
-def test_delete_category(db_session: MagicMock, monkeypatch):
+def test_update_category_duplicate_name_in_database(sqlite_session: Session):
+    """Test that a unique violation reported by the database raises CategoryExistsError."""
+    sqlite_session.add_all([Category(id=1, name="Breakfast"), Category(id=2, name="Dinner")])
+    sqlite_session.commit()
+
+    with pytest.raises(CategoryExistsError):
+        CategoryService(sqlite_session).update_category(2, name="Breakfast")
+
+
+def test_delete_category(sqlite_session: Session):
     """Test deleting a category."""
-    service = CategoryService(db_session)
+    service = CategoryService(sqlite_session)
     example_category = Category(id=1, name="ToDelete", description="To be deleted")
-    monkeypatch.setattr(
-        service,
-        "_get_category_by_id",
-        lambda id: example_category,
-    )
+    sqlite_session.add(example_category)
+    sqlite_session.commit()
     service.delete_category(example_category.id)
-    db_session.delete.assert_called_once_with(example_category)
-    db_session.commit.assert_called_once()
+    assert sqlite_session.get(Category, 1) is None
 
 
-def test_delete_category_not_found_raises_error(db_session: MagicMock, monkeypatch):
+def test_delete_category_with_recipes(sqlite_session: Session):
+    """Test that deleting a category unlinks its recipes and keeps them."""
+    sqlite_session.add_all(
+        [
+            Category(id=1, name="Baking"),
+            User(id=1, username="alice", password="pw"),
+            Recipe(id=1, user_id=1, name="Bread"),
+        ]
+    )
+    sqlite_session.commit()
+    sqlite_session.add(RecipeCategory(recipe_id=1, category_id=1))
+    sqlite_session.commit()
+
+    CategoryService(sqlite_session).delete_category(1)
+
+    assert sqlite_session.get(Category, 1) is None
+    assert sqlite_session.scalars(select(RecipeCategory)).all() == []
+    assert sqlite_session.get(Recipe, 1) is not None
+
+
+def test_delete_category_not_found_raises_error(sqlite_session: Session):
     """Test that deleting a non-existent category raises CategoryNotFoundError."""
-    service = CategoryService(db_session)
-    monkeypatch.setattr(service, "_get_category_by_id", lambda x: None)
+    service = CategoryService(sqlite_session)
 
     with pytest.raises(CategoryNotFoundError) as exc_info:
         service.delete_category(999)
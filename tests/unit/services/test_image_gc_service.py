@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from docuisine.db.storage import S3Storage
+from docuisine.services import ImageGCService
+
+HASH_A = "a" * 32
+HASH_B = "b" * 32
+OLD = datetime.now(timezone.utc) - timedelta(days=7)
+NEW = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+
+def listed(key: str, modified: datetime = OLD, size: int = 100) -> dict:
+    return {"Key": key, "LastModified": modified, "Size": size}
+
+
+@pytest.fixture
+def mock_s3_client():
+    """Provide a mock S3 client listing no objects."""
+    mock_s3 = MagicMock()
+    mock_s3.bucket_name = "docuisine-images"
+    mock_s3.get_paginator.return_value.paginate.return_value = []
+    mock_s3.delete_objects.return_value = {}
+    return mock_s3
+
+
+def storage(mock_s3_client: MagicMock) -> S3Storage:
+    return S3Storage(mock_s3_client, bucket_name=mock_s3_client.bucket_name)
+
+
+def set_listing(mock_s3_client: MagicMock, *pages: list[dict]) -> None:
+    mock_s3_client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": page} for page in pages
+    ]
+
+
+def set_referenced(db_session: MagicMock, *batches: list[str]) -> None:
+    db_session.execute.return_value.scalars.return_value.all.side_effect = list(batches)
+
+
+def deleted_keys(mock_s3_client: MagicMock) -> list[str]:
+    return [
+        obj["Key"]
+        for call in mock_s3_client.delete_objects.call_args_list
+        for obj in call.kwargs["Delete"]["Objects"]
+    ]
+
+
+def test_collect_dry_run_reports_without_deleting(db_session, mock_s3_client):
+    """Test that a dry run counts orphans but deletes nothing."""
+    set_listing(mock_s3_client, [listed(f"{HASH_A}.jpg", size=300), listed(f"{HASH_B}.png")])
+    set_referenced(db_session, [f"{HASH_B}.png"])
+    service = ImageGCService(db_session=db_session, storage=storage(mock_s3_client))
+
+    report = service.collect()
+
+    assert report.dry_run is True
+    assert report.scanned_objects == 2
+    assert report.scanned_bytes == 400
+    assert report.referenced_objects == 1
+    assert report.orphaned_objects == 1
+    assert report.reclaimable_bytes == 300
+    assert report.deleted_objects == 0
+    mock_s3_client.delete_objects.assert_not_called()
+
+
+def test_collect_deletes_orphans(db_session, mock_s3_client):
+    """Test that orphans are deleted when not in dry-run mode."""
+    set_listing(mock_s3_client, [listed(f"{HASH_A}.jpg"), listed(f"{HASH_B}.png")])
+    set_referenced(db_session, [f"{HASH_B}.png"])
+    service = ImageGCService(db_session=db_session, storage=storage(mock_s3_client))
+
+    report = service.collect(dry_run=False)
+
+    assert report.deleted_objects == 1
+    assert deleted_keys(mock_s3_client) == [f"{HASH_A}.jpg"]
+    statement = db_session.execute.call_args.args[0]
+    assert statement.is_delete
+    assert statement.table.name == "images"
+    db_session.commit.assert_called_once()
+
+
+def test_collect_keeps_recent_objects(db_session, mock_s3_client):
+    """Test that unreferenced objects inside the grace period are kept."""
+    set_listing(mock_s3_client, [listed(f"{HASH_A}.jpg", modified=NEW), listed("uploads/abc")])
+    set_referenced(db_session, [])
+    service = ImageGCService(db_session=db_session, storage=storage(mock_s3_client))
+
+    report = service.collect(grace_period=timedelta(hours=1), dry_run=False)
+
+    assert report.recent_objects == 1
+    assert report.orphaned_objects == 1
+    assert deleted_keys(mock_s3_client) == ["uploads/abc"]
+
+
+def test_collect_keeps_whole_family_of_referenced_image(db_session, mock_s3_client):
+    """Test that variants are kept when only the original and preview are referenced."""
+    set_listing(
+        mock_s3_client,
+        [
+            listed(f"{HASH_A}.jpg"),
+            listed(f"{HASH_A}_preview.jpg"),
+            listed(f"{HASH_A}_w256.webp"),
+            listed(f"{HASH_A}_w1024.webp"),
+        ],
+    )
+    set_referenced(db_session, [f"{HASH_A}_preview.jpg"])
+    service = ImageGCService(db_session=db_session, storage=storage(mock_s3_client))
+
+    report = service.collect(dry_run=False)
+
+    assert report.referenced_objects == 4
+    assert report.orphaned_objects == 0
+    mock_s3_client.delete_objects.assert_not_called()
+
+
+def test_collect_never_splits_a_family_across_batches(db_session, mock_s3_client):
+    """Test that batches are only cut between families."""
+    set_listing(
+        mock_s3_client,
+        [listed(f"{HASH_A}.jpg"), listed(f"{HASH_A}_preview.jpg")],
+        [listed(f"{HASH_A}_w64.webp"), listed(f"{HASH_B}.jpg")],
+    )
+    set_referenced(db_session, [f"{HASH_A}.jpg"], [])
+    service = ImageGCService(db_session=db_session, storage=storage(mock_s3_client))
+
+    report = service.collect(dry_run=False, batch_size=2)
+
+    assert db_session.execute.return_value.scalars.call_count == 2
+    assert report.referenced_objects == 3
+    assert deleted_keys(mock_s3_client) == [f"{HASH_B}.jpg"]
+
+
+def test_collect_counts_failed_deletions(db_session, mock_s3_client):
+    """Test that keys S3 failed to delete are not counted as deleted."""
+    set_listing(mock_s3_client, [listed(f"{HASH_A}.jpg"), listed(f"{HASH_B}.jpg")])
+    set_referenced(db_session, [])
+    mock_s3_client.delete_objects.return_value = {
+        "Errors": [{"Key": f"{HASH_B}.jpg", "Code": "AccessDenied"}]
+    }
+    service = ImageGCService(db_session=db_session, storage=storage(mock_s3_client))
+
+    report = service.collect(dry_run=False)
+
+    assert report.orphaned_objects == 2
+    assert report.deleted_objects == 1
+
+
+def test_collect_empty_bucket(db_session, mock_s3_client):
+    """Test collecting an empty bucket."""
+    service = ImageGCService(db_session=db_session, storage=storage(mock_s3_client))
+
+    report = service.collect(dry_run=False)
+
+    assert report.scanned_objects == 0
+    db_session.execute.assert_not_called()
+    mock_s3_client.delete_objects.assert_not_called()
@@ -1,24 +1,48 @@
-from hashlib import md5
+import base64
+from hashlib import md5, sha256
+from io import BytesIO
+import threading
 from unittest.mock import MagicMock
 
+from botocore.exceptions import ClientError
+from PIL import Image, PngImagePlugin
 import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
 
-from docuisine.schemas.image import ImageSet
+from docuisine.db.models import Base, StoredImage
+from docuisine.db.storage import LocalStorage, S3Storage
+from docuisine.schemas.image import (
+    ImageNormalizationConfig,
+    ImageSet,
+    ImageVariantConfig,
+    RenditionOptions,
+    UploadLimits,
+)
 from docuisine.services import ImageService
+from docuisine.services.image import generate_image_renditions, normalize_image
 from docuisine.utils import errors
+from docuisine.utils.dedup import ContentIndex
+from docuisine.utils.disk_cache import DiskCache
+from docuisine.utils.ingest import SpooledUpload
 
 
 @pytest.fixture
 def mock_s3_client(monkeypatch):
     """Fixture for mocking boto3 S3 client."""
     mock_s3 = MagicMock()
+    mock_s3.bucket_name = "docuisine-images"
     return mock_s3
 
 
+def s3_storage(mock_s3_client: MagicMock) -> S3Storage:
+    return S3Storage(mock_s3_client, bucket_name=mock_s3_client.bucket_name)
+
+
 @pytest.fixture
 def image_service(mock_s3_client: MagicMock, monkeypatch):
     """Fixture for ImageService with mocked S3 client and supported formats."""
-    service = ImageService(s3=mock_s3_client)
+    service = ImageService(storage=s3_storage(mock_s3_client))
     monkeypatch.setattr(service, "_supported_formats", {"png", "jpeg", "jpg", "gif"})
     return service
 
@@ -37,8 +61,8 @@ def test_upload_image(image_service: ImageService, monkeypatch, mock_s3_client:
         lambda *args: "newimage.jpeg",
     )
     monkeypatch.setattr(
-        "docuisine.services.image.ImageService._generate_image_preview",
-        lambda self, image: b"preview-image-bytes",
+        "docuisine.services.image.ImageService._generate_renditions",
+        lambda self, image, format: (b"preview-image-bytes", {}, "data:image/webp;base64,"),
     )
     mock_s3_client.meta.endpoint_url = "http://mock-s3-endpoint/"
     mock_s3_client.bucket_name = "docuisine-images"
@@ -46,7 +70,7 @@ def test_upload_image(image_service: ImageService, monkeypatch, mock_s3_client:
     image_bytes = b"fake-image-bytes"
     image_set: ImageSet = image_service.upload_image(image_bytes)
     assert image_set.original == "newimage.jpeg"
-    assert image_set.preview == "newimage.jpeg"
+    assert image_set.preview == "newimage_preview.jpeg"
     mock_s3_client.upload_fileobj.called_count == 2
 
 
@@ -70,13 +94,755 @@ def test_validate_format_supported(image_service):
 
 
 def test_build_image_name():
-    """Test building image name from bytes and format."""
+    """Test building image name from the hash of the bytes and format."""
     image_bytes = b"test-image-bytes"
     format = "png"
 
-    image_name = ImageService._build_image_name(image_bytes, format)
+    image_name = ImageService._build_image_name(md5(image_bytes).hexdigest(), format)
 
     expected_hash = md5(image_bytes).hexdigest()
     expected_image_name = f"{expected_hash}.png"
 
     assert image_name == expected_image_name
+
+
+def make_image(format: str, size: tuple[int, int] = (1200, 900)) -> bytes:
+    """Encode a solid-color test image in the given PIL format."""
+    buffer = BytesIO()
+    Image.new("RGB", size, color=(200, 120, 40)).save(buffer, format=format)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "pil_format, expected", [("JPEG", "jpeg"), ("PNG", "png"), ("GIF", "gif"), ("WEBP", "webp")]
+)
+def test_determine_format_from_magic_bytes(pil_format: str, expected: str):
+    """Test sniffing the image format from its leading bytes."""
+    assert ImageService._determine_format(make_image(pil_format, (8, 8))) == expected
+
+
+def test_determine_format_unknown():
+    """Test that bytes without a known signature are rejected."""
+    with pytest.raises(errors.UnsupportedImageFormatError):
+        ImageService._determine_format(b"not an image at all")
+
+
+@pytest.mark.parametrize(
+    "image", [b"\xff\xd8\xff\xe0" + b"garbage" * 10, b"\x89PNG\r\n\x1a\n" + b"garbage" * 10]
+)
+def test_upload_corrupt_image(image_service: ImageService, image: bytes):
+    """Test that an image with a valid signature but a corrupt body is rejected as invalid."""
+    with pytest.raises(errors.InvalidImageError):
+        image_service.upload_image(image)
+
+
+def test_upload_corrupt_image_leaves_no_object(tmp_path):
+    """Test that the original stored while an undecodable image is rendered is deleted."""
+    service = ImageService(storage=LocalStorage(tmp_path))
+
+    with pytest.raises(errors.InvalidImageError):
+        service.upload_image(b"\xff\xd8\xff\xe0" + b"garbage" * 10)
+    assert list(service.storage.iter_objects()) == []
+
+
+def test_determine_format_webp_requires_riff_header():
+    """Test that `WEBP` at offset 8 is not enough without the leading `RIFF` tag."""
+    with pytest.raises(errors.UnsupportedImageFormatError):
+        ImageService._determine_format(b"XXXX\x00\x00\x00\x00WEBPVP8 ")
+
+
+@pytest.mark.parametrize("pil_format", ["JPEG", "PNG"])
+def test_generate_image_preview(image_service: ImageService, pil_format: str):
+    """Test that the preview fits the requested size and keeps the input format."""
+    preview, variants, _ = image_service._generate_renditions(
+        make_image(pil_format), pil_format.lower()
+    )
+
+    with Image.open(BytesIO(preview)) as img:
+        assert img.format == pil_format
+        assert max(img.size) == 256
+        assert img.size == (256, 192)
+    assert variants == {}
+
+
+def test_upload_image_decodes_once(
+    image_service: ImageService, mock_s3_client: MagicMock, monkeypatch
+):
+    """Test that a real upload opens the image exactly once and uploads both files."""
+    open_image = MagicMock(wraps=Image.open)
+    monkeypatch.setattr("docuisine.services.image.Image.open", open_image)
+    image_bytes = make_image("JPEG")
+
+    image_set = image_service.upload_image(image_bytes)
+
+    open_image.assert_called_once()
+    assert image_set.original == f"{md5(image_bytes).hexdigest()}.jpeg"
+    assert image_set.preview.endswith(".jpeg")
+    assert mock_s3_client.upload_fileobj.call_count == 2
+
+
+def test_generate_renditions_in_pool(mock_s3_client: MagicMock):
+    """Test that preview generation is handed to the process pool when configured."""
+    pool = MagicMock()
+    pool.run.return_value = (b"preview-image-bytes", {}, "data:image/webp;base64,")
+    service = ImageService(storage=s3_storage(mock_s3_client), pool=pool)
+
+    preview, _, _ = service._generate_renditions(b"image-bytes", "png")
+
+    assert preview == b"preview-image-bytes"
+    pool.run.assert_called_once_with(
+        generate_image_renditions, b"image-bytes", "png", (256, 256), (), "webp", 80
+    )
+
+
+def test_upload_image_uploads_concurrently(image_service: ImageService, mock_s3_client: MagicMock):
+    """Test that the original and the preview are uploaded at the same time."""
+    both_uploading = threading.Barrier(2, timeout=5)
+    mock_s3_client.upload_fileobj.side_effect = lambda **kwargs: both_uploading.wait()
+
+    image_set = image_service.upload_image(make_image("PNG"))
+
+    uploaded_keys = {c.kwargs["Key"] for c in mock_s3_client.upload_fileobj.call_args_list}
+    assert uploaded_keys == {image_set.original, image_set.preview}
+
+
+def test_build_variant_name():
+    """Test that variants are named after the source image."""
+    assert ImageService._build_variant_name("abc123.png", "preview") == "abc123_preview.png"
+    assert ImageService._build_variant_name("abc123.png", "w64", "webp") == "abc123_w64.webp"
+
+
+@pytest.fixture
+def variant_service(mock_s3_client: MagicMock) -> ImageService:
+    """ImageService generating WebP variants at three widths."""
+    return ImageService(
+        storage=s3_storage(mock_s3_client),
+        variants=ImageVariantConfig(widths=[1024, 64, 256], format="webp"),
+    )
+
+
+def test_upload_image_with_variants(variant_service: ImageService, mock_s3_client: MagicMock):
+    """Test that every variant is resized, encoded as WebP and uploaded with its content type."""
+    image_bytes = make_image("JPEG", size=(2400, 1800))
+
+    image_set = variant_service.upload_image(image_bytes)
+
+    image_hash = md5(image_bytes).hexdigest()
+    assert [(v.key, v.width, v.format) for v in image_set.variants] == [
+        (f"{image_hash}_w64.webp", 64, "webp"),
+        (f"{image_hash}_w256.webp", 256, "webp"),
+        (f"{image_hash}_w1024.webp", 1024, "webp"),
+    ]
+    uploads = {c.kwargs["Key"]: c.kwargs for c in mock_s3_client.upload_fileobj.call_args_list}
+    assert len(uploads) == 5
+    for variant in image_set.variants:
+        upload = uploads[variant.key]
+        assert upload["ExtraArgs"] == {
+            "ContentType": "image/webp",
+            "CacheControl": "public, max-age=31536000, immutable",
+        }
+        with Image.open(upload["Fileobj"]) as img:
+            assert img.format == "WEBP"
+            assert img.size == (variant.width, variant.width * 3 // 4)
+
+
+def test_generate_renditions_does_not_upscale():
+    """Test that variants wider than the image keep the image size."""
+    preview, variants, _ = generate_image_renditions(
+        make_image("PNG", size=(100, 50)), "png", (256, 256), (64, 256), "avif", 60
+    )
+
+    with Image.open(BytesIO(variants[64])) as img:
+        assert (img.format, img.size) == ("AVIF", (64, 32))
+    with Image.open(BytesIO(variants[256])) as img:
+        assert (img.format, img.size) == ("AVIF", (100, 50))
+    with Image.open(BytesIO(preview)) as img:
+        assert img.size == (100, 50)
+
+
+def test_upload_image_placeholder(image_service: ImageService, mock_s3_client: MagicMock):
+    """Test that a small inline placeholder is returned and stored with the preview."""
+    image_set = image_service.upload_image(make_image("JPEG"))
+
+    assert image_set.placeholder is not None
+    assert image_set.placeholder.startswith("data:image/webp;base64,")
+    assert len(image_set.placeholder) < 1024
+    encoded = image_set.placeholder.removeprefix("data:image/webp;base64,")
+    with Image.open(BytesIO(base64.b64decode(encoded))) as img:
+        assert img.size == (32, 24)
+    uploads = {c.kwargs["Key"]: c.kwargs for c in mock_s3_client.upload_fileobj.call_args_list}
+    assert uploads[image_set.preview]["ExtraArgs"]["Metadata"] == {
+        "placeholder": image_set.placeholder
+    }
+
+
+def test_upload_image_indexed_without_variants_is_rechecked(
+    mock_s3_client: MagicMock, variant_service: ImageService
+):
+    """Test that an image indexed before variants were enabled gets its variants."""
+    mock_s3_client.head_object.side_effect = not_found
+    variant_service.index = ContentIndex(maxsize=8, ttl=60)
+    image_bytes = make_image("PNG")
+    original = f"{md5(image_bytes).hexdigest()}.png"
+    variant_service.index.add(original, ImageSet(original=original, preview="old_preview.png"))
+
+    image_set = variant_service.upload_image(image_bytes)
+
+    assert len(image_set.variants) == 3
+    assert mock_s3_client.upload_fileobj.call_count == 5
+
+
+@pytest.fixture
+def dedup_service(mock_s3_client: MagicMock) -> ImageService:
+    """ImageService with an empty image index."""
+    return ImageService(storage=s3_storage(mock_s3_client), index=ContentIndex(maxsize=8, ttl=60))
+
+
+def not_found(**kwargs):
+    raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+
+def test_upload_image_miss_uploads_and_indexes(
+    dedup_service: ImageService, mock_s3_client: MagicMock
+):
+    """Test that a new image is uploaded once and found in the index afterwards."""
+    mock_s3_client.head_object.side_effect = not_found
+    image_bytes = make_image("PNG")
+
+    first = dedup_service.upload_image(image_bytes)
+    second = dedup_service.upload_image(image_bytes)
+
+    assert first == second
+    assert mock_s3_client.upload_fileobj.call_count == 2
+    assert mock_s3_client.head_object.call_count == 2
+    assert dedup_service.get_dedup_stats().model_dump() == {
+        "local_hits": 1,
+        "remote_hits": 0,
+        "misses": 1,
+    }
+
+
+def test_upload_image_found_in_bucket(
+    dedup_service: ImageService, mock_s3_client: MagicMock, monkeypatch
+):
+    """Test that an image already in the bucket is neither processed nor uploaded."""
+    generate_preview = MagicMock()
+    monkeypatch.setattr(dedup_service, "_generate_renditions", generate_preview)
+    mock_s3_client.head_object.return_value = {
+        "Metadata": {"placeholder": "data:image/webp;base64,"}
+    }
+    image_bytes = make_image("PNG")
+
+    image_set = dedup_service.upload_image(image_bytes)
+
+    image_hash = md5(image_bytes).hexdigest()
+    assert image_set == ImageSet(
+        original=f"{image_hash}.png",
+        preview=f"{image_hash}_preview.png",
+        placeholder="data:image/webp;base64,",
+    )
+    generate_preview.assert_not_called()
+    mock_s3_client.upload_fileobj.assert_not_called()
+    assert dedup_service.get_dedup_stats().remote_hits == 1
+
+
+def test_upload_spooled_image_indexed_is_not_read(
+    dedup_service: ImageService, mock_s3_client: MagicMock
+):
+    """Test that a spooled upload already in the index is never loaded into memory."""
+    image_bytes = make_image("PNG")
+    image_hash = md5(image_bytes).hexdigest()
+    image_set = ImageSet(original=f"{image_hash}.png", preview=f"{image_hash}_preview.png")
+    dedup_service.index.add(image_set.original, image_set)  # type: ignore
+
+    with SpooledUpload.from_bytes(image_bytes) as upload:
+        upload.read = MagicMock()  # type: ignore
+        assert dedup_service.upload_spooled_image(upload) == image_set
+        upload.read.assert_not_called()
+    mock_s3_client.upload_fileobj.assert_not_called()
+
+
+def test_object_exists_reraises_other_errors(image_service: ImageService, mock_s3_client):
+    """Test that errors other than a missing object are not treated as a miss."""
+    mock_s3_client.head_object.side_effect = ClientError({"Error": {"Code": "403"}}, "HeadObject")
+
+    with pytest.raises(ClientError):
+        image_service._head_object("abc123.png")
+
+
+def test_dedup_stats_without_index(image_service: ImageService):
+    """Test that the counters are zero when deduplication is disabled."""
+    assert image_service.get_dedup_stats().model_dump() == {
+        "local_hits": 0,
+        "remote_hits": 0,
+        "misses": 0,
+    }
+
+
+def test_create_presigned_upload(image_service: ImageService, mock_s3_client: MagicMock):
+    """Test that the presigned URL is bound to the content type and size of the image."""
+    mock_s3_client.bucket_name = "docuisine-images"
+    mock_s3_client.generate_presigned_url.return_value = "http://s3/presigned"
+
+    presigned = image_service.create_presigned_upload("image/png", 1234, UploadLimits())
+
+    assert presigned.url == "http://s3/presigned"
+    assert presigned.key.startswith("uploads/")
+    assert presigned.headers == {"Content-Type": "image/png", "Content-Length": "1234"}
+    mock_s3_client.generate_presigned_url.assert_called_once_with(
+        "put_object",
+        Params={
+            "Bucket": "docuisine-images",
+            "Key": presigned.key,
+            "ContentType": "image/png",
+            "ContentLength": 1234,
+        },
+        ExpiresIn=900,
+        HttpMethod="PUT",
+    )
+
+
+def test_create_presigned_upload_too_large(image_service: ImageService):
+    """Test that no URL is issued for images above the maximum upload size."""
+    with pytest.raises(errors.UploadTooLargeError):
+        image_service.create_presigned_upload("image/png", 101, UploadLimits(max_size=100))
+
+
+def staged_object(mock_s3_client: MagicMock, data: bytes) -> str:
+    """Make the mock bucket return `data` for a staged upload and return its key."""
+    body = MagicMock()
+    body.iter_chunks.side_effect = lambda size: iter(
+        [data[i : i + size] for i in range(0, len(data), size)]
+    )
+    mock_s3_client.get_object.return_value = {"ContentLength": len(data), "Body": body}
+    return "uploads/" + "0" * 32
+
+
+def test_complete_presigned_upload(image_service: ImageService, mock_s3_client: MagicMock):
+    """Test that the original is copied in the bucket and only the preview is uploaded."""
+    image_bytes = make_image("PNG")
+    key = staged_object(mock_s3_client, image_bytes)
+
+    image_set = image_service.complete_presigned_upload(key, UploadLimits())
+
+    assert image_set.original == f"{md5(image_bytes).hexdigest()}.png"
+    copy = mock_s3_client.copy_object.call_args.kwargs
+    assert copy["CopySource"]["Key"] == key
+    assert copy["Key"] == image_set.original
+    assert copy["CacheControl"] == "public, max-age=31536000, immutable"
+    uploaded_keys = [c.kwargs["Key"] for c in mock_s3_client.upload_fileobj.call_args_list]
+    assert uploaded_keys == [image_set.preview]
+    mock_s3_client.delete_object.assert_called_once_with(
+        Bucket=mock_s3_client.bucket_name, Key=key
+    )
+
+
+def test_complete_presigned_upload_unsupported(
+    image_service: ImageService, mock_s3_client: MagicMock
+):
+    """Test that a staged upload that is not an image is rejected and deleted."""
+    key = staged_object(mock_s3_client, b"not an image at all")
+
+    with pytest.raises(errors.UnsupportedImageFormatError):
+        image_service.complete_presigned_upload(key, UploadLimits())
+    mock_s3_client.delete_object.assert_called_once_with(
+        Bucket=mock_s3_client.bucket_name, Key=key
+    )
+
+
+def test_complete_presigned_upload_corrupt(image_service: ImageService, mock_s3_client: MagicMock):
+    """Test that an undecodable staged upload is rejected, and neither it nor its copy is kept."""
+    image_bytes = b"\x89PNG\r\n\x1a\n" + b"garbage" * 10
+    key = staged_object(mock_s3_client, image_bytes)
+
+    with pytest.raises(errors.InvalidImageError):
+        image_service.complete_presigned_upload(key, UploadLimits())
+    deleted_keys = {c.kwargs["Key"] for c in mock_s3_client.delete_object.call_args_list}
+    assert deleted_keys == {key, f"{md5(image_bytes).hexdigest()}.png"}
+
+
+@pytest.mark.parametrize("key", ["abc123.png", "uploads/../abc123.png", "uploads/" + "0" * 32])
+def test_complete_presigned_upload_not_found(
+    image_service: ImageService, mock_s3_client: MagicMock, key: str
+):
+    """Test that only staged keys that were uploaded can be completed."""
+    mock_s3_client.get_object.side_effect = not_found
+
+    with pytest.raises(errors.UploadNotFoundError):
+        image_service.complete_presigned_upload(key, UploadLimits())
+    mock_s3_client.delete_object.assert_not_called()
+
+
+def stored_object(mock_s3_client: MagicMock, data: bytes) -> None:
+    """Make the mock bucket return `data` for any GET."""
+    body = MagicMock()
+    body.read.return_value = data
+    body.iter_chunks.side_effect = lambda size: iter([data])
+    mock_s3_client.get_object.return_value = {"ContentLength": len(data), "Body": body}
+
+
+ORIGINAL_KEY = "0123456789abcdef0123456789abcdef.jpeg"
+
+
+def test_get_image_original_is_streamed(image_service: ImageService, mock_s3_client: MagicMock):
+    """Test that without options the stored image is streamed with a key-derived ETag."""
+    stored_object(mock_s3_client, b"image-bytes")
+
+    image = image_service.get_image(ORIGINAL_KEY, RenditionOptions())
+
+    assert image.etag == '"0123456789abcdef0123456789abcdef"'
+    assert image.content_type == "image/jpeg"
+    assert image.cache_control == "public, max-age=31536000, immutable"
+    assert b"".join(image.stream) == b"image-bytes"  # type: ignore
+    mock_s3_client.get_object.return_value["Body"].close.assert_called_once()
+
+
+def test_get_image_rendition_is_cached(mock_s3_client: MagicMock, tmp_path):
+    """Test that a rendition is generated once and then served from the disk cache."""
+    service = ImageService(
+        storage=s3_storage(mock_s3_client), cache=DiskCache(tmp_path, max_bytes=10_000_000)
+    )
+    stored_object(mock_s3_client, make_image("JPEG"))
+    options = RenditionOptions(width=300, format="webp", quality=70)
+
+    first = service.get_image(ORIGINAL_KEY, options)
+    second = service.get_image(ORIGINAL_KEY, options)
+
+    assert first.content == second.content
+    assert first.etag == '"0123456789abcdef0123456789abcdef_w300_q70.webp"'
+    assert first.content_type == "image/webp"
+    assert mock_s3_client.get_object.call_count == 1
+    with Image.open(BytesIO(first.content)) as img:  # type: ignore
+        assert (img.format, img.size) == ("WEBP", (300, 225))
+
+
+def test_get_image_rendition_not_upscaled(image_service: ImageService, mock_s3_client):
+    """Test that a width above the image width keeps the image size."""
+    stored_object(mock_s3_client, make_image("PNG", size=(100, 50)))
+
+    image = image_service.get_image(
+        "0123456789abcdef0123456789abcdef.png", RenditionOptions(width=400)
+    )
+
+    with Image.open(BytesIO(image.content)) as img:  # type: ignore
+        assert (img.format, img.size) == ("PNG", (100, 50))
+
+
+def test_get_image_not_modified(image_service: ImageService, mock_s3_client: MagicMock):
+    """Test that a matching If-None-Match is answered without touching the bucket."""
+    image = image_service.get_image(
+        ORIGINAL_KEY,
+        RenditionOptions(width=64),
+        '"other", "0123456789abcdef0123456789abcdef_w64_q80.jpeg"',
+    )
+
+    assert image.not_modified
+    mock_s3_client.get_object.assert_not_called()
+
+
+@pytest.mark.parametrize("key", ["uploads/" + "0" * 32, "../secret.png", "abc.png"])
+def test_get_image_rejects_other_keys(image_service: ImageService, mock_s3_client, key: str):
+    """Test that only uploaded images can be served."""
+    with pytest.raises(errors.ImageNotFoundError):
+        image_service.get_image(key, RenditionOptions())
+    mock_s3_client.get_object.assert_not_called()
+
+
+def test_get_image_missing(image_service: ImageService, mock_s3_client: MagicMock):
+    """Test that an image missing from the bucket is reported as not found."""
+    mock_s3_client.get_object.side_effect = not_found
+
+    with pytest.raises(errors.ImageNotFoundError):
+        image_service.get_image(ORIGINAL_KEY, RenditionOptions(width=64))
+
+
+@pytest.fixture
+def sqlite_session():
+    """Session on an empty in-memory SQLite database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def test_upload_image_records_metadata(mock_s3_client: MagicMock, sqlite_session: Session):
+    """Test that the dimensions, size and renditions of an upload are recorded."""
+    service = ImageService(
+        storage=s3_storage(mock_s3_client),
+        variants=ImageVariantConfig(widths=[64], format="webp"),
+        db_session=sqlite_session,
+    )
+    image_bytes = make_image("JPEG", size=(640, 480))
+
+    image_set = service.upload_image(image_bytes)
+    metadata = service.get_image_metadata(image_set.original)
+
+    assert (metadata.width, metadata.height) == (640, 480)
+    assert metadata.bytes == len(image_bytes)
+    assert metadata.format == "jpeg"
+    assert metadata.sha == sha256(image_bytes).hexdigest()
+    assert metadata.preview == image_set.preview
+    assert metadata.placeholder == image_set.placeholder
+    assert metadata.variants == image_set.variants
+
+
+def test_upload_image_recorded_is_not_uploaded_again(
+    mock_s3_client: MagicMock, sqlite_session: Session
+):
+    """Test that a recorded image is deduplicated without querying the bucket."""
+    image_bytes = make_image("PNG")
+    first = ImageService(
+        storage=s3_storage(mock_s3_client), db_session=sqlite_session
+    ).upload_image(image_bytes)
+    mock_s3_client.reset_mock()
+
+    second = ImageService(
+        storage=s3_storage(mock_s3_client), db_session=sqlite_session
+    ).upload_image(image_bytes)
+
+    assert second == first
+    mock_s3_client.upload_fileobj.assert_not_called()
+    mock_s3_client.head_object.assert_not_called()
+
+
+def test_upload_image_indexed_but_collected_is_uploaded_again(
+    mock_s3_client: MagicMock, sqlite_session: Session
+):
+    """Test that an indexed image whose record was collected is not returned from the index."""
+    mock_s3_client.head_object.side_effect = not_found
+    service = ImageService(
+        storage=s3_storage(mock_s3_client),
+        index=ContentIndex(maxsize=8, ttl=60),
+        db_session=sqlite_session,
+    )
+    image_bytes = make_image("PNG")
+    first = service.upload_image(image_bytes)
+    # As ImageGCService does, from another process: the record, then the objects.
+    sqlite_session.execute(text("DELETE FROM images"))
+    sqlite_session.commit()
+    mock_s3_client.reset_mock()
+
+    second = service.upload_image(image_bytes)
+
+    assert second == first
+    assert mock_s3_client.upload_fileobj.call_count == 2
+    assert sqlite_session.get(StoredImage, first.original) is not None
+    assert service.get_dedup_stats().model_dump() == {
+        "local_hits": 0,
+        "remote_hits": 0,
+        "misses": 2,
+    }
+
+
+def test_upload_image_recorded_without_variants_is_updated(
+    mock_s3_client: MagicMock, sqlite_session: Session
+):
+    """Test that a recorded image gets its variants once they are enabled."""
+    image_bytes = make_image("PNG")
+    ImageService(storage=s3_storage(mock_s3_client), db_session=sqlite_session).upload_image(
+        image_bytes
+    )
+    service = ImageService(
+        storage=s3_storage(mock_s3_client),
+        variants=ImageVariantConfig(widths=[64, 256], format="webp"),
+        db_session=sqlite_session,
+    )
+
+    image_set = service.upload_image(image_bytes)
+
+    assert len(service.get_image_metadata(image_set.original).variants) == 2
+    assert sqlite_session.query(StoredImage).count() == 1
+
+
+def test_get_image_metadata_not_recorded(image_service: ImageService):
+    """Test that images without a record are not found."""
+    with pytest.raises(errors.ImageNotFoundError):
+        image_service.get_image_metadata(f"{'a' * 32}.png")
+
+
+def test_upload_spooled_images_dedups_within_batch(
+    image_service: ImageService, mock_s3_client: MagicMock
+):
+    """Test that identical images of a batch are stored once and share their result."""
+    first, second = make_image("PNG"), make_image("JPEG")
+    uploads = [SpooledUpload.from_bytes(data) for data in (first, second, first)]
+
+    items = image_service.upload_spooled_images(uploads)
+
+    assert [item.status_code for item in items] == [200, 200, 200]
+    assert items[0].image == items[2].image
+    assert items[1].image.original == f"{md5(second).hexdigest()}.jpeg"  # type: ignore
+    assert mock_s3_client.upload_fileobj.call_count == 4
+
+
+def test_upload_spooled_images_reports_errors_per_item(
+    image_service: ImageService, mock_s3_client: MagicMock
+):
+    """Test that rejected images do not fail the rest of the batch."""
+    truncated = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+    uploads = [
+        SpooledUpload.from_bytes(data) for data in (b"not an image", make_image("PNG"), truncated)
+    ]
+
+    items = image_service.upload_spooled_images(uploads)
+
+    assert [item.status_code for item in items] == [415, 200, 422]
+    assert items[0].image is None and items[0].detail is not None
+    assert items[1].image is not None
+    assert items[2].detail == "Image could not be decoded"
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [b"\xff\xd8\xff\xe0" + b"garbage" * 10, b"\x89PNG\r\n\x1a\n" + b"garbage" * 10],
+    ids=["jpeg", "png"],
+)
+def test_upload_spooled_images_reports_corrupt_images_per_item(
+    image_service: ImageService, mock_s3_client: MagicMock, corrupt: bytes
+):
+    """Test that an image failing to decode mid-batch is reported without failing the batch."""
+    uploads = [SpooledUpload.from_bytes(data) for data in (corrupt, make_image("JPEG"))]
+
+    items = image_service.upload_spooled_images(uploads)
+
+    assert [item.status_code for item in items] == [422, 200]
+    assert items[0].detail == "Image could not be decoded"
+    assert items[1].image is not None
+
+
+def test_upload_spooled_images_runs_concurrently(mock_s3_client: MagicMock, monkeypatch):
+    """Test that up to `batch_concurrency` images are processed at the same time."""
+    service = ImageService(storage=s3_storage(mock_s3_client), batch_concurrency=3)
+    all_storing = threading.Barrier(3, timeout=5)
+
+    def store_image(upload: SpooledUpload) -> ImageSet:
+        all_storing.wait()
+        return ImageSet(original=f"{upload.md5}.png", preview=f"{upload.md5}_preview.png")
+
+    monkeypatch.setattr(service, "_store_image", store_image)
+    uploads = [SpooledUpload.from_bytes(make_image("PNG", size=(10 + i, 10))) for i in range(3)]
+
+    items = service.upload_spooled_images(uploads)
+
+    assert [item.status_code for item in items] == [200, 200, 200]
+
+
+def test_upload_image_single_part_with_cache_control(mock_s3_client: MagicMock):
+    """Test that objects are uploaded in one part with the configured Cache-Control."""
+    service = ImageService(storage=s3_storage(mock_s3_client), cache_control="public, max-age=600")
+
+    image_set = service.upload_image(make_image("PNG"))
+
+    uploads = {c.kwargs["Key"]: c.kwargs for c in mock_s3_client.upload_fileobj.call_args_list}
+    for upload in uploads.values():
+        assert upload["ExtraArgs"]["CacheControl"] == "public, max-age=600"
+        assert upload["Config"].multipart_threshold >= 5 * 1024**3
+    assert set(uploads) == {image_set.original, image_set.preview}
+
+
+def test_upload_image_without_cache_control(mock_s3_client: MagicMock):
+    """Test that no Cache-Control is stored when it is disabled."""
+    service = ImageService(storage=s3_storage(mock_s3_client), cache_control=None)
+
+    service.upload_image(make_image("PNG"))
+
+    for upload in mock_s3_client.upload_fileobj.call_args_list:
+        assert "CacheControl" not in upload.kwargs["ExtraArgs"]
+
+
+def test_upload_and_get_image_with_local_storage(tmp_path):
+    """Test that stored images are served from the local filesystem as files."""
+    service = ImageService(storage=LocalStorage(tmp_path))
+
+    image_set = service.upload_image(make_image("PNG"))
+    served = service.get_image(image_set.original, RenditionOptions())
+    rendition = service.get_image(image_set.original, RenditionOptions(width=8, format="webp"))
+
+    assert served.path is not None
+    assert served.path.read_bytes() == make_image("PNG")
+    assert served.stream is None
+    assert rendition.content.startswith(b"RIFF")
+    assert service.storage.head(image_set.preview).metadata["placeholder"].startswith("data:")
+
+
+def make_photo(size: tuple[int, int] = (40, 20), orientation: int = 1) -> bytes:
+    """Encode a JPEG with an EXIF block and a comment, like a phone camera."""
+    img = Image.new("RGB", size, color=(200, 120, 40))
+    exif = Image.Exif()
+    exif[0x0112] = orientation
+    exif[0x010F] = "Camera maker"
+    buffer = BytesIO()
+    img.save(buffer, format="JPEG", exif=exif, comment=b"x" * 1000)
+    return buffer.getvalue()
+
+
+def test_normalize_image_strips_metadata_without_reencoding():
+    """Test that upright images lose their metadata but keep their pixels."""
+    photo = make_photo()
+
+    normalized = normalize_image(photo, "jpeg", max_dimension=None, quality=85)
+
+    assert len(normalized) < len(photo) - 1000
+    with Image.open(BytesIO(normalized)) as img, Image.open(BytesIO(photo)) as original:
+        assert not img.getexif()
+        assert "comment" not in img.info
+        assert img.tobytes() == original.tobytes()
+
+
+def test_normalize_image_applies_orientation():
+    """Test that rotated images are transposed and lose their orientation flag."""
+    normalized = normalize_image(make_photo(orientation=6), "jpeg", max_dimension=None, quality=85)
+
+    with Image.open(BytesIO(normalized)) as img:
+        assert img.size == (20, 40)
+        assert not img.getexif()
+
+
+def test_normalize_image_caps_resolution():
+    """Test that images above the maximum dimension are downscaled."""
+    normalized = normalize_image(
+        make_image("PNG", (300, 150)), "png", max_dimension=100, quality=85
+    )
+
+    with Image.open(BytesIO(normalized)) as img:
+        assert img.size == (100, 50)
+
+
+def test_normalize_image_strips_png_text():
+    """Test that PNG text chunks are removed."""
+    buffer = BytesIO()
+    info = PngImagePlugin.PngInfo()
+    info.add_text("Comment", "x" * 500)
+    Image.new("RGB", (8, 8)).save(buffer, format="PNG", pnginfo=info)
+
+    normalized = normalize_image(buffer.getvalue(), "png", max_dimension=None, quality=85)
+
+    assert b"tEXt" not in normalized
+    with Image.open(BytesIO(normalized)) as img:
+        assert img.size == (8, 8)
+
+
+def test_upload_image_normalizes_original(mock_s3_client: MagicMock, sqlite_session: Session):
+    """Test that the normalized original is stored and recorded, with upright renditions."""
+    photo = make_photo(size=(400, 200), orientation=6)
+    service = ImageService(
+        storage=s3_storage(mock_s3_client),
+        normalization=ImageNormalizationConfig(max_dimension=100),
+        db_session=sqlite_session,
+    )
+
+    image_set = service.upload_image(photo)
+
+    uploads = {
+        c.kwargs["Key"]: c.kwargs["Fileobj"].getvalue()
+        for c in mock_s3_client.upload_fileobj.call_args_list
+    }
+    assert image_set.original == f"{md5(photo).hexdigest()}.jpeg"
+    with Image.open(BytesIO(uploads[image_set.original])) as img:
+        assert img.size == (50, 100)
+    with Image.open(BytesIO(uploads[image_set.preview])) as img:
+        assert img.height > img.width
+    metadata = service.get_image_metadata(image_set.original)
+    assert (metadata.width, metadata.height) == (50, 100)
+    assert metadata.bytes == len(uploads[image_set.original])
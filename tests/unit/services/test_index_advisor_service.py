@@ -0,0 +1,153 @@
+import ast
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Column, Select, inspect, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import visitors
+
+from docuisine.db.models import Base
+from docuisine.services import IndexAdvisorService
+import docuisine.services as services
+
+MODELS = {mapper.class_.__name__: mapper.class_ for mapper in Base.registry.mappers}
+
+
+def plan_of(report, name: str):
+    return next(query for query in report.queries if query.name == name)
+
+
+def model_of(node: ast.expr):
+    """Return the model a chained query starts from, e.g. `session.query(Recipe)...`."""
+    while isinstance(node, (ast.Call, ast.Attribute)):
+        if isinstance(node, ast.Call):
+            if node.args and isinstance(node.args[0], ast.Name) and node.args[0].id in MODELS:
+                return MODELS[node.args[0].id]
+            node = node.func
+        else:
+            node = node.value
+    return None
+
+
+def service_filters() -> dict[tuple[str, str], str]:
+    """Return the columns the services filter on, besides primary keys, and where."""
+    filters = {}
+    for path in Path(services.__file__).parent.glob("*.py"):
+        if path.name == "index_advisor.py":
+            continue
+        for node in ast.walk(ast.parse(path.read_text())):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+                continue
+            columns = []
+            if node.func.attr == "filter_by" and (model := model_of(node.func.value)):
+                columns = [(model, keyword.arg) for keyword in node.keywords]
+            elif node.func.attr in ("filter", "where"):
+                columns = [
+                    (MODELS[child.value.id], child.attr)
+                    for arg in node.args
+                    for child in ast.walk(arg)
+                    if isinstance(child, ast.Attribute)
+                    and isinstance(child.value, ast.Name)
+                    and child.value.id in MODELS
+                ]
+            for model, name in columns:
+                table = model.__table__
+                if name != next(iter(table.primary_key)).name:
+                    filters[(table.name, name)] = f"{path.name}:{node.lineno}"
+    return filters
+
+
+def shape_filters(statement: Select) -> set[tuple[str, str]]:
+    """Return the columns compared in the WHERE clauses of a query and its subqueries."""
+    return {
+        (column.table.name, column.name)
+        for select in visitors.iterate(statement)
+        if isinstance(select, Select) and select.whereclause is not None
+        for column in visitors.iterate(select.whereclause)
+        if isinstance(column, Column)
+    }
+
+
+def test_query_shapes_cover_service_filters():
+    """Test that every column a service filters on is explained by a query shape."""
+    covered = set().union(
+        *(shape_filters(statement) for _, statement in IndexAdvisorService._query_shapes())
+    )
+
+    uncovered = {
+        column: where for column, where in service_filters().items() if column not in covered
+    }
+
+    assert uncovered == {}
+
+
+def test_advise_without_sequential_scans(sqlite_session: Session):
+    """Test that the declared indexes serve every query shape."""
+    report = IndexAdvisorService(sqlite_session).advise()
+
+    assert report.dialect == "sqlite"
+    assert report.missing_indexes == []
+    assert [query.name for query in report.queries if query.sequential_scans] == []
+    assert "ix_recipes_user_id" in " ".join(
+        plan_of(report, "RecipeService.get_recipes_by_user").plan
+    )
+
+
+def test_advise_reports_missing_index(sqlite_session: Session):
+    """Test that a dropped index is reported, with the query that now scans its table."""
+    sqlite_session.execute(text("DROP INDEX ix_shelves_ingredient_id"))
+    sqlite_session.commit()
+
+    report = IndexAdvisorService(sqlite_session).advise()
+
+    assert report.missing_indexes == ["ix_shelves_ingredient_id"]
+    assert report.sequential_scans == 1
+    assert plan_of(report, "Ingredient.stores").sequential_scans == ["shelves"]
+
+
+def test_advise_creates_missing_indexes(sqlite_session: Session):
+    """Test that missing indexes are created when asked."""
+    sqlite_session.execute(text("DROP INDEX ix_recipes_name"))
+    sqlite_session.commit()
+
+    report = IndexAdvisorService(sqlite_session).advise(create_missing=True)
+
+    assert report.created_indexes == ["ix_recipes_name"]
+    assert report.missing_indexes == []
+    assert report.sequential_scans == 0
+    indexes = inspect(sqlite_session.connection()).get_indexes("recipes")
+    assert "ix_recipes_name" in {index["name"] for index in indexes}
+
+
+def test_advise_unsupported_dialect():
+    """Test that databases other than PostgreSQL and SQLite are rejected."""
+    db_session = MagicMock()
+    db_session.get_bind.return_value.dialect.name = "mysql"
+
+    with pytest.raises(NotImplementedError):
+        IndexAdvisorService(db_session).advise()
+
+
+def test_walk_postgresql_plan_reports_full_scans():
+    """Test that sequential scans and unconditioned index scans are reported."""
+    node = {
+        "Node Type": "Nested Loop",
+        "Plans": [
+            {"Node Type": "Index Only Scan", "Relation Name": "shelves", "Index Name": "pk"},
+            {
+                "Node Type": "Index Scan",
+                "Relation Name": "stores",
+                "Index Name": "stores_pkey",
+                "Index Cond": "(id = shelves.store_id)",
+            },
+            {"Node Type": "Seq Scan", "Relation Name": "recipes"},
+        ],
+    }
+    plan: list[str] = []
+    sequential_scans: list[str] = []
+
+    IndexAdvisorService(MagicMock())._walk_postgresql_plan(node, 0, plan, sequential_scans)
+
+    assert sequential_scans == ["shelves", "recipes"]
+    assert plan[2] == "  Index Scan on stores using stores_pkey ((id = shelves.store_id))"
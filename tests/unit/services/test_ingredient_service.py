@@ -1,11 +1,17 @@
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import event, select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
-from docuisine.db.models import Ingredient
+from docuisine.db.models import Ingredient, Recipe, User
 from docuisine.services import IngredientService
-from docuisine.utils.errors import IngredientExistsError, IngredientNotFoundError
+from docuisine.utils.errors import (
+    ConstraintViolationError,
+    IngredientExistsError,
+    IngredientNotFoundError,
+)
 
 
 def test_create_ingredient(db_session: MagicMock):
@@ -48,6 +54,51 @@ def test_create_ingredient_duplicate_name_raises_error(db_session: MagicMock):
     db_session.rollback.assert_called_once()
 
 
+def test_create_ingredients(sqlite_session: Session):
+    """Test that existing and repeated names are reported as conflicts, in order."""
+    sqlite_session.add(Ingredient(id=1, name="Salt"))
+    sqlite_session.commit()
+    statements: list[str] = []
+    event.listen(
+        sqlite_session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    rows = [
+        {"name": name, "description": None, "recipe_id": None}
+        for name in ("Sugar", "Salt", "Flour", "Sugar", "Eggs")
+    ]
+
+    items = IngredientService(sqlite_session).create_ingredients(rows, chunk_size=2)
+
+    assert [item.status_code for item in items] == [201, 409, 201, 409, 201]
+    assert [item.index for item in items] == [0, 1, 2, 3, 4]
+    assert items[1].detail == IngredientExistsError("Salt").message
+    assert items[3].detail == IngredientExistsError("Sugar").message
+    # The repeated "Sugar" is never sent: 4 rows in chunks of 2.
+    inserts = [s for s in statements if s.startswith("INSERT")]
+    assert len(inserts) == 2
+    assert all("ON CONFLICT (name) DO NOTHING" in s for s in inserts)
+    names = {i.id: i.name for i in sqlite_session.scalars(select(Ingredient))}
+    assert names == {1: "Salt", items[0].id: "Sugar", items[2].id: "Flour", items[4].id: "Eggs"}
+
+
+def test_create_ingredients_unknown_recipe(sqlite_session: Session):
+    """Test that a row breaking a foreign key is rejected without failing its chunk."""
+    rows = [
+        {"name": "Sugar", "description": None, "recipe_id": None},
+        {"name": "Dough", "description": None, "recipe_id": 99},
+        {"name": "Flour", "description": None, "recipe_id": None},
+    ]
+
+    items = IngredientService(sqlite_session).create_ingredients(rows, chunk_size=10)
+
+    assert [item.status_code for item in items] == [201, 422, 201]
+    assert items[1].id is None
+    names = set(sqlite_session.scalars(select(Ingredient.name)))
+    assert names == {"Sugar", "Flour"}
+
+
 def test_get_ingredient_by_id(db_session: MagicMock, monkeypatch):
     """Test retrieving an ingredient by ID."""
     service = IngredientService(db_session)
@@ -128,67 +179,68 @@ def test_get_all_ingredients(db_session: MagicMock):
     db_session.query.return_value.all.assert_called_once()
 
 
-def test_update_ingredient_name(db_session: MagicMock, monkeypatch):
+def test_update_ingredient_name(sqlite_session: Session):
     """Test updating an ingredient's name."""
-    service = IngredientService(db_session)
+    service = IngredientService(sqlite_session)
     ingredient: Ingredient = Ingredient(id=1, name="Suagar", description="Sweetener")
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: ingredient)
+    sqlite_session.add(ingredient)
+    sqlite_session.commit()
 
     updated: Ingredient = service.update_ingredient(ingredient.id, name="Sugar")
 
-    db_session.commit.assert_called_once()
     assert updated.id == ingredient.id
     assert updated.name == "Sugar"
-    assert updated.description == ingredient.description
+    assert updated.description == "Sweetener"
 
 
-def test_update_ingredient_description(db_session: MagicMock, monkeypatch):
+def test_update_ingredient_description(sqlite_session: Session):
     """Test updating an ingredient's description."""
-    service = IngredientService(db_session)
+    service = IngredientService(sqlite_session)
     ingredient: Ingredient = Ingredient(id=1, name="Salt", description="Old desc")
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: ingredient)
+    sqlite_session.add(ingredient)
+    sqlite_session.commit()
 
     updated: Ingredient = service.update_ingredient(ingredient.id, description="New desc")
 
-    db_session.commit.assert_called_once()
     assert updated.id == ingredient.id
     assert updated.name == "Salt"
     assert updated.description == "New desc"
 
 
-def test_update_ingredient_recipe_id(db_session: MagicMock, monkeypatch):
+def test_update_ingredient_recipe_id(sqlite_session: Session):
     """Test updating an ingredient's recipe_id."""
-    service = IngredientService(db_session)
+    service = IngredientService(sqlite_session)
     ingredient: Ingredient = Ingredient(id=1, name="Butter", description=None, recipe_id=None)
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: ingredient)
+    sqlite_session.add_all([User(id=1, username="alice", password="pw"), ingredient])
+    sqlite_session.add(Recipe(id=42, user_id=1, name="Clarified Butter"))
+    sqlite_session.commit()
 
     updated: Ingredient = service.update_ingredient(ingredient.id, recipe_id=42)
 
-    db_session.commit.assert_called_once()
     assert updated.id == ingredient.id
     assert updated.recipe_id == 42
 
 
-def test_update_ingredient_both_fields(db_session: MagicMock, monkeypatch):
+def test_update_ingredient_both_fields(sqlite_session: Session):
     """Test updating multiple fields of an ingredient."""
-    service = IngredientService(db_session)
+    service = IngredientService(sqlite_session)
     example: Ingredient = Ingredient(id=1, name="Flour", description="All-purpose", recipe_id=None)
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: example)
+    sqlite_session.add_all([User(id=1, username="alice", password="pw"), example])
+    sqlite_session.add(Recipe(id=7, user_id=1, name="Milled Flour"))
+    sqlite_session.commit()
 
     updated = service.update_ingredient(
         example.id, name="00 Flour", description="Fine milled", recipe_id=7
     )
-    db_session.commit.assert_called_once()
     assert updated.id == example.id
     assert updated.name == "00 Flour"
     assert updated.description == "Fine milled"
     assert updated.recipe_id == 7
 
 
-def test_update_ingredient_not_found_raises_error(db_session: MagicMock, monkeypatch):
+def test_update_ingredient_not_found_raises_error(sqlite_session: Session):
     """Test that updating a non-existent ingredient raises IngredientNotFoundError."""
-    service = IngredientService(db_session)
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: None)
+    service = IngredientService(sqlite_session)
 
     with pytest.raises(IngredientNotFoundError) as exc_info:
         service.update_ingredient(999, name="NewName")
@@ -196,15 +248,13 @@ def test_update_ingredient_not_found_raises_error(db_session: MagicMock, monkeyp
     assert "999" in str(exc_info.value)
 
 
-def test_update_ingredient_duplicate_name_raises_error(db_session: MagicMock):
+def test_update_ingredient_duplicate_name_raises_error(
+    db_session: MagicMock, unique_violation: IntegrityError
+):
     """Test that updating to a duplicate name raises IngredientExistsError."""
     service = IngredientService(db_session)
 
-    db_session.commit.side_effect = IntegrityError(
-        statement=None,
-        params=None,
-        orig=Exception(),
-    )
+    db_session.commit.side_effect = unique_violation
     with pytest.raises(IngredientExistsError) as exc_info:
         service.update_ingredient(1, name="Salt")
 
@@ -213,20 +263,30 @@ def test_update_ingredient_duplicate_name_raises_error(db_session: MagicMock):
     db_session.rollback.assert_called_once()
 
 
-def test_delete_ingredient(db_session: MagicMock, monkeypatch):
+def test_update_ingredient_unknown_recipe_raises_error(sqlite_session: Session):
+    """Test that an unknown recipe ID is reported as a constraint violation, not a duplicate."""
+    sqlite_session.add(Ingredient(id=1, name="Butter"))
+    sqlite_session.commit()
+
+    with pytest.raises(ConstraintViolationError):
+        IngredientService(sqlite_session).update_ingredient(1, recipe_id=999)
+
+    assert sqlite_session.get(Ingredient, 1).recipe_id is None  # type: ignore
+
+
+def test_delete_ingredient(sqlite_session: Session):
     """Test deleting an ingredient."""
-    service = IngredientService(db_session)
+    service = IngredientService(sqlite_session)
     example = Ingredient(id=1, name="ToDelete", description="To be deleted")
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda id: example)
+    sqlite_session.add(example)
+    sqlite_session.commit()
     service.delete_ingredient(example.id)
-    db_session.delete.assert_called_once_with(example)
-    db_session.commit.assert_called_once()
+    assert sqlite_session.get(Ingredient, 1) is None
 
 
-def test_delete_ingredient_not_found_raises_error(db_session: MagicMock, monkeypatch):
+def test_delete_ingredient_not_found_raises_error(sqlite_session: Session):
     """Test that deleting a non-existent ingredient raises IngredientNotFoundError."""
-    service = IngredientService(db_session)
-    monkeypatch.setattr(service, "_get_ingredient_by_id", lambda x: None)
+    service = IngredientService(sqlite_session)
 
     with pytest.raises(IngredientNotFoundError) as exc_info:
         service.delete_ingredient(999)
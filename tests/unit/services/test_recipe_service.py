@@ -1,12 +1,22 @@
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import event, select
 from sqlalchemy.exc import IntegrityError
-
-from docuisine.db.models import Recipe
+from sqlalchemy.orm import Session
+
+from docuisine.db.models import (
+    Category,
+    Ingredient,
+    Recipe,
+    RecipeCategory,
+    RecipeIngredient,
+    RecipeStep,
+    User,
+)
 from docuisine.schemas import recipe as recipe_schemas
 from docuisine.services import RecipeService
-from docuisine.utils.errors import RecipeExistsError, RecipeNotFoundError
+from docuisine.utils.errors import ConstraintViolationError, RecipeExistsError, RecipeNotFoundError
 
 
 def test_create_recipe(db_session: MagicMock):
@@ -195,23 +205,43 @@ def test_get_recipes_by_user(db_session: MagicMock):
     db_session.query.return_value.filter_by.assert_called_once_with(user_id=5)
 
 
-def test_update_recipe_name(db_session: MagicMock, monkeypatch):
+@pytest.fixture
+def creator(sqlite_session: Session) -> User:
+    """Provide the user with ID 1, who created the recipes stored in the tests."""
+    user = User(id=1, username="alice", password="pw")
+    sqlite_session.add(user)
+    sqlite_session.commit()
+    return user
+
+
+def test_is_recipe_owner(sqlite_session: Session, creator: User):
+    """Test that only the creator of an existing recipe owns it."""
+    sqlite_session.add(Recipe(id=1, user_id=1, name="Bread"))
+    sqlite_session.commit()
+    service = RecipeService(sqlite_session)
+
+    assert service.is_recipe_owner(recipe_id=1, user_id=1) is True
+    assert service.is_recipe_owner(recipe_id=1, user_id=2) is False
+    assert service.is_recipe_owner(recipe_id=2, user_id=1) is False
+
+
+def test_update_recipe_name(sqlite_session: Session, creator: User):
     """Test updating a recipe's name."""
-    service = RecipeService(db_session)
+    service = RecipeService(sqlite_session)
     recipe: Recipe = Recipe(id=1, user_id=1, name="Old Name", description="Some description")
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: recipe)
+    sqlite_session.add(recipe)
+    sqlite_session.commit()
 
     updated: Recipe = service.update_recipe(recipe.id, name="New Name")
 
-    db_session.commit.assert_called_once()
     assert updated.id == recipe.id
     assert updated.name == "New Name"
     assert updated.description == "Some description"
 
 
-def test_update_recipe_times(db_session: MagicMock, monkeypatch):
+def test_update_recipe_times(sqlite_session: Session, creator: User):
     """Test updating a recipe's time fields."""
-    service = RecipeService(db_session)
+    service = RecipeService(sqlite_session)
     recipe: Recipe = Recipe(
         id=1,
         user_id=1,
@@ -220,36 +250,36 @@ def test_update_recipe_times(db_session: MagicMock, monkeypatch):
         prep_time_sec=None,
         non_blocking_time_sec=None,
     )
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: recipe)
+    sqlite_session.add(recipe)
+    sqlite_session.commit()
 
     updated: Recipe = service.update_recipe(
         recipe.id, cook_time_sec=1800, prep_time_sec=600, non_blocking_time_sec=300
     )
 
-    db_session.commit.assert_called_once()
     assert updated.cook_time_sec == 1800
     assert updated.prep_time_sec == 600
     assert updated.non_blocking_time_sec == 300
 
 
-def test_update_recipe_servings_and_description(db_session: MagicMock, monkeypatch):
+def test_update_recipe_servings_and_description(sqlite_session: Session, creator: User):
     """Test updating a recipe's servings and description."""
-    service = RecipeService(db_session)
+    service = RecipeService(sqlite_session)
     recipe: Recipe = Recipe(id=1, user_id=1, name="Recipe", servings=None, description=None)
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: recipe)
+    sqlite_session.add(recipe)
+    sqlite_session.commit()
 
     updated: Recipe = service.update_recipe(
         recipe.id, servings=4, description="Updated description"
     )
 
-    db_session.commit.assert_called_once()
     assert updated.servings == 4
     assert updated.description == "Updated description"
 
 
-def test_update_recipe_multiple_fields(db_session: MagicMock, monkeypatch):
+def test_update_recipe_multiple_fields(sqlite_session: Session, creator: User):
     """Test updating multiple fields of a recipe."""
-    service = RecipeService(db_session)
+    service = RecipeService(sqlite_session)
     example: Recipe = Recipe(
         id=1,
         user_id=1,
@@ -259,7 +289,8 @@ def test_update_recipe_multiple_fields(db_session: MagicMock, monkeypatch):
         servings=None,
         description=None,
     )
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: example)
+    sqlite_session.add(example)
+    sqlite_session.commit()
 
     updated = service.update_recipe(
         example.id,
@@ -270,7 +301,6 @@ def test_update_recipe_multiple_fields(db_session: MagicMock, monkeypatch):
         description="Fully updated",
     )
 
-    db_session.commit.assert_called_once()
     assert updated.id == example.id
     assert updated.name == "Updated Recipe"
     assert updated.cook_time_sec == 2400
@@ -279,10 +309,9 @@ def test_update_recipe_multiple_fields(db_session: MagicMock, monkeypatch):
     assert updated.description == "Fully updated"
 
 
-def test_update_recipe_not_found_raises_error(db_session: MagicMock, monkeypatch):
+def test_update_recipe_not_found_raises_error(sqlite_session: Session):
     """Test that updating a non-existent recipe raises RecipeNotFoundError."""
-    service = RecipeService(db_session)
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: None)
+    service = RecipeService(sqlite_session)
 
     with pytest.raises(RecipeNotFoundError) as exc_info:
         service.update_recipe(999, name="NewName")
@@ -290,15 +319,13 @@ def test_update_recipe_not_found_raises_error(db_session: MagicMock, monkeypatch
     assert "999" in str(exc_info.value)
 
 
-def test_update_recipe_duplicate_name_raises_error(db_session: MagicMock):
+def test_update_recipe_duplicate_name_raises_error(
+    db_session: MagicMock, unique_violation: IntegrityError
+):
     """Test that updating to a duplicate name raises RecipeExistsError."""
     service = RecipeService(db_session)
 
-    db_session.commit.side_effect = IntegrityError(
-        statement=None,
-        params=None,
-        orig=Exception(),
-    )
+    db_session.commit.side_effect = unique_violation
     with pytest.raises(RecipeExistsError) as exc_info:
         service.update_recipe(1, name="Existing Recipe")
 
@@ -307,22 +334,133 @@ def test_update_recipe_duplicate_name_raises_error(db_session: MagicMock):
     db_session.rollback.assert_called_once()
 
 
-def test_delete_recipe(db_session: MagicMock, monkeypatch):
+def test_update_recipe_negative_time_raises_error(sqlite_session: Session, creator: User):
+    """Test that a negative time is reported as a constraint violation, not a duplicate."""
+    sqlite_session.add(Recipe(id=1, user_id=1, name="Bread"))
+    sqlite_session.commit()
+
+    with pytest.raises(ConstraintViolationError):
+        RecipeService(sqlite_session).update_recipe(1, cook_time_sec=-1)
+
+
+def test_delete_recipe(sqlite_session: Session, creator: User):
     """Test deleting a recipe."""
-    service = RecipeService(db_session)
+    service = RecipeService(sqlite_session)
     example = Recipe(id=1, user_id=1, name="ToDelete")
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda id: example)
+    sqlite_session.add(example)
+    sqlite_session.commit()
 
     service.delete_recipe(example.id)
 
-    db_session.delete.assert_called_once_with(example)
-    db_session.commit.assert_called_once()
+    assert sqlite_session.get(Recipe, 1) is None
+
+
+def test_get_recipe_batches_children(sqlite_session: Session, creator: User):
+    """Test that a recipe's children are read in one query each, without joining them."""
+    sqlite_session.add_all([Ingredient(id=1, name="Flour"), Ingredient(id=2, name="Water")])
+    sqlite_session.add(
+        Recipe(
+            id=1,
+            user_id=1,
+            name="Bread",
+            steps=[
+                RecipeStep(step_number=number, description=f"Step {number}")
+                for number in (1, 2, 3)
+            ],
+            ingredients=[
+                RecipeIngredient(ingredient_id=1, quantity=500, unit="g"),
+                RecipeIngredient(ingredient_id=2, quantity=300, unit="ml"),
+            ],
+        )
+    )
+    sqlite_session.commit()
+    sqlite_session.expunge_all()
+    statements: list[str] = []
+    event.listen(
+        sqlite_session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
 
+    recipe = RecipeService(sqlite_session).get_recipe(recipe_id=1)
+
+    assert len(statements) == 3
+    assert not any("JOIN" in statement for statement in statements)
+    assert len(recipe.steps) == 3
+    assert len(recipe.ingredients) == 2
+
+
+def test_update_recipe_returns_row_without_reloading(sqlite_session: Session, creator: User):
+    """Test that an update is one statement and its result is serialized without queries."""
+    sqlite_session.add(Ingredient(id=1, name="Flour"))
+    sqlite_session.add(
+        Recipe(
+            id=1,
+            user_id=1,
+            name="Bread",
+            steps=[RecipeStep(step_number=1, description="Knead")],
+            ingredients=[RecipeIngredient(ingredient_id=1, quantity=500, unit="g")],
+        )
+    )
+    sqlite_session.commit()
+    sqlite_session.expire_all()
+    statements: list[str] = []
+    event.listen(
+        sqlite_session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
 
-def test_delete_recipe_not_found_raises_error(db_session: MagicMock, monkeypatch):
+    updated = RecipeService(sqlite_session).update_recipe(1, servings=2)
+    executed = len(statements)
+    recipe_out = recipe_schemas.RecipeOut.model_validate(updated)
+
+    assert [s for s in statements if s.startswith("UPDATE")] == statements[:1]
+    assert not any(s.startswith("SELECT recipes") for s in statements)
+    assert len(statements) == executed
+    assert recipe_out.servings == 2
+    assert [step.description for step in recipe_out.steps] == ["Knead"]
+    assert [line.quantity for line in recipe_out.ingredients] == [500]
+
+
+def test_delete_recipe_with_children(sqlite_session: Session, creator: User):
+    """Test that deleting a recipe is one statement, the database deleting its children."""
+    sqlite_session.add_all([Category(id=1, name="Baking"), Ingredient(id=1, name="Flour")])
+    sqlite_session.add(
+        Recipe(
+            id=1,
+            user_id=1,
+            name="Bread",
+            steps=[RecipeStep(step_number=1, description="Knead")],
+            ingredients=[RecipeIngredient(ingredient_id=1, quantity=500, unit="g")],
+        )
+    )
+    sqlite_session.commit()
+    sqlite_session.add_all(
+        [RecipeCategory(recipe_id=1, category_id=1), Ingredient(id=2, name="Bread", recipe_id=1)]
+    )
+    sqlite_session.commit()
+    statements: list[str] = []
+    event.listen(
+        sqlite_session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    RecipeService(sqlite_session).delete_recipe(1)
+
+    assert len(statements) == 1
+    assert statements[0].startswith("DELETE FROM recipes")
+
+    for model in (Recipe, RecipeStep, RecipeIngredient, RecipeCategory):
+        assert sqlite_session.scalars(select(model)).all() == []
+    assert sqlite_session.get(Ingredient, 2).recipe_id is None
+    assert sqlite_session.get(Category, 1) is not None
+
+
+def test_delete_recipe_not_found_raises_error(sqlite_session: Session):
     """Test that deleting a non-existent recipe raises RecipeNotFoundError."""
-    service = RecipeService(db_session)
-    monkeypatch.setattr(service, "_get_recipe_by_id", lambda x: None)
+    service = RecipeService(sqlite_session)
 
     with pytest.raises(RecipeNotFoundError) as exc_info:
         service.delete_recipe(999)
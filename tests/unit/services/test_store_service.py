@@ -1,11 +1,13 @@
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
-from docuisine.db.models import Store
+from docuisine.db.models import Ingredient, Shelf, Store
 from docuisine.services import StoreService
-from docuisine.utils.errors import StoreExistsError, StoreNotFoundError
+from docuisine.utils.errors import ConstraintViolationError, StoreExistsError, StoreNotFoundError
 
 
 def test_create_store(db_session: MagicMock):
@@ -66,6 +68,21 @@ def test_create_store_duplicate_name_raises_error(db_session: MagicMock):
     db_session.rollback.assert_called_once()
 
 
+def test_create_stores(sqlite_session: Session):
+    """Test that stores with the same name are all created and bad coordinates rejected."""
+    rows = [
+        {"name": "Grocery Mart", "address": "1 Main St", "longitude": 4.9, "latitude": 52.3},
+        {"name": "Grocery Mart", "address": "2 Main St", "longitude": 500.0, "latitude": 0.0},
+        {"name": "Grocery Mart", "address": "3 Main St", "longitude": None, "latitude": None},
+    ]
+
+    items = StoreService(sqlite_session).create_stores(rows, chunk_size=10)
+
+    assert [item.status_code for item in items] == [201, 422, 201]
+    addresses = {s.id: s.address for s in sqlite_session.scalars(select(Store))}
+    assert addresses == {items[0].id: "1 Main St", items[2].id: "3 Main St"}
+
+
 def test_get_store_by_id(db_session: MagicMock, monkeypatch):
     """Test retrieving a store by ID."""
     service = StoreService(db_session)
@@ -149,49 +166,49 @@ def test_get_all_stores(db_session: MagicMock):
     db_session.query.return_value.all.assert_called_once()
 
 
-def test_update_store_name(db_session: MagicMock, monkeypatch):
+def test_update_store_name(sqlite_session: Session):
     """Test updating a store's name."""
-    service = StoreService(db_session)
+    service = StoreService(sqlite_session)
     store: Store = Store(id=1, name="Old Name", address="555 Main St")
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: store)
+    sqlite_session.add(store)
+    sqlite_session.commit()
 
     updated: Store = service.update_store(store.id, name="New Name")
 
-    db_session.commit.assert_called_once()
     assert updated.id == store.id
     assert updated.name == "New Name"
     assert updated.address == "555 Main St"
 
 
-def test_update_store_address(db_session: MagicMock, monkeypatch):
+def test_update_store_address(sqlite_session: Session):
     """Test updating a store's address."""
-    service = StoreService(db_session)
+    service = StoreService(sqlite_session)
     store: Store = Store(id=1, name="Shop", address="Old Address")
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: store)
+    sqlite_session.add(store)
+    sqlite_session.commit()
 
     updated: Store = service.update_store(store.id, address="New Address")
 
-    db_session.commit.assert_called_once()
     assert updated.name == "Shop"
     assert updated.address == "New Address"
 
 
-def test_update_store_coordinates(db_session: MagicMock, monkeypatch):
+def test_update_store_coordinates(sqlite_session: Session):
     """Test updating a store's coordinates."""
-    service = StoreService(db_session)
+    service = StoreService(sqlite_session)
     store: Store = Store(id=1, name="Store", address="123 St", longitude=None, latitude=None)
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: store)
+    sqlite_session.add(store)
+    sqlite_session.commit()
 
     updated: Store = service.update_store(store.id, longitude=-118.2437, latitude=34.0522)
 
-    db_session.commit.assert_called_once()
     assert updated.longitude == -118.2437
     assert updated.latitude == 34.0522
 
 
-def test_update_store_multiple_fields(db_session: MagicMock, monkeypatch):
+def test_update_store_multiple_fields(sqlite_session: Session):
     """Test updating multiple fields of a store."""
-    service = StoreService(db_session)
+    service = StoreService(sqlite_session)
     example: Store = Store(
         id=1,
         name="Old Store",
@@ -200,7 +217,8 @@ def test_update_store_multiple_fields(db_session: MagicMock, monkeypatch):
         website=None,
         description=None,
     )
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: example)
+    sqlite_session.add(example)
+    sqlite_session.commit()
 
     updated = service.update_store(
         example.id,
@@ -211,7 +229,6 @@ def test_update_store_multiple_fields(db_session: MagicMock, monkeypatch):
         description="Updated description",
     )
 
-    db_session.commit.assert_called_once()
     assert updated.id == example.id
     assert updated.name == "Updated Store"
     assert updated.address == "Updated Address"
@@ -220,10 +237,9 @@ def test_update_store_multiple_fields(db_session: MagicMock, monkeypatch):
     assert updated.description == "Updated description"
 
 
-def test_update_store_not_found_raises_error(db_session: MagicMock, monkeypatch):
+def test_update_store_not_found_raises_error(sqlite_session: Session):
     """Test that updating a non-existent store raises StoreNotFoundError."""
-    service = StoreService(db_session)
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: None)
+    service = StoreService(sqlite_session)
 
     with pytest.raises(StoreNotFoundError) as exc_info:
         service.update_store(999, name="NewName")
@@ -231,15 +247,13 @@ def test_update_store_not_found_raises_error(db_session: MagicMock, monkeypatch)
     assert "999" in str(exc_info.value)
 
 
-def test_update_store_duplicate_name_raises_error(db_session: MagicMock):
+def test_update_store_duplicate_name_raises_error(
+    db_session: MagicMock, unique_violation: IntegrityError
+):
     """Test that updating to a duplicate name raises StoreExistsError."""
     service = StoreService(db_session)
 
-    db_session.commit.side_effect = IntegrityError(
-        statement=None,
-        params=None,
-        orig=Exception(),
-    )
+    db_session.commit.side_effect = unique_violation
     with pytest.raises(StoreExistsError) as exc_info:
         service.update_store(1, name="Existing Store")
 
@@ -248,22 +262,45 @@ def test_update_store_duplicate_name_raises_error(db_session: MagicMock):
     db_session.rollback.assert_called_once()
 
 
-def test_delete_store(db_session: MagicMock, monkeypatch):
+def test_update_store_out_of_range_raises_error(sqlite_session: Session):
+    """Test that out of range coordinates are reported as a constraint violation."""
+    sqlite_session.add(Store(id=1, name="Market", address="1 Main St"))
+    sqlite_session.commit()
+
+    with pytest.raises(ConstraintViolationError):
+        StoreService(sqlite_session).update_store(1, latitude=100.0)
+
+
+def test_delete_store(sqlite_session: Session):
     """Test deleting a store."""
-    service = StoreService(db_session)
+    service = StoreService(sqlite_session)
     example = Store(id=1, name="ToDelete", address="Delete St")
-    monkeypatch.setattr(service, "_get_store_by_id", lambda id: example)
+    sqlite_session.add(example)
+    sqlite_session.commit()
 
     service.delete_store(example.id)
 
-    db_session.delete.assert_called_once_with(example)
-    db_session.commit.assert_called_once()
+    assert sqlite_session.get(Store, 1) is None
+
+
+def test_delete_store_with_shelves(sqlite_session: Session):
+    """Test that deleting a store deletes its shelves and keeps the ingredients."""
+    sqlite_session.add_all(
+        [Store(id=1, name="Market", address="Main St"), Ingredient(id=1, name="Flour")]
+    )
+    sqlite_session.commit()
+    sqlite_session.add(Shelf(store_id=1, ingredient_id=1, quantity=3))
+    sqlite_session.commit()
 
+    StoreService(sqlite_session).delete_store(1)
 
-def test_delete_store_not_found_raises_error(db_session: MagicMock, monkeypatch):
+    assert sqlite_session.scalars(select(Shelf)).all() == []
+    assert sqlite_session.get(Ingredient, 1) is not None
+
+
+def test_delete_store_not_found_raises_error(sqlite_session: Session):
     """Test that deleting a non-existent store raises StoreNotFoundError."""
-    service = StoreService(db_session)
-    monkeypatch.setattr(service, "_get_store_by_id", lambda x: None)
+    service = StoreService(sqlite_session)
 
     with pytest.raises(StoreNotFoundError) as exc_info:
         service.delete_store(999)
@@ -1,13 +1,17 @@
+import math
 import time
 from unittest.mock import MagicMock
 
+from cachetools import TTLCache
 import pytest
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
 from docuisine.db.models import User
-from docuisine.schemas.auth import JWTConfig
+from docuisine.schemas.auth import JWTConfig, UserIdentity
 from docuisine.schemas.enums import JWTAlgorithm, Role
 from docuisine.services import UserService
+from docuisine.services.user import create_identity_cache
 from docuisine.utils import errors
 
 
@@ -145,60 +149,74 @@ def test_create_user_with_email(db_session: MagicMock):
     db_session.commit.assert_called_once()
 
 
-def test_delete_user_success(db_session: MagicMock):
+def test_delete_user_success(sqlite_session: Session):
     """Test that deleting an existing user works correctly."""
-    user = User(id=1, username="alice", password="pw")
-    db_session.first.return_value = user
+    sqlite_session.add(User(id=1, username="alice", password="pw"))
+    sqlite_session.commit()
 
-    service = UserService(db_session)
+    service = UserService(sqlite_session)
     service.delete_user(user_id=1)
 
-    db_session.delete.assert_called_once_with(user)
-    db_session.commit.assert_called_once()
+    assert sqlite_session.get(User, 1) is None
 
 
-def test_delete_user_not_found(db_session: MagicMock):
+def test_delete_user_not_found(sqlite_session: Session):
     """Test that deleting a non-existent user raises UserNotFoundError."""
-    db_session.first.return_value = None
-    service = UserService(db_session)
+    service = UserService(sqlite_session)
 
     with pytest.raises(errors.UserNotFoundError):
         service.delete_user(user_id=999)
 
 
-def test_update_email_success(db_session: MagicMock):
+def test_update_email_success(sqlite_session: Session):
     """Test that updating a user's email works correctly."""
-    user = User(id=1, username="alice", password="pw", email="old@example.com")
-    db_session.first.return_value = user
+    sqlite_session.add(User(id=1, username="alice", password="pw", email="old@example.com"))
+    sqlite_session.commit()
 
-    service = UserService(db_session)
+    service = UserService(sqlite_session)
     updated_user = service.update_user_email(user_id=1, new_email="new@example.com")
 
     assert updated_user.email == "new@example.com"
-    db_session.commit.assert_called_once()
+    assert updated_user.username == "alice"
 
 
-def test_update_email_user_not_found(db_session: MagicMock):
+def test_update_email_duplicate_raises_error(sqlite_session: Session):
+    """Test that taking the email of another user raises DuplicateEmailError."""
+    sqlite_session.add_all(
+        [
+            User(id=1, username="alice", password="pw", email="alice@example.com"),
+            User(id=2, username="bob", password="pw", email="bob@example.com"),
+        ]
+    )
+    sqlite_session.commit()
+    service = UserService(sqlite_session)
+
+    with pytest.raises(errors.DuplicateEmailError):
+        service.update_user_email(user_id=2, new_email="alice@example.com")
+
+    assert sqlite_session.get(User, 2).email == "bob@example.com"
+
+
+def test_update_email_user_not_found(sqlite_session: Session):
     """Test that updating a user's email for a non-existent user raises UserNotFoundError."""
-    db_session.first.return_value = None
-    service = UserService(db_session)
+    service = UserService(sqlite_session)
 
     with pytest.raises(errors.UserNotFoundError):
         service.update_user_email(user_id=999, new_email="new@example.com")
 
 
-def test_update_password_success(db_session: MagicMock):
+def test_update_password_success(sqlite_session: Session):
     """Test that updating a user's password works correctly."""
-    user = User(id=1, username="alice", password="hashed::oldpassword123")
-    db_session.first.return_value = user
+    sqlite_session.add(User(id=1, username="alice", password="hashed::oldpassword123"))
+    sqlite_session.commit()
 
-    service = UserService(db_session)
+    service = UserService(sqlite_session)
     updated_user = service.update_user_password(
         user_id=1, old_password="oldpassword123", new_password="newpassword123"
     )
 
     assert updated_user.password == "hashed::newpassword123"
-    db_session.commit.assert_called_once()
+    assert updated_user.token_version == 1
 
 
 def test_update_password_user_not_found(db_session: MagicMock):
@@ -274,8 +292,9 @@ def test_verify_password(db_session: MagicMock, monkeypatch):
     service = UserService(db_session)
     monkeypatch.setattr(
         "docuisine.services.user.UserService._verify_password",
-        lambda self, plain_password, hashed_password: f"hashed::{plain_password}"
-        == hashed_password,
+        lambda self, plain_password, hashed_password: (
+            f"hashed::{plain_password}" == hashed_password
+        ),
     )
 
     assert service._verify_password("password123", "hashed::password123") is True
@@ -365,22 +384,188 @@ def test_authorize_user_invalid_token(db_session: MagicMock, monkeypatch):
         service.authorize_user("invalidtoken")
 
 
-def test_update_user_role_success(db_session: MagicMock):
-    """Test that updating a user's role works correctly."""
-    user = User(id=1, username="alice", password="pw", role=Role.USER)
+def test_authorize_identity_is_cached(db_session: MagicMock, monkeypatch):
+    """Test that a cached identity is served without decoding or querying again."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256)
+    mock_decode = MagicMock(return_value={"sub": "alice"})
+    mock_get_user = MagicMock(
+        return_value=User(id=1, username="alice", password="pw", role=Role.USER.value)
+    )
+    monkeypatch.setattr("docuisine.services.user.jwt.decode", mock_decode)
+    monkeypatch.setattr("docuisine.services.user.UserService.get_user", mock_get_user)
+
+    service = UserService(
+        db_session, jwt_config=jwt_config, identity_cache=create_identity_cache(maxsize=8, ttl=60)
+    )
+    first = service.authorize_identity("validtoken")
+    second = service.authorize_identity("validtoken")
+
+    assert first == second == UserIdentity(id=1, username="alice", role=Role.USER)
+    mock_decode.assert_called_once()
+    mock_get_user.assert_called_once()
+
+
+def test_authorize_identity_not_cached_past_expiry(db_session: MagicMock, monkeypatch):
+    """Test that an identity is not cached for a token that has already expired."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256)
+    monkeypatch.setattr(
+        "docuisine.services.user.jwt.decode",
+        lambda token, key, algorithms: {"sub": "alice", "exp": time.time() - 1},
+    )
+    monkeypatch.setattr(
+        "docuisine.services.user.UserService.get_user",
+        lambda self, username: User(id=1, username="alice", password="pw", role="user"),
+    )
+    cache = create_identity_cache(maxsize=8, ttl=60)
+
+    UserService(db_session, jwt_config=jwt_config, identity_cache=cache).authorize_identity("t")
+
+    assert cache.get("t") is None
+
+
+def test_authorize_identity_invalid_token_not_cached(db_session: MagicMock, monkeypatch):
+    """Test that an invalid token raises InvalidCredentialsError and is not cached."""
+    jwt_config = JWTConfig(secret_key="testsecret", algorithm=JWTAlgorithm.HS256)
+    cache = create_identity_cache(maxsize=8, ttl=60)
+    service = UserService(db_session, jwt_config=jwt_config, identity_cache=cache)
+
+    with pytest.raises(errors.InvalidCredentialsError):
+        service.authorize_identity("invalidtoken")
+    assert len(cache) == 0
+
+
+def test_identity_cache_expires_with_token_or_ttl():
+    """Test that a cached identity expires with its token, and after the TTL at the latest."""
+    cache = create_identity_cache(maxsize=8, ttl=60)
+    identity = UserIdentity(id=1, username="alice", role=Role.USER)
+    now = time.time()
+    cache["short-token"] = (identity, now + 10)
+    cache["long-token"] = (identity, math.inf)
+
+    cache.expire(now + 30)
+    assert "short-token" not in cache
+    assert "long-token" in cache
+
+    cache.expire(now + 61)
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("toggle_user_role", {}),
+        ("delete_user", {}),
+        ("update_user_password", {"old_password": "pw", "new_password": "new-pw"}),
+    ],
+)
+def test_user_changes_invalidate_cached_identity(sqlite_session: Session, method: str, kwargs):
+    """Test that changing or deleting a user drops their cached identities only."""
+    sqlite_session.add(User(id=1, username="alice", password="hashed::pw", role=Role.USER.value))
+    sqlite_session.commit()
+    cache = create_identity_cache(maxsize=8, ttl=60)
+    cache["alice-token"] = (UserIdentity(id=1, username="alice", role=Role.USER), math.inf)
+    cache["bob-token"] = (UserIdentity(id=2, username="bob", role=Role.USER), math.inf)
+
+    service = UserService(sqlite_session, identity_cache=cache)
+    getattr(service, method)(user_id=1, **kwargs)
+
+    assert cache.get("alice-token") is None
+    assert cache.get("bob-token") is not None
+
+
+@pytest.fixture
+def token_service(db_session: MagicMock) -> UserService:
+    """Provide a UserService that signs real tokens and tracks token versions."""
+    jwt_config = JWTConfig(secret_key="testsecret" * 4, algorithm=JWTAlgorithm.HS256)
+    return UserService(
+        db_session, jwt_config=jwt_config, token_versions=TTLCache(maxsize=8, ttl=60)
+    )
+
+
+def test_access_token_is_authorized_from_claims(db_session: MagicMock, token_service):
+    """Test that an access token carries the identity and needs no database lookup."""
+    user = User(id=1, username="alice", password="pw", role=Role.ADMIN.value, token_version=3)
+    token = token_service.create_access_token(user)
+    db_session.query.reset_mock()
+
+    identity = token_service.authorize_identity(token)
+
+    assert identity == UserIdentity(id=1, username="alice", role=Role.ADMIN)
+    db_session.query.assert_not_called()
+
+
+def test_refresh_token_is_not_an_access_token(token_service):
+    """Test that a refresh token cannot be used to authorize requests."""
+    user = User(id=1, username="alice", password="pw", role=Role.USER.value, token_version=0)
+    token = token_service.create_refresh_token(user)
+
+    with pytest.raises(errors.InvalidCredentialsError):
+        token_service.authorize_identity(token)
+
+
+def test_revoked_access_token_is_rejected(sqlite_session: Session, token_service):
+    """Test that access tokens older than a recorded token version are checked and rejected."""
+    user = User(id=1, username="alice", password="pw", role=Role.ADMIN.value, token_version=0)
+    token = token_service.create_access_token(user)
+    sqlite_session.add(user)
+    sqlite_session.commit()
+    token_service.db_session = sqlite_session
+
+    token_service.toggle_user_role(user_id=1)
+
+    assert sqlite_session.get(User, 1).token_version == 1
+    with pytest.raises(errors.InvalidCredentialsError):
+        token_service.authorize_identity(token)
+
+
+def test_refresh_tokens_success(db_session: MagicMock, token_service):
+    """Test that a valid refresh token is exchanged for a new pair of tokens."""
+    user = User(id=1, username="alice", password="pw", role=Role.USER.value, token_version=2)
     db_session.first.return_value = user
+    refresh_token = token_service.create_refresh_token(user)
 
-    service = UserService(db_session)
-    updated_user = service.toggle_user_role(user_id=1)
+    access_token, new_refresh_token = token_service.refresh_tokens(refresh_token)
 
-    assert updated_user.role == Role.ADMIN
-    db_session.commit.assert_called_once()
+    assert token_service.authorize_identity(access_token).id == 1
+    assert isinstance(new_refresh_token, str)
 
 
-def test_update_user_role_user_not_found(db_session: MagicMock):
+@pytest.mark.parametrize("current_version", [None, 3])
+def test_refresh_tokens_revoked(db_session: MagicMock, token_service, current_version):
+    """Test that a refresh token is rejected if its user is gone or its version is stale."""
+    user = User(id=1, username="alice", password="pw", role=Role.USER.value, token_version=2)
+    refresh_token = token_service.create_refresh_token(user)
+    db_session.first.return_value = (
+        None if current_version is None else User(id=1, token_version=current_version)
+    )
+
+    with pytest.raises(errors.InvalidCredentialsError):
+        token_service.refresh_tokens(refresh_token)
+
+
+def test_refresh_tokens_rejects_access_token(token_service):
+    """Test that an access token cannot be used as a refresh token."""
+    user = User(id=1, username="alice", password="pw", role=Role.USER.value, token_version=0)
+    access_token = token_service.create_access_token(user)
+
+    with pytest.raises(errors.InvalidCredentialsError):
+        token_service.refresh_tokens(access_token)
+
+
+def test_update_user_role_success(sqlite_session: Session):
+    """Test that updating a user's role works correctly, back and forth."""
+    sqlite_session.add(User(id=1, username="alice", password="pw", role=Role.USER.value))
+    sqlite_session.commit()
+
+    service = UserService(sqlite_session)
+
+    assert service.toggle_user_role(user_id=1).role == Role.ADMIN
+    assert service.toggle_user_role(user_id=1).role == Role.USER
+
+
+def test_update_user_role_user_not_found(sqlite_session: Session):
     """Test that updating a user's role for a non-existent user raises UserNotFoundError."""
-    db_session.first.return_value = None
-    service = UserService(db_session)
+    service = UserService(sqlite_session)
 
     with pytest.raises(errors.UserNotFoundError):
         service.toggle_user_role(user_id=999)
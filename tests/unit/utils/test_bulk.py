@@ -0,0 +1,105 @@
+import asyncio
+
+from fastapi.exceptions import RequestValidationError
+import pytest
+
+from docuisine.schemas.common import BulkLimits
+from docuisine.schemas.ingredient import IngredientCreate
+from docuisine.utils import errors
+from docuisine.utils.bulk import NDJSON_MEDIA_TYPE, ingest_items
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def limits(**overrides) -> BulkLimits:
+    return BulkLimits(**{"max_items": 10, "chunk_size": 10, **overrides})
+
+
+@pytest.mark.parametrize(
+    "content_type, chunks",
+    [
+        ("application/json", (b'[{"name": "Sugar"}, {"name": "Salt", "recipe_id": 1}]',)),
+        ("application/x-ndjson", (b'{"name": "Sugar"}\n\n{"name": "Sa', b'lt", "recipe_id": 1}')),
+        (
+            "application/x-ndjson; charset=utf-8",
+            (b'{"name": "Sugar"}\n{"name": "Salt", "recipe_id": 1}\n',),
+        ),
+    ],
+    ids=["json", "ndjson_split_line", "ndjson_trailing_newline"],
+)
+def test_ingest_items(content_type: str, chunks: tuple[bytes, ...]):
+    """Test that items are read from a JSON array or NDJSON, whatever the chunking."""
+    items = asyncio.run(
+        ingest_items(stream(*chunks), content_type, IngredientCreate, limits(max_items=2))
+    )
+
+    assert [(item.name, item.recipe_id) for item in items] == [("Sugar", None), ("Salt", 1)]
+
+
+@pytest.mark.parametrize("content_type", ["application/json", "application/x-ndjson"])
+def test_ingest_items_too_many(content_type: str):
+    """Test that a body holding more items than allowed is rejected."""
+    body = (
+        b'[{"name": "a"}, {"name": "b"}, {"name": "c"}]'
+        if content_type == "application/json"
+        else b'{"name": "a"}\n{"name": "b"}\n{"name": "c"}\n'
+    )
+
+    with pytest.raises(errors.TooManyItemsError):
+        asyncio.run(
+            ingest_items(stream(body), content_type, IngredientCreate, limits(max_items=2))
+        )
+
+
+def test_ingest_items_invalid_ndjson():
+    """Test that every invalid line is reported with its position."""
+    body = b'{"name": "Sugar"}\n{"nam": "Salt"}\nnot json\n'
+
+    with pytest.raises(RequestValidationError) as exc_info:
+        asyncio.run(ingest_items(stream(body), NDJSON_MEDIA_TYPE, IngredientCreate, limits()))
+
+    locations = [error["loc"] for error in exc_info.value.errors()]
+    assert locations == [("body", 1, "name"), ("body", 2)]
+
+
+def test_ingest_items_too_many_rejected_before_validation():
+    """Test that a JSON array is counted before its items are validated."""
+    body = b'[{"nam": "a"}, {"nam": "b"}, {"nam": "c"}]'
+
+    with pytest.raises(errors.TooManyItemsError):
+        asyncio.run(
+            ingest_items(stream(body), "application/json", IngredientCreate, limits(max_items=2))
+        )
+
+
+@pytest.mark.parametrize("content_type", ["application/json", NDJSON_MEDIA_TYPE])
+def test_ingest_items_too_large(content_type: str):
+    """Test that reading stops at the first chunk past the maximum body size."""
+    read = []
+
+    async def chunks():
+        for chunk in [b'{"name": "Sugar"}\n'] * 10:
+            read.append(chunk)
+            yield chunk
+
+    with pytest.raises(errors.BulkRequestTooLargeError):
+        asyncio.run(ingest_items(chunks(), content_type, IngredientCreate, limits(max_bytes=40)))
+    assert len(read) == 3
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [(b'{"name": "Sugar"}\n{"name": "' + b"a" * 100 + b'"}\n',), (b'{"name": "', b"a" * 100)],
+    ids=["complete_line", "unterminated_line"],
+)
+def test_ingest_items_line_too_long(chunks: tuple[bytes, ...]):
+    """Test that an NDJSON line longer than allowed is rejected, even before it ends."""
+    with pytest.raises(errors.BulkLineTooLongError):
+        asyncio.run(
+            ingest_items(
+                stream(*chunks), NDJSON_MEDIA_TYPE, IngredientCreate, limits(max_line_bytes=64)
+            )
+        )
@@ -0,0 +1,69 @@
+import os
+
+from docuisine.utils.disk_cache import DiskCache
+
+
+def test_get_missing_key(tmp_path):
+    cache = DiskCache(tmp_path / "cache", max_bytes=100)
+
+    assert cache.get("missing") is None
+    assert not (tmp_path / "cache").exists()
+
+
+def test_set_and_get(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=100)
+    cache.set("a", b"abc")
+
+    assert cache.get("a") == b"abc"
+    assert len(cache) == 1
+    assert cache.size == 3
+
+
+def test_overwrite_replaces_size(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=100)
+    cache.set("a", b"abc")
+    cache.set("a", b"abcdef")
+
+    assert cache.get("a") == b"abcdef"
+    assert cache.size == 6
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=10)
+    cache.set("a", b"aaaa")
+    cache.set("b", b"bbbb")
+    cache.get("a")
+    cache.set("c", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.size == 8
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_skips_entries_larger_than_cache(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=4)
+    cache.set("a", b"too large")
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_reloads_existing_entries(tmp_path):
+    DiskCache(tmp_path, max_bytes=100).set("a", b"abc")
+
+    cache = DiskCache(tmp_path, max_bytes=100)
+
+    assert cache.get("a") == b"abc"
+    assert cache.size == 3
+
+
+def test_file_removed_externally_is_a_miss(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=100)
+    cache.set("a", b"abc")
+    for name in os.listdir(tmp_path):
+        os.remove(tmp_path / name)
+
+    assert cache.get("a") is None
+    assert cache.size == 0
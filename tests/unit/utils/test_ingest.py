@@ -0,0 +1,115 @@
+import asyncio
+import base64
+from hashlib import md5, sha256
+from io import BytesIO
+
+from fastapi import UploadFile
+import pytest
+
+from docuisine.schemas.image import UploadLimits
+from docuisine.utils import errors
+from docuisine.utils.ingest import (
+    Base64StreamDecoder,
+    SpooledUpload,
+    ingest_base64,
+    ingest_upload,
+)
+
+DATA = bytes(range(256)) * 40
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def split(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_ingest_upload_hashes_without_copying():
+    """Test that an upload is read in chunks and hashed, and kept in the file it came in."""
+    upload = UploadFile(BytesIO(DATA))
+    limits = UploadLimits(max_size=len(DATA), spool_threshold=1024)
+
+    with asyncio.run(ingest_upload(upload, limits, chunk_size=1000)) as spooled:
+        assert spooled.size == len(DATA)
+        assert spooled.md5 == md5(DATA).hexdigest()
+        assert spooled.sha256 == sha256(DATA).hexdigest()
+        assert spooled.head == DATA[:32]
+        assert spooled.file is upload.file
+        assert spooled.read() == DATA
+    assert upload.file.closed
+
+
+def test_spooled_upload_moves_to_disk_past_threshold():
+    """Test that written chunks are moved to a temporary file past the spool threshold."""
+    with SpooledUpload(UploadLimits(max_size=len(DATA), spool_threshold=1024)) as spooled:
+        for chunk in split(DATA, 1000):
+            spooled.write(chunk)
+        assert spooled.file._rolled
+        assert spooled.md5 == md5(DATA).hexdigest()
+        assert spooled.read() == DATA
+
+
+def test_ingest_upload_too_large():
+    """Test that an upload over the maximum size is rejected and its file released."""
+    upload = UploadFile(BytesIO(DATA))
+
+    with pytest.raises(errors.UploadTooLargeError):
+        asyncio.run(ingest_upload(upload, UploadLimits(max_size=2000), chunk_size=1000))
+    assert upload.file.closed
+
+
+def test_ingest_upload_too_large_known_size():
+    """Test that an upload of known size is rejected before it is read."""
+    upload = UploadFile(BytesIO(DATA), size=len(DATA))
+
+    with pytest.raises(errors.UploadTooLargeError):
+        asyncio.run(ingest_upload(upload, UploadLimits(max_size=100)))
+    assert upload.file.tell() == 0
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+def test_ingest_base64(chunk_size: int):
+    """Test that base64 split at any boundary, with line breaks, decodes to the original."""
+    encoded = base64.encodebytes(DATA)
+
+    spooled = asyncio.run(ingest_base64(stream(*split(encoded, chunk_size)), UploadLimits()))
+
+    with spooled:
+        assert spooled.read() == DATA
+        assert spooled.md5 == md5(DATA).hexdigest()
+
+
+def test_ingest_base64_too_large():
+    """Test that the limit applies to the decoded size."""
+    encoded = base64.b64encode(DATA)
+
+    with pytest.raises(errors.UploadTooLargeError):
+        asyncio.run(ingest_base64(stream(encoded), UploadLimits(max_size=len(DATA) - 1)))
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        (b"not base64!",),
+        (b"QUJ",),
+        (b"QQ==", b"QUJD"),
+        (b"QQ==QUJD",),
+    ],
+    ids=["invalid_characters", "truncated", "data_after_padding", "padding_in_the_middle"],
+)
+def test_ingest_base64_invalid(chunks: tuple[bytes, ...]):
+    """Test that malformed base64 is rejected."""
+    with pytest.raises(errors.DecodingError):
+        asyncio.run(ingest_base64(stream(*chunks), UploadLimits()))
+
+
+def test_base64_decoder_carries_partial_groups():
+    """Test that incomplete groups are kept until the rest arrives."""
+    decoder = Base64StreamDecoder()
+
+    assert decoder.decode(b"QU") == b""
+    assert decoder.decode(b"JDRA\n==") == b"ABCD"
+    assert decoder.finish() == b""
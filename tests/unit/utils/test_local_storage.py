@@ -0,0 +1,91 @@
+import pytest
+
+from docuisine.db.storage import LocalStorage
+from docuisine.utils.errors import ObjectNotFoundError, UnsupportedStorageOperationError
+
+KEY = "abcd1234.jpeg"
+
+
+def test_put_and_get(tmp_path):
+    storage = LocalStorage(tmp_path)
+    storage.put(KEY, b"image", content_type="image/jpeg")
+
+    with storage.get(KEY) as reader:
+        assert reader.size == 5
+        assert reader.path == tmp_path / "ab" / "cd" / KEY
+        assert reader.read() == b"image"
+
+
+def test_put_leaves_no_temporary_files(tmp_path):
+    storage = LocalStorage(tmp_path)
+    storage.put(KEY, b"first", content_type="image/jpeg")
+    storage.put(KEY, b"second", content_type="image/jpeg")
+
+    assert [path.name for path in (tmp_path / "ab" / "cd").iterdir()] == [KEY]
+    with storage.get(KEY) as reader:
+        assert b"".join(reader.iter_chunks(2)) == b"second"
+
+
+def test_head_returns_metadata(tmp_path):
+    storage = LocalStorage(tmp_path)
+    storage.put(KEY, b"image", content_type="image/jpeg", metadata={"placeholder": "data:"})
+
+    info = storage.head(KEY)
+
+    assert info.size == 5
+    assert info.metadata == {"placeholder": "data:"}
+    assert info.last_modified is not None
+
+
+def test_head_and_get_missing_object(tmp_path):
+    storage = LocalStorage(tmp_path)
+
+    assert storage.head(KEY) is None
+    with pytest.raises(ObjectNotFoundError):
+        storage.get(KEY)
+
+
+@pytest.mark.parametrize("key", ["../secret", "/etc/passwd", "a//b", ".hidden", "a.meta.json"])
+def test_unsafe_keys_are_rejected(tmp_path, key):
+    storage = LocalStorage(tmp_path)
+
+    with pytest.raises(ObjectNotFoundError):
+        storage.put(key, b"data", content_type="image/jpeg")
+
+
+def test_copy_drops_metadata(tmp_path):
+    storage = LocalStorage(tmp_path)
+    storage.put("uploads/ff00", b"image", content_type="image/jpeg", metadata={"a": "b"})
+
+    storage.copy("uploads/ff00", KEY, content_type="image/jpeg")
+
+    assert storage.head(KEY).metadata == {}
+    with pytest.raises(ObjectNotFoundError):
+        storage.copy("uploads/missing", KEY, content_type="image/jpeg")
+
+
+def test_iter_objects_in_key_order(tmp_path):
+    storage = LocalStorage(tmp_path)
+    keys = ["uploads/ff00", "bb.png", "aa_w64.webp", "aa.png", "aa_preview.png"]
+    for key in keys:
+        storage.put(key, b"x", content_type="image/png", metadata={"a": "b"})
+
+    listed = [info.key for info in storage.iter_objects()]
+
+    assert listed == ["aa.png", "aa_preview.png", "aa_w64.webp", "bb.png", "uploads/ff00"]
+
+
+def test_delete_many(tmp_path):
+    storage = LocalStorage(tmp_path)
+    storage.put(KEY, b"image", content_type="image/jpeg", metadata={"a": "b"})
+
+    assert storage.delete_many([KEY, "missing.png"]) == []
+    assert storage.head(KEY) is None
+    assert list(storage.iter_objects()) == []
+
+
+def test_presign_put_is_unsupported(tmp_path):
+    storage = LocalStorage(tmp_path)
+
+    with pytest.raises(UnsupportedStorageOperationError):
+        storage.presign_put(KEY, "image/jpeg", 10, 60)
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+from pytest import raises
+
+from docuisine.utils.errors import InvalidCursorError
+from docuisine.utils.pagination import decode_cursor, encode_cursor, paginate
+
+
+@pytest.mark.parametrize("last_id", [1, 42, 2**31 - 1])
+def test_cursor_round_trip(last_id: int):
+    cursor = encode_cursor(last_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == last_id
+
+
+def test_decode_cursor_none():
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-a-cursor", "!!!", encode_cursor(-1), encode_cursor(0), encode_cursor(2**31)],
+)
+def test_decode_cursor_invalid(cursor: str):
+    with raises(InvalidCursorError, match="Invalid pagination cursor"):
+        decode_cursor(cursor)
+
+
+def test_paginate_with_next_page():
+    rows = [SimpleNamespace(id=i) for i in range(1, 5)]
+
+    items, next_cursor = paginate(rows, limit=3)
+
+    assert [item.id for item in items] == [1, 2, 3]
+    assert next_cursor is not None
+    assert decode_cursor(next_cursor) == 3
+
+
+def test_paginate_last_page():
+    rows = [SimpleNamespace(id=i) for i in range(1, 3)]
+
+    items, next_cursor = paginate(rows, limit=3)
+
+    assert [item.id for item in items] == [1, 2]
+    assert next_cursor is None
+
+
+def test_paginate_empty():
+    assert paginate([], limit=3) == ([], None)
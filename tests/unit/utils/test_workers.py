@@ -0,0 +1,42 @@
+import os
+import time
+
+import pytest
+
+from docuisine.utils.errors import WorkerPoolBusyError
+from docuisine.utils.workers import ProcessPool
+
+
+@pytest.fixture
+def pool():
+    pool = ProcessPool(max_workers=1, max_pending=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_run_in_worker_process(pool: ProcessPool):
+    assert pool.run(pow, 2, 10) == 1024
+
+
+def test_submit_rejects_when_full(pool: ProcessPool):
+    future = pool.submit(time.sleep, 0.5)
+
+    with pytest.raises(WorkerPoolBusyError):
+        pool.submit(pow, 2, 10)
+
+    future.result()
+    assert pool.run(pow, 2, 10) == 1024
+
+
+def test_worker_errors_release_the_slot(pool: ProcessPool):
+    with pytest.raises(ZeroDivisionError):
+        pool.run(divmod, 1, 0)
+
+    assert pool.run(pow, 2, 3) == 8
+
+
+def test_crashed_worker_restarts_the_pool(pool: ProcessPool):
+    with pytest.raises(WorkerPoolBusyError):
+        pool.run(os._exit, 1)
+
+    assert pool.run(pow, 2, 3) == 8